@@ -7,19 +7,19 @@ and ZIP archives with string replacement functionality.
 
 import json
 import logging
-import sys
 import argparse
 import zipfile
-import tempfile
 import shutil
 import os
 import csv
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Union, Optional, Set, Tuple
+from typing import Any, Dict, Union, Optional, Set, Tuple
 from datetime import datetime
 
 from ..shared import globals
+from ..shared.asset_uids import scan_asset_uids
+from ..shared.zip_stream import rewrite_zip
 
 
 class PolicyTranformer:
@@ -107,7 +107,8 @@ class PolicyTranformer:
         # Initialize data quality policy extraction tracking
         self.extracted_assets: Set[str] = set()
         self.all_asset_uids: Set[str] = set()  # Track all UIDs without filtering
-        self.deep_scan_count: int = 0  # Track how many times deep scan is called
+        self.deep_scan_count: int = 0  # Track how many values the deep scan visited
+        self.uid_fields_found: int = 0  # Track how many UID fields the deep scan found
         
         self.logger.info("PolicyExportFormatter initialized successfully")
         self.logger.info(f"Input directory: {self.input_dir}")
@@ -179,6 +180,7 @@ class PolicyTranformer:
                 
             # Log asset extraction results
             self.logger.info(f"Asset extraction results:")
+            self.logger.info(f"  Deep scan so far: {self.deep_scan_count} values, {self.uid_fields_found} UID fields")
             self.logger.info(f"  Total unique assets found so far: {len(self.all_asset_uids)}")
             if len(self.all_asset_uids) > 0:
                 # Show first few assets found
@@ -209,70 +211,19 @@ class PolicyTranformer:
             self.logger.error(f"Error extracting all assets from policy: {e}")
             self.stats["errors"].append(f"All assets extraction error: {e}")
     
-    def _deep_scan_for_asset_uids(self, obj: Any, path: str = "") -> None:
-        """Recursively scan any object to find uid and parentAssetUid fields.
+    def _deep_scan_for_asset_uids(self, obj: Any) -> None:
+        """Scan any object to find uid and parentAssetUid fields.
         
         Args:
             obj: The object to scan (dict, list, or primitive)
-            path: Current path in the object for debugging
         """
         try:
-            self.deep_scan_count += 1
-            if self.deep_scan_count % 1000 == 0:  # Log every 1000th scan
-                self.logger.debug(f"Deep scan count: {self.deep_scan_count}, current path: {path}")
-            if isinstance(obj, dict):
-                # Check for uid and parentAssetUid fields in this dict
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    
-                    # Check if this key is uid or parentAssetUid
-                    if key in ['uid', 'parentAssetUid'] and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                    
-                    # Also check for asset-related fields that might contain UIDs
-                    if key in ['assetUid', 'asset_uid', 'assetUid', 'backingAssetUid', 'backingAssetId'] and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                    
-                    # Check for any field that contains "uid" in its name (case-insensitive)
-                    if 'uid' in key.lower() and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                    
-                    # Check for asset objects that might contain UIDs
-                    if key in ['asset', 'assets', 'backingAsset', 'backingAssets'] and isinstance(value, (dict, list)):
-                        # This is likely an asset object or list, scan it more carefully
-                        self.logger.debug(f"Found asset object at {current_path}, scanning for UIDs")
-                        self._deep_scan_for_asset_uids(value, current_path)
-                    
-                    # Check for any field that contains "uid" in its name (case-insensitive)
-                    if 'uid' in key.lower() and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                        # Also log at info level for important finds
-                        self.logger.info(f"Found asset UID at {current_path}: {uid}")
-                        # Log the current total count after adding this UID
-                        self.logger.info(f"Total assets after adding {uid}: {len(self.all_asset_uids)}")
-                    
-                    # Recursively scan the value
-                    self._deep_scan_for_asset_uids(value, current_path)
-                    
-            elif isinstance(obj, list):
-                # Scan each item in the list
-                for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    self._deep_scan_for_asset_uids(item, current_path)
-                    
-            # For primitive types (str, int, bool, etc.), no further scanning needed
-            
+            result = scan_asset_uids(obj, self.all_asset_uids, self.logger)
+            self.deep_scan_count += result.nodes
+            self.uid_fields_found += result.uid_fields
         except Exception as e:
-            self.logger.error(f"Error in deep scan at path {path}: {e}")
-            self.stats["errors"].append(f"Deep scan error at {path}: {e}")
+            self.logger.error(f"Error in deep scan: {e}")
+            self.stats["errors"].append(f"Deep scan error: {e}")
     
     def _extract_from_policy(self, policy: Dict[str, Any]) -> None:
         """Extract assets from a single policy definition.
@@ -518,6 +469,10 @@ class PolicyTranformer:
     def process_zip_file(self, zip_file_path: Path) -> bool:
         """Process a ZIP file with comprehensive error handling.
         
+        JSON members are transformed in memory and written straight into the
+        output archive; all other members, and JSON members without any
+        replacements, are copied as raw compressed bytes.
+        
         Args:
             zip_file_path (Path): Path to the ZIP file to process
             
@@ -537,59 +492,36 @@ class PolicyTranformer:
             
             self.logger.info(f"Processing ZIP file: {zip_file_path}")
             
-            # Create a temporary directory for extraction
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                self.logger.debug(f"Created temporary directory: {temp_path}")
-                
-                # Extract the ZIP file
-                try:
-                    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                        zip_ref.extractall(temp_path)
-                except zipfile.BadZipFile as e:
-                    raise zipfile.BadZipFile(f"Invalid ZIP file {zip_file_path}: {e}")
-                except Exception as e:
-                    raise RuntimeError(f"Failed to extract ZIP file {zip_file_path}: {e}")
-                
-                self.logger.debug(f"Extracted ZIP file to: {temp_path}")
-                
-                # Get all files from the original ZIP to maintain structure
-                try:
-                    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                        original_files = zip_ref.namelist()
-                except Exception as e:
-                    raise RuntimeError(f"Failed to read ZIP file structure {zip_file_path}: {e}")
-                
-                self.logger.info(f"Original ZIP contains {len(original_files)} files")
-                
-                # Find all JSON files in the extracted content
-                json_files = list(temp_path.rglob("*.json"))
-                
-                if not json_files:
-                    self.logger.warning(f"No JSON files found in ZIP: {zip_file_path}")
-                    # Still create the output ZIP with original content
-                    return self._create_output_zip(zip_file_path, temp_path, original_files)
-                
-                self.logger.info(f"Found {len(json_files)} JSON files in ZIP: {zip_file_path}")
-                
-                # Log all JSON files found for debugging
-                for i, json_file in enumerate(json_files, 1):
-                    self.logger.info(f"  JSON file {i}: {json_file.name}")
-                
-                # Process each JSON file
-                successful = 0
-                failed = 0
-                
-                for json_file in json_files:
-                    if self._process_json_file_in_zip(json_file, temp_path):
-                        successful += 1
-                    else:
-                        failed += 1
-                
+            # Create output ZIP filename with "-import-ready" suffix
+            output_zip_path = self.output_dir / (zip_file_path.stem + "-import-ready.zip")
+            self.logger.info(f"Creating output ZIP: {output_zip_path}")
+            
+            successful = 0
+            failed = 0
+            
+            def transform_member(info: zipfile.ZipInfo, content: bytes) -> Optional[bytes]:
+                nonlocal successful, failed
+                self.logger.info(f"  JSON file {successful + failed + 1}: {Path(info.filename).name}")
+                new_content = self._process_json_file_in_zip(info.filename, content)
+                if new_content is None:
+                    failed += 1
+                else:
+                    successful += 1
+                return new_content
+            
+            try:
+                result = rewrite_zip(zip_file_path, output_zip_path, transform_member)
+            except zipfile.BadZipFile as e:
+                raise zipfile.BadZipFile(f"Invalid ZIP file {zip_file_path}: {e}")
+            
+            self.logger.info(f"Original ZIP contains {result.members} files")
+            if successful + failed == 0:
+                self.logger.warning(f"No JSON files found in ZIP: {zip_file_path}")
+            else:
                 self.logger.info(f"ZIP processing complete: {successful} successful, {failed} failed")
-                
-                # Create output ZIP with all files (processed and unprocessed)
-                return self._create_output_zip(zip_file_path, temp_path, original_files)
+            self.logger.info(f"Successfully created ZIP with {result.members} files "
+                             f"({result.rewritten} rewritten, {result.copied} copied unchanged): {output_zip_path}")
+            return True
                 
         except (zipfile.BadZipFile, FileNotFoundError, ValueError, RuntimeError) as e:
             error_msg = f"ZIP processing error for {zip_file_path}: {e}"
@@ -602,32 +534,31 @@ class PolicyTranformer:
             self.stats["errors"].append(error_msg)
             return False
     
-    def _process_json_file_in_zip(self, json_file_path: Path, temp_path: Path) -> bool:
-        """Process a single JSON file within a ZIP extraction.
+    def _process_json_file_in_zip(self, member_name: str, content: bytes) -> Optional[bytes]:
+        """Process the content of a single JSON member of a ZIP file.
         
         Args:
-            json_file_path (Path): Path to the JSON file to process
-            temp_path (Path): Base path of the temporary extraction directory
+            member_name (str): Name of the member inside the ZIP file
+            content (bytes): Member content
             
         Returns:
-            bool: True if successful, False otherwise
+            Optional[bytes]: The new content (the original content if nothing was replaced),
+                or None if the member could not be processed
         """
         try:
             self.stats["files_investigated"] += 1
             self.stats["json_files_processed"] += 1
             
-            self.logger.debug(f"Processing JSON file in ZIP: {json_file_path}")
+            self.logger.debug(f"Processing JSON file in ZIP: {member_name}")
             
-            # Read the JSON file
+            # Decode the JSON content with encoding detection
             try:
-                with open(json_file_path, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
+                data = json.loads(content.decode('utf-8'))
             except UnicodeDecodeError:
-                with open(json_file_path, 'r', encoding='latin-1') as file:
-                    data = json.load(file)
+                data = json.loads(content.decode('latin-1'))
             
             # Process ALL JSON files for asset extraction, not just data_quality_policy_definitions
-            file_name = json_file_path.name
+            file_name = Path(member_name).name
             self.logger.info(f"Processing JSON file in ZIP for asset extraction: {file_name}")
             
             # Extract assets from ALL JSON files (policies, configurations, etc.)
@@ -664,82 +595,25 @@ class PolicyTranformer:
             self.extract_data_quality_assets(data)
             
             # Process the data (existing functionality)
+            changes_before = self.stats["changes_made"]
             modified_data = self.replace_in_value(data)
+            if self.stats["changes_made"] == changes_before:
+                self.logger.debug(f"No replacements in {member_name}, keeping original content")
+                return content
             
-            # Write the modified data back to the same location in temp directory
-            with open(json_file_path, 'w', encoding='utf-8') as file:
-                json.dump(modified_data, file, ensure_ascii=False, separators=(',', ':'))
-            
-            self.logger.debug(f"Successfully processed: {json_file_path}")
-            return True
+            self.logger.debug(f"Successfully processed: {member_name}")
+            return json.dumps(modified_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
             
         except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON in {json_file_path}: {e}"
-            self.logger.error(error_msg)
-            self.stats["errors"].append(error_msg)
-            return False
-        except Exception as e:
-            error_msg = f"Error processing {json_file_path}: {e}"
+            error_msg = f"Invalid JSON in {member_name}: {e}"
             self.logger.error(error_msg)
             self.stats["errors"].append(error_msg)
-            return False
-    
-    def _create_output_zip(self, original_zip_path: Path, temp_path: Path, original_files: List[str]) -> bool:
-        """Create a new ZIP file with the processed content.
-        
-        Args:
-            original_zip_path (Path): Path to the original ZIP file
-            temp_path (Path): Path to the temporary directory with processed files
-            original_files (List[str]): List of file paths from the original ZIP
-            
-        Returns:
-            bool: True if successful, False otherwise
-        """
-        try:
-            # Create output ZIP filename with "-import-ready" suffix
-            zip_name = original_zip_path.stem + "-import-ready.zip"
-            output_zip_path = self.output_dir / zip_name
-            
-            self.logger.info(f"Creating output ZIP: {output_zip_path}")
-            
-            # Create the new ZIP file
-            try:
-                with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
-                    # Add all files from the original ZIP structure
-                    for file_path in original_files:
-                        # Convert ZIP path to filesystem path
-                        fs_path = temp_path / file_path
-                        
-                        if fs_path.exists():
-                            # Add file to ZIP, preserving the original path structure
-                            zip_ref.write(fs_path, file_path)
-                            self.logger.debug(f"Added to ZIP: {file_path}")
-                        else:
-                            self.logger.warning(f"File not found in temp directory: {file_path}")
-            except Exception as e:
-                raise RuntimeError(f"Failed to create ZIP file {output_zip_path}: {e}")
-            
-            # Verify the output ZIP has the same number of files
-            try:
-                with zipfile.ZipFile(output_zip_path, 'r') as zip_ref:
-                    output_files = zip_ref.namelist()
-            except Exception as e:
-                raise RuntimeError(f"Failed to verify output ZIP {output_zip_path}: {e}")
-            
-            if len(output_files) == len(original_files):
-                self.logger.info(f"Successfully created ZIP with {len(output_files)} files: {output_zip_path}")
-                return True
-            else:
-                error_msg = f"File count mismatch: original={len(original_files)}, output={len(output_files)}"
-                self.logger.error(error_msg)
-                self.stats["errors"].append(error_msg)
-                return False
-                
+            return None
         except Exception as e:
-            error_msg = f"Error creating output ZIP {output_zip_path}: {e}"
+            error_msg = f"Error processing {member_name}: {e}"
             self.logger.error(error_msg)
             self.stats["errors"].append(error_msg)
-            return False
+            return None
     
     def process_directory(self) -> Dict[str, Any]:
         """Process all JSON files and ZIP files in the input directory.
@@ -0,0 +1,84 @@
+"""
+Row assembly for asset-config-export.
+
+Each row of ``asset-config-export.csv`` holds four JSON columns: the asset
+configuration, its profile anomaly rules and the assetId -> uid maps of the
+source and target child assets. ``AssetConfigExportRow`` keeps them as the
+parsed API responses while the row is assembled and checked, and
+``to_csv_row`` serializes each column exactly once, so no value is dumped
+and parsed again on its way to the file. With ``--format jsonl`` the row is
+encoded by ``config_record_writer`` instead, which embeds the JSON columns
+as objects.
+"""
+
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO
+
+from ..shared.record_io import FORMAT_CSV, RecordWriter
+
+# Columns of asset-config-export.csv
+CONFIG_EXPORT_HEADER = ['target_uid', 'asset_config_json', 'asset_profile_anomaly_config_json',
+                        'asset_id_to_uid_map_json', 'asset_target_id_to_uid_map_json', 'source_uid']
+CONFIG_EXPORT_JSON_COLUMNS = CONFIG_EXPORT_HEADER[1:5]
+
+
+def config_record_writer(stream: Optional[TextIO], record_format: str = FORMAT_CSV) -> RecordWriter:
+    """Create a record writer for asset-config-export rows.
+
+    Args:
+        stream: Output text stream, or None to only encode rows
+        record_format: FORMAT_CSV or FORMAT_JSONL
+
+    Returns:
+        RecordWriter that accepts AssetConfigExportRow values as rows
+    """
+    return RecordWriter(stream, CONFIG_EXPORT_HEADER, CONFIG_EXPORT_JSON_COLUMNS, record_format)
+
+
+def child_asset_uid_map(child_assets_response: Dict[str, Any]) -> Dict[Any, str]:
+    """Build the assetId -> uid map of a childAssets response.
+
+    Args:
+        child_assets_response: Response of GET /assets/{id}/childAssets
+
+    Returns:
+        Dictionary of child assetId -> uid
+    """
+    return {item["assetId"]: item["uid"] for item in child_assets_response["childAssets"]}
+
+
+def _to_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+class AssetConfigExportRow(NamedTuple):
+    """One asset of asset-config-export, with its JSON columns still parsed."""
+    target_uid: str
+    asset_config: Any
+    profile_anomaly_config: Any
+    asset_id_to_uid_map: Dict[Any, str]
+    target_asset_id_to_uid_map: Dict[Any, str]
+    source_uid: str
+
+    def validate(self) -> List[str]:
+        """Check the row the way the exported file used to be checked after writing.
+
+        Returns:
+            List of problems, empty if the row is valid
+        """
+        errors = []
+        if not self.target_uid.strip():
+            errors.append("Empty target_uid value")
+        columns = zip(CONFIG_EXPORT_JSON_COLUMNS, (self.asset_config, self.profile_anomaly_config,
+                                                  self.asset_id_to_uid_map, self.target_asset_id_to_uid_map))
+        for column, value in columns:
+            if not isinstance(value, dict):
+                errors.append(f"{column} is not a valid JSON object")
+            elif not value:
+                errors.append(f"{column} is empty")
+        return errors
+
+    def to_csv_row(self) -> List[str]:
+        """Serialize the row, writing each JSON column once in compact form."""
+        return [self.target_uid, _to_json(self.asset_config), _to_json(self.profile_anomaly_config),
+                _to_json(self.asset_id_to_uid_map), _to_json(self.target_asset_id_to_uid_map), self.source_uid]
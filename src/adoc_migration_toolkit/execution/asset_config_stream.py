@@ -0,0 +1,140 @@
+"""
+Streaming reader for asset-config-import input files.
+
+``asset-config-import-ready.csv`` holds one multi-megabyte ``config_json``
+blob per asset and can grow to several gigabytes, so asset-config-import no
+longer loads it into memory. The file is read twice instead:
+
+1. ``scan_asset_config_csv`` builds a small index (row number, target UID,
+   source UID and, optionally, the kind of configuration) without keeping
+   any JSON.
+2. ``iter_asset_config_rows`` yields the selected rows one at a time while
+   they are imported.
+
+Only rows whose target UID occurs more than once are loaded in full, so they
+can be shown for interactive duplicate resolution.
+
+JSON Lines input files are read the same way; their config_json objects are
+handed on as JSON text, like the CSV column.
+"""
+
+import itertools
+import json
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
+
+from ..shared.record_io import FORMAT_CSV, open_records
+
+# Kinds of configuration reported by the import analysis
+CONFIG_CUSTOM = 'custom'      # assetConfiguration is set
+CONFIG_NULL = 'null'          # assetConfiguration is null (default configuration)
+CONFIG_MISSING = 'missing'    # No assetConfiguration field
+CONFIG_INVALID = 'invalid'    # config_json is not valid JSON
+
+
+class AssetConfigRowInfo(NamedTuple):
+    """Index entry for one row of an asset config CSV file."""
+    row_number: int
+    target_uid: str
+    source_uid: str
+    config_kind: Optional[str]
+
+
+def classify_asset_config(config_json: str) -> str:
+    """Get the kind of configuration held by a config_json value.
+
+    Args:
+        config_json: JSON string from the config_json column
+
+    Returns:
+        One of CONFIG_CUSTOM, CONFIG_NULL, CONFIG_MISSING or CONFIG_INVALID
+    """
+    try:
+        config_data = json.loads(config_json)
+    except (json.JSONDecodeError, TypeError):
+        return CONFIG_INVALID
+    if not isinstance(config_data, dict) or "assetConfiguration" not in config_data:
+        return CONFIG_MISSING
+    return CONFIG_CUSTOM if config_data["assetConfiguration"] is not None else CONFIG_NULL
+
+
+def _is_header(row: List[str]) -> bool:
+    """Check whether the first row of the file is a header rather than data."""
+    if len(row) < 6:
+        return True
+    return ('target_uid' in row[0].lower() or 'asset_config_json' in row[1].lower()
+            or 'source_uid' in row[5].lower() or not (row[0].strip() and row[1].strip()))
+
+
+def iter_asset_config_rows(csv_file: str, row_numbers: Optional[Set[int]] = None) -> Iterator[Dict[str, str]]:
+    """Yield asset config rows one at a time.
+
+    Supports the 6-column export format (target_uid, asset_config_json, ...,
+    source_uid), the 3-column format (target_uid, config_json, source_uid)
+    and the legacy 2-column format without source UIDs, as CSV or JSON Lines.
+
+    Args:
+        csv_file: Path to the CSV or JSON Lines file
+        row_numbers: Only yield these rows (1-based numbers of the CSV records or JSON lines)
+
+    Yields:
+        Dictionaries with row_number, target_uid, config_json and source_uid
+    """
+    with open_records(csv_file) as reader:
+        is_csv = reader.record_format == FORMAT_CSV
+        # CSV files may have no header, so the first row is checked like any other
+        rows = itertools.chain([reader.header], reader) if is_csv else reader
+        for row_number, row in enumerate(rows, start=1):
+            if is_csv and row_number == 1 and _is_header(row):
+                continue
+            if row_numbers is not None and row_number not in row_numbers:
+                continue
+            if len(row) >= 6:
+                source_uid = row[5].strip()
+            elif len(row) >= 3:
+                source_uid = row[2].strip()
+            elif len(row) == 2:
+                source_uid = 'Unknown'
+            else:
+                continue
+            target_uid = row[0].strip()
+            config_json = row[1].strip() if is_csv else reader.text(row[1])
+            if not target_uid or not config_json:
+                continue
+            yield {
+                'row_number': row_number,
+                'target_uid': target_uid,
+                'config_json': config_json,
+                'source_uid': source_uid
+            }
+
+
+def scan_asset_config_csv(csv_file: str, classify: bool = False) -> List[AssetConfigRowInfo]:
+    """Index an asset config CSV file without keeping the JSON values.
+
+    Args:
+        csv_file: Path to the CSV or JSON Lines file
+        classify: Also record the kind of configuration of each row (parses every config_json)
+
+    Returns:
+        List of AssetConfigRowInfo in file order
+    """
+    return [
+        AssetConfigRowInfo(asset['row_number'], asset['target_uid'], asset['source_uid'],
+                           classify_asset_config(asset['config_json']) if classify else None)
+        for asset in iter_asset_config_rows(csv_file)
+    ]
+
+
+def find_duplicate_rows(index: List[AssetConfigRowInfo]) -> Dict[str, List[int]]:
+    """Get the row numbers of target UIDs that occur more than once.
+
+    Args:
+        index: Index from scan_asset_config_csv()
+
+    Returns:
+        Dictionary mapping target UID to its row numbers, empty if there are no duplicates
+    """
+    rows_by_uid: Dict[str, List[int]] = {}
+    for info in index:
+        rows_by_uid.setdefault(info.target_uid, []).append(info.row_number)
+    return {uid: rows for uid, rows in rows_by_uid.items() if len(rows) > 1}
@@ -10,19 +10,43 @@ import json
 import logging
 import sys
 import threading
-import tempfile
-import os
-import re
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from adoc_migration_toolkit.execution.utils import create_progress_bar, read_csv_uids, read_csv_uids_single_column, read_csv_asset_data, get_thread_names
+from adoc_migration_toolkit.execution.utils import create_progress_bar, read_csv_uids, read_csv_uids_single_column, read_csv_asset_data, get_thread_names, get_thread_client
 from ..shared.file_utils import get_output_file_path
 from ..shared import globals
+from ..shared.api_client import DEFAULT_MAX_CONCURRENCY
 from .utils import get_source_to_target_asset_id_map
+from .work_queue import WorkQueue, SubRequestPool, run_work_queue
+from .string_transforms import StringTransformEngine
+from .asset_resolver import TargetAssetResolver
+from .checkpoint import CheckpointJournal
+from ..shared.sorted_runs import SortedRunWriter, merge_sorted_runs, remove_runs
+from ..shared.record_io import (
+    FORMAT_CSV, FORMAT_JSONL, RecordWriter, open_records, record_file_path, resolve_record_file
+)
+from .asset_config_rows import AssetConfigExportRow, CONFIG_EXPORT_HEADER, child_asset_uid_map, config_record_writer
+from .asset_config_stream import (
+    AssetConfigRowInfo, CONFIG_CUSTOM, CONFIG_NULL, CONFIG_MISSING, CONFIG_INVALID,
+    find_duplicate_rows, iter_asset_config_rows, scan_asset_config_csv
+)
+
+# Columns of asset-profile-export output; profile_json holds the profile configuration
+PROFILE_EXPORT_COLUMNS = ['target-env', 'profile_json', 'source-env']
+PROFILE_JSON_COLUMNS = ('profile_json',)
+# Separators of json.dumps defaults, which profile CSV files have always used
+PROFILE_JSON_SEPARATORS = (', ', ': ')
+
+
+def profile_record_writer(stream, record_format: str = FORMAT_CSV) -> RecordWriter:
+    """Create a record writer for asset-profile-export output."""
+    return RecordWriter(stream, PROFILE_EXPORT_COLUMNS, PROFILE_JSON_COLUMNS, record_format,
+                        json_separators=PROFILE_JSON_SEPARATORS)
 
 
 
@@ -184,7 +208,7 @@ def execute_asset_profile_export_guided(
         return False, error_msg
 
 
-def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False, verbose_mode: bool = False, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic'], source_context_id: str = None, target_context_id: str = None):
+def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False, verbose_mode: bool = False, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic'], source_context_id: str = None, target_context_id: str = None, record_format: str = FORMAT_CSV):
     """Execute the asset-profile-export command.
     
     Args:
@@ -197,6 +221,7 @@ def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger,
         allowed_types: List of asset types to export
         source_context_id: Source context ID for notification mapping (optional)
         target_context_id: Target context ID for notification mapping (optional)
+        record_format: Output format, FORMAT_CSV or FORMAT_JSONL
     """
     try:
         # Check if CSV file exists
@@ -251,7 +276,8 @@ def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger,
         
         # Generate default output file if not provided - use asset-import category
         if not output_file:
-            output_file = get_output_file_path(csv_file, "asset-profiles-import-ready.csv", category="asset-import")
+            output_file = str(record_file_path(
+                get_output_file_path(csv_file, "asset-profiles-import-ready.csv", category="asset-import"), record_format))
         
         if not quiet_mode:
             print(f"\nProcessing {len(env_mappings)} asset profile exports from CSV file: {csv_file}")
@@ -281,10 +307,10 @@ def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger,
         )
         
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer = profile_record_writer(f, record_format)
             
             # Write header - include source-env for duplicate resolution
-            writer.writerow(['target-env', 'profile_json', 'source-env'])
+            writer.write_header()
             
             for i, (source_env, target_env) in enumerate(env_mappings, 1):
                 if verbose_mode:
@@ -352,9 +378,8 @@ def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger,
                             profile_response, notification_id_mapping, quiet_mode, verbose_mode
                         )
                     
-                    # Step 4: Write to CSV - include source-env for duplicate resolution
-                    profile_json = json.dumps(profile_response, ensure_ascii=False)
-                    writer.writerow([target_env, profile_json, source_env])
+                    # Step 4: Write the record - include source-env for duplicate resolution
+                    writer.write([target_env, profile_response, source_env])
                     
                     if verbose_mode:
                         print(f"✅ Written to file: {target_env}")
@@ -400,11 +425,14 @@ def execute_asset_profile_export(csv_file: str, client, logger: logging.Logger,
         return False, error_msg
 
 
-def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger, dry_run: bool = False, quiet_mode: bool = True, verbose_mode: bool = False, max_threads: int = 5, notification_mapping_csv: str = None, interactive_duplicate_resolution: bool = True):
-    """Execute the asset-profile-import command with parallel processing."""
-    import threading
+def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger, dry_run: bool = False, quiet_mode: bool = True, verbose_mode: bool = False, max_threads: int = 5, notification_mapping_csv: str = None, interactive_duplicate_resolution: bool = True, resume: bool = False):
+    """Execute the asset-profile-import command with parallel processing.
+
+    With resume=True, target assets imported by an earlier interrupted run are skipped.
+    """
     try:
-        # Check if CSV file exists
+        # Check if the CSV (or JSON Lines) file exists
+        csv_file = str(resolve_record_file(csv_file))
         csv_path = Path(csv_file)
         if not csv_path.exists():
             error_msg = f"CSV file does not exist: {csv_file}"
@@ -459,11 +487,10 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
                 print("🔊 VERBOSE MODE - Detailed output including headers and responses")
             print("="*80)
         
-        # Read CSV file
+        # Read CSV or JSON Lines file
         import_mappings = []
-        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        with open_records(csv_file) as reader:
+            header = reader.header
             # Support both old format (2 columns) and new format (3 columns with source-env)
             if len(header) < 2 or header[0] != 'target-env' or header[1] != 'profile_json':
                 error_msg = f"Invalid CSV format. Expected header: ['target-env', 'profile_json'] or ['target-env', 'profile_json', 'source-env'], got: {header}"
@@ -474,10 +501,11 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
             
             # Check if we have the new format with source-env column
             has_source_env = len(header) >= 3 and header[2] == 'source-env'
+            format_name = 'JSON Lines' if reader.record_format == FORMAT_JSONL else 'CSV'
             if not quiet_mode and has_source_env:
-                print(f"📋 Detected CSV format with source-env column (new format)")
+                print(f"📋 Detected {format_name} format with source-env column (new format)")
             elif not quiet_mode:
-                print(f"📋 Detected CSV format without source-env column (legacy format)")
+                print(f"📋 Detected {format_name} format without source-env column (legacy format)")
             for row_num, row in enumerate(reader, start=2):
                 # Handle both 2-column and 3-column formats
                 if len(row) < 2:
@@ -485,7 +513,7 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
                     continue
                 
                 target_env = row[0].strip()
-                profile_json = row[1].strip()
+                profile_json = row[1].strip() if reader.record_format == FORMAT_CSV else row[1]
                 
                 if not target_env or not profile_json:
                     logger.warning(f"Row {row_num}: Empty target-env or profile_json value")
@@ -500,94 +528,66 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
             logger.warning("No valid import mappings found in CSV file")
             return
         logger.info(f"Read {len(import_mappings)} import mappings from CSV file: {csv_file}")
+
+        # Dry runs change nothing, so they neither skip nor record completed assets
+        journal = None if dry_run else CheckpointJournal(csv_file, "asset-profile-import", resume=resume, logger=logger)
+        if journal and journal.resumed:
+            total_mappings = len(import_mappings)
+            import_mappings = [m for m in import_mappings if not journal.is_done(m[0])]
+            if not quiet_mode:
+                print(f"⏩ Resuming: {total_mappings - len(import_mappings)} of {total_mappings} assets already imported")
  
         # Threading setup
-        num_threads = max_threads
         min_assets_per_thread = 10
         if len(import_mappings) < min_assets_per_thread:
             num_threads = 1
-            assets_per_thread = len(import_mappings)
         else:
             num_threads = min(max_threads, (len(import_mappings) + min_assets_per_thread - 1) // min_assets_per_thread)
-            assets_per_thread = (len(import_mappings) + num_threads - 1) // num_threads
 
         if not quiet_mode:
             print(f"Using {num_threads} threads to process {len(import_mappings)} imports")
-            print(f"Assets per thread: {assets_per_thread}")
             print("="*80)
         
         thread_names = get_thread_names()
         
-        thread_results = []
-        def process_chunk(thread_id, chunk):
+        # Workers pull mappings from a shared queue so slow assets do not stall a whole slice
+        progress_bar = create_progress_bar(
+            total=len(import_mappings),
+            desc="Importing profiles",
+            unit="assets",
+            disable=quiet_mode
+        )
+        work_queue = WorkQueue(import_mappings, progress_bar)
+        resolver = TargetAssetResolver.for_import(client, logger)
+        if not dry_run:
+            resolver.prefetch((target_env for target_env, _ in import_mappings), num_threads)
+
+        def process_chunk(thread_id):
             thread_successful = 0
             thread_failed = 0
             thread_name = thread_names[thread_id] if thread_id < len(thread_names) else f"Thread {thread_id}"
-            progress_bar = create_progress_bar(
-                total=len(chunk),
-                desc=thread_name,
-                unit="assets",
-                disable=quiet_mode,
-                position=thread_id,
-                leave=False
-            )
 
-            for i, (target_env, profile_json) in enumerate(chunk):
+            for target_env, profile_json in work_queue.consume():
                 try:
                     if not quiet_mode and verbose_mode:
                         print(f"[Thread {thread_name}] Processing target-env: {target_env}")
                     if not dry_run:
-                        asset_response = client.make_api_call(
-                            endpoint=f"/catalog-server/api/assets?uid={target_env}",
-                            method='GET',
-                            use_target_auth=True,
-                            use_target_tenant=True
-                        )
+                        asset_id = resolver.resolve(target_env)
                     else:
-                        asset_response = {
-                            "data": [
-                                {
-                                    "id": 12345,
-                                    "name": "MOCK_ASSET",
-                                    "uid": target_env
-                                }
-                            ]
-                        }
+                        asset_id = 12345
                         if not quiet_mode:
                             print(f"[Thread {thread_name}] DRY RUN - Would get asset details for UID: {target_env}")
-                    if verbose_mode and not dry_run:
-                        print(f"[Thread {thread_name}] Asset Response: {json.dumps(asset_response, indent=2, ensure_ascii=False)}")
-                    if not asset_response or 'data' not in asset_response:
-                        error_msg = f"No 'data' field found in asset response for UID: {target_env}"
-                        if not quiet_mode:
-                            print(f"❌ [Thread {thread_name}] {target_env}: {error_msg}")
-                        logger.error(error_msg)
-                        thread_failed += 1
-                        progress_bar.update(1)
-                        continue
-                    data_array = asset_response['data']
-                    if not data_array or len(data_array) == 0:
-                        error_msg = f"Empty 'data' array in asset response for UID: {target_env}"
+                    if asset_id is None:
+                        error_msg = f"No target asset found for UID: {target_env}"
                         if not quiet_mode:
                             print(f"❌ [Thread {thread_name}] {target_env}: {error_msg}")
                         logger.error(error_msg)
                         thread_failed += 1
-                        progress_bar.update(1)
                         continue
-                    first_asset = data_array[0]
-                    if 'id' not in first_asset:
-                        error_msg = f"No 'id' field found in first asset for UID: {target_env}"
-                        if not quiet_mode:
-                            print(f"❌ [Thread {thread_name}] {target_env}: {error_msg}")
-                        logger.error(error_msg)
-                        thread_failed += 1
-                        progress_bar.update(1)
-                        continue
-                    asset_id = first_asset['id']
                     if not quiet_mode:
                         print(f"[Thread {thread_name}] Extracted asset ID: {asset_id}")
                     try:
-                        profile_data = json.loads(profile_json)
+                        profile_data = reader.json(profile_json)
                         
                         # Transform profile configuration if notification mapping is available
                         if notification_id_mapping:
@@ -601,18 +601,17 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
                             print(f"❌ [Thread {thread_name}] {target_env}: {error_msg}")
                         logger.error(error_msg)
                         thread_failed += 1
-                        progress_bar.update(1)
                         continue
                     if not quiet_mode:
                         print(f"[Thread {thread_name}] Updating profile configuration for asset ID: {asset_id}")
                     if not dry_run:
-                        import_response = client.make_api_call(
+                        asset_id, import_response = resolver.retry_stale(target_env, asset_id, lambda asset_id: client.make_api_call(
                             endpoint=f"/catalog-server/api/profile/{asset_id}/config",
                             method='PUT',
                             json_payload=profile_data,
                             use_target_auth=True,
                             use_target_tenant=True
-                        )
+                        ))
                         if verbose_mode:
                             print(f"[Thread {thread_name}] Import Response: {json.dumps(import_response, indent=2, ensure_ascii=False)}")
                         if not quiet_mode:
@@ -621,7 +620,8 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
                         if not quiet_mode:
                             print(f"[Thread {thread_name}] DRY RUN - Would update profile for asset {asset_id}")
                     thread_successful += 1
-                    progress_bar.update(1)
+                    if journal:
+                        journal.record(target_env)
                     logger.info(f"Successfully processed target-env {target_env} (asset ID: {asset_id})")
                 except Exception as e:
                     error_msg = f"Failed to process UID {target_env}: {e}"
@@ -629,10 +629,8 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
                         print(f"❌ [Thread {thread_name}] {target_env}: {error_msg}")
                     logger.error(error_msg)
                     thread_failed += 1
-                    progress_bar.update(1)
 
-            progress_bar.close()       
-            print(f"Thread {thread_name} completed")
+            logger.debug(f"Thread {thread_name} completed")
 
             return {
                 'thread_id': thread_id,
@@ -640,43 +638,16 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
                 'failed': thread_failed
             }
         
-        # Split import_mappings into chunks
-        threads = []
-        
-        for i in range(num_threads):
-            start_index = i * assets_per_thread
-            end_index = min(start_index + assets_per_thread, len(import_mappings))
-            chunk = import_mappings[start_index:end_index]
-            t = threading.Thread(target=process_chunk, args=(i, chunk))
-            threads.append(t)
-            t.start()
-        for t in threads:
-            t.join()
-
-                # Execute parallel processing
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            # Submit tasks for each thread
-            futures = []
-            for thread_id in range(num_threads):
-                start_index = thread_id * assets_per_thread
-                end_index = min(start_index + assets_per_thread, len(import_mappings))
-                
-                if start_index < len(import_mappings):  # Only submit if there are pages to process
-                    future = executor.submit(process_chunk, thread_id, chunk)
-                    futures.append(future)
-            
-            # Collect results
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    thread_results.append(result)
-                except Exception as e:
-                    logger.error(f"Thread failed with exception: {e}")
-        
+        # Execute parallel processing
+        thread_results = run_work_queue(work_queue, process_chunk, num_threads, logger)
+        progress_bar.close()
+        resolver.save()
+        logger.info(resolver.format_stats())
 
-        print("thread_results", thread_results)
         total_successful = sum(r['successful'] for r in thread_results)
         total_failed = sum(r['failed'] for r in thread_results)
+        if journal:
+            journal.finish(failed=total_failed)
 
         if not quiet_mode:
             print("\n" + "="*80)
@@ -693,6 +664,8 @@ def execute_asset_profile_import(csv_file: str, client, logger: logging.Logger,
             for result in thread_results:
                 thread_name = thread_names[result['thread_id']] if result['thread_id'] < len(thread_names) else f"Thread {result['thread_id']}"
                 print(f"  {thread_name}: {result['successful']} successful, {result['failed']} failed")
+            print(f"\n{work_queue.format_latency_stats()}")
+            print(resolver.format_stats())
 
             print("="*80)
         else:
@@ -921,7 +894,42 @@ def execute_asset_config_export(csv_file: str, client, logger: logging.Logger, o
         logger.error(error_msg)
 
 
-def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, parallel_mode: bool = False, dry_run: bool = False, max_threads: int = 1):
+def _resolve_duplicate_asset_config_rows(csv_file: str, asset_index: List[AssetConfigRowInfo], quiet_mode: bool = False,
+                                        verbose_mode: bool = False) -> Optional[List[AssetConfigRowInfo]]:
+    """Resolve target UIDs that occur in more than one row of an asset config CSV file.
+
+    Only the duplicated rows are loaded in full, so the user can pick one configuration per target UID.
+
+    Args:
+        csv_file: Path to the CSV file
+        asset_index: Index from scan_asset_config_csv()
+        quiet_mode: Whether to suppress output
+        verbose_mode: Whether to enable verbose logging
+
+    Returns:
+        Index entries to import, or None if the user cancelled
+    """
+    duplicate_rows = find_duplicate_rows(asset_index)
+    if not duplicate_rows:
+        return asset_index
+    if not quiet_mode:
+        print("🔍 Resolving duplicates interactively...")
+
+    row_numbers = {row for rows in duplicate_rows.values() for row in rows}
+    duplicate_assets = list(iter_asset_config_rows(csv_file, row_numbers))
+    resolved_assets = resolve_duplicates_interactively(
+        duplicate_assets, check_for_duplicates_in_asset_data(duplicate_assets), quiet_mode, verbose_mode)
+    if resolved_assets is None:
+        return None
+
+    dropped_rows = row_numbers - {asset['row_number'] for asset in resolved_assets}
+    asset_index = [info for info in asset_index if info.row_number not in dropped_rows]
+    if not quiet_mode:
+        print(f"✅ Duplicate resolution completed. Processing {len(asset_index)} unique configurations")
+    return asset_index
+
+
+def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, parallel_mode: bool = False, dry_run: bool = False, max_threads: int = 1, resume: bool = False):
     """Execute the asset-config-import command.
     
     Args:
@@ -932,13 +940,16 @@ def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, q
         verbose_mode: Whether to enable verbose logging
         parallel_mode: Whether to use parallel processing
         dry_run: If True, print the request and payload instead of making the API call
+        resume: Skip assets imported by an earlier interrupted run (see checkpoint.py)
     """
     if parallel_mode:
-        execute_asset_config_import_parallel(csv_file, client, logger, quiet_mode, verbose_mode, dry_run, max_threads)
+        execute_asset_config_import_parallel(csv_file, client, logger, quiet_mode, verbose_mode, dry_run, max_threads,
+                                             resume=resume)
         return
     
     try:
-        # Check if CSV file exists
+        # Check if the CSV (or JSON Lines) file exists
+        csv_file = str(resolve_record_file(csv_file))
         csv_path = Path(csv_file)
         if not csv_path.exists():
             error_msg = f"CSV file does not exist: {csv_file}"
@@ -951,100 +962,54 @@ def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, q
             logger.error(error_msg)
             return
         
-        # Read CSV data
-        asset_data = []
-        csv.field_size_limit(sys.maxsize)  # Handle large JSON fields
-        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            # Skip header row if it exists
-            header = next(reader, None)
-            if header and len(header) >= 6:
-                if 'target_uid' in header[0].lower() or 'asset_config_json' in header[1].lower() or 'source_uid' in header[5].lower():
-                    pass  # This is a header row, skip
-                else:
-                    # This might be data, add it back
-                    if header[0].strip() and header[1].strip():
-                        asset_data.append({
-                            'target_uid': header[0].strip(),
-                            'config_json': header[1].strip(),
-                            'source_uid': header[5].strip() if len(header) > 5 else 'Unknown'
-                        })
-            for row in reader:
-                if len(row) >= 6:  # Ensure we have all 6 columns
-                    target_uid = row[0].strip()
-                    config_json = row[1].strip()  # asset_config_json column
-                    source_uid = row[5].strip()  # source_uid column (6th column)
-                    if target_uid and config_json:  # Skip empty rows
-                        asset_data.append({
-                            'target_uid': target_uid,
-                            'config_json': config_json,
-                            'source_uid': source_uid
-                        })
-                elif len(row) >= 3:  # Fallback for 3-column format
-                    target_uid = row[0].strip()
-                    config_json = row[1].strip()
-                    source_uid = row[2].strip() if len(row) > 2 else 'Unknown'
-                    if target_uid and config_json:  # Skip empty rows
-                        asset_data.append({
-                            'target_uid': target_uid,
-                            'config_json': config_json,
-                            'source_uid': source_uid
-                        })
-        
-        if not asset_data:
+        # Index the file; config_json values are streamed from disk while importing
+        asset_index = scan_asset_config_csv(csv_file)
+        if not asset_index:
             print("❌ No valid asset data found in CSV file")
             logger.warning("No valid asset data found in CSV file")
             return
         
         if not quiet_mode:
-            print(f"📊 Found {len(asset_data)} assets to process")
+            print(f"📊 Found {len(asset_index)} assets to process")
         
         # Check for and resolve duplicates before processing
-        duplicates_found = check_for_duplicates_in_asset_data(asset_data)
-        if duplicates_found:
+        asset_index = _resolve_duplicate_asset_config_rows(csv_file, asset_index, quiet_mode, verbose_mode)
+        if asset_index is None:
+            print("❌ Duplicate resolution was cancelled by user")
+            return
+        
+        # Dry runs change nothing, so they neither skip nor record completed assets
+        journal = None if dry_run else CheckpointJournal(csv_file, "asset-config-import", resume=resume, logger=logger)
+        if journal and journal.resumed:
+            total_assets = len(asset_index)
+            asset_index = [info for info in asset_index if not journal.is_done(info.target_uid)]
             if not quiet_mode:
-                print("🔍 Resolving duplicates interactively...")
-            
-            # Resolve duplicates interactively
-            resolved_asset_data = resolve_duplicates_interactively(asset_data, duplicates_found, quiet_mode, verbose_mode)
-            if resolved_asset_data is None:
-                print("❌ Duplicate resolution was cancelled by user")
-                return
-            else:
-                asset_data = resolved_asset_data
-                if not quiet_mode:
-                    print(f"✅ Duplicate resolution completed. Processing {len(asset_data)} unique configurations")
+                print(f"⏩ Resuming: {total_assets - len(asset_index)} of {total_assets} assets already imported")
+        total_assets = len(asset_index)
         
         # Create progress bar if in quiet mode
         if quiet_mode and not verbose_mode:
-            pbar = tqdm(total=len(asset_data), desc="Processing assets", colour='green')
+            pbar = tqdm(total=total_assets, desc="Processing assets", colour='green')
         
         successful = 0
         failed = 0
         failed_assets = []
+        resolver = TargetAssetResolver.for_import(client, logger)
+        resolver.prefetch((info.target_uid for info in asset_index), max_threads)
         
-        for i, asset in enumerate(asset_data):
+        asset_rows = iter_asset_config_rows(csv_file, {info.row_number for info in asset_index})
+        for i, asset in enumerate(asset_rows):
             target_uid = asset['target_uid']
             config_json = asset['config_json']
             
             try:
                 # Step 1: Get asset ID from target_uid
                 if verbose_mode:
-                    print(f"\n🔍 Processing asset {i+1}/{len(asset_data)}: {target_uid}")
+                    print(f"\n🔍 Processing asset {i+1}/{total_assets}: {target_uid}")
                     print(f"   GET /catalog-server/api/assets?uid={target_uid}")
                 
-                # Make GET request to get asset ID
-                response = client.make_api_call(
-                    endpoint=f'/catalog-server/api/assets?uid={target_uid}',
-                    method='GET',
-                    use_target_auth=True,
-                    use_target_tenant=True
-                )
-                
-                if verbose_mode:
-                    print(f"   Response: {response}")
-                
-                if not response or 'data' not in response or not response['data']:
+                asset_id = resolver.resolve(target_uid)
+                if asset_id is None:
                     error_msg = f"No asset found for UID: {target_uid}"
                     if verbose_mode:
                         print(f"   ❌ {error_msg}")
@@ -1052,9 +1017,6 @@ def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, q
                     failed_assets.append({'target_uid': target_uid, 'error': error_msg})
                     continue
                 
-                # Extract asset ID
-                asset_id = response['data'][0]['id']
-                
                 if verbose_mode:
                     print(f"   Asset ID: {asset_id}")
                     print(f"   PUT /catalog-server/api/assets/{asset_id}/config")
@@ -1071,19 +1033,20 @@ def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, q
                     successful += 1
                     continue
                 
-                config_response = client.make_api_call(
+                asset_id, config_response = resolver.retry_stale(target_uid, asset_id, lambda asset_id: client.make_api_call(
                     endpoint=f'/catalog-server/api/assets/{asset_id}/config',
                     method='PUT',
-                    json_payload=transformed_config,
+                    json_payload=transform_config_json_to_asset_configuration(config_data, asset_id),
                     use_target_auth=True,
                     use_target_tenant=True
-                )
+                ))
                 
                 if verbose_mode:
                     print(f"   Config Response: {config_response}")
                 
                 if config_response:
                     successful += 1
+                    journal.record(target_uid)
                     if verbose_mode:
                         print(f"   ✅ Successfully updated config for {target_uid}")
                 else:
@@ -1107,6 +1070,10 @@ def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, q
         # Close progress bar
         if quiet_mode and not verbose_mode:
             pbar.close()
+        resolver.save()
+        logger.info(resolver.format_stats())
+        if journal:
+            journal.finish(failed=failed)
         
         # Print summary
         if not quiet_mode:
@@ -1115,9 +1082,10 @@ def execute_asset_config_import(csv_file: str, client, logger: logging.Logger, q
             print("="*80)
             if dry_run:
                 print("🔍 DRY RUN MODE - No actual changes were made")
-            print(f"Total mappings processed: {len(asset_data)}")
+            print(f"Total mappings processed: {total_assets}")
             print(f"Successful: {successful}")
             print(f"Failed: {failed}")
+            print(resolver.format_stats())
             print("="*80)
         else:
             print(f"✅ Asset config import completed: {successful} successful, {failed} failed")
@@ -1416,6 +1384,84 @@ def execute_asset_list_export(client, logger: logging.Logger, source_type_ids: s
         logger.error(error_msg)
 
 
+def asset_list_sort_key(row: List[str]) -> Tuple[str, int, str]:
+    """Sort key of asset-list-export rows: source_uid, then numeric source_id.
+
+    Non-numeric IDs sort as 0, as they always have; the raw ID breaks ties so
+    the order does not depend on the order rows were exported in.
+    """
+    source_uid = row[0] if len(row) > 0 else ''
+    source_id = row[1] if len(row) > 1 else ''
+    try:
+        source_id_int = int(source_id) if source_id else 0
+    except (ValueError, TypeError):
+        source_id_int = 0
+    return (source_uid, source_id_int, source_id)
+
+
+def asset_list_dedup_key(row: List[str]) -> str:
+    """Deduplication key of asset-list-export rows: the source assetId."""
+    return row[1] if len(row) > 1 else ''
+
+
+def write_asset_list_export(runs: List[str], output_file: Path, duplicates_file: Path,
+                            verbose_mode: bool = False) -> Tuple[int, int, int]:
+    """Write the asset-list-export output from sorted runs of exported rows.
+    
+    The runs must be sorted by asset_list_dedup_key. Only the first row of each
+    assetId is kept; later copies go to the duplicates file. The kept rows are
+    sorted again by asset_list_sort_key, also on disk, and written to the output.
+    The run files are removed.
+    
+    Args:
+        runs: Run files sorted by asset_list_dedup_key; duplicates are resolved in this order
+        output_file: Path of the output CSV file
+        duplicates_file: Path of the CSV file for duplicate rows
+        verbose_mode: Whether to print every duplicate
+        
+    Returns:
+        Tuple of (rows processed, unique rows written, duplicates removed)
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    header = ['source_uid', 'source_id', 'target_uid', 'tags', 'assembly_id', 'asset_type']
+    unique_runs = SortedRunWriter(asset_list_sort_key)
+    total_processed = 0
+    unique_count = 0
+    duplicate_count = 0
+    previous_asset_id = None
+    try:
+        # Rows with the same assetId are adjacent after the merge
+        with open(duplicates_file, 'w', newline='', encoding='utf-8') as duplicates_f:
+            duplicates_writer = csv.writer(duplicates_f, quoting=csv.QUOTE_ALL)
+            duplicates_writer.writerow(header + ['duplicate_reason'])
+            for row in merge_sorted_runs(runs, asset_list_dedup_key):
+                total_processed += 1
+                if len(row) < 2:  # Ensure we have at least source_uid and source_id
+                    continue
+                asset_id = asset_list_dedup_key(row)
+                if asset_id == previous_asset_id:
+                    duplicate_count += 1
+                    # Save duplicate to separate file with reason
+                    duplicates_writer.writerow(row + ['Duplicate assetId found in multiple pages/threads'])
+                    if verbose_mode:
+                        print(f"🔄 Duplicate asset found: {row[0]} (ID: {row[1]})")
+                    continue
+                previous_asset_id = asset_id
+                unique_count += 1
+                unique_runs.add(row)
+        
+        # Sort by source_uid, then source_id
+        with open(output_file, 'w', newline='', encoding='utf-8') as output_f:
+            writer = csv.writer(output_f, quoting=csv.QUOTE_ALL)
+            writer.writerow(header)
+            writer.writerows(merge_sorted_runs(unique_runs.close(), asset_list_sort_key))
+    finally:
+        # Clean up run files
+        remove_runs(runs)
+        remove_runs(unique_runs.runs)
+    return total_processed, unique_count, duplicate_count
+
+
 def execute_asset_list_export_parallel(client, logger: logging.Logger, source_type_ids: str = None, asset_type_ids: str = None, assembly_ids: str = None, quiet_mode: bool = False, verbose_mode: bool = False, use_target: bool = False, page_size: int = 100, max_threads: int = 5):
     """Execute the asset-list-export command with parallel processing.
     Args:
@@ -1526,7 +1572,6 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
         
         # Process pages in parallel
         thread_results = []
-        temp_files = []
         
         # Funny thread names for progress indicators (all same length)
         thread_names = get_thread_names()
@@ -1534,23 +1579,10 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
         def process_page_chunk(thread_id, start_page, end_page):
             """Process a chunk of pages for a specific thread."""
             # Create a thread-local client instance
-            thread_client = type(client)(
-                host=client.host,
-                access_key=client.access_key,
-                secret_key=client.secret_key,
-                tenant=getattr(client, 'tenant', None)
-            )
-            # Copy target credentials to thread client
-            thread_client.target_access_key = getattr(client, 'target_access_key', None)
-            thread_client.target_secret_key = getattr(client, 'target_secret_key', None)
-            thread_client.target_tenant = getattr(client, 'target_tenant', None)
-            # Copy host template for tenant substitution
-            thread_client.host_template = getattr(client, 'host_template', None)
+            thread_client = get_thread_client(client)
             
-            # Create temporary file for this thread
-            temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8')
-            print(f"Writing to temp file - {temp_file.name}")
-            temp_files.append(temp_file.name)
+            # Rows are spilled to temporary files as runs sorted by assetId for deduplication
+            runs = SortedRunWriter(asset_list_dedup_key)
             
             # Create progress bar for this thread with green color
             progress_bar = create_progress_bar(
@@ -1609,28 +1641,24 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
                     if page_response and 'assets' in page_response:
                         page_assets = page_response['assets']
                         
-                        # Write assets to temporary CSV file
-                        with open(temp_file.name, 'a', newline='', encoding='utf-8') as f:
-                            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                        # Add asset data to this thread's sorted runs - new API structure
+                        for asset in page_assets:
+                            # Extract required fields from new API structure
+                            asset_id = asset.get('assetId', '')
+                            asset_uid = asset.get('assetUid', '')
+                            assembly_id = asset.get('assemblyId', '')
+                            asset_type = asset.get('assetType', '')
                             
-                            # Write asset data - new API structure
-                            for asset in page_assets:
-                                # Extract required fields from new API structure
-                                asset_id = asset.get('assetId', '')
-                                asset_uid = asset.get('assetUid', '')
-                                assembly_id = asset.get('assemblyId', '')
-                                asset_type = asset.get('assetType', '')
-                                
-                                # Extract tags and concatenate with colon separator
-                                # Note: New API structure may not have tags in the same format
-                                tags = []
-                                # For now, we'll leave tags empty as the new API structure doesn't show tags
-                                # This can be updated once we see the actual response structure
-                                
-                                tags_str = ':'.join(tags) if tags else ''
-                                
-                                # Write row: source_uid (asset.assetUid), source_id (asset.assetId), target_uid (asset.assetUid), tags, assembly_id, asset_type
-                                writer.writerow([asset_uid, asset_id, asset_uid, tags_str, assembly_id, asset_type])
+                            # Extract tags and concatenate with colon separator
+                            # Note: New API structure may not have tags in the same format
+                            tags = []
+                            # For now, we'll leave tags empty as the new API structure doesn't show tags
+                            # This can be updated once we see the actual response structure
+                            
+                            tags_str = ':'.join(tags) if tags else ''
+                            
+                            # Row: source_uid (asset.assetUid), source_id (asset.assetId), target_uid (asset.assetUid), tags, assembly_id, asset_type
+                            runs.add([asset_uid, asset_id, asset_uid, tags_str, assembly_id, asset_type])
                         
                         total_assets += len(page_assets)
                         successful_pages += 1
@@ -1648,28 +1676,24 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
                                 if location in page_response:
                                     page_assets = page_response[location]
                                     if isinstance(page_assets, list):
-                                        # Write assets to temporary CSV file
-                                        with open(temp_file.name, 'a', newline='', encoding='utf-8') as f:
-                                            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                                        # Add asset data to this thread's sorted runs - new API structure
+                                        for asset in page_assets:
+                                            # Extract required fields from new API structure
+                                            asset_id = asset.get('assetId', '')
+                                            asset_uid = asset.get('assetUid', '')
+                                            assembly_id = asset.get('assemblyId', '')
+                                            asset_type = asset.get('assetType', '')
+                                            
+                                            # Extract tags and concatenate with colon separator
+                                            # Note: New API structure may not have tags in the same format
+                                            tags = []
+                                            # For now, we'll leave tags empty as the new API structure doesn't show tags
+                                            # This can be updated once we see the actual response structure
+                                            
+                                            tags_str = ':'.join(tags) if tags else ''
                                             
-                                            # Write asset data - new API structure
-                                            for asset in page_assets:
-                                                # Extract required fields from new API structure
-                                                asset_id = asset.get('assetId', '')
-                                                asset_uid = asset.get('assetUid', '')
-                                                assembly_id = asset.get('assemblyId', '')
-                                                asset_type = asset.get('assetType', '')
-                                                
-                                                # Extract tags and concatenate with colon separator
-                                                # Note: New API structure may not have tags in the same format
-                                                tags = []
-                                                # For now, we'll leave tags empty as the new API structure doesn't show tags
-                                                # This can be updated once we see the actual response structure
-                                                
-                                                tags_str = ':'.join(tags) if tags else ''
-                                                
-                                                # Write row: source_uid (asset.assetUid), source_id (asset.assetId), target_uid (asset.assetUid), tags, assembly_id, asset_type
-                                                writer.writerow([asset_uid, asset_id, asset_uid, tags_str, assembly_id, asset_type])
+                                            # Row: source_uid (asset.assetUid), source_id (asset.assetId), target_uid (asset.assetUid), tags, assembly_id, asset_type
+                                            runs.add([asset_uid, asset_id, asset_uid, tags_str, assembly_id, asset_type])
                                         
                                         total_assets += len(page_assets)
                                         successful_pages += 1
@@ -1706,7 +1730,7 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
                 'successful_pages': successful_pages,
                 'failed_pages': failed_pages,
                 'total_assets': total_assets,
-                'temp_file': temp_file.name
+                'runs': runs.close()
             }
         
         # Execute parallel processing
@@ -1729,104 +1753,34 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
                 except Exception as e:
                     logger.error(f"Thread failed with exception: {e}")
         
-        # Step 3: Combine all temporary files into final output
+        # Step 3: Merge the sorted runs of all threads into the final output. Runs are
+        # merged in thread order, so the first copy of a duplicate asset is kept.
+        thread_results.sort(key=lambda result: result['thread_id'])
+        runs = [run for result in thread_results for run in result['runs']]
         if not quiet_mode:
-            print(f"\nCombining {len(temp_files)} temporary files into final output...")
-        
-        # Create output directory if needed
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Combine all temporary files with deduplication
-        seen_assets = set()  # Track unique assets by assetId
-        duplicate_count = 0
-        total_processed = 0
+            print(f"\nMerging {len(runs)} sorted runs into final output...")
         
         # Create duplicates file path
         duplicates_file = output_file.parent / f"{output_file.stem}-duplicates.csv"
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as output_f, \
-             open(duplicates_file, 'w', newline='', encoding='utf-8') as duplicates_f:
-            
-            writer = csv.writer(output_f, quoting=csv.QUOTE_ALL)
-            duplicates_writer = csv.writer(duplicates_f, quoting=csv.QUOTE_ALL)
-            
-            # Write headers
-            writer.writerow(['source_uid', 'source_id', 'target_uid', 'tags', 'assembly_id', 'asset_type'])
-            duplicates_writer.writerow(['source_uid', 'source_id', 'target_uid', 'tags', 'assembly_id', 'asset_type', 'duplicate_reason'])
-            
-            # Process all temporary files with deduplication
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    with open(temp_file, 'r', newline='', encoding='utf-8') as temp_f:
-                        reader = csv.reader(temp_f)
-                        for row in reader:
-                            total_processed += 1
-                            if len(row) >= 2:  # Ensure we have at least source_uid and source_id
-                                asset_id = row[1]  # source_id is the second column
-                                if asset_id not in seen_assets:
-                                    seen_assets.add(asset_id)
-                                    writer.writerow(row)
-                                else:
-                                    duplicate_count += 1
-                                    # Save duplicate to separate file with reason
-                                    duplicate_row = row + ['Duplicate assetId found in multiple pages/threads']
-                                    duplicates_writer.writerow(duplicate_row)
-                                    if verbose_mode:
-                                        print(f"🔄 Duplicate asset found: {row[0]} (ID: {asset_id})")
+        total_processed, unique_count, duplicate_count = write_asset_list_export(
+            runs, output_file, duplicates_file, verbose_mode)
         
         if not quiet_mode:
             print(f"\n📊 Deduplication Results:")
             print(f"  Total assets processed: {total_processed}")
-            print(f"  Unique assets written: {len(seen_assets)}")
+            print(f"  Unique assets written: {unique_count}")
             print(f"  Duplicates removed: {duplicate_count}")
             if duplicate_count > 0:
                 print(f"  ⚠️  Found {duplicate_count} duplicate assets - this indicates API pagination issues")
                 print(f"  📄 Duplicates saved to: {duplicates_file}")
                 print(f"  💡 Review duplicates file to analyze API pagination issues")
         
-        # Clean up temporary files
-        for temp_file in temp_files:
-            try:
-                os.unlink(temp_file)
-            except Exception as e:
-                logger.warning(f"Failed to delete temporary file {temp_file}: {e}")
-        
-        # Step 4: Sort the CSV file by source_uid, then source_id
-        if not quiet_mode:
-            print("Sorting CSV file by source_uid, then source_id...")
-        
-        # Read all rows
-        rows = []
-        with open(output_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)  # Skip header
-            rows = list(reader)
-        
-        # Sort rows: first by source_uid, then by source_id
-        def sort_key(row):
-            source_uid = row[0] if len(row) > 0 else ''
-            source_id = row[1] if len(row) > 1 else ''
-            # Convert source_id to int for proper numeric sorting, fallback to string
-            try:
-                source_id_int = int(source_id) if source_id else 0
-            except (ValueError, TypeError):
-                source_id_int = 0
-            return (source_uid, source_id_int)
-        
-        rows.sort(key=sort_key)
-        
-        # Write sorted data back to file
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-            writer.writerow(header)
-            writer.writerows(rows)
-        
-        # Step 5: Calculate total statistics
+        # Step 4: Calculate total statistics
         total_successful_pages = sum(result['successful_pages'] for result in thread_results)
         total_failed_pages = sum(result['failed_pages'] for result in thread_results)
         total_assets_exported = sum(result['total_assets'] for result in thread_results)
         
-        # Step 6: Print statistics
+        # Step 5: Print statistics
         if not quiet_mode:
             print("\n" + "="*80)
             print("ASSET LIST EXPORT COMPLETED (PARALLEL MODE)")
@@ -1856,7 +1810,7 @@ def execute_asset_list_export_parallel(client, logger: logging.Logger, source_ty
         logger.error(error_msg)
 
 
-def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False, verbose_mode: bool = False, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic'], max_threads: int = 5, source_context_id: str = None, target_context_id: str = None):
+def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False, verbose_mode: bool = False, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic'], max_threads: int = 5, source_context_id: str = None, target_context_id: str = None, resume: bool = False, record_format: str = FORMAT_CSV):
     """Execute the asset-profile-export command with parallel processing.
     
     Args:
@@ -1867,6 +1821,8 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
         allowed_types: List of asset types to export
+        resume: Skip assets completed by an earlier interrupted run (see checkpoint.py)
+        record_format: Output format, FORMAT_CSV or FORMAT_JSONL
     """
     try:
         print(f"Assset profile export parallel starting with threads : {max_threads}")
@@ -1924,7 +1880,16 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
         
         # Generate default output file if not provided - use asset-import category
         if not output_file:
-            output_file = get_output_file_path(csv_file, "asset-profiles-import-ready.csv", category="asset-import")
+            output_file = str(record_file_path(
+                get_output_file_path(csv_file, "asset-profiles-import-ready.csv", category="asset-import"), record_format))
+        
+        # Finished rows go to a journaled partial file so an interrupted run can be resumed
+        journal = CheckpointJournal(output_file, "asset-profile-export", resume=resume, with_rows=True, logger=logger)
+        record_encoder = profile_record_writer(None, record_format)
+        total_mappings = len(env_mappings)
+        env_mappings = [m for m in env_mappings if not journal.is_done(f"{m[0]}|{m[1]}")]
+        if journal.resumed and not quiet_mode:
+            print(f"⏩ Resuming: {total_mappings - len(env_mappings)} of {total_mappings} assets already exported")
         
         print(f"quiet_mode : {quiet_mode}")
         if not quiet_mode:
@@ -1956,7 +1921,6 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
         
         # Process assets in parallel
         thread_results = []
-        temp_files = []
         
         # Funny thread names for progress indicators (all same length)
         thread_names = get_thread_names()
@@ -1964,29 +1928,15 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
         def process_asset_chunk(thread_id, start_index, end_index):
             """Process a chunk of assets for a specific thread."""
             # Create a thread-local client instance
-            thread_client = type(client)(
-                host=client.host,
-                access_key=client.access_key,
-                secret_key=client.secret_key,
-                tenant=getattr(client, 'tenant', None)
-            )
-            # Copy target credentials to thread client
-            thread_client.target_access_key = getattr(client, 'target_access_key', None)
-            thread_client.target_secret_key = getattr(client, 'target_secret_key', None)
-            thread_client.target_tenant = getattr(client, 'target_tenant', None)
-            # Copy host template for tenant substitution
-            thread_client.host_template = getattr(client, 'host_template', None)
+            thread_client = get_thread_client(client)
             
             # Get assets for this thread
             thread_env_mappings = env_mappings[start_index:end_index]
             
-            # Create temporary file for this thread
-            temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8')
-            temp_files.append(temp_file.name)
             thread_name = thread_names[thread_id] if thread_id < len(thread_names) else f"Thread {thread_id}"
             # Create progress bar for this thread
             progress_bar = create_progress_bar(
-                total=end_page - start_page,
+                total=end_index - start_index,
                 desc= thread_name,
                 unit="assets",
                 disable=quiet_mode,
@@ -2088,11 +2038,9 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
                             profile_response, notification_id_mapping, quiet_mode, verbose_mode
                         )
                     
-                    # Step 4: Write to temporary CSV file - include source-env for duplicate resolution
-                    profile_json = json.dumps(profile_response, ensure_ascii=False)
-                    with open(temp_file.name, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-                        writer.writerow([target_env, profile_json, source_env])
+                    # Step 4: Append to the journaled partial file - include source-env for duplicate resolution
+                    journal.append_record(f"{source_env}|{target_env}",
+                                          record_encoder.encode([target_env, profile_response, source_env]))
                     
                     if verbose_mode:
                         print(f"{thread_name} - ✅ Written to file: {target_env}")
@@ -2116,8 +2064,7 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
                 'thread_id': thread_id,
                 'successful': successful,
                 'failed': failed,
-                'total_assets_processed': total_assets_processed,
-                'temp_file': temp_file.name
+                'total_assets_processed': total_assets_processed
             }
         
         # Execute parallel processing
@@ -2140,52 +2087,59 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
                 except Exception as e:
                     logger.error(f"Thread failed with exception: {e}")
 
-        # Merge temporary files
+        # Merge the partial file, which also holds rows from earlier runs when resuming
         if not quiet_mode:
-            print("\nMerging temporary files...")
+            print("\nMerging exported rows...")
         
         # Create output directory if needed
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Read all rows from temporary files
-        all_rows = []
-        csv.field_size_limit(sys.maxsize)  # Handle large JSON fields
-        for temp_file in temp_files:
-            try:
-                with open(temp_file, 'r', newline='', encoding='utf-8') as temp_csv:
-                    reader = csv.reader(temp_csv)
-                    for row in reader:
-                        if len(row) >= 2:  # Ensure we have target-env and profile_json
-                            all_rows.append(row)
-            except Exception as e:
-                logger.error(f"Error reading temporary file {temp_file}: {e}")
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file)
-                except Exception as e:
-                    logger.warning(f"Could not delete temporary file {temp_file}: {e}")
-        
-        # Sort rows by target-env (first column)
-        if not quiet_mode:
-            print("Sorting results by target-env...")
-        
-        def sort_key(row):
-            target_env = row[0] if len(row) > 0 else ''
-            return target_env.lower()  # Case-insensitive sorting
-        
-        all_rows.sort(key=sort_key)
-        
-        # Write final output
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        if record_format == FORMAT_JSONL:
+            # Records are complete lines; only target-env is needed to sort them
+            all_rows = []
+            for line in journal.iter_records():
+                if line.strip():
+                    all_rows.append((json.loads(line).get('target-env', '').lower(), line))
             
-            # Write header - include source-env for duplicate resolution
-            writer.writerow(['target-env', 'profile_json', 'source-env'])
+            if not quiet_mode:
+                print("Sorting results by target-env...")
+            all_rows.sort(key=lambda row: row[0])
             
-            # Write sorted data
-            writer.writerows(all_rows)
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                f.writelines(line for _, line in all_rows)
+        else:
+            # Read all rows from the partial file
+            all_rows = []
+            csv.field_size_limit(sys.maxsize)  # Handle large JSON fields
+            for row in journal.iter_rows():
+                if len(row) >= 2:  # Ensure we have target-env and profile_json
+                    all_rows.append(row)
+            
+            # Sort rows by target-env (first column)
+            if not quiet_mode:
+                print("Sorting results by target-env...")
+            
+            def sort_key(row):
+                target_env = row[0] if len(row) > 0 else ''
+                return target_env.lower()  # Case-insensitive sorting
+            
+            all_rows.sort(key=sort_key)
+            
+            # Write final output
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                
+                # Write header - include source-env for duplicate resolution
+                writer.writerow(PROFILE_EXPORT_COLUMNS)
+                
+                # Write sorted data
+                writer.writerows(all_rows)
+        
+        run_failed = sum(1 for m in env_mappings if not journal.is_done(f"{m[0]}|{m[1]}"))
+        journal.finish(failed=run_failed)
+        if run_failed and not quiet_mode:
+            print(f"💡 Re-run with --resume to retry only the {run_failed} failed assets")
         
         # Print statistics
         if not quiet_mode:
@@ -2253,7 +2207,18 @@ def execute_asset_profile_export_parallel(csv_file: str, client, logger: logging
         raise
 
 
-def execute_asset_tag_import(csv_file: str, client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, parallel_mode: bool = False):
+def tag_import_checkpoint_key(asset: Dict, is_transformed_format: bool) -> str:
+    """Get the checkpoint key of an asset-tag-import entry.
+
+    Transformed files hold one tag per row, so the key is the target asset ID and tag;
+    other formats hold every tag of an asset in one row, keyed by target UID.
+    """
+    if is_transformed_format:
+        return f"{asset['target_asset_id']}:{asset['tag_name']}"
+    return asset['target_uid']
+
+
+def execute_asset_tag_import(csv_file: str, client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, parallel_mode: bool = False, async_mode: bool = False, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, resume: bool = False):
     """Execute the asset-tag-import command.
     
     This command implements step 9 from fetch_tags.py:
@@ -2266,6 +2231,9 @@ def execute_asset_tag_import(csv_file: str, client, logger: logging.Logger, quie
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
         parallel_mode: Whether to use parallel processing
+        async_mode: Whether to use the asyncio engine
+        max_concurrency: Maximum number of in-flight requests in async mode
+        resume: Skip assets (or asset/tag pairs) imported by an earlier interrupted run (see checkpoint.py)
     """
     try:
         # If no CSV file specified, use the default transformed_tag_assets_output.csv
@@ -2426,6 +2394,14 @@ def execute_asset_tag_import(csv_file: str, client, logger: logging.Logger, quie
             logger.info("No assets with tags found in CSV file")
             return
         
+        journal = CheckpointJournal(csv_file, "asset-tag-import", resume=resume, logger=logger)
+        if journal.resumed:
+            total_assets = len(assets_with_tags)
+            assets_with_tags = [a for a in assets_with_tags
+                                if not journal.is_done(tag_import_checkpoint_key(a, is_transformed_format))]
+            if not quiet_mode:
+                print(f"⏩ Resuming: {total_assets - len(assets_with_tags)} of {total_assets} entries already imported")
+        
         if not quiet_mode:
             print(f"\nImporting tags for {len(assets_with_tags)} assets from CSV file")
             print(f"Input file: {csv_file}")
@@ -2440,10 +2416,18 @@ def execute_asset_tag_import(csv_file: str, client, logger: logging.Logger, quie
         # Set default max_threads for parallel processing
         max_threads = 5
         
-        if parallel_mode:
-            execute_asset_tag_import_parallel(assets_with_tags, client, logger, quiet_mode, verbose_mode, max_threads, is_transformed_format)
+        if async_mode:
+            from .async_asset_operations import execute_asset_tag_import_async
+            execute_asset_tag_import_async(assets_with_tags, client, logger, quiet_mode, verbose_mode, max_concurrency, is_transformed_format,
+                                           journal=journal)
+        elif parallel_mode:
+            execute_asset_tag_import_parallel(assets_with_tags, client, logger, quiet_mode, verbose_mode, max_threads, is_transformed_format,
+                                              journal=journal)
         else:
-            execute_asset_tag_import_sequential(assets_with_tags, client, logger, quiet_mode, verbose_mode, is_transformed_format)
+            execute_asset_tag_import_sequential(assets_with_tags, client, logger, quiet_mode, verbose_mode, is_transformed_format,
+                                                journal=journal)
+        journal.finish(failed=sum(1 for a in assets_with_tags
+                                  if not journal.is_done(tag_import_checkpoint_key(a, is_transformed_format))))
         
     except Exception as e:
         error_msg = f"Error in asset-tag-import: {e}"
@@ -2452,7 +2436,7 @@ def execute_asset_tag_import(csv_file: str, client, logger: logging.Logger, quie
         logger.error(error_msg)
 
 
-def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, is_transformed_format: bool = False):
+def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, is_transformed_format: bool = False, journal: Optional[CheckpointJournal] = None):
     """Execute asset tag import in sequential mode.
     
     Args:
@@ -2462,6 +2446,7 @@ def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, lo
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
         is_transformed_format: Whether the data is in transformed format (individual tag entries)
+        journal: Checkpoint journal to record fully imported entries in
     """
     total_assets = len(assets_with_tags)
     successful_assets = 0
@@ -2476,8 +2461,12 @@ def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, lo
         unit="assets",
         disable=quiet_mode or verbose_mode
     )
+    resolver = TargetAssetResolver.for_import(client, logger)
+    if not is_transformed_format:
+        resolver.prefetch(asset['target_uid'] for asset in assets_with_tags)
     
     for asset in assets_with_tags:
+        successful_before = successful_assets
         try:
             if is_transformed_format:
                 # Transformed format: individual tag entries
@@ -2555,35 +2544,9 @@ def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, lo
                     if hasattr(client, 'tenant') and client.tenant:
                         print(f"  X-Tenant: {client.tenant}")
                 
-                asset_response = client.make_api_call(
-                    endpoint=f"/catalog-server/api/assets?uid={target_uid}",
-                    method='GET',
-                    use_target_auth=True,
-                    use_target_tenant=True
-                )
-                
-                if verbose_mode:
-                    print(f"Asset Response:")
-                    print(json.dumps(asset_response, indent=2, ensure_ascii=False))
-                
-                # Extract asset ID
-                assets_list = []
-                if asset_response and 'data' in asset_response:
-                    if isinstance(asset_response['data'], list):
-                        assets_list = asset_response['data']
-                    elif isinstance(asset_response['data'], dict) and 'assets' in asset_response['data']:
-                        assets_list = asset_response['data']['assets']
-                if not assets_list:
-                    error_msg = f"No asset found for UID: {target_uid}"
-                    if verbose_mode:
-                        print(f"❌ {error_msg}")
-                    logger.error(error_msg)
-                    failed_assets += 1
-                    progress_bar.update(1)
-                    continue
-                asset_id = assets_list[0].get('id') if assets_list and isinstance(assets_list[0], dict) else None
+                asset_id = resolver.resolve(target_uid)
                 if not asset_id:
-                    error_msg = f"No asset ID found for UID: {target_uid}"
+                    error_msg = f"No asset found for UID: {target_uid}"
                     if verbose_mode:
                         print(f"❌ {error_msg}")
                     logger.error(error_msg)
@@ -2610,13 +2573,13 @@ def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, lo
                                 print(f"  X-Tenant: {client.tenant}")
                             print(f"  Request Body: {{\"name\": \"{tag}\"}}")
                         
-                        tag_response = client.make_api_call(
+                        asset_id, tag_response = resolver.retry_stale(target_uid, asset_id, lambda asset_id: client.make_api_call(
                             endpoint=f"/catalog-server/api/assets/{asset_id}/tag",
                             method='POST',
                             json_payload={"name": tag},
                             use_target_auth=True,
                             use_target_tenant=True
-                        )
+                        ))
                         
                         if verbose_mode:
                             print(f"Tag Response:")
@@ -2660,8 +2623,13 @@ def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, lo
             logger.error(error_msg)
             failed_assets += 1
             progress_bar.update(1)
+        
+        if journal is not None and successful_assets > successful_before:
+            journal.record(tag_import_checkpoint_key(asset, is_transformed_format))
     
     progress_bar.close()
+    resolver.save()
+    logger.info(resolver.format_stats())
     
     # Print statistics
     if not quiet_mode:
@@ -2678,7 +2646,7 @@ def execute_asset_tag_import_sequential(assets_with_tags: List[Dict], client, lo
         print(f"✅ Asset tag import completed: {successful_assets}/{total_assets} assets successful, {total_tags_imported} tags imported")
 
 
-def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, max_threads: int = 5, is_transformed_format: bool = False):
+def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, max_threads: int = 5, is_transformed_format: bool = False, journal: Optional[CheckpointJournal] = None):
     """Execute asset tag import in parallel mode.
     Args:
         assets_with_tags: List of asset data dictionaries
@@ -2693,50 +2661,32 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
     min_assets_per_thread = 10
     if len(assets_with_tags) < min_assets_per_thread:
         num_threads = 1
-        assets_per_thread = len(assets_with_tags)
     else:
         num_threads = min(max_threads, (len(assets_with_tags) + min_assets_per_thread - 1) // min_assets_per_thread)
-        assets_per_thread = (len(assets_with_tags) + num_threads - 1) // num_threads
     
     if not quiet_mode:
         print(f"Using {num_threads} threads to process {len(assets_with_tags)} assets")
-        print(f"Assets per thread: {assets_per_thread}")
         print("="*80)
     
-    # Process assets in parallel
-    thread_results = []
-    
     # Funny thread names for progress indicators (all same length)
     thread_names = get_thread_names()
     
-    def process_asset_chunk(thread_id, start_index, end_index):
-        """Process a chunk of assets for a specific thread."""
+    # Workers pull assets from a shared queue so slow assets do not stall a whole slice
+    progress_bar = create_progress_bar(
+        total=len(assets_with_tags),
+        desc="Importing tags",
+        unit="assets",
+        disable=quiet_mode or verbose_mode
+    )
+    work_queue = WorkQueue(assets_with_tags, progress_bar)
+    resolver = TargetAssetResolver.for_import(client, logger)
+    if not is_transformed_format:
+        resolver.prefetch((asset['target_uid'] for asset in assets_with_tags), max_threads)
+    
+    def process_asset_chunk(thread_id):
+        """Process assets from the shared queue for a specific thread."""
         # Create a thread-local client instance
-        thread_client = type(client)(
-            host=client.host,
-            access_key=client.access_key,
-            secret_key=client.secret_key,
-            tenant=getattr(client, 'tenant', None)
-        )
-        # Copy target credentials to thread client
-        thread_client.target_access_key = getattr(client, 'target_access_key', None)
-        thread_client.target_secret_key = getattr(client, 'target_secret_key', None)
-        thread_client.target_tenant = getattr(client, 'target_tenant', None)
-        # Copy host template for tenant substitution
-        thread_client.host_template = getattr(client, 'host_template', None)
-        
-        # Get assets for this thread
-        thread_assets = assets_with_tags[start_index:end_index]
-        
-        # Create progress bar for this thread (disable if quiet mode or verbose mode)
-        progress_bar = create_progress_bar(
-            total=len(thread_assets),
-            desc=thread_names[thread_id] if thread_id < len(thread_names) else f"Thread {thread_id}",
-            unit="assets",
-            disable=quiet_mode or verbose_mode,
-            position=thread_id,
-            leave=False
-        )
+        thread_client = get_thread_client(client)
         
         successful_assets = 0
         failed_assets = 0
@@ -2744,8 +2694,9 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
         total_tags_already_exist = 0
         total_tags_failed = 0
         
-        # Process each asset in this thread's range
-        for asset in thread_assets:
+        # Process assets until the shared queue is drained
+        for asset in work_queue.consume():
+            successful_before = successful_assets
             try:
                 if is_transformed_format:
                     # Transformed format: individual tag entries
@@ -2840,49 +2791,13 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
                         if hasattr(thread_client, 'tenant') and thread_client.tenant:
                             print(f"  X-Tenant: {thread_client.tenant}")
                     
-                    asset_response = thread_client.make_api_call(
-                        endpoint=f"/catalog-server/api/assets?uid={target_uid}",
-                        method='GET',
-                        use_target_auth=True,
-                        use_target_tenant=True
-                    )
-                    
-                    if verbose_mode:
-                        print(f"Asset Response:")
-                        print(json.dumps(asset_response, indent=2, ensure_ascii=False))
-                    
-                    # Extract asset ID
-                    if not asset_response or 'data' not in asset_response:
-                        error_msg = f"No 'data' field found in asset response for UID: {target_uid}"
-                        if verbose_mode:
-                            print(f"❌ {error_msg}")
-                        logger.error(error_msg)
-                        failed_assets += 1
-                        progress_bar.update(1)
-                        continue
-                    
-                    assets_list = []
-                    if asset_response and 'data' in asset_response:
-                        if isinstance(asset_response['data'], list):
-                            assets_list = asset_response['data']
-                        elif isinstance(asset_response['data'], dict) and 'assets' in asset_response['data']:
-                            assets_list = asset_response['data']['assets']
-                    if not assets_list:
-                        error_msg = f"No asset found for UID: {target_uid}"
-                        if verbose_mode:
-                            print(f"❌ {error_msg}")
-                        logger.error(error_msg)
-                        failed_assets += 1
-                        progress_bar.update(1)
-                        continue
-                    asset_id = assets_list[0].get('id') if assets_list and isinstance(assets_list[0], dict) else None
+                    asset_id = resolver.resolve(target_uid, thread_client)
                     if not asset_id:
-                        error_msg = f"No asset ID found for UID: {target_uid}"
+                        error_msg = f"No asset found for UID: {target_uid}"
                         if verbose_mode:
                             print(f"❌ {error_msg}")
                         logger.error(error_msg)
                         failed_assets += 1
-                        progress_bar.update(1)
                         continue
                     
                     if verbose_mode:
@@ -2904,13 +2819,13 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
                                     print(f"  X-Tenant: {thread_client.tenant}")
                                 print(f"  Request Body: {{\"name\": \"{tag}\"}}")
                             
-                            tag_response = thread_client.make_api_call(
+                            asset_id, tag_response = resolver.retry_stale(target_uid, asset_id, lambda asset_id: thread_client.make_api_call(
                                 endpoint=f"/catalog-server/api/assets/{asset_id}/tag",
                                 method='POST',
                                 json_payload={"name": tag},
                                 use_target_auth=True,
                                 use_target_tenant=True
-                            )
+                            ), thread_client)
                             
                             if verbose_mode:
                                 print(f"Tag Response:")
@@ -2945,7 +2860,6 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
                         if verbose_mode:
                             print(f"⚠️  Partially processed asset: {target_uid} ({asset_tags_successful} successful, {asset_tags_failed} failed)")
                     
-                    progress_bar.update(1)
                 
             except Exception as e:
                 error_msg = f"Error processing asset {asset.get('target_uid', 'unknown')}: {e}"
@@ -2953,9 +2867,9 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
                     print(f"❌ {error_msg}")
                 logger.error(error_msg)
                 failed_assets += 1
-                progress_bar.update(1)
-        
-        progress_bar.close()
+            
+            if journal is not None and successful_assets > successful_before:
+                journal.record(tag_import_checkpoint_key(asset, is_transformed_format))
         
         return {
             'thread_id': thread_id,
@@ -2967,23 +2881,10 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
         }
     
     # Execute parallel processing
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = []
-        
-        for i in range(num_threads):
-            start_index = i * assets_per_thread
-            end_index = min(start_index + assets_per_thread, len(assets_with_tags))
-            
-            future = executor.submit(process_asset_chunk, i, start_index, end_index)
-            futures.append(future)
-        
-        # Collect results
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                thread_results.append(result)
-            except Exception as e:
-                logger.error(f"Thread execution error: {e}")
+    thread_results = run_work_queue(work_queue, process_asset_chunk, num_threads, logger)
+    progress_bar.close()
+    resolver.save()
+    logger.info(resolver.format_stats())
     
     # Aggregate results
     total_successful_assets = sum(r['successful_assets'] for r in thread_results)
@@ -3004,6 +2905,7 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
         print(f"Total tags already exist: {total_tags_already_exist}")
         print(f"Total tags failed: {total_tags_failed}")
         print(f"Threads used: {num_threads}")
+        print(work_queue.format_latency_stats())
         print("="*80)
     else:
         total_tags_processed = total_tags_imported + total_tags_already_exist
@@ -3011,7 +2913,8 @@ def execute_asset_tag_import_parallel(assets_with_tags: List[Dict], client, logg
 
 
 def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.Logger, output_file: str = None,
-                                         quiet_mode: bool = False, verbose_mode: bool = False, max_threads: int = 5, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic']):
+                                         quiet_mode: bool = False, verbose_mode: bool = False, max_threads: int = 5, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic'],
+                                         resume: bool = False, record_format: str = FORMAT_CSV):
     """Execute the asset-config-export command with parallel processing.
 
     Args:
@@ -3022,6 +2925,8 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
         max_threads: Maximum number of threads to use for parallel processing
+        resume: Skip assets completed by an earlier interrupted run (see checkpoint.py)
+        record_format: Output format, FORMAT_CSV or FORMAT_JSONL
     """
     try:
         # Read asset data from CSV file with 4 columns
@@ -3032,7 +2937,16 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
 
         # Generate default output file if not provided
         if not output_file:
-            output_file = get_output_file_path(csv_file, "asset-config-export.csv", category="asset-export")
+            output_file = str(record_file_path(
+                get_output_file_path(csv_file, "asset-config-export.csv", category="asset-export"), record_format))
+
+        # Finished rows go to a journaled partial file so an interrupted run can be resumed
+        journal = CheckpointJournal(output_file, "asset-config-export", resume=resume, with_rows=True, logger=logger)
+        record_encoder = config_record_writer(None, record_format)
+        total_assets = len(asset_data)
+        asset_data = [a for a in asset_data if not journal.is_done(f"{a['source_uid']}|{a['target_uid']}")]
+        if journal.resumed and not quiet_mode:
+            print(f"⏩ Resuming: {total_assets - len(asset_data)} of {total_assets} assets already exported")
 
         if not quiet_mode:
             print(f"\nReading asset config exports from CSV file :{csv_file}")
@@ -3063,13 +2977,19 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
         failed = 0
         total_assets_processed = 0
         anomaly_config_export_failed = 0
+        row_errors = []
         lock = threading.Lock()
-        all_results = []
+
+        # The four GETs of an asset are independent, so each worker fans them out
+        sub_requests = SubRequestPool(num_threads * 4)
+
+        def get(endpoint, **kwargs):
+            # Runs on a pool thread, which needs its own session on the shared connection pools
+            return get_thread_client(client).make_api_call(endpoint=endpoint, method='GET', **kwargs)
 
         def process_asset_chunk(thread_id, start_index, end_index):
             """Process a chunk of assets for a specific thread."""
             nonlocal successful, failed, total_assets_processed, anomaly_config_export_failed
-            thread_results = []
             thread_successful = 0
             thread_failed = 0
             thread_anomaly_failed = 0
@@ -3118,25 +3038,23 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
                         if hasattr(client, 'tenant') and client.tenant:
                             print(f"  X-Tenant: {client.tenant}")
 
-                    asset_config = client.make_api_call(
-                        endpoint=f"/catalog-server/api/assets/{source_id}/config",
-                        method='GET'
-                    )
+                    responses = sub_requests.fan_out({
+                        'config': partial(get, f"/catalog-server/api/assets/{source_id}/config"),
+                        'anomaly': partial(get, f"/catalog-server/api/rules/profile-anomaly/byAsset/{source_id}"),
+                        'source_children': partial(get, f"/catalog-server/api/assets/{source_id}/childAssets"),
+                        'target_children': partial(get, f"/catalog-server/api/assets/{target_id}/childAssets",
+                                                   use_target_auth=True, use_target_tenant=True)
+                    })
+                    asset_config = responses['config'].result()
 
                     # Show response in verbose mode
                     if verbose_mode:
                         print(f"\n[Thread {thread_id}] Config Response:")
                         print(json.dumps(asset_config, indent=2, ensure_ascii=False))
 
-                    asset_config_json = json.dumps(asset_config, ensure_ascii=False, separators=(',', ':'))
-                    asset_profile_anomaly_config_json = {}
+                    asset_profile_anomaly_config = {}
                     try:
-                        asset_profile_anomaly_config = client.make_api_call(
-                            endpoint=f"/catalog-server/api/rules/profile-anomaly/byAsset/{source_id}",
-                            method='GET'
-                        )
-                        asset_profile_anomaly_config_json = json.dumps(asset_profile_anomaly_config, ensure_ascii=False,
-                                                                       separators=(',', ':'))
+                        asset_profile_anomaly_config = responses['anomaly'].result()
                     except Exception as e:
                         error_msg = f"[Thread {thread_id}] Error exporting anomaly details source_id {source_id}: {e}"
                         if verbose_mode or not quiet_mode:
@@ -3144,44 +3062,22 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
                         logger.error(error_msg)
                         print(f"❌ {error_msg}")
                         thread_anomaly_failed += 1
-                    # Get child assets of each asset
-                    asset_child_assets_config = client.make_api_call(
-                        endpoint=f"/catalog-server/api/assets/{source_id}/childAssets",
-                        method='GET'
-                    )
-
-                    asset_child_assets_config_json = json.dumps(asset_child_assets_config, ensure_ascii=False,
-                                                                separators=(',', ':'))
-                    asset_child_assets_config_dict = json.loads(asset_child_assets_config_json)
-
-                    # Build a dictionary of assetId -> uid
-                    asset_id_to_uid_map = {item["assetId"]: item["uid"] for item in
-                                           asset_child_assets_config_dict["childAssets"]}
-                    asset_id_to_uid_map_json = json.dumps(asset_id_to_uid_map, ensure_ascii=False,
-                                                          separators=(',', ':'))
-
-                    # Get child assets of each asset
-                    asset_target_child_assets_config = client.make_api_call(
-                        endpoint=f"/catalog-server/api/assets/{target_id}/childAssets",
-                        method='GET',
-                        use_target_auth=True,
-                        use_target_tenant=True
+                    # Build dictionaries of assetId -> uid for the source and target child assets
+                    row = AssetConfigExportRow(
+                        target_uid=target_uid,
+                        asset_config=asset_config,
+                        profile_anomaly_config=asset_profile_anomaly_config,
+                        asset_id_to_uid_map=child_asset_uid_map(responses['source_children'].result()),
+                        target_asset_id_to_uid_map=child_asset_uid_map(responses['target_children'].result()),
+                        source_uid=source_uid
                     )
+                    errors = row.validate()
+                    if errors:
+                        with lock:
+                            row_errors.extend(f"{target_uid}: {error}" for error in errors)
 
-                    asset_target_child_assets_config_json = json.dumps(asset_target_child_assets_config,
-                                                                       ensure_ascii=False, separators=(',', ':'))
-                    asset_target_child_assets_config_dict = json.loads(asset_target_child_assets_config_json)
-
-                    # Build a dictionary of assetId -> uid
-                    asset_target_id_to_uid_map = {item["assetId"]: item["uid"] for item in
-                                                  asset_target_child_assets_config_dict["childAssets"]}
-                    asset_target_id_to_uid_map_json = json.dumps(asset_target_id_to_uid_map, ensure_ascii=False,
-                                                                 separators=(',', ':'))
-
-                    # Write the compressed JSON response to CSV with target_uid and source_uid
-                    thread_results.append(
-                        [target_uid, asset_config_json, asset_profile_anomaly_config_json, asset_id_to_uid_map_json,
-                         asset_target_id_to_uid_map_json, source_uid])
+                    # Write the compressed JSON responses to CSV with target_uid and source_uid
+                    journal.append_record(f"{source_uid}|{target_uid}", record_encoder.encode(row))
 
                     if verbose_mode:
                         print(f"[Thread {thread_id}] ✅ Written to file: {target_uid}")
@@ -3212,7 +3108,6 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
                 failed += thread_failed
                 total_assets_processed += thread_successful
                 anomaly_config_export_failed += thread_anomaly_failed
-                all_results.extend(thread_results)
 
             return {
                 'thread_id': thread_id,
@@ -3226,7 +3121,7 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
         remainder = len(asset_data) % num_threads
 
         # Create thread pool
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        with sub_requests, ThreadPoolExecutor(max_workers=num_threads) as executor:
             futures = []
             start_index = 0
 
@@ -3247,129 +3142,43 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
             for future in as_completed(futures):
                 thread_results.append(future.result())
 
-        # Write all results to CSV file
+        # Write all results to the output file
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            # Write header (CSV only)
+            config_record_writer(f, record_format).write_header()
 
-            # Write header
-            writer.writerow(
-                ['target_uid', 'asset_config_json', 'asset_profile_anomaly_config_json', 'asset_id_to_uid_map_json',
-                 'asset_target_id_to_uid_map_json', 'source_uid'])
+            # Copy all finished rows, including rows from earlier runs when resuming
+            f.flush()
+            journal.copy_rows_to(f)
 
-            # Write all results
-            writer.writerows(all_results)
+        journal.finish(failed=sum(1 for a in asset_data if not journal.is_done(f"{a['source_uid']}|{a['target_uid']}")))
+        if failed and not quiet_mode:
+            print(f"💡 Re-run with --resume to retry only the {failed} failed assets")
 
-        # Verify the CSV file can be read correctly
+        # Verify the output file can be read correctly. The JSON columns were checked
+        # while the rows were assembled, so they are not parsed again here.
         if verbose_mode or not quiet_mode:
             print("\nVerifying CSV file can be read correctly...")
 
         try:
-            with open(output_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                header = next(reader)
+            with open_records(output_path) as reader:
+                header = reader.header
                 row_count = 0
                 validation_errors = []
 
-                # Validate header
-                if len(header) != 6:
-                    validation_errors.append(f"Invalid header: expected 6 columns, got {len(header)}")
-                elif header[0] != 'target_uid' or header[1] != 'asset_config_json' or header[2] != 'asset_profile_anomaly_config_json' or header[3] != 'asset_id_to_uid_map_json' or header[4] != 'asset_target_id_to_uid_map_json' or header[5] != 'source_uid':
-                    validation_errors.append(f"Invalid header: expected ['target_uid', 'asset_config_json', 'asset_profile_anomaly_config_json', 'asset_id_to_uid_map_json', 'asset_target_id_to_uid_map_json', 'source_uid'], got {header}")
+                # Validate header (an empty JSON Lines file has none)
+                if header != CONFIG_EXPORT_HEADER and (header or reader.record_format == FORMAT_CSV):
+                    validation_errors.append(f"Invalid header: expected {CONFIG_EXPORT_HEADER}, got {header}")
 
                 # Validate each row
                 for row_num, row in enumerate(reader, start=2):
                     row_count += 1
 
                     # Check column count
-                    if len(row) != 6:
-                        validation_errors.append(f"Row {row_num}: Expected 6 columns, got {len(row)}")
-                        continue
-
-                    target_uid, asset_asset_config_json_str, asset_profile_anomaly_asset_config_json_str, asset_id_to_uid_map_json_str, asset_target_id_to_uid_map_json_str, source_uid = row
-
-                    # Check for empty values
-                    if not target_uid.strip():
-                        validation_errors.append(f"Row {row_num}: Empty target_uid value")
-
-                    if not asset_asset_config_json_str.strip():
-                        validation_errors.append(f"Row {row_num}: Empty asset_config_json value")
-
-                    if not asset_profile_anomaly_asset_config_json_str.strip():
-                        validation_errors.append(f"Row {row_num}: Empty asset_profile_anomaly_config_json value")
-                        continue
-
-                    if not asset_id_to_uid_map_json_str.strip():
-                        validation_errors.append(f"Row {row_num}: Empty asset_id_to_uid_map_json value")
-                        continue
-
-                    if not asset_target_id_to_uid_map_json_str.strip():
-                        validation_errors.append(f"Row {row_num}: Empty asset_target_id_to_uid_map_json value")
-                        continue
-                    # Verify JSON is parsable
-                    try:
-                        config_data = json.loads(asset_asset_config_json_str)
-
-                        # Additional validation: check if it's a valid config response
-                        if not isinstance(config_data, dict):
-                            validation_errors.append(f"Row {row_num}: asset_config_json is not a valid JSON object")
-                        elif not config_data:  # Empty object
-                            validation_errors.append(f"Row {row_num}: asset_config_json is empty")
-
-                    except json.JSONDecodeError as e:
-                        validation_errors.append(f"Row {row_num}: Invalid JSON in asset_config_json - {e}")
-                    except Exception as e:
-                        validation_errors.append(f"Row {row_num}: Error parsing asset_config_json - {e}")
-
-                    # Verify asset_profile_anomaly_config_json JSON is parsable
-                    try:
-                        config_data = json.loads(asset_profile_anomaly_asset_config_json_str)
-
-                        # Additional validation: check if it's a valid config response
-                        if not isinstance(config_data, dict):
-                            validation_errors.append(
-                                f"Row {row_num}: asset_profile_anomaly_config_json is not a valid JSON object")
-                        elif not config_data:  # Empty object
-                            validation_errors.append(f"Row {row_num}: asset_profile_anomaly_config_json is empty")
-
-                    except json.JSONDecodeError as e:
-                        validation_errors.append(
-                            f"Row {row_num}: Invalid JSON in asset_profile_anomaly_config_json - {e}")
-                    except Exception as e:
-                        validation_errors.append(
-                            f"Row {row_num}: Error parsing asset_profile_anomaly_config_json - {e}")
-
-                    # Verify asset_id_to_uid_map_json JSON is parsable
-                    try:
-                        config_data = json.loads(asset_id_to_uid_map_json_str)
+                    if len(row) != len(CONFIG_EXPORT_HEADER):
+                        validation_errors.append(f"Row {row_num}: Expected {len(CONFIG_EXPORT_HEADER)} columns, got {len(row)}")
+                validation_errors.extend(row_errors)
 
-                        # Additional validation: check if it's a valid config response
-                        if not isinstance(config_data, dict):
-                            validation_errors.append(
-                                f"Row {row_num}: asset_id_to_uid_map_json is not a valid JSON object")
-                        elif not config_data:  # Empty object
-                            validation_errors.append(f"Row {row_num}: asset_id_to_uid_map_json is empty")
-
-                    except json.JSONDecodeError as e:
-                        validation_errors.append(f"Row {row_num}: Invalid JSON in asset_id_to_uid_map_json - {e}")
-                    except Exception as e:
-                        validation_errors.append(f"Row {row_num}: Error parsing asset_id_to_uid_map_json - {e}")
-
-                        # Verify asset_id_to_uid_map_json JSON is parsable
-                    try:
-                        config_data = json.loads(asset_target_id_to_uid_map_json_str)
-
-                        # Additional validation: check if it's a valid config response
-                        if not isinstance(config_data, dict):
-                            validation_errors.append(
-                                f"Row {row_num}: asset_target_id_to_uid_map_json is not a valid JSON object")
-                        elif not config_data:  # Empty object
-                            validation_errors.append(f"Row {row_num}: asset_target_id_to_uid_map_json is empty")
-
-                    except json.JSONDecodeError as e:
-                        validation_errors.append(
-                            f"Row {row_num}: Invalid JSON in asset_target_id_to_uid_map_json - {e}")
-                    except Exception as e:
-                        validation_errors.append(f"Row {row_num}: Error parsing asset_target_id_to_uid_map_json - {e}")
                 # Report validation results
                 if verbose_mode or not quiet_mode:
                     if validation_errors:
@@ -3437,7 +3246,8 @@ def execute_asset_config_export_parallel(csv_file: str, client, logger: logging.
 
 
 def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.Logger, quiet_mode: bool = False,
-                                         verbose_mode: bool = False, dry_run: bool = False, max_threads: int = 5):
+                                         verbose_mode: bool = False, dry_run: bool = False, max_threads: int = 5,
+                                         resume: bool = False):
     """Execute the asset-config-import command with parallel processing.
 
     Args:
@@ -3447,10 +3257,12 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
         quiet_mode: Whether to show progress bars
         verbose_mode: Whether to enable verbose logging
         dry_run: If True, print the request and payload instead of making the API call
+        resume: Skip assets imported or skipped by an earlier interrupted run (see checkpoint.py)
 
     """
     try:
-        # Check if CSV file exists
+        # Check if the CSV (or JSON Lines) file exists
+        csv_file = str(resolve_record_file(csv_file))
         csv_path = Path(csv_file)
         if not csv_path.exists():
             error_msg = f"CSV file does not exist: {csv_file}"
@@ -3467,90 +3279,40 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
         assets_mapped_csv_file = str(globals.GLOBAL_OUTPUT_DIR / "asset-import" / "asset-merged-all.csv")
         assets_mapping = get_source_to_target_asset_id_map(assets_mapped_csv_file, logger)
 
-        # Read CSV data
-        asset_data = []
-        # The below limit is set to fix the error: field larger than field limit (131072), python csv read has a limitation.
-        csv.field_size_limit(sys.maxsize)
-        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)  # Skip header
-            
-            # Determine CSV format (3-column or 6-column)
-            if len(header) == 3:
-                # 3-column format: target_uid, config_json, source_uid
-                for row in reader:
-                    if len(row) >= 3:
-                        asset_data.append({
-                            'target_uid': row[0],
-                            'config_json': row[1],
-                            'source_uid': row[2]
-                        })
-            elif len(header) >= 6:
-                # 6-column format: target_uid, asset_config_json, asset_profile_anomaly_config_json, asset_id_to_uid_map_json, asset_target_id_to_uid_map_json, source_uid
-                for row in reader:
-                    if len(row) >= 6:
-                        asset_data.append({
-                            'target_uid': row[0],
-                            'config_json': row[1],
-                            'source_uid': row[5]
-                        })
-            else:
-                # Fallback for other formats
-                for row in reader:
-                    if len(row) >= 2:
-                        asset_data.append({
-                            'target_uid': row[0],
-                            'config_json': row[1],
-                            'source_uid': row[2] if len(row) > 2 else 'Unknown'
-                        })
-
-        if not asset_data:
+        # Index the file; config_json values are streamed from disk by the worker threads
+        asset_index = scan_asset_config_csv(csv_file, classify=True)
+        if not asset_index:
             print("❌ No asset data found in CSV file")
             return
 
         if not quiet_mode:
-            print(f"📊 Found {len(asset_data)} assets to process")
+            print(f"📊 Found {len(asset_index)} assets to process")
 
         # Check for and resolve duplicates before processing
-        duplicates_found = check_for_duplicates_in_asset_data(asset_data)
-        if duplicates_found:
-            if not quiet_mode:
-                print("🔍 Resolving duplicates interactively...")
-            
-            # Resolve duplicates interactively
-            resolved_asset_data = resolve_duplicates_interactively(asset_data, duplicates_found, quiet_mode, verbose_mode)
-            if resolved_asset_data is None:
-                print("❌ Duplicate resolution was cancelled by user")
-                return
-            else:
-                asset_data = resolved_asset_data
-                if not quiet_mode:
-                    print(f"✅ Duplicate resolution completed. Processing {len(asset_data)} unique configurations")
+        asset_index = _resolve_duplicate_asset_config_rows(csv_file, asset_index, quiet_mode, verbose_mode)
+        if asset_index is None:
+            print("❌ Duplicate resolution was cancelled by user")
+            return
+
+        # Dry runs change nothing, so they neither skip nor record completed assets
+        journal = None if dry_run else CheckpointJournal(csv_file, "asset-config-import", resume=resume, logger=logger)
+        if journal and journal.resumed:
+            total_assets = len(asset_index)
+            asset_index = [info for info in asset_index if not journal.is_done(info.target_uid)]
+            print(f"⏩ Resuming: {total_assets - len(asset_index)} of {total_assets} assets already imported")
+        total_assets = len(asset_index)
 
         # Pre-analyze assets to provide better visibility
         print(f"\n📊 ASSET CONFIG IMPORT ANALYSIS")
         print("=" * 60)
-        print(f"📋 Total assets in CSV: {len(asset_data)}")
+        print(f"📋 Total assets in CSV: {total_assets}")
         
         # Categorize assets before processing
-        assets_with_config = 0
-        assets_without_config = 0
-        assets_with_null_config = 0
-        assets_with_empty_config = 0
-        
-        for asset in asset_data:
-            config_json = asset['config_json']
-            try:
-                config_data = json.loads(config_json)
-                if "assetConfiguration" in config_data:
-                    if config_data["assetConfiguration"] is not None:
-                        assets_with_config += 1
-                    else:
-                        assets_with_null_config += 1
-                else:
-                    assets_without_config += 1
-            except (json.JSONDecodeError, TypeError):
-                assets_with_empty_config += 1
+        config_kinds = [info.config_kind for info in asset_index]
+        assets_with_config = config_kinds.count(CONFIG_CUSTOM)
+        assets_without_config = config_kinds.count(CONFIG_MISSING)
+        assets_with_null_config = config_kinds.count(CONFIG_NULL)
+        assets_with_empty_config = config_kinds.count(CONFIG_INVALID)
         
         print(f"🔧 Assets with custom configuration: {assets_with_config}")
         print(f"⚙️  Assets with null configuration: {assets_with_null_config}")
@@ -3564,7 +3326,7 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
             return
 
         # Determine number of threads (max 5, min 1)
-        num_threads = min(max_threads, max(1, len(asset_data)))
+        num_threads = min(max_threads, max(1, total_assets))
 
         if not quiet_mode:
             print(f"Using {num_threads} threads for processing")
@@ -3581,33 +3343,27 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
         lock = threading.Lock()
         all_results = []
 
-        # Create progress bar if in quiet mode
-        if quiet_mode and not verbose_mode:
-            pbar = tqdm(total=len(asset_data), desc="Processing assets", colour='green')
+        # Shared progress bar (show in normal mode and quiet mode, but not in verbose mode)
+        pbar = tqdm(total=total_assets, desc="Processing assets", colour='green', disable=verbose_mode)
 
-        def process_asset_chunk(thread_id, start_index, end_index):
+        # Workers pull assets from a shared queue so slow assets do not stall a whole slice. Rows are
+        # read lazily and only a few are held in memory at a time, however large the file is.
+        asset_rows = iter_asset_config_rows(csv_file, {info.row_number for info in asset_index})
+        work_queue = WorkQueue(enumerate(asset_rows), pbar, max_pending=num_threads * 2, total=total_assets)
+        resolver = TargetAssetResolver.for_import(client, logger)
+        resolver.prefetch((info.target_uid for info in asset_index), num_threads)
+
+        def process_asset_chunk(thread_id):
             nonlocal successful, failed, total_assets_processed, asset_configs_not_found, asset_not_found
             thread_successful = 0
             thread_failed = 0
+            thread_processed = 0
             asset_configs_not_per_thread = 0
             asset_not_found_thread = 0
             thread_results = []
 
-            # Create progress bar for this thread (show in normal mode and quiet mode, but not in verbose mode)
-            if not verbose_mode:
-                thread_name = thread_names[thread_id] if thread_id < len(thread_names) else f"Thread {thread_id}"
-                thread_pbar = tqdm(
-                    total=end_index - start_index,
-                    desc=thread_name,
-                    colour='green',
-                    position=thread_id,
-                    leave=False
-                )
-            else:
-                thread_pbar = None
-
-            for i in range(start_index, end_index):
-                asset = asset_data[i]
+            for i, asset in work_queue.consume():
+                thread_processed += 1
                 target_uid = asset['target_uid']
                 config_json = asset['config_json']
                 # profile_anomaly_config_json = asset['asset_profile_anomaly_config_json']
@@ -3615,20 +3371,11 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
                 try:
                     # Step 1: Get asset ID from target_uid
                     if verbose_mode:
-                        print(f"\n[Thread {thread_id}] 🔍 Processing asset {i + 1}/{len(asset_data)}: {target_uid}")
+                        print(f"\n[Thread {thread_id}] 🔍 Processing asset {i + 1}/{total_assets}: {target_uid}")
                         print(f"   GET /catalog-server/api/assets?uid={target_uid}")
 
-                    response = client.make_api_call(
-                        endpoint=f'/catalog-server/api/assets?uid={target_uid}',
-                        method='GET',
-                        use_target_auth=True,
-                        use_target_tenant=True
-                    )
-
-                    if verbose_mode:
-                        print(f"   Response: {response}")
-
-                    if not response or 'data' not in response or not response['data']:
+                    asset_id = resolver.resolve(target_uid)
+                    if asset_id is None:
                         error_msg = f"No asset found for UID: {target_uid}"
                         if verbose_mode:
                             print(f"   ❌ {error_msg}")
@@ -3637,8 +3384,6 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
                         thread_results.append({'target_uid': target_uid, 'error': error_msg, 'status': 'failed', 'reason': 'Asset not found in target'})
                         continue
 
-                    asset_id = response['data'][0]['id']
-
                     if verbose_mode:
                         print(f"   Asset ID: {asset_id}")
                         print(f"   PUT /catalog-server/api/assets/{asset_id}/config")
@@ -3656,19 +3401,21 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
                             thread_results.append({'target_uid': target_uid, 'asset_id': asset_id, 'status': 'dry_run', 'reason': 'Dry run mode'})
                             continue
 
-                        config_response = client.make_api_call(
+                        asset_id, config_response = resolver.retry_stale(target_uid, asset_id, lambda asset_id: client.make_api_call(
                             endpoint=f'/catalog-server/api/assets/{asset_id}/config',
                             method='PUT',
-                            json_payload=transformed_config,
+                            json_payload=transform_config_json_to_asset_configuration(config_data, asset_id),
                             use_target_auth=True,
                             use_target_tenant=True
-                        )
+                        ))
 
                         if verbose_mode:
                             print(f"   Config Response: {config_response}")
 
                         if config_response:
                             thread_successful += 1
+                            if journal:
+                                journal.record(target_uid)
                             thread_results.append({'target_uid': target_uid, 'asset_id': asset_id, 'status': 'success', 'reason': 'Configuration imported successfully'})
                             if verbose_mode:
                                 print(f"   ✅ Successfully updated config for {target_uid}")
@@ -3692,6 +3439,9 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
                             print(f"   ⏭️ Skipping {target_uid}: {reason}")
                         thread_failed += 1
                         asset_configs_not_per_thread += 1
+                        if journal:
+                            # Nothing to import for default configurations, so a resumed run need not revisit them
+                            journal.record(target_uid)
                         thread_results.append({'target_uid': target_uid, 'asset_id': asset_id, 'status': 'skipped', 'reason': reason})
                         continue
 
@@ -3704,43 +3454,21 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
                     thread_failed += 1
                     thread_results.append({'target_uid': target_uid, 'status': 'failed', 'error': error_msg, 'reason': 'Exception occurred'})
 
-                # Update progress bar
-                if thread_pbar:
-                    thread_pbar.update(1)
-
-            # Close thread progress bar
-            if thread_pbar:
-                thread_pbar.close()
-
             # Update global counters
             with lock:
                 successful += thread_successful
                 failed += thread_failed
-                total_assets_processed += (end_index - start_index)
+                total_assets_processed += thread_processed
                 all_results.extend(thread_results)
                 asset_configs_not_found += asset_configs_not_per_thread
                 asset_not_found += asset_not_found_thread
 
-        # Create and start threads
-        threads = []
-        chunk_size = len(asset_data) // num_threads
-        remainder = len(asset_data) % num_threads
-
-        start_index = 0
-        for i in range(num_threads):
-            end_index = start_index + chunk_size + (1 if i < remainder else 0)
-            thread = threading.Thread(target=process_asset_chunk, args=(i, start_index, end_index))
-            threads.append(thread)
-            thread.start()
-            start_index = end_index
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-
-        # Close main progress bar
-        if quiet_mode and not verbose_mode:
-            pbar.close()
+        # Run worker threads until the queue is drained
+        run_work_queue(work_queue, process_asset_chunk, num_threads, logger)
+        pbar.close()
+        resolver.save()
+        if journal:
+            journal.finish(failed=sum(1 for result in all_results if result['status'] == 'failed'))
 
         if failed > 0:
             print(f"\nFailed assets:")
@@ -3759,7 +3487,7 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
         print("\n" + "=" * 60)
         print("ASSET CONFIG IMPORT SUMMARY")
         print("=" * 60)
-        print(f"📋 Total assets in CSV: {len(asset_data)}")
+        print(f"📋 Total assets in CSV: {total_assets}")
         print(f"🔧 Assets with custom configuration: {assets_with_config}")
         print(f"⚙️  Assets with null configuration: {assets_with_null_config}")
         print(f"📄 Assets without configuration field: {assets_without_config}")
@@ -3770,6 +3498,8 @@ def execute_asset_config_import_parallel(csv_file: str, client, logger: logging.
         print(f"❌ Failed to import: {failed}")
         print(f"🔍 Asset not found in target: {asset_not_found}")
         print(f"⏭️  Assets skipped (default config): {asset_configs_not_found}")
+        print(f"⏱️  {work_queue.format_latency_stats()}")
+        print(f"🗂️  {resolver.format_stats()}")
         print("=" * 60)
         
         # Show detailed reasons for skipped assets
@@ -3958,6 +3688,7 @@ def execute_transform_and_merge(string_transforms: dict, quiet_mode: bool, verbo
         # Create temporary source file with transformed target_uid
         temp_source_file = asset_export_dir / "temp_source_transformed.csv"
         transformed_count = 0
+        transform_engine = StringTransformEngine(string_transforms)
 
         try:
             with open(temp_source_file, 'w', newline='', encoding='utf-8') as f:
@@ -3974,31 +3705,11 @@ def execute_transform_and_merge(string_transforms: dict, quiet_mode: bool, verbo
                     
                     # Apply string transformations atomically if provided
                     if string_transforms:
-                        # Phase 1: Replace all source strings with unique placeholders
-                        # This prevents later transformations from affecting earlier ones
-                        placeholders = {}
-                        temp_uid = transformed_target_uid
-                        
-                        for source_str, target_str in string_transforms.items():
-                            if source_str != target_str:
-                                # Use exact word boundary matching
-                                if re.search(r'\b' + re.escape(source_str) + r'\b', temp_uid):
-                                    # Create a unique placeholder for this transformation
-                                    placeholder = f"__TRANSFORM_PLACEHOLDER_{len(placeholders)}__"
-                                    placeholders[placeholder] = target_str
-                                    # Use regex replacement for exact word boundary matching
-                                    temp_uid = re.sub(r'\b' + re.escape(source_str) + r'\b', placeholder, temp_uid)
-                                    transformed_count += 1
-                                    if verbose_mode:
-                                        print(f"🔄 Phase 1: '{source_str}' -> '{placeholder}' in '{original_target_uid}'")
-                        
-                        # Phase 2: Replace all placeholders with their target strings
-                        for placeholder, target_str in placeholders.items():
-                            temp_uid = temp_uid.replace(placeholder, target_str)
-                            if verbose_mode:
-                                print(f"🔄 Phase 2: '{placeholder}' -> '{target_str}'")
-                        
-                        transformed_target_uid = temp_uid
+                        transformed_target_uid, matched_sources = transform_engine.apply_with_matches(original_target_uid)
+                        transformed_count += len(matched_sources)
+                        if verbose_mode:
+                            for source_str in matched_sources:
+                                print(f"🔄 '{source_str}' -> '{string_transforms[source_str]}' in '{original_target_uid}'")
                         
                         if transformed_target_uid != original_target_uid:
                             if verbose_mode:
@@ -4388,12 +4099,12 @@ def detect_and_resolve_duplicates(csv_file: str, quiet_mode: bool = False, verbo
     Detect duplicate target UIDs in the asset-profiles-import-ready.csv file and let user choose which one to keep.
     
     Args:
-        csv_file: Path to the asset-profiles-import-ready.csv file
+        csv_file: Path to the asset-profiles-import-ready.csv file (or its JSON Lines counterpart)
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
         
     Returns:
-        str: Path to the deduplicated CSV file
+        str: Path to the deduplicated file, in the format of the input file
     """
     import csv
     from pathlib import Path
@@ -4404,14 +4115,12 @@ def detect_and_resolve_duplicates(csv_file: str, quiet_mode: bool = False, verbo
     
     # Read all entries
     entries = []
-    csv.field_size_limit(sys.maxsize)  # Handle large JSON fields
-    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)  # Skip header
+    with open_records(csv_file) as reader:
+        header = reader.header
         for row_num, row in enumerate(reader, 2):
             if len(row) >= 2:
                 target_env = row[0].strip()
-                profile_json = row[1].strip()
+                profile_json = row[1].strip() if reader.record_format == FORMAT_CSV else row[1]
                 entries.append({
                     'row_num': row_num,
                     'target_env': target_env,
@@ -4452,7 +4161,7 @@ def detect_and_resolve_duplicates(csv_file: str, quiet_mode: bool = False, verbo
                 # Extract source info from profile JSON for display
                 try:
                     import json
-                    profile_data = json.loads(entry['profile_json'])
+                    profile_data = reader.json(entry['profile_json'])
                     profile_settings = profile_data.get("profileSettingsConfigs", {})
                     
                     # Check for notification channels
@@ -4521,17 +4230,23 @@ def detect_and_resolve_duplicates(csv_file: str, quiet_mode: bool = False, verbo
         if len(entries) == 1 and target_env not in skipped_targets:
             selected_entries.append(entries[0])
     
-    # Create deduplicated CSV - use the same format as the input file
-    output_file = csv_file.replace('.csv', '_deduplicated.csv')
+    # Create deduplicated file - use the same format as the input file
+    input_path = Path(csv_file)
+    output_file = str(input_path.with_name(f"{input_path.stem}_deduplicated{input_path.suffix}"))
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-        writer.writerow(header)  # Write header (preserves format)
-        for entry in selected_entries:
-            # Write the same format as input (with or without source-env)
-            if len(entry['raw_row']) >= 3:
-                writer.writerow([entry['target_env'], entry['profile_json'], entry['raw_row'][2]])
-            else:
-                writer.writerow([entry['target_env'], entry['profile_json']])
+        if reader.record_format == FORMAT_JSONL:
+            # Records keep their parsed profiles and the columns they were read with
+            RecordWriter(f, header, record_format=FORMAT_JSONL).write_rows(
+                entry['raw_row'] for entry in selected_entries)
+        else:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(header)  # Write header (preserves format)
+            for entry in selected_entries:
+                # Write the same format as input (with or without source-env)
+                if len(entry['raw_row']) >= 3:
+                    writer.writerow([entry['target_env'], entry['profile_json'], entry['raw_row'][2]])
+                else:
+                    writer.writerow([entry['target_env'], entry['profile_json']])
     
     if not quiet_mode:
         print(f"\n✅ Deduplication complete!")
@@ -5093,30 +4808,25 @@ def verify_asset_configurations_after_import(input_csv_file: str, client, logger
         from .utils import get_thread_names
         thread_names = get_thread_names()
         
-        def verify_asset_config_chunk(thread_id, start_index, end_index):
+        # Shared progress bar; workers pull assets from a shared queue so slow assets do not stall a whole slice
+        pbar = create_progress_bar(
+            total=len(asset_data),
+            desc="Verifying configs",
+            unit="assets",
+            disable=verbose_mode  # Disable if verbose mode
+        )
+        work_queue = WorkQueue(enumerate(asset_data), pbar)
+        
+        def verify_asset_config_chunk(thread_id):
             nonlocal successful, failed, asset_not_found, config_not_found
             thread_successful = 0
             thread_failed = 0
             thread_asset_not_found = 0
             thread_config_not_found = 0
             thread_results = []
-            
-            # Create individual progress bar for this thread
             thread_name = thread_names[thread_id] if thread_id < len(thread_names) else f"Thread {thread_id}"
-            thread_pbar = create_progress_bar(
-                total=end_index - start_index,
-                desc=thread_name,
-                unit="",
-                disable=verbose_mode,  # Disable if verbose mode
-                position=thread_id,
-                leave=False
-            )
             
-            for i in range(start_index, end_index):
-                if i >= len(asset_data):
-                    break
-                
-                asset = asset_data[i]
+            for i, asset in work_queue.consume():
                 target_uid = asset['target_uid']
                 expected_config = asset['config_json']
                 
@@ -5401,10 +5111,6 @@ def verify_asset_configurations_after_import(input_csv_file: str, client, logger
                         'has_config': False,
                         'config_details': {}
                     })
-                
-                # Update thread progress bar
-                if thread_pbar:
-                    thread_pbar.update(1)
             
             # Update global counters
             with lock:
@@ -5414,34 +5120,12 @@ def verify_asset_configurations_after_import(input_csv_file: str, client, logger
                 config_not_found += thread_config_not_found
                 all_results.extend(thread_results)
             
-            # Close thread progress bar
-            if thread_pbar:
-                thread_pbar.close()
-            
             if verbose_mode:
                 print(f"🔍 {thread_name}: Completed - {thread_successful} success, {thread_failed} failed, {thread_asset_not_found} asset not found, {thread_config_not_found} config not found")
         
-        # Create and start threads
-        threads = []
-        chunk_size = len(asset_data) // num_threads
-        remainder = len(asset_data) % num_threads
-        
-        start_index = 0
-        for thread_id in range(num_threads):
-            end_index = start_index + chunk_size + (1 if thread_id < remainder else 0)
-            thread = threading.Thread(
-                target=verify_asset_config_chunk,
-                args=(thread_id + 1, start_index, end_index)
-            )
-            threads.append(thread)
-            thread.start()
-            start_index = end_index
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Progress bars are closed by individual threads
+        # Run worker threads until the queue is drained
+        run_work_queue(work_queue, verify_asset_config_chunk, num_threads, logger)
+        pbar.close()
         
         # Compile results
         verification_results = {
@@ -5450,7 +5134,8 @@ def verify_asset_configurations_after_import(input_csv_file: str, client, logger
                 'successful': successful,
                 'failed': failed,
                 'asset_not_found': asset_not_found,
-                'config_not_found': config_not_found
+                'config_not_found': config_not_found,
+                'latency': work_queue.latency_stats()
             },
             'details': all_results
         }
@@ -5467,6 +5152,7 @@ def verify_asset_configurations_after_import(input_csv_file: str, client, logger
             if successful > 0:
                 success_rate = (successful / len(asset_data)) * 100
                 print(f"   📈 Success rate: {success_rate:.1f}%")
+            print(f"   ⏱️  {work_queue.format_latency_stats()}")
             
             # Enhanced detailed breakdown
             print(f"\n🔍 DETAILED BREAKDOWN:")
@@ -6048,17 +5734,7 @@ def fetch_assets_for_all_tags_from_api(client, logger: logging.Logger, tags, use
     def process_tag_chunk(thread_id, start_index, end_index):
         """Process a chunk of tags for a specific thread."""
         # Create a thread-local client instance
-        thread_client = type(client)(
-            host=client.host,
-            access_key=client.access_key,
-            secret_key=client.secret_key,
-            tenant=getattr(client, 'tenant', None)
-        )
-        # Copy target credentials to thread client
-        thread_client.target_access_key = getattr(client, 'target_access_key', None)
-        thread_client.target_secret_key = getattr(client, 'target_secret_key', None)
-        thread_client.target_host = getattr(client, 'target_host', None)
-        thread_client.target_tenant = getattr(client, 'target_tenant', None)
+        thread_client = get_thread_client(client)
         
         # Get tags for this thread
         thread_tags = tags[start_index:end_index]
@@ -6213,17 +5889,7 @@ def enrich_assets_with_details_from_api(client, logger: logging.Logger, mappings
     def process_asset_chunk(thread_id, start_index, end_index):
         """Process a chunk of assets for a specific thread."""
         # Create a thread-local client instance
-        thread_client = type(client)(
-            host=client.host,
-            access_key=client.access_key,
-            secret_key=client.secret_key,
-            tenant=getattr(client, 'tenant', None)
-        )
-        # Copy target credentials to thread client
-        thread_client.target_access_key = getattr(client, 'target_access_key', None)
-        thread_client.target_secret_key = getattr(client, 'target_secret_key', None)
-        thread_client.target_host = getattr(client, 'target_host', None)
-        thread_client.target_tenant = getattr(client, 'target_tenant', None)
+        thread_client = get_thread_client(client)
         
         # Get assets for this thread
         thread_assets = mappings[start_index:end_index]
@@ -0,0 +1,401 @@
+"""
+Target asset UID to ID resolution for import commands.
+
+Every import command needs the target asset ID for each target UID before it
+can write anything, and historically each one issued its own
+``GET /catalog-server/api/assets?uid=`` per row. This module keeps a single
+UID index that is:
+
+- seeded from the CSV files earlier steps already wrote
+  (``asset-import/asset-merged-all.csv`` and
+  ``asset-export/asset-all-target-export.csv``),
+- filled lazily from the API for UIDs the files do not cover, and
+- persisted to ``~/.adoc_migration_toolkit/cache`` per target environment so
+  later commands and reruns start warm.
+
+Entries older than the TTL are ignored. Misses are never cached, so an asset
+created after a failed lookup is found on the next attempt, and an ID the API
+rejects as not found is dropped and looked up again (see ``retry_stale``).
+"""
+
+import csv
+import sys
+import json
+import time
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from ..shared import globals
+
+# Default time-to-live for resolved UIDs, in seconds
+DEFAULT_RESOLVER_TTL = 24 * 60 * 60
+
+# Directory holding the persisted per-environment UID indexes
+RESOLVER_CACHE_DIR = Path.home() / ".adoc_migration_toolkit" / "cache"
+
+
+def _normalize_asset_id(asset_id: Any) -> Any:
+    """Return numeric IDs read from CSV or JSON as int, like the API returns them."""
+    if isinstance(asset_id, str) and asset_id.isdigit():
+        return int(asset_id)
+    return asset_id
+
+
+def extract_assets_from_response(response: Any) -> list:
+    """Get the asset list from a ``GET /catalog-server/api/assets?uid=`` response.
+
+    The endpoint returns ``data`` either as a list of assets or as a
+    dictionary with an ``assets`` list.
+
+    Args:
+        response: Parsed API response
+
+    Returns:
+        List of asset dictionaries (empty if none were found)
+    """
+    if not isinstance(response, dict):
+        return []
+    data = response.get('data')
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get('assets'), list):
+        return data['assets']
+    return []
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """Check whether an API call failed with HTTP 404."""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) == 404
+
+
+class TargetAssetResolver:
+    """Thread-safe UID to asset ID index for the target environment."""
+
+    def __init__(self, client, logger: Optional[logging.Logger] = None, ttl: int = DEFAULT_RESOLVER_TTL,
+                 cache_file: Optional[Path] = None):
+        """Initialize the resolver.
+
+        Args:
+            client: API client used for lookups the index cannot answer
+            logger: Logger instance
+            ttl: Seconds a resolved UID stays valid
+            cache_file: Path of the persisted index; defaults to one file per target environment.
+                The index is kept in memory only if no environment can be determined.
+        """
+        self.client = client
+        self.logger = logger or logging.getLogger(__name__)
+        self.ttl = ttl
+        self.cache_file = cache_file if cache_file is not None else self._default_cache_file(client)
+        self.hits = 0
+        self.lookups = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # UIDs prefetch found no asset for, answered once without another lookup
+        self._prefetch_misses = set()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @staticmethod
+    def _default_cache_file(client) -> Optional[Path]:
+        """Cache file for the client's target environment, or None if it is unknown."""
+        try:
+            host_url = client._build_host_url(use_target_tenant=True)
+        except Exception:
+            return None
+        tenant = getattr(client, 'target_tenant', None) or getattr(client, 'tenant', None)
+        if not isinstance(host_url, str) or not isinstance(tenant, str):
+            return None
+        digest = hashlib.sha1(f"{host_url}|{tenant}".encode('utf-8')).hexdigest()[:16]
+        return RESOLVER_CACHE_DIR / f"target-asset-ids-{digest}.json"
+
+    @classmethod
+    def for_import(cls, client, logger: Optional[logging.Logger] = None, ttl: int = DEFAULT_RESOLVER_TTL):
+        """Create a resolver warmed from the on-disk cache and the output directory CSV files.
+
+        Args:
+            client: API client instance
+            logger: Logger instance
+            ttl: Seconds a resolved UID stays valid
+
+        Returns:
+            TargetAssetResolver instance
+        """
+        resolver = cls(client, logger, ttl)
+        resolver.load()
+        if globals.GLOBAL_OUTPUT_DIR:
+            output_dir = Path(globals.GLOBAL_OUTPUT_DIR)
+            resolver.seed_from_csv(output_dir / "asset-export" / "asset-all-target-export.csv")
+            resolver.seed_from_csv(output_dir / "asset-import" / "asset-merged-all.csv")
+        return resolver
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _is_fresh(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        return ((now or time.time()) - entry.get('ts', 0)) < self.ttl
+
+    def _store(self, uid: str, asset_id: Any, asset_type: Optional[str], ts: float) -> None:
+        """Add an entry unless a newer one is already known. Caller holds the lock."""
+        current = self._entries.get(uid)
+        if current and current['ts'] > ts:
+            return
+        if current and asset_type is None and str(current['id']) == str(asset_id):
+            asset_type = current.get('asset_type')
+        self._entries[uid] = {'id': _normalize_asset_id(asset_id), 'asset_type': asset_type, 'ts': ts}
+        self._dirty = True
+
+    def load(self) -> int:
+        """Load fresh entries from the persisted index.
+
+        Returns:
+            Number of entries loaded
+        """
+        if not self.cache_file or not Path(self.cache_file).exists():
+            return 0
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable asset ID cache {self.cache_file}: {e}")
+            return 0
+        now = time.time()
+        loaded = 0
+        with self._lock:
+            for uid, entry in data.get('assets', {}).items():
+                if isinstance(entry, dict) and 'id' in entry and self._is_fresh(entry, now):
+                    self._store(uid, entry['id'], entry.get('asset_type'), entry.get('ts', 0))
+                    loaded += 1
+            self._dirty = False
+        self.logger.debug(f"Loaded {loaded} target asset IDs from {self.cache_file}")
+        return loaded
+
+    def seed_from_csv(self, csv_file) -> int:
+        """Seed the index from an asset CSV written by an earlier step.
+
+        Supports asset-merged-all.csv (``target_uid``/``target_id`` columns) and
+        asset-all-target-export.csv, where ``source_uid``/``source_id`` hold the
+        target environment's own UID and ID. Files older than the TTL are skipped;
+        otherwise the file modification time is used as the entry timestamp.
+
+        Args:
+            csv_file: Path to the CSV file
+
+        Returns:
+            Number of UIDs seeded
+        """
+        csv_path = Path(csv_file)
+        try:
+            mtime = csv_path.stat().st_mtime
+        except OSError:
+            return 0
+        if not self._is_fresh({'ts': mtime}):
+            self.logger.info(f"Not seeding asset IDs from {csv_path}: older than {self.ttl}s")
+            return 0
+
+        seeded = 0
+        csv.field_size_limit(sys.maxsize)
+        try:
+            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                fields = reader.fieldnames or []
+                if 'target_id' in fields and 'target_uid' in fields:
+                    uid_column, id_column = 'target_uid', 'target_id'
+                elif 'source_id' in fields and 'source_uid' in fields and 'assembly_id' in fields:
+                    uid_column, id_column = 'source_uid', 'source_id'
+                else:
+                    self.logger.warning(f"Unrecognised asset CSV format, not seeding asset IDs: {csv_path}")
+                    return 0
+                with self._lock:
+                    for row in reader:
+                        uid = (row.get(uid_column) or '').strip()
+                        asset_id = (row.get(id_column) or '').strip()
+                        if not uid or not asset_id:
+                            continue
+                        # Only IDs are seeded; asset types always come from the UID lookup so enrichment output is unchanged
+                        self._store(uid, asset_id, None, mtime)
+                        seeded += 1
+        except (OSError, csv.Error) as e:
+            self.logger.warning(f"Could not seed asset IDs from {csv_path}: {e}")
+            return 0
+        self.logger.info(f"Seeded {seeded} target asset IDs from {csv_path}")
+        return seeded
+
+    def get_cached(self, uid: str) -> Optional[Dict[str, Any]]:
+        """Get a fresh index entry without calling the API."""
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry and self._is_fresh(entry):
+                return dict(entry)
+        return None
+
+    def resolve_asset(self, uid: str, client=None, need_type: bool = False) -> Optional[Dict[str, Any]]:
+        """Resolve a target UID to its index entry, calling the API on a miss.
+
+        Args:
+            uid: Target asset UID
+            client: Client to use for the lookup (defaults to the resolver's client)
+            need_type: Treat entries without an asset type as misses
+
+        Returns:
+            Dictionary with ``id`` and ``asset_type``, or None if the asset was not found
+        """
+        if not uid:
+            return None
+        entry = self.get_cached(uid)
+        if entry and (entry.get('asset_type') or not need_type):
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        with self._lock:
+            if uid in self._prefetch_misses:
+                self._prefetch_misses.discard(uid)
+                self.hits += 1
+                return None
+            self.lookups += 1
+        response = (client or self.client).make_api_call(
+            endpoint=f"/catalog-server/api/assets?uid={uid}",
+            method='GET',
+            use_target_auth=True,
+            use_target_tenant=True
+        )
+        assets = extract_assets_from_response(response)
+        asset = assets[0] if assets and isinstance(assets[0], dict) else None
+        if not asset or not asset.get('id'):
+            self.logger.debug(f"No target asset ID found for UID: {uid}")
+            return None
+
+        asset_type = asset.get('assetType')
+        if isinstance(asset_type, dict):
+            asset_type = asset_type.get('name')
+        with self._lock:
+            self._store(uid, asset['id'], asset_type or None, time.time())
+            return dict(self._entries[uid])
+
+    def resolve(self, uid: str, client=None) -> Optional[Any]:
+        """Resolve a target UID to its asset ID, calling the API on a miss.
+
+        Args:
+            uid: Target asset UID
+            client: Client to use for the lookup (defaults to the resolver's client)
+
+        Returns:
+            Target asset ID, or None if the asset was not found
+        """
+        entry = self.resolve_asset(uid, client)
+        return entry['id'] if entry else None
+
+    def invalidate(self, uid: str) -> None:
+        """Drop a UID from the index, e.g. once its asset was deleted and recreated."""
+        with self._lock:
+            self._prefetch_misses.discard(uid)
+            if self._entries.pop(uid, None) is not None:
+                self._dirty = True
+
+    def retry_stale(self, uid: str, asset_id: Any, request: Callable[[Any], Any],
+                    client=None) -> Tuple[Any, Any]:
+        """Run a request against a resolved asset ID, resolving the UID again if the ID is stale.
+
+        If the request fails with HTTP 404, the UID is dropped from the index and
+        looked up through the API once; the request is retried if that gives a
+        different ID.
+
+        Args:
+            uid: Target asset UID
+            asset_id: Asset ID the UID was resolved to
+            request: Callable that sends the request for an asset ID
+            client: Client to use for the lookup (defaults to the resolver's client)
+
+        Returns:
+            Tuple of the asset ID used and the result of the request
+
+        Raises:
+            Exception: The request's error if it fails for another reason, or the
+                UID still resolves to the same ID or to no asset
+        """
+        try:
+            return asset_id, request(asset_id)
+        except Exception as e:
+            if not is_not_found_error(e):
+                raise
+            self.invalidate(uid)
+            fresh_id = self.resolve(uid, client)
+            if fresh_id is None or str(fresh_id) == str(asset_id):
+                raise
+        self.logger.info(f"Target asset ID for {uid} changed from {asset_id} to {fresh_id}, retrying")
+        return fresh_id, request(fresh_id)
+
+    def prefetch(self, uids: Iterable[str], max_threads: int = 5, need_type: bool = False) -> int:
+        """Resolve all UIDs the index cannot answer, deduplicated and in parallel.
+
+        A UID without an asset is remembered until the next lookup, so resolving
+        it right after the prefetch does not call the API again.
+
+        Args:
+            uids: Target asset UIDs
+            max_threads: Maximum number of concurrent lookups
+            need_type: Also fetch UIDs whose cached entry lacks an asset type
+
+        Returns:
+            Number of UIDs looked up through the API
+        """
+        misses = []
+        for uid in dict.fromkeys(u for u in uids if u):
+            entry = self.get_cached(uid)
+            if not entry or (need_type and not entry.get('asset_type')):
+                misses.append(uid)
+        if not misses:
+            return 0
+
+        thread_clients = threading.local()
+
+        def lookup(uid):
+            if not hasattr(thread_clients, 'client'):
+                for_thread = getattr(type(self.client), 'for_thread', None)
+                thread_clients.client = self.client.for_thread() if callable(for_thread) else self.client
+            try:
+                if self.resolve_asset(uid, thread_clients.client, need_type) is None:
+                    with self._lock:
+                        self._prefetch_misses.add(uid)
+            except Exception as e:
+                self.logger.warning(f"Failed to resolve target asset UID {uid}: {e}")
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_threads, len(misses)))) as executor:
+            list(executor.map(lookup, misses))
+        return len(misses)
+
+    def save(self) -> bool:
+        """Persist fresh entries to the on-disk index, atomically.
+
+        Returns:
+            True if the index was written
+        """
+        if not self.cache_file or not self._dirty:
+            return False
+        now = time.time()
+        with self._lock:
+            assets = {uid: entry for uid, entry in self._entries.items() if self._is_fresh(entry, now)}
+            self._dirty = False
+        cache_path = Path(self.cache_file)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'saved_at': now, 'assets': assets}, f)
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save asset ID cache {cache_path}: {e}")
+            return False
+        self.logger.debug(f"Saved {len(assets)} target asset IDs to {cache_path}")
+        return True
+
+    def format_stats(self) -> str:
+        """Format cache usage as a single summary line."""
+        return f"Target asset IDs: {self.hits} from cache, {self.lookups} API lookups"
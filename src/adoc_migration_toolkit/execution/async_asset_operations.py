@@ -0,0 +1,462 @@
+"""
+Async asset operations execution functions.
+
+This module contains asyncio-based versions of the bulk asset commands
+(asset-list-export, asset-profile-export and asset-tag-import). Instead of one
+OS thread per blocking request, a fixed pool of coroutines pulls work from a
+queue and shares a single AsyncAcceldataAPIClient, so hundreds of requests can
+be in flight from one process.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from adoc_migration_toolkit.execution.utils import create_progress_bar, read_csv_asset_data
+from ..shared.api_client import AsyncAcceldataAPIClient, DEFAULT_MAX_CONCURRENCY
+from ..shared.file_utils import get_output_file_path
+from ..shared import globals
+from .asset_operations import asset_list_dedup_key, tag_import_checkpoint_key, write_asset_list_export
+from ..shared.sorted_runs import SortedRunWriter, remove_runs
+
+
+async def run_bounded(items: Iterable[Any], worker: Callable[[Any], Awaitable[Any]], max_concurrency: int,
+                      progress_bar=None) -> List[Any]:
+    """Run ``worker`` over ``items`` with at most ``max_concurrency`` coroutines.
+
+    Items are pulled from ``items`` on demand, so at most ``max_concurrency`` of
+    them are in flight at a time. Every result is kept until the call returns,
+    so memory use still grows with the number of items.
+
+    Args:
+        items: Items to process
+        worker: Coroutine function called once per item
+        max_concurrency: Number of worker coroutines
+        progress_bar: Optional progress bar updated once per item
+
+    Returns:
+        List of worker results in input order (exceptions are returned in place of results)
+    """
+    # The event loop runs one coroutine at a time, so the workers can share the iterator
+    pending = enumerate(items)
+    results: Dict[int, Any] = {}
+
+    async def consume():
+        for index, item in pending:
+            try:
+                results[index] = await worker(item)
+            except Exception as e:
+                results[index] = e
+            if progress_bar is not None:
+                progress_bar.update(1)
+
+    await asyncio.gather(*(consume() for _ in range(max(1, max_concurrency))))
+    return [results[index] for index in range(len(results))]
+
+
+def _extract_page_assets(page_response: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Extract the asset list from an /assets/list page response.
+
+    Args:
+        page_response: Page response from the API
+
+    Returns:
+        List of assets, or None if the response has no recognisable asset list
+    """
+    if not page_response:
+        return None
+    for location in ['assets', 'asset', 'items', 'results']:
+        page_assets = page_response.get(location)
+        if isinstance(page_assets, list):
+            return page_assets
+    return None
+
+
+def execute_asset_list_export_async(client, logger: logging.Logger, source_type_ids: str = None, asset_type_ids: str = None, assembly_ids: str = None, quiet_mode: bool = False, verbose_mode: bool = False, use_target: bool = False, page_size: int = 100, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+    """Execute the asset-list-export command using the async engine.
+
+    Produces the same output files as execute_asset_list_export_parallel.
+
+    Args:
+        client: API client instance
+        logger: Logger instance
+        quiet_mode: Whether to suppress console output
+        verbose_mode: Whether to enable verbose logging
+        use_target: Whether to use target environment instead of source
+        page_size: Number of assets per page
+        max_concurrency: Maximum number of in-flight requests
+    """
+    try:
+        asyncio.run(_asset_list_export_async(client, logger, asset_type_ids, assembly_ids, quiet_mode, verbose_mode,
+                                             use_target, page_size, max_concurrency))
+    except Exception as e:
+        error_msg = f"Error in asset-list-export (async): {e}"
+        if not quiet_mode:
+            print(f"❌ {error_msg}")
+        logger.error(error_msg)
+
+
+async def _asset_list_export_async(client, logger: logging.Logger, asset_type_ids, assembly_ids, quiet_mode: bool,
+                                   verbose_mode: bool, use_target: bool, page_size: int, max_concurrency: int):
+    """Async implementation of execute_asset_list_export_async."""
+    env_type = "TARGET" if use_target else "SOURCE"
+    file_name = "asset-all-target-export.csv" if use_target else "asset-all-source-export.csv"
+    if globals.GLOBAL_OUTPUT_DIR:
+        output_file = globals.GLOBAL_OUTPUT_DIR / "asset-export" / file_name
+    else:
+        output_file = Path(file_name)
+
+    if not quiet_mode:
+        print(f"\nExporting all assets from ADOC {env_type} environment (Async Mode)")
+        print(f"Host: {client._build_host_url(use_target_tenant=use_target)}")
+        print(f"Output will be written to: {output_file}")
+        print(f"Max concurrency: {max_concurrency}")
+        print("="*80)
+
+    def page_endpoint(page: int) -> str:
+        query_params = [f"page={page}", f"size={page_size}", "sortBy=id:ASC"]
+        if asset_type_ids not in [None, 'None', 'null', '']:
+            query_params.append(f"asset_type_ids={asset_type_ids}")
+        if assembly_ids not in [None, 'None', 'null', '']:
+            query_params.append(f"assembly_ids={assembly_ids}")
+        return f"/catalog-server/api/assets/list?{'&'.join(query_params)}"
+
+    async with AsyncAcceldataAPIClient(client, max_concurrency=max_concurrency, logger=logger) as async_client:
+        count_response = await async_client.make_api_call(
+            endpoint=page_endpoint(0),
+            method='GET',
+            use_target_auth=use_target,
+            use_target_tenant=use_target
+        )
+        if not count_response or 'assets' not in count_response:
+            error_msg = "Failed to get assets from response"
+            print(f"❌ {error_msg}")
+            logger.error(error_msg)
+            return
+
+        total_count = count_response.get('meta', {}).get('total', len(count_response['assets']))
+        total_pages = (total_count + page_size - 1) // page_size
+        if not quiet_mode:
+            print(f"Total assets found: {total_count}")
+            print(f"Total pages to retrieve: {total_pages}")
+
+        async def fetch_page(page: int):
+            page_response = await async_client.make_api_call(
+                endpoint=page_endpoint(page),
+                method='GET',
+                use_target_auth=use_target,
+                use_target_tenant=use_target
+            )
+            if verbose_mode:
+                print(f"\nPage {page + 1} Response:")
+                print(json.dumps(page_response, indent=2, ensure_ascii=False))
+            page_assets = _extract_page_assets(page_response)
+            if page_assets is None:
+                raise ValueError(f"Invalid response format for page {page + 1} - no assets found")
+            return page_assets
+
+        progress_bar = create_progress_bar(total=total_pages, desc="Pages", unit="pages", disable=quiet_mode)
+        page_results = await run_bounded(range(total_pages), fetch_page, max_concurrency, progress_bar)
+        progress_bar.close()
+
+    # Rows are added in page order, so the first copy of a duplicate asset is kept,
+    # and written by the same deduplication and sort as the parallel export
+    runs = SortedRunWriter(asset_list_dedup_key)
+    failed_pages = 0
+    try:
+        for page, result in enumerate(page_results):
+            if isinstance(result, Exception):
+                error_msg = f"Failed to retrieve page {page + 1}: {result}"
+                if not quiet_mode:
+                    print(f"❌ {error_msg}")
+                logger.error(error_msg)
+                failed_pages += 1
+                continue
+            for asset in result:
+                asset_uid = asset.get('assetUid', '')
+                runs.add([asset_uid, asset.get('assetId', ''), asset_uid, '',
+                          asset.get('assemblyId', ''), asset.get('assetType', '')])
+        run_files = runs.close()
+    except BaseException:
+        remove_runs(runs.runs)
+        raise
+
+    duplicates_file = output_file.parent / f"{output_file.stem}-duplicates.csv"
+    _, unique_count, duplicate_count = write_asset_list_export(run_files, output_file, duplicates_file, verbose_mode)
+
+    if not quiet_mode:
+        print("\n" + "="*80)
+        print("ASSET LIST EXPORT COMPLETED (ASYNC MODE)")
+        print("="*80)
+        print(f"Environment: {env_type}")
+        print(f"Output file: {output_file}")
+        print(f"Total assets exported: {unique_count}")
+        print(f"Duplicates removed: {duplicate_count}")
+        print(f"Successful pages: {total_pages - failed_pages}")
+        print(f"Failed pages: {failed_pages}")
+        print(f"Max concurrency: {max_concurrency}")
+        print("="*80)
+    else:
+        print(f"✅ Asset list export completed: {unique_count} assets exported to {output_file}")
+
+
+def execute_asset_profile_export_async(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False, verbose_mode: bool = False, allowed_types: list[str] = ['table', 'sql_view', 'view', 'file', 'kafka_topic'], max_concurrency: int = DEFAULT_MAX_CONCURRENCY, source_context_id: str = None, target_context_id: str = None):
+    """Execute the asset-profile-export command using the async engine.
+
+    Produces the same output file as execute_asset_profile_export_parallel.
+
+    Args:
+        csv_file: Path to the CSV file containing source-env and target-env mappings
+        client: API client instance
+        logger: Logger instance
+        output_file: Path to output file for writing results
+        quiet_mode: Whether to suppress console output
+        verbose_mode: Whether to enable verbose logging
+        allowed_types: List of asset types to export
+        max_concurrency: Maximum number of in-flight requests
+        source_context_id: Source context ID for notification mapping
+        target_context_id: Target context ID for notification mapping
+    """
+    try:
+        csv_path = Path(csv_file)
+        if not csv_path.exists():
+            error_msg = f"CSV file does not exist: {csv_file}"
+            print(f"❌ {error_msg}")
+            logger.error(error_msg)
+            return
+
+        asset_data = read_csv_asset_data(csv_file, logger, allowed_types)
+        env_mappings = [
+            (entry['source_uid'], entry['target_uid'])
+            for entry in asset_data
+            if entry.get('source_uid') and entry.get('target_uid')
+        ]
+        if not env_mappings:
+            logger.warning("No environment mappings found in CSV file")
+            return
+
+        # Notification mapping is built once up front with the sync client
+        notification_id_mapping = {}
+        if source_context_id and target_context_id:
+            try:
+                from .notification_operations import create_notification_id_mapping_csv, load_notification_id_mapping
+                mapping_csv_path = create_notification_id_mapping_csv(client, logger, source_context_id, target_context_id, quiet_mode, verbose_mode)
+                notification_id_mapping = load_notification_id_mapping(mapping_csv_path, quiet_mode, verbose_mode)
+            except Exception as e:
+                if not quiet_mode:
+                    print(f"⚠️  Failed to create notification ID mapping: {e}")
+                logger.warning(f"Failed to create notification ID mapping: {e}")
+
+        if not output_file:
+            output_file = get_output_file_path(csv_file, "asset-profiles-import-ready.csv", category="asset-import")
+
+        if not quiet_mode:
+            print(f"\nProcessing {len(env_mappings)} asset profile exports from CSV file (Async Mode)")
+            print(f"Input file: {csv_file}")
+            print(f"Output will be written to: {output_file}")
+            print(f"Max concurrency: {max_concurrency}")
+            print("="*80)
+
+        rows, failed = asyncio.run(_asset_profile_export_async(
+            env_mappings, client, logger, quiet_mode, verbose_mode, max_concurrency, notification_id_mapping))
+
+        rows.sort(key=lambda row: row[0].lower())
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(['target-env', 'profile_json', 'source-env'])
+            writer.writerows(rows)
+
+        if not quiet_mode:
+            print("\n" + "="*80)
+            print("ASSET PROFILE EXPORT COMPLETED (ASYNC MODE)")
+            print("="*80)
+            print(f"Output file: {output_file}")
+            print(f"Total assets processed: {len(env_mappings)}")
+            print(f"Total successful: {len(rows)}")
+            print(f"Total failed: {failed}")
+            print("="*80)
+            if failed > 0:
+                print("⚠️  Export completed with errors. Check log file for details.")
+            else:
+                print("✅ Export completed successfully!")
+        else:
+            print(f"✅ Asset profile export completed: {len(rows)} assets processed")
+            print(f"Output written to: {output_file}")
+
+    except Exception as e:
+        error_msg = f"Error in async asset-profile-export: {e}"
+        if not quiet_mode:
+            print(f"❌ {error_msg}")
+        logger.error(error_msg)
+        raise
+
+
+async def _asset_profile_export_async(env_mappings, client, logger: logging.Logger, quiet_mode: bool, verbose_mode: bool,
+                                      max_concurrency: int, notification_id_mapping: dict):
+    """Async implementation of execute_asset_profile_export_async.
+
+    Returns:
+        Tuple of (rows, failed_count) where each row is [target_env, profile_json, source_env]
+    """
+    async with AsyncAcceldataAPIClient(client, max_concurrency=max_concurrency, logger=logger) as async_client:
+
+        async def export_profile(mapping):
+            source_env, target_env = mapping
+            asset_response = await async_client.make_api_call(
+                endpoint=f"/catalog-server/api/assets?uid={source_env}",
+                method='GET'
+            )
+            data_array = asset_response.get('data') if asset_response else None
+            if not data_array or 'id' not in data_array[0]:
+                raise ValueError(f"No asset ID found in asset response for UID: {source_env}")
+            asset_id = data_array[0]['id']
+
+            profile_response = await async_client.make_api_call(
+                endpoint=f"/catalog-server/api/profile/{asset_id}/config",
+                method='GET'
+            )
+            if verbose_mode:
+                print(f"\nProfile Response for {source_env}:")
+                print(json.dumps(profile_response, indent=2, ensure_ascii=False))
+
+            if notification_id_mapping:
+                from .notification_operations import transform_profile_configuration
+                profile_response = transform_profile_configuration(
+                    profile_response, notification_id_mapping, quiet_mode, verbose_mode
+                )
+            return [target_env, json.dumps(profile_response, ensure_ascii=False), source_env]
+
+        progress_bar = create_progress_bar(total=len(env_mappings), desc="Profiles", unit="assets", disable=quiet_mode)
+        results = await run_bounded(env_mappings, export_profile, max_concurrency, progress_bar)
+        progress_bar.close()
+
+    rows = []
+    failed = 0
+    for (source_env, _), result in zip(env_mappings, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to process source-env {source_env}: {result}")
+            failed += 1
+        else:
+            rows.append(result)
+    return rows, failed
+
+
+def execute_asset_tag_import_async(assets_with_tags: List[Dict], client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, is_transformed_format: bool = False, journal=None):
+    """Execute asset tag import using the async engine.
+
+    Args:
+        assets_with_tags: List of asset data dictionaries
+        client: API client instance
+        logger: Logger instance
+        quiet_mode: Whether to suppress console output
+        verbose_mode: Whether to enable verbose logging
+        max_concurrency: Maximum number of in-flight requests
+        is_transformed_format: Whether the data is in transformed format (individual tag entries)
+        journal: Checkpoint journal to record fully imported entries in
+    """
+    if not quiet_mode:
+        print(f"Using async engine with max concurrency {max_concurrency} to process {len(assets_with_tags)} assets")
+        print("="*80)
+
+    stats = asyncio.run(_asset_tag_import_async(assets_with_tags, client, logger, quiet_mode, verbose_mode,
+                                                max_concurrency, is_transformed_format, journal))
+
+    if not quiet_mode:
+        print("\n" + "="*80)
+        print("ASSET TAG IMPORT COMPLETED (ASYNC MODE)")
+        print("="*80)
+        print(f"Total assets processed: {len(assets_with_tags)}")
+        print(f"Successful assets: {stats['successful_assets']}")
+        print(f"Failed assets: {stats['failed_assets']}")
+        print(f"Total tags imported: {stats['tags_imported']}")
+        print(f"Total tags already exist: {stats['tags_already_exist']}")
+        print(f"Total tags failed: {stats['tags_failed']}")
+        print(f"Max concurrency: {max_concurrency}")
+        print("="*80)
+    else:
+        total_tags_processed = stats['tags_imported'] + stats['tags_already_exist']
+        print(f"✅ Asset tag import completed: {stats['successful_assets']}/{len(assets_with_tags)} assets successful, {total_tags_processed} tags processed ({stats['tags_imported']} imported, {stats['tags_already_exist']} already exist)")
+
+
+async def _asset_tag_import_async(assets_with_tags: List[Dict], client, logger: logging.Logger, quiet_mode: bool,
+                                  verbose_mode: bool, max_concurrency: int, is_transformed_format: bool,
+                                  journal=None) -> Dict[str, int]:
+    """Async implementation of execute_asset_tag_import_async.
+
+    Returns:
+        Dictionary of aggregated import statistics
+    """
+    stats = {'successful_assets': 0, 'failed_assets': 0, 'tags_imported': 0, 'tags_already_exist': 0, 'tags_failed': 0}
+
+    async with AsyncAcceldataAPIClient(client, max_concurrency=max_concurrency, logger=logger) as async_client:
+
+        async def apply_tag(asset_id, tag_name: str) -> str:
+            """Apply a single tag; returns 'imported', 'exists' or 'failed'."""
+            try:
+                tag_response = await async_client.make_api_call(
+                    endpoint=f"/catalog-server/api/assets/{asset_id}/tag",
+                    method='POST',
+                    json_payload={"name": tag_name},
+                    use_target_auth=True,
+                    use_target_tenant=True
+                )
+                if isinstance(tag_response, dict) and (
+                        'already' in (tag_response.get('message') or '').lower()
+                        or tag_response.get('status') == 'already_exists'
+                        or tag_response.get('code') == 409):
+                    return 'exists'
+                return 'imported' if tag_response or is_transformed_format else 'failed'
+            except Exception as e:
+                if "409" in str(e) or "Conflict" in str(e):
+                    return 'exists'
+                logger.error(f"Error importing tag '{tag_name}' for asset {asset_id}: {e}")
+                return 'failed'
+
+        async def import_asset(asset):
+            if is_transformed_format:
+                outcomes = [await apply_tag(asset['target_asset_id'], asset['tag_name'])]
+            else:
+                target_uid = asset['target_uid']
+                asset_response = await async_client.make_api_call(
+                    endpoint=f"/catalog-server/api/assets?uid={target_uid}",
+                    method='GET',
+                    use_target_auth=True,
+                    use_target_tenant=True
+                )
+                assets_list = []
+                if asset_response and 'data' in asset_response:
+                    if isinstance(asset_response['data'], list):
+                        assets_list = asset_response['data']
+                    elif isinstance(asset_response['data'], dict) and 'assets' in asset_response['data']:
+                        assets_list = asset_response['data']['assets']
+                asset_id = assets_list[0].get('id') if assets_list and isinstance(assets_list[0], dict) else None
+                if not asset_id:
+                    raise ValueError(f"No asset ID found for UID: {target_uid}")
+                outcomes = await asyncio.gather(*(apply_tag(asset_id, tag) for tag in asset['tags']))
+            if journal is not None and 'failed' not in outcomes:
+                journal.record(tag_import_checkpoint_key(asset, is_transformed_format))
+            return outcomes
+
+        progress_bar = create_progress_bar(total=len(assets_with_tags), desc="Assets", unit="assets",
+                                           disable=quiet_mode or verbose_mode)
+        results = await run_bounded(assets_with_tags, import_asset, max_concurrency, progress_bar)
+        progress_bar.close()
+
+    for asset, outcomes in zip(assets_with_tags, results):
+        if isinstance(outcomes, Exception):
+            logger.error(f"Error processing asset {asset.get('target_uid', 'unknown')}: {outcomes}")
+            stats['failed_assets'] += 1
+            continue
+        stats['tags_imported'] += outcomes.count('imported')
+        stats['tags_already_exist'] += outcomes.count('exists')
+        stats['tags_failed'] += outcomes.count('failed')
+        if 'failed' in outcomes:
+            stats['failed_assets'] += 1
+        else:
+            stats['successful_assets'] += 1
+    return stats
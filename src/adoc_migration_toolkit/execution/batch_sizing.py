@@ -0,0 +1,180 @@
+"""
+Adaptive batch sizing for policy-definition exports.
+
+A fixed number of policy IDs per export request is either too small (many
+round trips for simple policies) or too large (a batch of complex policies
+runs into the HTTP timeout and fails as a whole). ``AdaptiveBatchSizer``
+tunes the batch size per policy type from the exports it has seen:
+
+- Every successful batch updates a moving average of seconds and ZIP bytes
+  per policy. The next batch is sized to take ``TARGET_TIMEOUT_FRACTION`` of
+  ``HTTP_CONFIG['timeout']`` and to stay under ``MAX_BATCH_BYTES``, growing by
+  at most ``MAX_GROWTH`` per batch.
+- A batch that times out halves the size for its type; the caller retries it
+  as two smaller batches (see ``split_batch``).
+
+``iter_policy_batches`` hands out batches lazily, so each one is sized with
+the latest measurements, taking the next batch from the type with the most
+policies left.
+"""
+
+import threading
+from typing import Dict, Iterator, List, Tuple
+
+from requests.exceptions import HTTPError, Timeout
+
+from ..shared.api_client import is_streamed_read_timeout
+from ..shared.globals import HTTP_CONFIG
+
+# Aim for this share of the HTTP timeout per request, leaving room for slow outliers
+TARGET_TIMEOUT_FRACTION = 0.25
+
+# Upper bound for the ZIP size of a single batch
+MAX_BATCH_BYTES = 50 * 1024 * 1024
+
+# Largest factor a batch may grow by from one batch to the next
+MAX_GROWTH = 2.0
+
+# Bounds for the number of policy IDs in one request
+MIN_BATCH_SIZE = 1
+MAX_BATCH_SIZE = 500
+
+# Weight of the newest measurement in the per-policy moving averages
+SMOOTHING = 0.3
+
+# Status codes returned by gateways when the export took too long
+TIMEOUT_STATUS_CODES = [408, 504]
+
+
+def is_timeout_error(error: Exception) -> bool:
+    """Check whether an export failed because it took too long.
+
+    Args:
+        error: Exception raised by the API call
+
+    Returns:
+        True for client-side timeouts, including read timeouts while a
+        streamed download is in progress, and gateway timeout responses
+    """
+    if isinstance(error, Timeout) or is_streamed_read_timeout(error):
+        return True
+    response = getattr(error, 'response', None)
+    return isinstance(error, HTTPError) and getattr(response, 'status_code', None) in TIMEOUT_STATUS_CODES
+
+
+def split_batch(batch_ids: List[str]) -> List[List[str]]:
+    """Split a batch into two halves, or return it unchanged if it holds a single ID."""
+    if len(batch_ids) <= 1:
+        return [batch_ids]
+    middle = len(batch_ids) // 2
+    return [batch_ids[:middle], batch_ids[middle:]]
+
+
+class AdaptiveBatchSizer:
+    """Thread-safe per-policy-type batch size tuned from export latency and payload size."""
+
+    def __init__(self, initial_sizes: Dict[str, int], adaptive: bool = True,
+                 min_size: int = MIN_BATCH_SIZE, max_size: int = MAX_BATCH_SIZE):
+        """Initialize the sizer.
+
+        Args:
+            initial_sizes: Starting batch size per policy type, with a 'default' entry
+            adaptive: If False, always use the initial sizes (e.g. sizes entered by the user)
+            min_size: Lower bound for a batch size
+            max_size: Upper bound for a batch size
+        """
+        self.initial_sizes = dict(initial_sizes)
+        self.adaptive = adaptive
+        self.min_size = min_size
+        self.max_size = max_size
+        self._sizes: Dict[str, int] = {}
+        self._seconds_per_policy: Dict[str, float] = {}
+        self._bytes_per_policy: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _initial_size(self, policy_type: str) -> int:
+        return self.initial_sizes.get(policy_type, self.initial_sizes.get('default', 50))
+
+    def batch_size(self, policy_type: str) -> int:
+        """Get the number of policy IDs to put in the next batch of a type."""
+        with self._lock:
+            return self._sizes.get(policy_type, self._initial_size(policy_type))
+
+    def record_success(self, policy_type: str, count: int, seconds: float, size_bytes: int) -> None:
+        """Record a successful export and resize the next batches of its type.
+
+        Args:
+            policy_type: Policy type of the batch
+            count: Number of policy IDs in the batch
+            seconds: Time taken by the export request
+            size_bytes: Size of the returned ZIP file
+        """
+        if not self.adaptive or count <= 0:
+            return
+        with self._lock:
+            seconds_per_policy = self._smooth(self._seconds_per_policy, policy_type, seconds / count)
+            bytes_per_policy = self._smooth(self._bytes_per_policy, policy_type, size_bytes / count)
+
+            target_seconds = HTTP_CONFIG.get('timeout', 300) * TARGET_TIMEOUT_FRACTION
+            ideal = target_seconds / seconds_per_policy if seconds_per_policy > 0 else self.max_size
+            if bytes_per_policy > 0:
+                ideal = min(ideal, MAX_BATCH_BYTES / bytes_per_policy)
+
+            current = self._sizes.get(policy_type, self._initial_size(policy_type))
+            new_size = int(min(ideal, current * MAX_GROWTH))
+            self._sizes[policy_type] = max(self.min_size, min(self.max_size, new_size))
+
+    def record_timeout(self, policy_type: str, count: int) -> None:
+        """Record an export that timed out and halve the batch size of its type.
+
+        Args:
+            policy_type: Policy type of the batch
+            count: Number of policy IDs in the batch that timed out
+        """
+        if not self.adaptive:
+            return
+        with self._lock:
+            current = self._sizes.get(policy_type, self._initial_size(policy_type))
+            self._sizes[policy_type] = max(self.min_size, min(current, count) // 2)
+
+    @staticmethod
+    def _smooth(averages: Dict[str, float], key: str, value: float) -> float:
+        """Update an exponential moving average. Caller holds the lock."""
+        previous = averages.get(key)
+        averages[key] = value if previous is None else SMOOTHING * value + (1 - SMOOTHING) * previous
+        return averages[key]
+
+    def estimate_batches(self, policies_by_type: Dict[str, List[str]]) -> int:
+        """Estimate the number of batches at the current sizes."""
+        return sum(-(-len(ids) // self.batch_size(policy_type)) for policy_type, ids in policies_by_type.items() if ids)
+
+
+def iter_policy_batches(policies_by_type: Dict[str, List[str]],
+                        sizer: AdaptiveBatchSizer) -> Iterator[Tuple[str, int, int, int, List[str]]]:
+    """Yield export batches, sizing each one when it is handed out.
+
+    The next batch always comes from the policy type with the most IDs left, so
+    the largest types start first and finish alongside the small ones.
+
+    Args:
+        policies_by_type: Policy IDs per policy type
+        sizer: Batch sizer consulted for every batch
+
+    Yields:
+        Tuples of (policy_type, batch_num, start_idx, end_idx, batch_ids)
+    """
+    offsets = {policy_type: 0 for policy_type in policies_by_type}
+    batch_numbers = {policy_type: 0 for policy_type in policies_by_type}
+    while True:
+        remaining = [(len(ids) - offsets[policy_type], policy_type)
+                     for policy_type, ids in policies_by_type.items() if offsets[policy_type] < len(ids)]
+        if not remaining:
+            return
+        _, policy_type = max(remaining, key=lambda entry: entry[0])
+        policy_ids = policies_by_type[policy_type]
+        start_idx = offsets[policy_type]
+        end_idx = min(start_idx + sizer.batch_size(policy_type), len(policy_ids))
+        offsets[policy_type] = end_idx
+        batch_num = batch_numbers[policy_type]
+        batch_numbers[policy_type] += 1
+        yield policy_type, batch_num, start_idx, end_idx, policy_ids[start_idx:end_idx]
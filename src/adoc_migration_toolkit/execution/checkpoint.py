@@ -0,0 +1,220 @@
+"""
+Resumable checkpoints for long-running export and import commands.
+
+A bulk command that dies half way (network drop, expired token, Ctrl+C) used
+to lose everything it had done. Commands that support ``--resume`` keep an
+append-only journal next to their output (or input) file:
+
+- ``<file>.<command>.journal`` holds one JSON line per completed work item
+  (``{"key": ..., "offset": ..., "length": ...}``).
+- Exports also append each finished CSV row to ``<file>.<command>.partial``;
+  the journal records the byte range of every row, so a torn last write is
+  truncated away on resume. Rows and their journal records are written by a
+  single writer thread in batches; rows are flushed before the records that
+  point at them.
+
+Without ``--resume`` a command discards any earlier journal and starts over.
+With ``--resume`` it skips every key already in the journal. The journal is
+removed once a run completes without failures; if items failed it is kept so
+a ``--resume`` run retries only those.
+"""
+
+import csv
+import io
+import json
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from ..shared.file_utils import BatchedOutputWriter
+
+
+def checkpoint_paths(base_file, command: str):
+    """Get the journal and partial-output paths for a command.
+
+    Args:
+        base_file: Output file of an export, or input file of an import. For a
+            directory the files are kept inside it as hidden files.
+        command: Command name, e.g. ``asset-config-import``
+
+    Returns:
+        Tuple of (journal_path, partial_path)
+    """
+    base = Path(base_file)
+    if base.is_dir():
+        return base / f".{command}.journal", base / f".{command}.partial"
+    return (base.with_name(f"{base.name}.{command}.journal"),
+            base.with_name(f"{base.name}.{command}.partial"))
+
+
+class CheckpointJournal:
+    """Append-only journal of completed work items for one command."""
+
+    def __init__(self, base_file, command: str, resume: bool = False, with_rows: bool = False,
+                 logger: Optional[logging.Logger] = None):
+        """Open the journal, loading it on resume and discarding it otherwise.
+
+        Args:
+            base_file: Output file of an export, or input file of an import
+            command: Command name, used to keep journals of different commands apart
+            resume: Keep and load an existing journal instead of starting over
+            with_rows: Also keep finished CSV rows in a partial output file (exports)
+            logger: Logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.journal_path, partial_path = checkpoint_paths(base_file, command)
+        self.partial_path = partial_path if with_rows else None
+        self.resumed = 0
+        self._done: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if resume:
+            self._load()
+        else:
+            self._discard_files()
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._rows = None
+        self._writer = None
+        if self.partial_path is not None:
+            # Drop bytes written after the last journaled row (a write torn by a crash)
+            end = max((r['offset'] + r['length'] for r in self._done.values() if 'offset' in r), default=0)
+            with open(self.partial_path, 'ab') as f:
+                f.truncate(end)
+            self._rows = open(self.partial_path, 'ab')
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        if self._rows is not None:
+            self._writer = BatchedOutputWriter(self._write_records, name=f"{command}-journal")
+
+        if self.resumed:
+            self.logger.info(f"Resuming from {self.journal_path}: {self.resumed} items already completed")
+
+    def _load(self) -> None:
+        """Load completed keys, ignoring a torn last line."""
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    self.logger.warning(f"Ignoring incomplete checkpoint record in {self.journal_path}")
+                    continue
+                if isinstance(record, dict) and 'key' in record:
+                    self._done[str(record['key'])] = record
+        self.resumed = len(self._done)
+
+    def _discard_files(self) -> None:
+        for path in (self.journal_path, self.partial_path):
+            if path is not None and path.exists():
+                path.unlink()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._done)
+
+    def __contains__(self, key) -> bool:
+        return self.is_done(key)
+
+    def is_done(self, key) -> bool:
+        """Check whether a work item was completed in this or an earlier run."""
+        with self._lock:
+            return str(key) in self._done
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Write a journal record. Caller holds the lock."""
+        self._journal.write(json.dumps(record) + '\n')
+        self._journal.flush()
+        self._done[record['key']] = record
+
+    def record(self, key) -> None:
+        """Mark a work item as completed."""
+        with self._lock:
+            self._append({'key': str(key)})
+
+    def append_row(self, key, row: List[Any]) -> None:
+        """Append a finished CSV row to the partial output and mark its work item as completed.
+
+        Args:
+            key: Work item key
+            row: CSV row, written with the same quoting as the final output
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_ALL).writerow(row)
+        self.append_record(key, buffer.getvalue())
+
+    def append_record(self, key, record: str) -> None:
+        """Append an encoded record to the partial output and mark its work item as completed.
+
+        The record is written by the writer thread; the work item counts as
+        completed right away.
+
+        Args:
+            key: Work item key
+            record: Complete record including its line terminator, e.g. a JSON Lines line
+        """
+        entry = {'key': str(key)}
+        with self._lock:
+            self._done[entry['key']] = entry
+        self._writer.put((entry, record.encode('utf-8')))
+
+    def _write_records(self, batch: List[Tuple[Dict[str, Any], bytes]]) -> None:
+        """Write a batch of rows and their journal records. Runs in the writer thread."""
+        lines = []
+        for entry, data in batch:
+            entry['offset'] = self._rows.tell()
+            entry['length'] = len(data)
+            self._rows.write(data)
+            lines.append(json.dumps(entry) + '\n')
+        # Rows reach the file before the journal records that point at them
+        self._rows.flush()
+        with self._lock:
+            self._journal.writelines(lines)
+            self._journal.flush()
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        """Iterate over every row in the partial output, including rows from earlier runs."""
+        self._writer.flush()
+        with open(self.partial_path, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.reader(f)
+
+    def iter_records(self) -> Iterator[str]:
+        """Iterate over the lines of a partial output written with append_record."""
+        self._writer.flush()
+        with open(self.partial_path, 'r', newline='', encoding='utf-8') as f:
+            yield from f
+
+    def copy_rows_to(self, stream: TextIO) -> None:
+        """Copy every row in the partial output to a text stream without parsing it again.
+
+        Args:
+            stream: Text stream opened with newline='', e.g. the final CSV file after its header
+        """
+        self._writer.flush()
+        with open(self.partial_path, 'r', newline='', encoding='utf-8') as f:
+            shutil.copyfileobj(f, stream)
+
+    def close(self) -> None:
+        """Close the journal files, keeping them for a later ``--resume``."""
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            with self._lock:
+                for handle in (self._journal, self._rows):
+                    if handle is not None and not handle.closed:
+                        handle.close()
+
+    def finish(self, failed: int = 0) -> None:
+        """Close the journal; remove it if every item succeeded.
+
+        Args:
+            failed: Number of items that failed in this run
+        """
+        self.close()
+        if failed:
+            self.logger.info(f"Keeping checkpoint {self.journal_path}: {failed} items failed")
+        else:
+            self._discard_files()
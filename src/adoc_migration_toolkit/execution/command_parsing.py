@@ -3,6 +3,137 @@ import os
 from pathlib import Path
 from adoc_migration_toolkit.shared import globals
 from ..shared.file_utils import get_output_file_path
+from ..shared.api_client import DEFAULT_MAX_CONCURRENCY
+from ..shared.record_io import FORMAT_CSV, RECORD_FORMATS, record_file_path
+
+def _parse_max_concurrency(parts: list, i: int) -> int:
+    """Parse the value following a --max-concurrency flag.
+    
+    Args:
+        parts: Command parts
+        i: Index of the --max-concurrency flag
+        
+    Returns:
+        Positive integer concurrency limit
+        
+    Raises:
+        ValueError: If the value is missing or not a positive integer
+    """
+    if i + 1 >= len(parts):
+        raise ValueError("--max-concurrency requires a value")
+    try:
+        max_concurrency = int(parts[i + 1])
+    except ValueError:
+        raise ValueError("Invalid max concurrency. Must be a positive integer")
+    if max_concurrency <= 0:
+        raise ValueError("Invalid max concurrency. Must be a positive integer")
+    return max_concurrency
+
+def strip_resume_flag(command: str) -> tuple:
+    """Remove the --resume flag from a bulk command.
+    
+    The flag is shared by every resumable command, so it is handled here
+    instead of in each command's parser.
+    
+    Args:
+        command: Command string, e.g. "asset-config-import file.csv --resume"
+        
+    Returns:
+        Tuple of (command without --resume, resume)
+    """
+    parts = command.strip().split(' ')
+    resume = '--resume' in parts
+    if resume:
+        parts = [part for part in parts if part != '--resume']
+    return ' '.join(parts), resume
+
+def strip_format_option(command: str) -> tuple:
+    """Remove the --format option from an export command.
+    
+    --format selects the record format of the output file: csv (default) or
+    jsonl. Imports detect the format of their input file, so they take no option.
+    
+    Args:
+        command: Command string, e.g. "asset-profile-export --parallel --format jsonl"
+        
+    Returns:
+        Tuple of (command without the option, record_format)
+        
+    Raises:
+        ValueError: If the --format value is missing or not a known format
+    """
+    parts = command.strip().split(' ')
+    record_format = FORMAT_CSV
+    remaining = []
+    i = 0
+    while i < len(parts):
+        if parts[i] == '--format':
+            if i + 1 >= len(parts):
+                raise ValueError("--format requires a value")
+            record_format = parts[i + 1].lower()
+            if record_format not in RECORD_FORMATS:
+                raise ValueError(f"Invalid format: {parts[i + 1]}. Must be one of: {', '.join(RECORD_FORMATS)}")
+            i += 2
+        else:
+            remaining.append(parts[i])
+            i += 1
+    return ' '.join(remaining), record_format
+
+def default_record_output_file(command: str, output_file: str, record_format: str) -> str:
+    """Give the default output file of an export the suffix of its record format.
+    
+    The export parsers fill in a default .csv output file; with --format jsonl
+    it becomes a .jsonl file. An explicit --output-file is kept as given.
+    
+    Args:
+        command: Command string the output file was parsed from
+        output_file: Output file returned by the command's parser
+        record_format: Record format from strip_format_option()
+        
+    Returns:
+        Output file path
+    """
+    if not output_file or '--output-file' in command.split():
+        return output_file
+    return str(record_file_path(output_file, record_format))
+
+def strip_processes_option(command: str) -> tuple:
+    """Remove the --parallel and --processes options from a CPU-bound command.
+    
+    --parallel uses one worker process per CPU core, --processes N sets the
+    number of worker processes explicitly.
+    
+    Args:
+        command: Command string, e.g. "policy-xfr --string-transform A:B --parallel"
+        
+    Returns:
+        Tuple of (command without the options, processes); processes is 1 without either option
+        
+    Raises:
+        ValueError: If the --processes value is missing or not a positive integer
+    """
+    parts = command.strip().split(' ')
+    processes = 1
+    remaining = []
+    i = 0
+    while i < len(parts):
+        if parts[i] == '--parallel':
+            processes = max(processes, os.cpu_count() or 1)
+            i += 1
+        elif parts[i] == '--processes':
+            if i + 1 >= len(parts):
+                raise ValueError("--processes requires a value")
+            try:
+                processes = int(parts[i + 1])
+            except ValueError:
+                raise ValueError("Invalid number of processes. Must be a positive integer")
+            if processes <= 0:
+                raise ValueError("Invalid number of processes. Must be a positive integer")
+            i += 2
+        else:
+            remaining.append(parts[i])
+            i += 1
+    return ' '.join(remaining), processes
 
 def parse_api_command(command: str) -> tuple:
     """Parse an API command string into components.
@@ -148,7 +279,8 @@ def parse_asset_profile_export_command(command: str) -> tuple:
         command: Command string like "asset-profile-export [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel]"
         
     Returns:
-        Tuple of (csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, allowed_types)
+        Tuple of (csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, allowed_types, max_threads,
+                  source_context_id, target_context_id, async_mode, max_concurrency)
     """
     parts = command.strip().split()
     if not parts or parts[0].lower() != 'asset-profile-export':
@@ -163,6 +295,8 @@ def parse_asset_profile_export_command(command: str) -> tuple:
     max_threads = 5
     source_context_id = None
     target_context_id = None
+    async_mode = False
+    max_concurrency = DEFAULT_MAX_CONCURRENCY
     # Check for flags and options
     i = 1
     while i < len(parts):
@@ -181,6 +315,13 @@ def parse_asset_profile_export_command(command: str) -> tuple:
         elif parts[i] == '--parallel':
             parallel_mode = True
             parts.remove('--parallel')
+        elif parts[i] == '--async':
+            async_mode = True
+            parts.remove('--async')
+        elif parts[i] == '--max-concurrency':
+            max_concurrency = _parse_max_concurrency(parts, i)
+            parts.pop(i)
+            parts.pop(i)
         elif parts[i] == '--allowed-types':
             if i + 1 >= len(parts):
                 raise ValueError("--allowed-types requires a value")
@@ -262,7 +403,7 @@ def parse_asset_profile_export_command(command: str) -> tuple:
     if not output_file:
         output_file = get_output_file_path(csv_file, "asset-profiles-import-ready.csv", category="asset-import")
 
-    return csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, allowed_types, max_threads, source_context_id, target_context_id
+    return csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, allowed_types, max_threads, source_context_id, target_context_id, async_mode, max_concurrency
 
 def parse_asset_profile_import_command(command: str) -> tuple:
     """Parse an asset-profile-import command string into components.
@@ -439,15 +580,16 @@ def parse_asset_list_export_command(command: str) -> tuple:
     """Parse an asset-list-export command string into components.
 
     Args:
-        command: Command string like "asset-list-export [--quiet] [--verbose] [--parallel] [--target] [--page-size <size>] [--max-threads <num>]"
+        command: Command string like "asset-list-export [--quiet] [--verbose] [--parallel] [--async] [--target] [--page-size <size>] [--max-threads <num>] [--max-concurrency <num>]"
 
     Returns:
-        Tuple of (quiet_mode, verbose_mode, parallel_mode, use_target, page_size, source_type_ids, asset_type_ids, assembly_ids, max_threads)
+        Tuple of (quiet_mode, verbose_mode, parallel_mode, use_target, page_size, source_type_ids, asset_type_ids, assembly_ids, max_threads,
+                  async_mode, max_concurrency)
     """
     parts = command.strip().split()
     print(f"Command arguments {parts}")
     if not parts or parts[0].lower() != 'asset-list-export':
-        return False, False, False, False, 100, None, None, None, 5
+        return False, False, False, False, 100, None, None, None, 5, False, DEFAULT_MAX_CONCURRENCY
 
     quiet_mode = False
     verbose_mode = False
@@ -458,6 +600,8 @@ def parse_asset_list_export_command(command: str) -> tuple:
     asset_type_ids = None
     assembly_ids = None
     max_threads = 5
+    async_mode = False
+    max_concurrency = DEFAULT_MAX_CONCURRENCY
     # Check for flags and options
     i = 1
     while i < len(parts):
@@ -497,6 +641,13 @@ def parse_asset_list_export_command(command: str) -> tuple:
         elif parts[i] == '--target':
             use_target = True
             parts.remove('--target')
+        elif parts[i] == '--async':
+            async_mode = True
+            parts.remove('--async')
+        elif parts[i] == '--max-concurrency':
+            max_concurrency = _parse_max_concurrency(parts, i)
+            parts.pop(i)
+            parts.pop(i)
         elif parts[i] == '--source_type_ids':
             if i + 1 >= len(parts):
                 raise ValueError("--source_type_ids requires a value")
@@ -518,7 +669,7 @@ def parse_asset_list_export_command(command: str) -> tuple:
         else:
             i += 1
 
-    return quiet_mode, verbose_mode, parallel_mode, use_target, page_size, source_type_ids, asset_type_ids, assembly_ids, max_threads
+    return quiet_mode, verbose_mode, parallel_mode, use_target, page_size, source_type_ids, asset_type_ids, assembly_ids, max_threads, async_mode, max_concurrency
 
 def parse_asset_tag_export_command(command: str) -> tuple:
     """Parse an asset-tag-export command string into components.
@@ -1044,19 +1195,21 @@ def parse_asset_tag_import_command(command: str) -> tuple:
     """Parse an asset-tag-import command string into components.
     
     Args:
-        command: Command string like "asset-tag-import [csv_file] [--quiet] [--verbose] [--parallel]"
+        command: Command string like "asset-tag-import [csv_file] [--quiet] [--verbose] [--parallel] [--async] [--max-concurrency <num>]"
         
     Returns:
-        Tuple of (csv_file, quiet_mode, verbose_mode, parallel_mode)
+        Tuple of (csv_file, quiet_mode, verbose_mode, parallel_mode, async_mode, max_concurrency)
     """
     parts = command.strip().split()
     if not parts or parts[0].lower() != 'asset-tag-import':
-        return None, False, False, False
+        return None, False, False, False, False, DEFAULT_MAX_CONCURRENCY
     
     csv_file = None
     quiet_mode = False
     verbose_mode = False
     parallel_mode = False
+    async_mode = False
+    max_concurrency = DEFAULT_MAX_CONCURRENCY
     
     # Check for flags and options
     i = 1
@@ -1071,6 +1224,12 @@ def parse_asset_tag_import_command(command: str) -> tuple:
         elif arg == '--parallel' or arg == '-p':
             parallel_mode = True
             i += 1
+        elif arg == '--async':
+            async_mode = True
+            i += 1
+        elif arg == '--max-concurrency':
+            max_concurrency = _parse_max_concurrency(parts, i)
+            i += 2
         elif arg == '--help' or arg == '-h':
             print("\n" + "="*60)
             print("ASSET-TAG-IMPORT COMMAND HELP")
@@ -1082,6 +1241,8 @@ def parse_asset_tag_import_command(command: str) -> tuple:
             print("  --quiet, -q: Suppress console output, show only summary")
             print("  --verbose, -v: Show detailed output including API calls")
             print("  --parallel, -p: Use parallel processing for faster import")
+            print("  --async: Use the asyncio engine (requires aiohttp)")
+            print(f"  --max-concurrency <num>: Maximum in-flight requests for --async (default: {DEFAULT_MAX_CONCURRENCY})")
             print("  --help, -h: Show this help message")
             print("\nExamples:")
             print("  asset-tag-import")
@@ -1094,7 +1255,7 @@ def parse_asset_tag_import_command(command: str) -> tuple:
             print("  • Applies source tags to target assets using POST API calls")
             print("  • Requires target environment configuration")
             print("="*60)
-            return None, False, False, False
+            return None, False, False, False, False, DEFAULT_MAX_CONCURRENCY
         else:
             # This should be the CSV file path
             if csv_file is None:
@@ -1102,14 +1263,14 @@ def parse_asset_tag_import_command(command: str) -> tuple:
             else:
                 print(f"❌ Unknown argument: {arg}")
                 print("💡 Use 'asset-tag-import --help' for usage information")
-                return None, False, False, False
+                return None, False, False, False, False, DEFAULT_MAX_CONCURRENCY
             i += 1
     
     # Return None for csv_file if not provided, let calling code handle path resolution
     # if csv_file is None:
     #     csv_file = "transformed_tag_assets_output.csv"
     
-    return csv_file, quiet_mode, verbose_mode, parallel_mode
+    return csv_file, quiet_mode, verbose_mode, parallel_mode, async_mode, max_concurrency
 
 
 def parse_tag_xfr_command(command: str) -> tuple:
@@ -1458,11 +1619,15 @@ def parse_set_http_config_command(command: str) -> dict:
     Args:
         command (str): The command string like 'set-http-config --timeout 20 --retry 5 --proxy http://proxy:8080'
     Returns:
-        dict: Dictionary with keys 'timeout', 'retry', 'proxy' (values or None if not set)
+        dict: Dictionary with keys 'timeout', 'retry', 'proxy', 'pool_connections', 'pool_maxsize',
+              'adaptive_concurrency', 'max_in_flight', 'response_cache', 'response_cache_ttl',
+              'response_cache_max_mb' (values or None if not set)
     """
     import shlex
     args = shlex.split(command)
-    config = {'timeout': None, 'retry': None, 'proxy': None}
+    config = {'timeout': None, 'retry': None, 'proxy': None, 'pool_connections': None, 'pool_maxsize': None,
+              'adaptive_concurrency': None, 'max_in_flight': None, 'response_cache': None,
+              'response_cache_ttl': None, 'response_cache_max_mb': None}
     i = 1  # skip 'set-http-config'
     while i < len(args):
         if args[i] == '--timeout' and i + 1 < len(args):
@@ -1482,9 +1647,35 @@ def parse_set_http_config_command(command: str) -> dict:
         elif args[i] == '--proxy' and i + 1 < len(args):
             config['proxy'] = args[i + 1]
             i += 2
+        elif args[i] in ('--adaptive-concurrency', '--response-cache') and i + 1 < len(args):
+            if args[i + 1].lower() not in ('on', 'off'):
+                print(f"❌ Invalid value for {args[i]} (must be on or off)")
+                return None
+            config[args[i][2:].replace('-', '_')] = args[i + 1].lower() == 'on'
+            i += 2
+        elif args[i] in ('--cache-ttl', '--cache-max-mb') and i + 1 < len(args):
+            key = 'response_' + args[i][2:].replace('-', '_')
+            try:
+                config[key] = int(args[i + 1])
+                if config[key] <= 0:
+                    raise ValueError
+            except Exception:
+                print(f"❌ Invalid value for {args[i]} (must be positive integer)")
+                return None
+            i += 2
+        elif args[i] in ('--pool-connections', '--pool-maxsize', '--max-in-flight') and i + 1 < len(args):
+            key = args[i][2:].replace('-', '_')
+            try:
+                config[key] = int(args[i + 1])
+                if config[key] <= 0:
+                    raise ValueError
+            except Exception:
+                print(f"❌ Invalid value for {args[i]} (must be positive integer)")
+                return None
+            i += 2
         else:
             print(f"❌ Unknown or incomplete argument: {args[i]}")
-            print("💡 Usage: set-http-config [--timeout x] [--retry x] [--proxy url]")
+            print("💡 Usage: set-http-config [--timeout x] [--retry x] [--proxy url] [--pool-connections x] [--pool-maxsize x] [--adaptive-concurrency on|off] [--max-in-flight x] [--response-cache on|off] [--cache-ttl x] [--cache-max-mb x]")
             return None
     return config 
 
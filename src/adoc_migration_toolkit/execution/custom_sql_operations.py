@@ -2,14 +2,11 @@ import csv
 import json
 import logging
 import os
-import re
 import zipfile
 from collections import defaultdict
 from pathlib import Path
 from ..shared import globals
-
-
-TBL_REGEX = re.compile(r'([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)', re.IGNORECASE)
+from .policy_visitor import walk_policies, CustomSqlTableVisitor
 
 
 def _resolve_dir(category: str) -> Path:
@@ -24,6 +21,7 @@ def _extract_policy_tables_from_zips(directory: Path) -> dict:
     Returns: dict[policy_name] -> set of full table refs (db.schema.table)
     """
     policies = defaultdict(set)
+    table_visitor = CustomSqlTableVisitor(policies)
     if not directory.exists() or not directory.is_dir():
         return policies
 
@@ -40,25 +38,7 @@ def _extract_policy_tables_from_zips(directory: Path) -> dict:
                                 j = json.load(f)
                             except Exception:
                                 continue
-                            # Normalize to list of dicts
-                            records = [j] if isinstance(j, dict) else [r for r in j if isinstance(r, dict)]
-                            for rec in records:
-                                policy_name = str(rec.get('name', '')).strip()
-                                if not policy_name:
-                                    continue
-                                csc = rec.get('customSqlConfig')
-                                sqls = []
-                                if isinstance(csc, dict):
-                                    expr = csc.get('sqlExpression')
-                                    if expr:
-                                        sqls.append(expr)
-                                elif isinstance(csc, list):
-                                    for it in csc:
-                                        if isinstance(it, dict) and it.get('sqlExpression'):
-                                            sqls.append(it.get('sqlExpression'))
-                                for sql in sqls:
-                                    for db, schema, tbl in TBL_REGEX.findall(sql):
-                                        policies[policy_name].add(f"{db}.{schema}.{tbl}")
+                            walk_policies(j, [table_visitor])
         except zipfile.BadZipFile:
             continue
         except Exception:
@@ -4,19 +4,28 @@ Formatter execution functions.
 This module contains execution functions for policy and asset formatter operations.
 """
 
+import io
 import json
 import logging
 import sys
 import argparse
 import zipfile
-import tempfile
 import shutil
 import os
 import csv
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Union, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, List, Union, Optional, Set, TextIO, Tuple
 from datetime import datetime
 from ..shared import globals
+from ..shared.record_io import FORMAT_CSV, FORMAT_JSONL, RecordWriter, open_records, record_file_path, resolve_record_file
+from ..shared.json_stream import (STREAMING_THRESHOLD, detect_encoding, is_json_array, iter_json_array,
+                                  write_json_array)
+from ..shared.zip_stream import rewrite_zip, is_json_member
+from .asset_resolver import TargetAssetResolver
+from .string_transforms import StringTransformEngine
+from .policy_visitor import walk_policies, StringTransformVisitor, AssetUidVisitor, SegmentedPolicyVisitor
 import re
 
 
@@ -49,6 +58,7 @@ class PolicyExportFormatter:
         # Setup paths
         self.input_dir = Path(input_dir).resolve()
         self.string_transforms = string_transforms
+        self.transform_engine = StringTransformEngine(string_transforms)
         
         # Validate input directory
         if not self.input_dir.exists():
@@ -83,12 +93,26 @@ class PolicyExportFormatter:
         except Exception as e:
             raise RuntimeError(f"Failed to create output directories: {e}")
         
-        # Initialize statistics
+        # Initialize statistics and data quality policy extraction tracking
+        self._reset_results()
+        
+        self.logger.info("PolicyExportFormatter initialized successfully")
+        self.logger.info(f"Input directory: {self.input_dir}")
+        self.logger.info(f"Output directory (processed files): {self.output_dir}")
+        self.logger.info(f"Asset export directory: {self.asset_export_dir}")
+        self.logger.info(f"Policy export directory: {self.policy_export_dir}")
+        self.logger.info(f"String transformations: {len(self.string_transforms)} transformations")
+        for source, target in self.string_transforms.items():
+            self.logger.info(f"  '{source}' -> '{target}'")
+    
+    def _reset_results(self) -> None:
+        """Reset the statistics and extracted assets."""
         self.stats = {
             "files_investigated": 0,
             "changes_made": 0,
             "json_files_processed": 0,
             "zip_files_processed": 0,
+            "files_unchanged": 0,
             "errors": [],
             # Policy type statistics
             "segmented_spark_policies": 0,
@@ -96,20 +120,24 @@ class PolicyExportFormatter:
             "non_segmented_policies": 0,
             "total_policies_processed": 0
         }
-        
-        # Initialize data quality policy extraction tracking
         self.extracted_assets: Set[str] = set()
         self.all_asset_uids: Set[str] = set()  # Track all UIDs without filtering
         self.deep_scan_count: int = 0  # Track how many times deep scan is called
+    
+    def _merge_results(self, results: Dict[str, Any]) -> None:
+        """Add the statistics and extracted assets of a worker process to this formatter.
         
-        self.logger.info("PolicyExportFormatter initialized successfully")
-        self.logger.info(f"Input directory: {self.input_dir}")
-        self.logger.info(f"Output directory (processed files): {self.output_dir}")
-        self.logger.info(f"Asset export directory: {self.asset_export_dir}")
-        self.logger.info(f"Policy export directory: {self.policy_export_dir}")
-        self.logger.info(f"String transformations: {len(self.string_transforms)} transformations")
-        for source, target in self.string_transforms.items():
-            self.logger.info(f"  '{source}' -> '{target}'")
+        Args:
+            results: Dictionary returned by _format_file_in_worker()
+        """
+        for key, value in results["stats"].items():
+            if key == "errors":
+                self.stats["errors"].extend(value)
+            else:
+                self.stats[key] += value
+        self.extracted_assets.update(results["extracted_assets"])
+        self.all_asset_uids.update(results["all_asset_uids"])
+        self.deep_scan_count += results["deep_scan_count"]
     
     def extract_data_quality_assets(self, data: Any) -> None:
         """Extract uid and backingAssetId from non-segmented data quality policies.
@@ -118,200 +146,107 @@ class PolicyExportFormatter:
             data: The JSON data to process
         """
         try:
-            # Reset per-file statistics
-            file_stats = {
-                "segmented_spark_policies": 0,
-                "segmented_jdbc_policies": 0,
-                "non_segmented_policies": 0,
-                "total_policies_processed": 0
-            }
-            
-            # Process each policy in the data
-            if isinstance(data, list):
-                # Process array of policy definitions
-                for policy in data:
-                    if isinstance(policy, dict):
-                        # Extract all UIDs without filtering
-                        self._extract_all_assets_from_policy(policy)
-                        # Extract filtered UIDs
-                        self._extract_from_policy(policy)
-                        # Update file stats based on the policy type
-                        is_segmented = policy.get("isSegmented", False)
-                        engine_type = policy.get("engineType", "")
-                        file_stats["total_policies_processed"] += 1
-                        
-                        if is_segmented and engine_type == "SPARK":
-                            file_stats["segmented_spark_policies"] += 1
-                        elif is_segmented and engine_type == "JDBC_SQL":
-                            file_stats["segmented_jdbc_policies"] += 1
-                        elif not is_segmented:
-                            file_stats["non_segmented_policies"] += 1
-            elif isinstance(data, dict):
-                # Process single policy definition
-                # Extract all UIDs without filtering
-                self._extract_all_assets_from_policy(data)
-                # Extract filtered UIDs
-                self._extract_from_policy(data)
-                # Update file stats
-                is_segmented = data.get("isSegmented", False)
-                engine_type = data.get("engineType", "")
-                file_stats["total_policies_processed"] += 1
-                
-                if is_segmented and engine_type == "SPARK":
-                    file_stats["segmented_spark_policies"] += 1
-                elif is_segmented and engine_type == "JDBC_SQL":
-                    file_stats["segmented_jdbc_policies"] += 1
-                elif not is_segmented:
-                    file_stats["non_segmented_policies"] += 1
-            
-            # Log per-file statistics
-            if file_stats["total_policies_processed"] > 0:
-                self.logger.info(f"File Policy Statistics:")
-                self.logger.info(f"  Total policies processed: {file_stats['total_policies_processed']}")
-                self.logger.info(f"  Segmented SPARK policies: {file_stats['segmented_spark_policies']}")
-                self.logger.info(f"  Segmented JDBC_SQL policies: {file_stats['segmented_jdbc_policies']}")
-                self.logger.info(f"  Non-segmented policies: {file_stats['non_segmented_policies']}")
-                
-            # Log asset extraction results
-            self.logger.info(f"Asset extraction results:")
-            self.logger.info(f"  Total unique assets found so far: {len(self.all_asset_uids)}")
-            if len(self.all_asset_uids) > 0:
-                # Show first few assets found
-                sample_assets = list(self.all_asset_uids)[:5]
-                for i, asset in enumerate(sample_assets, 1):
-                    self.logger.info(f"  Asset {i}: {asset}")
-                if len(self.all_asset_uids) > 5:
-                    self.logger.info(f"  ... and {len(self.all_asset_uids) - 5} more")
-            
-            # Also log at the end of each file processing to see incremental progress
-            self.logger.info(f"=== End of file processing - Total assets: {len(self.all_asset_uids)} ===")
-                
+            self._walk_policy_data(data, transform=False)
         except Exception as e:
             self.logger.error(f"Error extracting data quality assets: {e}")
             self.stats["errors"].append(f"Data quality extraction error: {e}")
     
-    def _extract_all_assets_from_policy(self, policy: Dict[str, Any]) -> None:
-        """Extract all asset UIDs from a policy by deeply scanning all JSON fields.
+    def _walk_policy_data(self, data: Any, transform: bool = True, extract_assets: bool = True,
+                          log_results: bool = True) -> Any:
+        """Transform strings and extract assets from a policy document in a single pass.
         
         Args:
-            policy: The policy definition dictionary
+            data: The JSON data to process
+            transform: Apply the string transformations
+            extract_assets: Collect asset UIDs and policy statistics
+            log_results: Log the extraction results for the document
+            
+        Returns:
+            The data with replacements made (the data itself if transform is False)
         """
-        try:
-            # Deep scan the entire policy object to find uid and parentAssetUid fields
-            self._deep_scan_for_asset_uids(policy)
-                        
-        except Exception as e:
-            self.logger.error(f"Error extracting all assets from policy: {e}")
-            self.stats["errors"].append(f"All assets extraction error: {e}")
+        visitors = []
+        string_visitor = StringTransformVisitor(self.apply_string_transforms) if transform else None
+        uid_visitor = AssetUidVisitor(self.all_asset_uids) if extract_assets else None
+        segmented_visitor = SegmentedPolicyVisitor(self.extracted_assets) if extract_assets else None
+        for visitor in (string_visitor, uid_visitor, segmented_visitor):
+            if visitor is not None:
+                visitors.append(visitor)
+        
+        modified_data = walk_policies(data, visitors)
+        
+        if string_visitor is not None:
+            self.stats["changes_made"] += string_visitor.changes
+        if extract_assets:
+            for key, count in segmented_visitor.counts.items():
+                self.stats[key] += count
+            self.deep_scan_count += uid_visitor.fields_scanned
+            if log_results:
+                self._log_extraction_results(segmented_visitor.counts)
+        return modified_data
     
-    def _deep_scan_for_asset_uids(self, obj: Any, path: str = "") -> None:
-        """Recursively scan any object to find uid and parentAssetUid fields.
+    def _transform_json_stream(self, source: TextIO, target: Optional[TextIO], extract_assets: bool = True,
+                               transform: bool = True) -> None:
+        """Transform a large JSON document from one text stream to another.
         
-        Args:
-            obj: The object to scan (dict, list, or primitive)
-            path: Current path in the object for debugging
-        """
-        try:
-            self.deep_scan_count += 1
-            if self.deep_scan_count % 1000 == 0:  # Log every 1000th scan
-                self.logger.debug(f"Deep scan count: {self.deep_scan_count}, current path: {path}")
-            if isinstance(obj, dict):
-                # Check for uid and parentAssetUid fields in this dict
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    
-                    # Check if this key is uid or parentAssetUid
-                    if key in ['uid', 'parentAssetUid'] and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                    
-                    # Also check for asset-related fields that might contain UIDs
-                    if key in ['assetUid', 'asset_uid', 'assetUid', 'backingAssetUid', 'backingAssetId'] and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                    
-                    # Check for asset objects that might contain UIDs
-                    if key in ['asset', 'assets', 'backingAsset', 'backingAssets'] and isinstance(value, (dict, list)):
-                        # This is likely an asset object or list, scan it more carefully
-                        self.logger.debug(f"Found asset object at {current_path}, scanning for UIDs")
-                        self._deep_scan_for_asset_uids(value, current_path)
-                    
-                    # Check for any field that contains "uid" in its name (case-insensitive)
-                    if 'uid' in key.lower() and isinstance(value, str) and value.strip():
-                        uid = value.strip()
-                        self.all_asset_uids.add(uid)
-                        self.logger.debug(f"Found asset UID at {current_path}: {uid}")
-                        # Also log at info level for important finds
-                        self.logger.info(f"Found asset UID at {current_path}: {uid}")
-                        # Log the current total count after adding this UID
-                        self.logger.info(f"Total assets after adding {uid}: {len(self.all_asset_uids)}")
-                    
-                    # Recursively scan the value
-                    self._deep_scan_for_asset_uids(value, current_path)
-                    
-            elif isinstance(obj, list):
-                # Scan each item in the list
-                for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    self._deep_scan_for_asset_uids(item, current_path)
-                    
-            # For primitive types (str, int, bool, etc.), no further scanning needed
-            
-        except Exception as e:
-            self.logger.error(f"Error in deep scan at path {path}: {e}")
-            self.stats["errors"].append(f"Deep scan error at {path}: {e}")
-    
-    def _extract_from_policy(self, policy: Dict[str, Any]) -> None:
-        """Extract assets from a single policy definition.
+        Policy exports are arrays of policies, which are read, transformed and
+        written one at a time, so only one policy is held in memory. Any other
+        document is loaded whole.
         
         Args:
-            policy: The policy definition dictionary
+            source: Seekable text stream with the JSON document
+            target: Text stream to write the transformed document to, or None to
+                only extract assets
+            extract_assets: Collect asset UIDs and policy statistics
+            transform: Apply the string transformations
         """
+        if not is_json_array(source):
+            data = self._walk_policy_data(json.load(source), transform=transform, extract_assets=extract_assets)
+            if target is not None:
+                json.dump(data, target, ensure_ascii=False, separators=(',', ':'))
+            return
+        
+        count_keys = SegmentedPolicyVisitor.COUNT_KEYS
+        counts_before = {key: self.stats[key] for key in count_keys}
+        policies = (self._walk_policy_data(policy, transform=transform, extract_assets=extract_assets,
+                                           log_results=False)
+                    for policy in iter_json_array(source))
+        if target is None:
+            written = sum(1 for _ in policies)
+        else:
+            written = write_json_array(policies, target)
+        self.logger.debug(f"Streamed {written} items")
+        if extract_assets:
+            self._log_extraction_results({key: self.stats[key] - counts_before[key] for key in count_keys})
+    
+    def _load_json_content(self, content: bytes) -> Any:
+        """Decode and parse a JSON document, falling back to latin-1 if it is not UTF-8."""
         try:
-            # Check if this is a segmented policy with SPARK engine
-            is_segmented = policy.get("isSegmented", False)
-            engine_type = policy.get("engineType", "")
-            policy_name = policy.get("name", "unknown")
-            
-            # Track statistics
-            self.stats["total_policies_processed"] += 1
-            
-            # Extract UIDs only when:
-            # isSegmented=true AND engineType=SPARK
-            should_extract = False
-            
-            if is_segmented and engine_type == "SPARK":
-                should_extract = True
-                self.stats["segmented_spark_policies"] += 1
-                self.logger.debug(f"Extracting from segmented SPARK policy: {policy_name}")
-            elif is_segmented and engine_type == "JDBC_SQL":
-                self.stats["segmented_jdbc_policies"] += 1
-                self.logger.debug(f"Skipping segmented JDBC_SQL policy: {policy_name}")
-            elif not is_segmented:
-                self.stats["non_segmented_policies"] += 1
-                self.logger.debug(f"Skipping non-segmented policy: {policy_name}")
-                return
-            else:
-                self.logger.debug(f"Skipping policy (isSegmented={is_segmented}, engineType={engine_type}): {policy_name}")
-                return
-            
-            if should_extract:
-                # Extract backing assets
-                backing_assets = policy.get("backingAssets", [])
-                
-                for asset in backing_assets:
-                    if isinstance(asset, dict):
-                        uid = asset.get("uid")
-                        
-                        if uid is not None:
-                            self.extracted_assets.add(uid)
-                            self.logger.debug(f"Extracted asset uid: {uid}")
-                            
-        except Exception as e:
-            self.logger.error(f"Error extracting from policy: {e}")
-            self.stats["errors"].append(f"Policy extraction error: {e}")
+            return json.loads(content.decode('utf-8'))
+        except UnicodeDecodeError:
+            return json.loads(content.decode('latin-1'))
+    
+    def _log_extraction_results(self, file_stats: Dict[str, int]) -> None:
+        """Log the policy statistics of a file and the assets found so far."""
+        if file_stats["total_policies_processed"] > 0:
+            self.logger.info(f"File Policy Statistics:")
+            self.logger.info(f"  Total policies processed: {file_stats['total_policies_processed']}")
+            self.logger.info(f"  Segmented SPARK policies: {file_stats['segmented_spark_policies']}")
+            self.logger.info(f"  Segmented JDBC_SQL policies: {file_stats['segmented_jdbc_policies']}")
+            self.logger.info(f"  Non-segmented policies: {file_stats['non_segmented_policies']}")
+            
+        # Log asset extraction results
+        self.logger.info(f"Asset extraction results:")
+        self.logger.info(f"  Total unique assets found so far: {len(self.all_asset_uids)}")
+        if len(self.all_asset_uids) > 0:
+            # Show first few assets found
+            sample_assets = list(self.all_asset_uids)[:5]
+            for i, asset in enumerate(sample_assets, 1):
+                self.logger.info(f"  Asset {i}: {asset}")
+            if len(self.all_asset_uids) > 5:
+                self.logger.info(f"  ... and {len(self.all_asset_uids) - 5} more")
+        
+        # Also log at the end of each file processing to see incremental progress
+        self.logger.info(f"=== End of file processing - Total assets: {len(self.all_asset_uids)} ===")
     
     def write_extracted_assets_csv(self) -> None:
         """Write extracted assets to CSV file."""
@@ -387,12 +322,15 @@ class PolicyExportFormatter:
     def process_asset_config_export_csv(self) -> bool:
         """Process the asset-config-export.csv file to replace source-env-string with target-env-string in the target_uid column (first column).
         
+        A JSON Lines export (asset-config-export.jsonl) is processed the same way
+        and produces asset-config-import-ready.jsonl.
+        
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Look for asset-config-export.csv in the asset-export directory
-            asset_config_export_csv = self.asset_export_dir / "asset-config-export.csv"
+            # Look for asset-config-export.csv (or .jsonl) in the asset-export directory
+            asset_config_export_csv = resolve_record_file(self.asset_export_dir / "asset-config-export.csv")
             
             if not asset_config_export_csv.exists():
                 self.logger.info(f"asset-config-export.csv not found at {asset_config_export_csv}")
@@ -400,13 +338,12 @@ class PolicyExportFormatter:
             
             self.logger.info(f"Processing asset-config-export.csv: {asset_config_export_csv}")
             
-            # Read the CSV file
-            rows = []
-            # The below limit is set to fix the error: field larger than field limit (131072), python csv read has a limitation.
-            csv.field_size_limit(sys.maxsize)
-            with open(asset_config_export_csv, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
+            # Read the file; open_records lifts the csv field size limit for large config_json values
+            with open_records(asset_config_export_csv) as reader:
+                record_format = reader.record_format
+                header = reader.header
+                # CSV rows are rewritten as they are, including the header row
+                rows = ([header] if header and record_format == FORMAT_CSV else []) + list(reader)
             
             if not rows:
                 self.logger.warning("asset-config-export.csv is empty")
@@ -420,7 +357,7 @@ class PolicyExportFormatter:
                     config_json = row[1]
                     source_uid = row[2] if len(row) > 2 else ''  # Handle both 2 and 3 column formats
                     original_target_uid = target_uid
-                    original_config_json = config_json
+                    config_changed = False
                     
                     # Apply string transformations to target_uid
                     for source, target in self.string_transforms.items():
@@ -429,9 +366,8 @@ class PolicyExportFormatter:
                     
                     # Apply string transformations to config_json (for asset UIDs in JSON)
                     try:
-                        if config_json.strip():
-                            config_data = json.loads(config_json)
-                            config_changed = False
+                        if record_format == FORMAT_JSONL or config_json.strip():
+                            config_data = reader.json(config_json)
                             
                             # Transform asset UIDs in the configuration
                             if "assetConfiguration" in config_data and config_data["assetConfiguration"]:
@@ -456,13 +392,14 @@ class PolicyExportFormatter:
                                                 config_changed = True
                             
                             if config_changed:
-                                config_json = json.dumps(config_data, ensure_ascii=False, separators=(',', ':'))
+                                config_json = config_data if record_format == FORMAT_JSONL else \
+                                    json.dumps(config_data, ensure_ascii=False, separators=(',', ':'))
                     
                     except (json.JSONDecodeError, ValueError) as e:
                         self.logger.warning(f"Could not parse config JSON for row {i}: {e}")
                     
                     # Update row if any changes were made
-                    if target_uid != original_target_uid or config_json != original_config_json:
+                    if target_uid != original_target_uid or config_changed:
                         rows[i][0] = target_uid
                         rows[i][1] = config_json
                         # Preserve source_uid if it exists
@@ -475,12 +412,15 @@ class PolicyExportFormatter:
             asset_import_dir = self.base_output_dir / "asset-import"
             asset_import_dir.mkdir(parents=True, exist_ok=True)
             
-            # Write the processed CSV to asset-import/asset-config-import-ready.csv
-            output_csv = asset_import_dir / "asset-config-import-ready.csv"
+            # Write the processed file to asset-import/asset-config-import-ready.csv (or .jsonl)
+            output_csv = record_file_path(asset_import_dir / "asset-config-import-ready.csv", record_format)
             
             with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-                writer.writerows(rows)
+                if record_format == FORMAT_JSONL:
+                    RecordWriter(f, header, record_format=FORMAT_JSONL).write_rows(rows)
+                else:
+                    writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                    writer.writerows(rows)
             
             self.logger.info(f"Processed asset-config-export.csv: {changes_made} changes made")
             self.logger.info(f"Output written to: {output_csv}")
@@ -565,32 +505,10 @@ class PolicyExportFormatter:
             self.stats["errors"].append(error_msg)
             return False
     
-    def _exact_word_boundary_replace(self, text: str, source: str, target: str) -> str:
-        """Replace source string with target string only when it appears as a complete word.
-        
-        Args:
-            text (str): The text to transform
-            source (str): The source string to replace (must be exact word match)
-            target (str): The target string to replace with
-            
-        Returns:
-            str: The transformed text
-        """
-        if source == target:
-            return text
-        
-        # Escape special regex characters in the source string
-        escaped_source = re.escape(source)
-        # Create a regex pattern that matches the source as a complete word
-        # Word boundaries: \b matches at word boundaries (alphanumeric vs non-alphanumeric)
-        pattern = r'\b' + escaped_source + r'\b'
-        
-        # Replace all occurrences of the exact word
-        return re.sub(pattern, target, text)
-    
     def apply_string_transforms(self, value: str) -> str:
         """Apply string transformations to a value atomically to prevent cross-transformation interference.
-        Uses exact word boundary matching to prevent partial matches.
+        Uses exact word boundary matching to prevent partial matches. All transformations
+        are applied in a single scan by the compiled engine (see string_transforms.py).
         
         Args:
             value (str): The string value to transform
@@ -598,28 +516,7 @@ class PolicyExportFormatter:
         Returns:
             str: The transformed string
         """
-        if not self.string_transforms:
-            return value
-        
-        # Phase 1: Replace all source strings with unique placeholders
-        # This prevents later transformations from affecting earlier ones
-        placeholders = {}
-        transformed_value = value
-        
-        for source, target in self.string_transforms.items():
-            if source != target:
-                # Use exact word boundary matching
-                if re.search(r'\b' + re.escape(source) + r'\b', transformed_value):
-                    # Create a unique placeholder for this transformation
-                    placeholder = f"__TRANSFORM_PLACEHOLDER_{len(placeholders)}__"
-                    placeholders[placeholder] = target
-                    transformed_value = self._exact_word_boundary_replace(transformed_value, source, placeholder)
-        
-        # Phase 2: Replace all placeholders with their target strings
-        for placeholder, target in placeholders.items():
-            transformed_value = transformed_value.replace(placeholder, target)
-        
-        return transformed_value
+        return self.transform_engine.apply(value)
     
     def replace_in_value(self, value: Any) -> Any:
         """Recursively replace substrings in a value with error handling.
@@ -678,23 +575,11 @@ class PolicyExportFormatter:
             if not json_file_path.is_file():
                 raise ValueError(f"Path is not a file: {json_file_path}")
             
-            # Read the JSON file with encoding detection
-            try:
-                with open(json_file_path, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-            except UnicodeDecodeError:
-                # Try with different encoding
-                with open(json_file_path, 'r', encoding='latin-1') as file:
-                    data = json.load(file)
-            
             # Check if this is a data quality policy definitions file
             file_name = json_file_path.name
-            if file_name.startswith("data_quality_policy_definitions"):
+            extract_assets = file_name.startswith("data_quality_policy_definitions")
+            if extract_assets:
                 self.logger.info(f"Processing data quality policy definitions file: {file_name}")
-                self.extract_data_quality_assets(data)
-            
-            # Process the data (existing functionality)
-            modified_data = self.replace_in_value(data)
             
             # Determine output file path
             if relative_base_path:
@@ -710,9 +595,52 @@ class PolicyExportFormatter:
             except PermissionError:
                 raise PermissionError(f"Permission denied: Cannot create directory {output_file_path.parent}")
             
-            # Write the modified data
-            with open(output_file_path, 'w', encoding='utf-8') as file:
-                json.dump(modified_data, file, ensure_ascii=False, separators=(',', ':'))
+            # Large exports are transformed one policy at a time
+            streaming = json_file_path.stat().st_size >= STREAMING_THRESHOLD
+            if streaming:
+                content = None
+                with open(json_file_path, 'rb') as file:
+                    may_match = self.transform_engine.may_match_stream(file)
+                    file.seek(0)
+                    encoding = detect_encoding(file) if may_match or extract_assets else None
+            else:
+                content = json_file_path.read_bytes()
+                may_match = self.transform_engine.may_match(content)
+            
+            if not may_match:
+                # No source string occurs in the file, so it is copied as it is. It is
+                # only parsed when its assets have to be extracted.
+                if extract_assets:
+                    if streaming:
+                        with open(json_file_path, 'r', encoding=encoding) as source:
+                            self._transform_json_stream(source, None, transform=False)
+                    else:
+                        self._walk_policy_data(self._load_json_content(content), transform=False)
+                shutil.copyfile(json_file_path, output_file_path)
+                self.stats["files_unchanged"] += 1
+                self.logger.info(f"No replacements in {json_file_path}, copied unchanged to {output_file_path}")
+                return True
+            
+            if streaming:
+                self.logger.info(f"Streaming large JSON file: {json_file_path}")
+                with open(json_file_path, 'r', encoding=encoding) as source, \
+                        open(output_file_path, 'w', encoding='utf-8') as target:
+                    self._transform_json_stream(source, target, extract_assets=extract_assets)
+            else:
+                # Transform strings and extract assets in a single pass
+                changes_before = self.stats["changes_made"]
+                modified_data = self._walk_policy_data(self._load_json_content(content), extract_assets=extract_assets)
+                
+                if self.stats["changes_made"] == changes_before:
+                    # Sources only occurred outside string values (or not as whole words)
+                    output_file_path.write_bytes(content)
+                    self.stats["files_unchanged"] += 1
+                    self.logger.info(f"No replacements in {json_file_path}, copied unchanged to {output_file_path}")
+                    return True
+                
+                # Write the modified data
+                with open(output_file_path, 'w', encoding='utf-8') as file:
+                    json.dump(modified_data, file, ensure_ascii=False, separators=(',', ':'))
             
             self.logger.info(f"Successfully processed: {json_file_path} -> {output_file_path}")
             return True
@@ -736,6 +664,10 @@ class PolicyExportFormatter:
     def process_zip_file(self, zip_file_path: Path) -> bool:
         """Process a ZIP file with comprehensive error handling.
         
+        JSON members are transformed in memory and written straight into the
+        output archive; all other members, and JSON members without any
+        replacements, are copied as raw compressed bytes.
+        
         Args:
             zip_file_path (Path): Path to the ZIP file to process
             
@@ -755,57 +687,50 @@ class PolicyExportFormatter:
             if not zip_file_path.is_file():
                 raise ValueError(f"Path is not a file: {zip_file_path}")
             
-            # Create a temporary directory for extraction
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                self.logger.debug(f"Created temporary directory: {temp_path}")
-                
-                # Extract the ZIP file
-                try:
-                    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                        zip_ref.extractall(temp_path)
-                except zipfile.BadZipFile as e:
-                    raise zipfile.BadZipFile(f"Invalid ZIP file {zip_file_path}: {e}")
-                
-                self.logger.debug(f"Extracted ZIP file to: {temp_path}")
-                
-                # Get all files from the original ZIP to maintain structure
-                try:
-                    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                        original_files = zip_ref.namelist()
-                except Exception as e:
-                    raise RuntimeError(f"Failed to read ZIP file structure {zip_file_path}: {e}")
-                
-                self.logger.info(f"Original ZIP contains {len(original_files)} files")
-                
-                # Find all JSON files in the extracted content
-                json_files = list(temp_path.rglob("*.json"))
-                
-                if not json_files:
-                    self.logger.warning(f"No JSON files found in ZIP: {zip_file_path}")
-                    # Still create the output ZIP with original content
-                    return self._create_output_zip(zip_file_path, temp_path, original_files)
-                
-                self.logger.info(f"Found {len(json_files)} JSON files in ZIP: {zip_file_path}")
-                
-                # Log all JSON files found for debugging
-                for i, json_file in enumerate(json_files, 1):
-                    self.logger.info(f"  JSON file {i}: {json_file.name}")
-                
-                # Process each JSON file
-                successful = 0
-                failed = 0
-                
-                for json_file in json_files:
-                    if self._process_json_file_in_zip(json_file, temp_path):
-                        successful += 1
-                    else:
-                        failed += 1
-                
+            # Create output ZIP filename with "-import-ready" suffix
+            output_zip_path = self.output_dir / (zip_file_path.stem + "-import-ready.zip")
+            self.logger.info(f"Creating output ZIP: {output_zip_path}")
+            
+            successful = 0
+            failed = 0
+            
+            def transform_member(info: zipfile.ZipInfo, content: bytes) -> Optional[bytes]:
+                nonlocal successful, failed
+                self.logger.info(f"  JSON file {successful + failed + 1}: {Path(info.filename).name}")
+                new_content = self._process_json_file_in_zip(info.filename, content)
+                if new_content is None:
+                    failed += 1
+                else:
+                    successful += 1
+                return new_content
+            
+            def stream_member(info: zipfile.ZipInfo, member: BinaryIO) -> Optional[BinaryIO]:
+                nonlocal successful, failed
+                self.logger.info(f"  JSON file {successful + failed + 1}: {Path(info.filename).name}")
+                success, new_stream = self._stream_json_file_in_zip(info.filename, member)
+                if success:
+                    successful += 1
+                else:
+                    failed += 1
+                return new_stream
+            
+            def is_large_json_member(info: zipfile.ZipInfo) -> bool:
+                return is_json_member(info) and info.file_size >= STREAMING_THRESHOLD
+            
+            try:
+                result = rewrite_zip(zip_file_path, output_zip_path, transform_member,
+                                     stream_transform=stream_member, stream_select=is_large_json_member)
+            except zipfile.BadZipFile as e:
+                raise zipfile.BadZipFile(f"Invalid ZIP file {zip_file_path}: {e}")
+            
+            self.logger.info(f"Original ZIP contains {result.members} files")
+            if successful + failed == 0:
+                self.logger.warning(f"No JSON files found in ZIP: {zip_file_path}")
+            else:
                 self.logger.info(f"ZIP processing complete: {successful} successful, {failed} failed")
-                
-                # Create output ZIP with all files (processed and unprocessed)
-                return self._create_output_zip(zip_file_path, temp_path, original_files)
+            self.logger.info(f"Successfully created ZIP with {result.members} files "
+                             f"({result.rewritten} rewritten, {result.copied} copied unchanged): {output_zip_path}")
+            return True
                 
         except (zipfile.BadZipFile, FileNotFoundError, ValueError, RuntimeError) as e:
             error_msg = f"ZIP processing error for {zip_file_path}: {e}"
@@ -818,148 +743,153 @@ class PolicyExportFormatter:
             self.stats["errors"].append(error_msg)
             return False
     
-    def _process_json_file_in_zip(self, json_file_path: Path, temp_path: Path) -> bool:
-        """Process a single JSON file within a ZIP extraction.
+    def _process_json_file_in_zip(self, member_name: str, content: bytes) -> Optional[bytes]:
+        """Process the content of a single JSON member of a ZIP file.
         
         Args:
-            json_file_path (Path): Path to the JSON file to process
-            temp_path (Path): Base path of the temporary extraction directory
+            member_name (str): Name of the member inside the ZIP file
+            content (bytes): Member content
             
         Returns:
-            bool: True if successful, False otherwise
+            Optional[bytes]: The new content (the original content if nothing was replaced),
+                or None if the member could not be processed
         """
         try:
             self.stats["files_investigated"] += 1
             self.stats["json_files_processed"] += 1
             
-            self.logger.debug(f"Processing JSON file in ZIP: {json_file_path}")
+            self.logger.debug(f"Processing JSON file in ZIP: {member_name}")
             
-            # Read the JSON file with encoding detection
-            try:
-                with open(json_file_path, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-            except UnicodeDecodeError:
-                with open(json_file_path, 'r', encoding='latin-1') as file:
-                    data = json.load(file)
+            data = self._load_json_content(content)
             
             # Process ALL JSON files for asset extraction, not just data_quality_policy_definitions
-            file_name = json_file_path.name
-            self.logger.info(f"Processing JSON file in ZIP for asset extraction: {file_name}")
-            
-            # Extract assets from ALL JSON files (policies, configurations, etc.)
-            self.logger.info(f"  Extracting assets from: {file_name}")
-            
-            # Log the type of file being processed for better debugging
-            if "data_quality_policy_definitions" in file_name:
-                self.logger.info(f"  File type: Data Quality Policy Definitions")
-            elif "data_drift_policy_definitions" in file_name:
-                self.logger.info(f"  File type: Data Drift Policy Definitions")
-            elif "schema_drift_policy_definitions" in file_name:
-                self.logger.info(f"  File type: Schema Drift Policy Definitions")
-            elif "reconciliation_policy_definitions" in file_name:
-                self.logger.info(f"  File type: Reconciliation Policy Definitions")
-            elif "profile_anomaly_policy_definition" in file_name:
-                self.logger.info(f"  File type: Profile Anomaly Policy Definition")
-            elif "data_cadence_policy_definitions" in file_name:
-                self.logger.info(f"  File type: Data Cadence Policy Definitions")
-            elif "business_rules" in file_name:
-                self.logger.info(f"  File type: Business Rules")
-            elif "asset_udf_variables" in file_name:
-                self.logger.info(f"  File type: Asset UDF Variables")
-            elif "data_sources" in file_name:
-                self.logger.info(f"  File type: Data Sources")
-            elif "notification_settings" in file_name:
-                self.logger.info(f"  File type: Notification Settings")
-            elif "package_udf_definitions" in file_name:
-                self.logger.info(f"  File type: Package UDF Definitions")
-            elif "reference_asset" in file_name:
-                self.logger.info(f"  File type: Reference Asset")
-            else:
-                self.logger.info(f"  File type: Other/Unknown")
+            self._log_zip_json_file_type(member_name)
             
-            self.extract_data_quality_assets(data)
+            # Transform strings and extract assets in a single pass, skipping the
+            # transformation when no source string occurs in the raw content
+            changes_before = self.stats["changes_made"]
+            modified_data = self._walk_policy_data(data, transform=self.transform_engine.may_match(content))
+            if self.stats["changes_made"] == changes_before:
+                self.logger.debug(f"No replacements in {member_name}, keeping original content")
+                self.stats["files_unchanged"] += 1
+                return content
             
-            # Process the data (existing functionality)
-            modified_data = self.replace_in_value(data)
-            
-            # Write the modified data back to the same location in temp directory
-            with open(json_file_path, 'w', encoding='utf-8') as file:
-                json.dump(modified_data, file, ensure_ascii=False, separators=(',', ':'))
-            
-            self.logger.debug(f"Successfully processed: {json_file_path}")
-            return True
+            self.logger.debug(f"Successfully processed: {member_name}")
+            return json.dumps(modified_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
             
         except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON in {json_file_path}: {e}"
+            error_msg = f"Invalid JSON in {member_name}: {e}"
             self.logger.error(error_msg)
             self.stats["errors"].append(error_msg)
-            return False
+            return None
         except Exception as e:
-            error_msg = f"Error processing {json_file_path}: {e}"
+            error_msg = f"Error processing {member_name}: {e}"
             self.logger.error(error_msg)
             self.stats["errors"].append(error_msg)
-            return False
+            return None
+    
+    def _log_zip_json_file_type(self, member_name: str) -> None:
+        """Log which kind of export a JSON member of a ZIP file holds."""
+        file_name = Path(member_name).name
+        self.logger.info(f"Processing JSON file in ZIP for asset extraction: {file_name}")
+        
+        # Extract assets from ALL JSON files (policies, configurations, etc.)
+        self.logger.info(f"  Extracting assets from: {file_name}")
+        
+        # Log the type of file being processed for better debugging
+        if "data_quality_policy_definitions" in file_name:
+            self.logger.info(f"  File type: Data Quality Policy Definitions")
+        elif "data_drift_policy_definitions" in file_name:
+            self.logger.info(f"  File type: Data Drift Policy Definitions")
+        elif "schema_drift_policy_definitions" in file_name:
+            self.logger.info(f"  File type: Schema Drift Policy Definitions")
+        elif "reconciliation_policy_definitions" in file_name:
+            self.logger.info(f"  File type: Reconciliation Policy Definitions")
+        elif "profile_anomaly_policy_definition" in file_name:
+            self.logger.info(f"  File type: Profile Anomaly Policy Definition")
+        elif "data_cadence_policy_definitions" in file_name:
+            self.logger.info(f"  File type: Data Cadence Policy Definitions")
+        elif "business_rules" in file_name:
+            self.logger.info(f"  File type: Business Rules")
+        elif "asset_udf_variables" in file_name:
+            self.logger.info(f"  File type: Asset UDF Variables")
+        elif "data_sources" in file_name:
+            self.logger.info(f"  File type: Data Sources")
+        elif "notification_settings" in file_name:
+            self.logger.info(f"  File type: Notification Settings")
+        elif "package_udf_definitions" in file_name:
+            self.logger.info(f"  File type: Package UDF Definitions")
+        elif "reference_asset" in file_name:
+            self.logger.info(f"  File type: Reference Asset")
+        else:
+            self.logger.info(f"  File type: Other/Unknown")
     
-    def _create_output_zip(self, original_zip_path: Path, temp_path: Path, original_files: List[str]) -> bool:
-        """Create a new ZIP file with the processed content.
+    def _stream_json_file_in_zip(self, member_name: str, member: BinaryIO) -> Tuple[bool, Optional[BinaryIO]]:
+        """Process a large JSON member of a ZIP file one policy at a time.
+        
+        The transformed member is spooled to a temporary file once it outgrows
+        the streaming threshold, so neither version is held in memory whole.
         
         Args:
-            original_zip_path (Path): Path to the original ZIP file
-            temp_path (Path): Path to the temporary directory with processed files
-            original_files (List[str]): List of file paths from the original ZIP
+            member_name (str): Name of the member inside the ZIP file
+            member (BinaryIO): Open, seekable stream of the member content
             
         Returns:
-            bool: True if successful, False otherwise
+            Tuple[bool, Optional[BinaryIO]]: Whether the member was processed, and a
+                stream with the new content (None to keep the original content)
         """
+        spool = None
         try:
-            # Create output ZIP filename with "-import-ready" suffix
-            zip_name = original_zip_path.stem + "-import-ready.zip"
-            output_zip_path = self.output_dir / zip_name
-            
-            self.logger.info(f"Creating output ZIP: {output_zip_path}")
-            
-            # Create the new ZIP file
-            try:
-                with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
-                    # Add all files from the original ZIP structure
-                    for file_path in original_files:
-                        # Convert ZIP path to filesystem path
-                        fs_path = temp_path / file_path
-                        
-                        if fs_path.exists():
-                            # Add file to ZIP, preserving the original path structure
-                            zip_ref.write(fs_path, file_path)
-                            self.logger.debug(f"Added to ZIP: {file_path}")
-                        else:
-                            self.logger.warning(f"File not found in temp directory: {file_path}")
-            except Exception as e:
-                raise RuntimeError(f"Failed to create ZIP file {output_zip_path}: {e}")
+            self.stats["files_investigated"] += 1
+            self.stats["json_files_processed"] += 1
             
-            # Verify the output ZIP has the same number of files
-            try:
-                with zipfile.ZipFile(output_zip_path, 'r') as zip_ref:
-                    output_files = zip_ref.namelist()
-            except Exception as e:
-                raise RuntimeError(f"Failed to verify output ZIP {output_zip_path}: {e}")
+            self.logger.debug(f"Streaming JSON file in ZIP: {member_name}")
+            self._log_zip_json_file_type(member_name)
+            
+            may_match = self.transform_engine.may_match_stream(member)
+            member.seek(0)
+            source = io.TextIOWrapper(member, encoding=detect_encoding(member))
+            if not may_match:
+                # Only extract assets; the member is copied as it is
+                self._transform_json_stream(source, None, transform=False)
+                self.stats["files_unchanged"] += 1
+                self.logger.debug(f"No replacements in {member_name}, keeping original content")
+                return True, None
+            
+            changes_before = self.stats["changes_made"]
+            spool = tempfile.SpooledTemporaryFile(max_size=STREAMING_THRESHOLD)
+            target = io.TextIOWrapper(spool, encoding='utf-8')
+            self._transform_json_stream(source, target)
+            target.flush()
+            target.detach()
+            if self.stats["changes_made"] == changes_before:
+                spool.close()
+                self.stats["files_unchanged"] += 1
+                self.logger.debug(f"No replacements in {member_name}, keeping original content")
+                return True, None
+            spool.seek(0)
+            
+            self.logger.debug(f"Successfully processed: {member_name}")
+            return True, spool
             
-            if len(output_files) == len(original_files):
-                self.logger.info(f"Successfully created ZIP with {len(output_files)} files: {output_zip_path}")
-                return True
-            else:
-                error_msg = f"File count mismatch: original={len(original_files)}, output={len(output_files)}"
-                self.logger.error(error_msg)
-                self.stats["errors"].append(error_msg)
-                return False
-                
+        except json.JSONDecodeError as e:
+            error_msg = f"Invalid JSON in {member_name}: {e}"
+            self.logger.error(error_msg)
+            self.stats["errors"].append(error_msg)
         except Exception as e:
-            error_msg = f"Error creating output ZIP {output_zip_path}: {e}"
+            error_msg = f"Error processing {member_name}: {e}"
             self.logger.error(error_msg)
             self.stats["errors"].append(error_msg)
-            return False
+        if spool is not None:
+            spool.close()
+        return False, None
     
-    def process_directory(self) -> Dict[str, Any]:
+    def process_directory(self, processes: int = 1) -> Dict[str, Any]:
         """Process all JSON files and ZIP files in the input directory.
         
+        Args:
+            processes (int): Number of worker processes; 1 processes the files in this process
+            
         Returns:
             Dict[str, Any]: Statistics about the processing
         """
@@ -983,22 +913,25 @@ class PolicyExportFormatter:
             
             self.logger.info(f"Found {len(json_files)} JSON files and {len(zip_files)} ZIP files to process")
             
-            # Process JSON files
             successful = 0
             failed = 0
             
-            for json_file in json_files:
-                if self.process_json_file(json_file):
-                    successful += 1
-                else:
-                    failed += 1
-            
-            # Process ZIP files
-            for zip_file in zip_files:
-                if self.process_zip_file(zip_file):
-                    successful += 1
-                else:
-                    failed += 1
+            if processes > 1 and total_files > 1:
+                successful, failed = self._process_files_in_pool(json_files + zip_files, processes)
+            else:
+                # Process JSON files
+                for json_file in json_files:
+                    if self.process_json_file(json_file):
+                        successful += 1
+                    else:
+                        failed += 1
+                
+                # Process ZIP files
+                for zip_file in zip_files:
+                    if self.process_zip_file(zip_file):
+                        successful += 1
+                    else:
+                        failed += 1
             
             # Write extracted assets CSV at the end
             self.write_extracted_assets_csv()
@@ -1018,6 +951,7 @@ class PolicyExportFormatter:
                 "failed": failed,
                 "files_investigated": self.stats["files_investigated"],
                 "changes_made": self.stats["changes_made"],
+                "files_unchanged": self.stats["files_unchanged"],
                 "extracted_assets": len(self.extracted_assets),
                 "all_assets": len(self.all_asset_uids),
                 "csv_processed": csv_processed,
@@ -1047,6 +981,7 @@ class PolicyExportFormatter:
                 "failed": 1,
                 "files_investigated": self.stats["files_investigated"],
                 "changes_made": self.stats["changes_made"],
+                "files_unchanged": self.stats["files_unchanged"],
                 "extracted_assets": len(self.extracted_assets),
                 "all_assets": len(self.all_asset_uids),
                 "csv_processed": False,
@@ -1061,6 +996,82 @@ class PolicyExportFormatter:
                 "deep_scan_count": self.deep_scan_count
             }
 
+    def _process_files_in_pool(self, files: List[Path], processes: int) -> Tuple[int, int]:
+        """Process files in a pool of worker processes.
+        
+        The largest files are submitted first so the workers finish evenly. Each
+        worker returns the statistics and assets of its file, and these are
+        merged in input order, so the results match a sequential run.
+        
+        Args:
+            files (List[Path]): JSON and ZIP files to process
+            processes (int): Number of worker processes
+            
+        Returns:
+            Tuple[int, int]: Number of successful and failed files
+        """
+        processes = min(processes, len(files))
+        self.logger.info(f"Processing {len(files)} files with {processes} worker processes")
+        
+        successful = 0
+        failed = 0
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_formatter_worker,
+                                 initargs=(str(self.input_dir), self.string_transforms,
+                                           str(self.base_output_dir))) as executor:
+            order = sorted(range(len(files)), key=lambda index: files[index].stat().st_size, reverse=True)
+            futures = {index: executor.submit(_format_file_in_worker, str(files[index])) for index in order}
+            for index, file_path in enumerate(files):
+                try:
+                    results = futures[index].result()
+                except Exception as e:
+                    error_msg = f"Worker process failed for {file_path}: {e}"
+                    self.logger.error(error_msg)
+                    self.stats["errors"].append(error_msg)
+                    failed += 1
+                    continue
+                self._merge_results(results)
+                if results["success"]:
+                    successful += 1
+                else:
+                    failed += 1
+        return successful, failed
+
+
+# Formatter of the current worker process, created by _init_formatter_worker()
+_worker_formatter: Optional[PolicyExportFormatter] = None
+
+
+def _init_formatter_worker(input_dir: str, string_transforms: dict, output_dir: str) -> None:
+    """Create the formatter used by a policy-xfr worker process."""
+    global _worker_formatter
+    _worker_formatter = PolicyExportFormatter(input_dir=input_dir, string_transforms=string_transforms,
+                                              output_dir=output_dir)
+
+
+def _format_file_in_worker(file_path: str) -> Dict[str, Any]:
+    """Process one JSON or ZIP file in a worker process.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        Dict[str, Any]: Success flag, statistics and extracted assets of the file
+    """
+    formatter = _worker_formatter
+    formatter._reset_results()
+    path = Path(file_path)
+    if path.suffix == '.zip':
+        success = formatter.process_zip_file(path)
+    else:
+        success = formatter.process_json_file(path)
+    return {
+        "success": success,
+        "stats": formatter.stats,
+        "extracted_assets": formatter.extracted_assets,
+        "all_asset_uids": formatter.all_asset_uids,
+        "deep_scan_count": formatter.deep_scan_count
+    }
+
 
 class AssetExportFormatter:
     """Professional asset transformation tool with comprehensive error handling for asset-specific operations."""
@@ -1088,6 +1099,7 @@ class AssetExportFormatter:
         # Setup paths
         self.input_dir = Path(input_dir).resolve()
         self.string_transforms = string_transforms or {}
+        self.transform_engine = StringTransformEngine(self.string_transforms)
         
         # Validate input directory
         if not self.input_dir.exists():
@@ -1137,29 +1149,6 @@ class AssetExportFormatter:
         for source, target in self.string_transforms.items():
             self.logger.info(f"    '{source}' -> '{target}'")
     
-    def _exact_word_boundary_replace(self, text: str, source: str, target: str) -> str:
-        """Replace source string with target string only when it appears as a complete word.
-        
-        Args:
-            text (str): The text to transform
-            source (str): The source string to replace (must be exact word match)
-            target (str): The target string to replace with
-            
-        Returns:
-            str: The transformed text
-        """
-        if source == target:
-            return text
-        
-        # Escape special regex characters in the source string
-        escaped_source = re.escape(source)
-        # Create a regex pattern that matches the source as a complete word
-        # Word boundaries: \b matches at word boundaries (alphanumeric vs non-alphanumeric)
-        pattern = r'\b' + escaped_source + r'\b'
-        
-        # Replace all occurrences of the exact word
-        return re.sub(pattern, target, text)
-    
     def process_directory(self) -> Dict[str, Any]:
         """Process all asset CSV files in the input directory.
         
@@ -1351,7 +1340,8 @@ class AssetExportFormatter:
     
     def apply_string_transforms(self, value: str) -> str:
         """Apply string transformations to a value atomically to prevent cross-transformation interference.
-        Uses exact word boundary matching to prevent partial matches.
+        Uses exact word boundary matching to prevent partial matches. All transformations
+        are applied in a single scan by the compiled engine (see string_transforms.py).
         
         Args:
             value (str): The string value to transform
@@ -1359,28 +1349,7 @@ class AssetExportFormatter:
         Returns:
             str: The transformed string
         """
-        if not self.string_transforms:
-            return value
-        
-        # Phase 1: Replace all source strings with unique placeholders
-        # This prevents later transformations from affecting earlier ones
-        placeholders = {}
-        transformed_value = value
-        
-        for source, target in self.string_transforms.items():
-            if source != target:
-                # Use exact word boundary matching
-                if re.search(r'\b' + re.escape(source) + r'\b', transformed_value):
-                    # Create a unique placeholder for this transformation
-                    placeholder = f"__TRANSFORM_PLACEHOLDER_{len(placeholders)}__"
-                    placeholders[placeholder] = target
-                    transformed_value = self._exact_word_boundary_replace(transformed_value, source, placeholder)
-        
-        # Phase 2: Replace all placeholders with their target strings
-        for placeholder, target in placeholders.items():
-            transformed_value = transformed_value.replace(placeholder, target)
-        
-        return transformed_value
+        return self.transform_engine.apply(value)
 
 
 def validate_arguments(args: argparse.Namespace) -> None:
@@ -1502,6 +1471,8 @@ def parse_formatter_command(command: str) -> tuple:
                 print("  --output-dir <dir>            Output directory (defaults to organized subdirectories)")
                 print("  --quiet, -q                   Quiet mode (minimal output)")
                 print("  --verbose, -v                 Verbose mode (detailed output)")
+                print("  --parallel                    Process files in one worker process per CPU core")
+                print("  --processes <n>               Process files in n worker processes")
                 print("  --help, -h                    Show this help message")
                 print("\nExamples:")
                 print("  policy-xfr --string-transform \"PROD_DB\":\"DEV_DB\", \"PROD_URL\":\"DEV_URL\"")
@@ -1643,7 +1614,7 @@ def parse_asset_formatter_command(command: str) -> tuple:
         return None, None, None, None, False
 
 def execute_formatter(input_dir: str, string_transforms: dict, output_dir: str, 
-                     quiet_mode: bool, verbose_mode: bool, logger):
+                     quiet_mode: bool, verbose_mode: bool, logger, processes: int = 1):
     """Execute formatter command in interactive mode.
     Args:
         input_dir (str): Input directory (can be None for auto-detection)
@@ -1652,6 +1623,7 @@ def execute_formatter(input_dir: str, string_transforms: dict, output_dir: str,
         quiet_mode (bool): Quiet mode flag
         verbose_mode (bool): Verbose mode flag
         logger: Logger instance
+        processes (int): Number of worker processes for the ZIP and JSON files
     """
     try:
         if not input_dir:
@@ -1682,7 +1654,9 @@ def execute_formatter(input_dir: str, string_transforms: dict, output_dir: str,
             output_dir=output_dir,
             logger=logger
         )
-        stats = formatter.process_directory()
+        if processes > 1 and not quiet_mode:
+            print(f"🚀 Processing files with {processes} worker processes")
+        stats = formatter.process_directory(processes=processes)
         if not quiet_mode:
             print("\n" + "="*60)
             print("PROCESSING SUMMARY")
@@ -1712,6 +1686,7 @@ def execute_formatter(input_dir: str, string_transforms: dict, output_dir: str,
                 print(f"ZIP files:           {stats['zip_files']}")
             print(f"Files investigated:  {stats.get('files_investigated', 0)}")
             print(f"Changes made:        {stats.get('changes_made', 0)}")
+            print(f"Copied unchanged:    {stats.get('files_unchanged', 0)}")
             if not string_transforms:
                 print("  ℹ️  Direct processing mode (no transformations provided)")
                 print("  💡 This mode processes files without string replacements")
@@ -2120,14 +2095,22 @@ def transform_asset_uid(source_uid: str, transformation_mappings: Dict[str, str]
     return result
 
 
-def enrich_with_target_assets_from_api(client, logger: logging.Logger, mappings: List[Dict[str, Any]], quiet_mode: bool = False) -> List[Dict[str, Any]]:
-    """Enrich transformed mappings with target asset data."""
+def enrich_with_target_assets_from_api(client, logger: logging.Logger, mappings: List[Dict[str, Any]], quiet_mode: bool = False, max_threads: int = 5) -> List[Dict[str, Any]]:
+    """Enrich transformed mappings with target asset data.
+
+    Each distinct target UID is looked up once, concurrently, through the
+    shared target asset resolver; repeated UIDs (one row per tag) are served
+    from its index.
+    """
     enriched_mappings = []
     total_mappings = len(mappings)
     
     if not quiet_mode:
         print(f"Enriching {total_mappings} transformed mappings with target asset data...")
     
+    resolver = TargetAssetResolver.for_import(client, logger)
+    resolver.prefetch((mapping.get('Target_Asset_UID', '') for mapping in mappings), max_threads, need_type=True)
+    
     # Create progress bar
     from tqdm import tqdm
     with tqdm(total=total_mappings, desc="Target Asset Enrichment", disable=quiet_mode) as pbar:
@@ -2135,15 +2118,13 @@ def enrich_with_target_assets_from_api(client, logger: logging.Logger, mappings:
             try:
                 target_uid = mapping.get('Target_Asset_UID', '')
                 if target_uid:
-                    # Fetch target asset by UID
-                    response = client.make_api_call(
-                        endpoint=f"/catalog-server/api/assets?uid={target_uid}",
-                        method='GET',
-                        use_target_auth=True,
-                        use_target_tenant=True
-                    )
-                    
-                    target_info = extract_target_asset_info(response)
+                    # Resolve target asset by UID (prefetched above)
+                    asset = resolver.resolve_asset(target_uid)
+                    target_info = {
+                        'found': asset is not None,
+                        'target_asset_id': str(asset['id']) if asset else '',
+                        'asset_type': (asset.get('asset_type') or '') if asset else ''
+                    }
                     
                     enriched_mapping = mapping.copy()
                     if target_info['found']:
@@ -2184,6 +2165,8 @@ def enrich_with_target_assets_from_api(client, logger: logging.Logger, mappings:
             
             pbar.update(1)
     
+    resolver.save()
+    logger.info(resolver.format_stats())
     return enriched_mappings
 
 
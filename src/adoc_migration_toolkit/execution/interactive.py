@@ -108,15 +108,15 @@ def show_interactive_help():
     print("="*80)
     
     print(f"\n{BOLD}📊 SEGMENTS COMMANDS:{RESET}")
-    print(f"  {BOLD}segments-export{RESET} [<csv_file>] [--output-file <file>] [--quiet]")
+    print(f"  {BOLD}segments-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--format csv|jsonl]")
     print("    Export segments from source environment to CSV file")
     print(f"  {BOLD}segments-import{RESET} <csv_file> [--dry-run] [--quiet] [--verbose]")
     print("    Import segments to target environment from CSV file")
     
     print(f"\n{BOLD}🔧 ASSET PROFILE COMMANDS:{RESET}")
-    print(f"  {BOLD}asset-profile-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--allowed-types <types>]")
+    print(f"  {BOLD}asset-profile-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--async] [--allowed-types <types>] [--resume] [--format csv|jsonl]")
     print("    Export asset profiles from source environment to CSV file")
-    print(f"  {BOLD}asset-profile-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--allowed-types <types>]")
+    print(f"  {BOLD}asset-profile-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--allowed-types <types>] [--resume]")
     print("    Import asset profiles to target environment from CSV file")
     print(f"  {BOLD}verify-profiles{RESET} [<csv_file>] [--quiet] [--verbose] [--max-threads <threads>]")
     print(f"  {BOLD}verify-configs{RESET} [<csv_file>] [--quiet] [--verbose] [--max-threads <threads>]")
@@ -129,24 +129,24 @@ def show_interactive_help():
     print("    Triggers the profiling[Changes the engine type to Pushdown] for the given assets supplied from CSV file.")
     
     print(f"\n{BOLD}🔍 ASSET CONFIGURATION COMMANDS:{RESET}")
-    print(f"  {BOLD}asset-config-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--allowed-types <types>]")
+    print(f"  {BOLD}asset-config-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--allowed-types <types>] [--resume] [--format csv|jsonl]")
     print("    Export asset configurations from source environment to CSV file")
-    print(f"  {BOLD}asset-config-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--parallel] [--allowed-types <types>]")
+    print(f"  {BOLD}asset-config-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--parallel] [--allowed-types <types>] [--resume]")
     print("    Import asset configurations to target environment from CSV file")
-    print(f"  {BOLD}asset-list-export{RESET} [--quiet] [--verbose] [--parallel] [--target] [--page-size <size>]")
+    print(f"  {BOLD}asset-list-export{RESET} [--quiet] [--verbose] [--parallel] [--async] [--target] [--page-size <size>]")
     print("    Export all assets from source or target environment to CSV file")
     print(f"  {BOLD}asset-tag-export{RESET} [--quiet] [--verbose] [--target] [--max-threads <num>]")
     print("    Export tags for assets from asset-merged-all.csv to asset-import/asset-tag-import-ready.csv")
-    print(f"  {BOLD}asset-tag-import{RESET} [csv_file] [--quiet] [--verbose] [--parallel]")
+    print(f"  {BOLD}asset-tag-import{RESET} [csv_file] [--quiet] [--verbose] [--parallel] [--async] [--resume]")
     print("    Import tags for assets from CSV file")
     
     
     print(f"\n{BOLD}📋 POLICY COMMANDS:{RESET}")
     print(f"  {BOLD}policy-list-export{RESET} [--quiet] [--verbose] [--parallel] [--existing-target-assets]")
     print("    Export all policies from source environment to CSV file")
-    print(f"  {BOLD}policy-export{RESET} [--type <export_type>] [--filter <filter_value>] [--quiet] [--verbose] [--batch-size <size>] [--parallel]")
+    print(f"  {BOLD}policy-export{RESET} [--type <export_type>] [--filter <filter_value>] [--quiet] [--verbose] [--batch-size <size>] [--parallel] [--resume]")
     print("    Export policy definitions by different categories from source environment to ZIP files")
-    print(f"  {BOLD}policy-import{RESET} <file_or_pattern> [--quiet] [--verbose]")
+    print(f"  {BOLD}policy-import{RESET} <file_or_pattern> [--quiet] [--verbose] [--resume]")
     print("    Import policy definitions from ZIP files to target environment")
     print(f"  {BOLD}rule-tag-export{RESET} [--quiet] [--verbose] [--parallel]")
     print("    Export rule tags for all policies from policies-all-export.csv")
@@ -187,7 +187,7 @@ def show_interactive_help():
     print("    Set global output directory for all export commands")
     print(f"  {BOLD}set-log-level{RESET} <level>")
     print("    Change log level dynamically (ERROR, WARNING, INFO, DEBUG)")
-    print(f"  {BOLD}set-http-config{RESET} [--timeout x] [--retry x] [--proxy url]")
+    print(f"  {BOLD}set-http-config{RESET} [--timeout x] [--retry x] [--proxy url] [--pool-connections x] [--pool-maxsize x] [--adaptive-concurrency on|off] [--max-in-flight x] [--response-cache on|off] [--cache-ttl x] [--cache-max-mb x]")
     print("    Configure HTTP timeout, retry, and proxy settings")
     print(f"  {BOLD}show-config{RESET}")
     print("    Display current configuration (HTTP, logging, environment, output)")
@@ -231,20 +231,22 @@ def show_command_help(command_name: str):
     
     # Command-specific help content
     if command_name == 'segments-export':
-        print(f"\n{BOLD}segments-export{RESET} [<csv_file>] [--output-file <file>] [--quiet]")
+        print(f"\n{BOLD}segments-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--format csv|jsonl]")
         print("    Description: Export segments from source environment to CSV file")
         print("    Arguments:")
         print("      csv_file: Path to CSV file with source-env and target-env mappings (optional)")
         print("      --output-file: Specify custom output file (optional)")
         print("      --quiet: Suppress console output, show only summary")
+        print("      --format: Output format, csv (default) or jsonl (one JSON object per line)")
         print("    Examples:")
         print("      segments-export")
         print("      segments-export <output-dir>/policy-export/segmented_spark_uids.csv")
         print("      segments-export data/uids.csv --output-file my_segments.csv --quiet")
+        print("      segments-export --format jsonl")
         print("    Behavior:")
         print("      • If no CSV file specified, uses default from output directory")
         print("      • Default input: <output-dir>/policy-export/segmented_spark_uids.csv")
-        print("      • Default output: <output-dir>/policy-import/segments_output.csv")
+        print("      • Default output: <output-dir>/policy-import/segments_output.csv (.jsonl with --format jsonl)")
         print("      • Exports segments configuration for assets with isSegmented=true")
         print("      • For engineType=SPARK: Required because segmented Spark configurations")
         print("        are not directly imported with standard import capability")
@@ -265,7 +267,7 @@ def show_command_help(command_name: str):
         print("      segments-import <output-dir>/policy-import/segments_output.csv")
         print("      segments-import segments.csv --dry-run --verbose")
         print("    Behavior:")
-        print("      • Reads the CSV file generated from segments-export command")
+        print("      • Reads the CSV or JSON Lines file generated from segments-export command")
         print("      • Targets UIDs for which segments are present and engine is SPARK")
         print("      • Imports segments configuration to target environment")
         print("      • Creates new segments (removes existing IDs)")
@@ -274,26 +276,32 @@ def show_command_help(command_name: str):
         print("      • Processes only assets that have valid segments configuration")
     
     elif command_name == 'asset-profile-export':
-        print(f"\n{BOLD}asset-profile-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--source-context <id>] [--target-context <id>]")
+        print(f"\n{BOLD}asset-profile-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--async] [--max-concurrency <num>] [--source-context <id>] [--target-context <id>] [--resume] [--format csv|jsonl]")
         print("    Description: Export asset profiles from source environment to CSV file")
         print("    Arguments:")
         print("      csv_file: Path to CSV file with source-env and target-env mappings (optional)")
         print("      --output-file: Specify custom output file (optional)")
         print("      --quiet: Suppress console output, show only summary (default)")
         print("      --verbose: Show detailed output including headers and responses")
+        print("      --resume: Continue an interrupted parallel export, skipping assets already exported")
         print("      --parallel: Use parallel processing for faster export (max 5 threads)")
+        print("      --async: Use the asyncio engine for high-concurrency export (requires aiohttp)")
+        print("      --max-concurrency: Maximum in-flight requests in async mode (default: 100)")
         print("      --source-context: Source context ID for notification mapping (optional)")
         print("      --target-context: Target context ID for notification mapping (optional)")
+        print("      --format: Output format, csv (default) or jsonl (one JSON object per line; not with --async)")
         print("    Examples:")
         print("      asset-profile-export")
         print("      asset-profile-export <output-dir>/asset-export/asset_uids.csv")
         print("      asset-profile-export uids.csv --output-file profiles.csv --verbose")
         print("      asset-profile-export --parallel")
+        print("      asset-profile-export --async --max-concurrency 200")
         print("      asset-profile-export --source-context 1643800761 --target-context 1080269831")
+        print("      asset-profile-export --parallel --format jsonl")
         print("    Behavior:")
         print("      • If no CSV file specified, uses default from output directory")
         print("      • Default input: <output-dir>/asset-export/asset_uids.csv")
-        print("      • Default output: <output-dir>/asset-import/asset-profiles-import-ready.csv")
+        print("      • Default output: <output-dir>/asset-import/asset-profiles-import-ready.csv (.jsonl with --format jsonl)")
         print("      • Reads source-env and target-env mappings from CSV file")
         print("      • Makes API calls to get asset profiles from source environment")
         print("      • Maps notification group IDs from source to target if context IDs provided")
@@ -304,13 +312,14 @@ def show_command_help(command_name: str):
         print("      • Parallel mode: Significantly faster for large asset sets")
     
     elif command_name == 'asset-profile-import':
-        print(f"\n{BOLD}asset-profile-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--max-threads <num>] [--notification-mapping <csv_file>] [--no-duplicate-resolution]")
+        print(f"\n{BOLD}asset-profile-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--max-threads <num>] [--notification-mapping <csv_file>] [--no-duplicate-resolution] [--resume]")
         print("    Description: Import asset profiles to target environment from CSV file")
         print("    Arguments:")
         print("      csv_file: Path to CSV file with target-env and profile_json (optional)")
         print("      --dry-run: Preview changes without making API calls")
         print("      --quiet: Suppress console output (default)")
         print("      --verbose: Show detailed output including headers and responses")
+        print("      --resume: Continue an interrupted import, skipping assets already imported")
         print("      --max-threads: Maximum number of threads for parallel processing (default: 5)")
         print("      --notification-mapping: Path to notification ID mapping CSV file (optional)")
         print("      --no-duplicate-resolution: Skip interactive duplicate resolution")
@@ -324,26 +333,29 @@ def show_command_help(command_name: str):
         print("      • If no CSV file specified, uses default from output directory")
         print("      • Default input: <output-dir>/asset-import/asset-profiles-import-ready.csv")
         print("      • Automatically detects duplicate target UIDs and prompts for selection")
-        print("      • Reads target-env and profile_json from CSV file")
+        print("      • Reads target-env and profile_json from CSV or JSON Lines file (detected automatically)")
         print("      • Maps notification group IDs from source to target if mapping CSV provided")
         print("      • Makes API calls to update asset profiles in target environment")
         print("      • Supports dry-run mode for previewing changes")
     
     elif command_name == 'asset-config-export':
-        print(f"\n{BOLD}asset-config-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel]")
+        print(f"\n{BOLD}asset-config-export{RESET} [<csv_file>] [--output-file <file>] [--quiet] [--verbose] [--parallel] [--resume] [--format csv|jsonl]")
         print("    Description: Export asset configurations from source environment to CSV file")
         print("    Arguments:")
         print("      csv_file: Path to CSV file with 5 columns: source_id, source_uid, target_id, target_uid, tags (optional)")
         print("      --output-file: Specify custom output file (optional)")
         print("      --quiet: Suppress console output, show only summary")
         print("      --verbose: Show detailed output including headers and responses")
+        print("      --resume: Continue an interrupted parallel export, skipping assets already exported")
         print("      --parallel: Use parallel processing for faster export (max 5 threads, quiet mode default)")
+        print("      --format: Output format with --parallel, csv (default) or jsonl (one JSON object per line)")
         print("    Examples:")
         print("      asset-config-export")
         print("      asset-config-export <output-dir>/asset-import/asset-merged-all.csv")
         print("      asset-config-export uids.csv --output-file configs.csv --verbose")
         print("      asset-config-export --parallel")
         print("      asset-config-export --parallel --verbose")
+        print("      asset-config-export --parallel --format jsonl")
         print("    Behavior:")
         print("      • Reads from asset-import/asset-merged-all.csv by default if no CSV file specified")
         print("      • Reads CSV with 5 columns: source_id, source_uid, target_id, target_uid, tags")
@@ -359,13 +371,14 @@ def show_command_help(command_name: str):
         print("      • Default mode: Silent (no progress bars)")
     
     elif command_name == 'asset-config-import':
-        print(f"\n{BOLD}asset-config-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--parallel]")
+        print(f"\n{BOLD}asset-config-import{RESET} [<csv_file>] [--dry-run] [--quiet] [--verbose] [--parallel] [--resume]")
         print("    Description: Import asset configurations to target environment from CSV file")
         print("    Arguments:")
-        print("      csv_file: Path to CSV file with target_uid and config_json columns (optional)")
+        print("      csv_file: Path to CSV or JSON Lines file with target_uid and config_json columns (optional)")
         print("      --dry-run: Preview requests and payloads without making API calls")
         print("      --quiet: Show progress bars (default for parallel mode)")
         print("      --verbose: Show detailed output including HTTP requests and responses")
+        print("      --resume: Continue an interrupted import, skipping assets already imported")
         print("      --parallel: Use parallel processing for faster import (max 5 threads)")
         print("    Examples:")
         print("      asset-config-import")
@@ -376,6 +389,8 @@ def show_command_help(command_name: str):
         print("      • Reads from asset-import/asset-config-import-ready.csv by default if no CSV file specified")
         print("      • Reads CSV with 2 columns: target_uid, config_json")
         print("      • Gets asset ID using GET /catalog-server/api/assets?uid=<target_uid>")
+        print("      • Asset IDs already known from asset-merged-all.csv, asset-all-target-export.csv or")
+        print("        ~/.adoc_migration_toolkit/cache (entries valid for 24 hours) are reused without an API call")
         print("      • Updates config using PUT /catalog-server/api/assets/<id>/config")
         print("      • Shows progress bar in quiet mode")
         print("      • Shows HTTP details in verbose mode")
@@ -386,12 +401,14 @@ def show_command_help(command_name: str):
         print("      • Default mode: Silent (no progress bars)")
     
     elif command_name == 'asset-list-export':
-        print(f"\n{BOLD}asset-list-export{RESET} [--quiet] [--verbose] [--parallel] [--target] [--page-size <size>]")
+        print(f"\n{BOLD}asset-list-export{RESET} [--quiet] [--verbose] [--parallel] [--async] [--max-concurrency <num>] [--target] [--page-size <size>]")
         print("    Description: Export all assets from source or target environment to CSV file")
         print("    Arguments:")
         print("      --quiet: Suppress console output, show only summary")
         print("      --verbose: Show detailed output including headers and responses")
         print("      --parallel: Use parallel processing for faster export (max 5 threads)")
+        print("      --async: Use the asyncio engine for high-concurrency export (requires aiohttp)")
+        print("      --max-concurrency: Maximum in-flight requests in async mode (default: 100)")
         print("      --target: Use target environment instead of source environment")
         print("      --page-size: Number of assets per page (default: 250)")
         print("      --source_type_ids <list>     Comma-separated list of source type IDs (optional)")
@@ -402,6 +419,7 @@ def show_command_help(command_name: str):
         print("      asset-list-export --quiet")
         print("      asset-list-export --verbose")
         print("      asset-list-export --parallel")
+        print("      asset-list-export --async --max-concurrency 200")
         print("      asset-list-export --parallel --source_type_ids=5 --asset_type_ids=2,23,53 --assembly_ids=100,101 ")
         print("      asset-list-export --target")
         print("      asset-list-export --target --verbose")
@@ -452,19 +470,23 @@ def show_command_help(command_name: str):
         print("      • Next step: Use tag-xfr to transform UIDs and enrich with target data")
     
     elif command_name == 'asset-tag-import':
-        print(f"\n{BOLD}asset-tag-import{RESET} [csv_file] [--quiet] [--verbose] [--parallel]")
+        print(f"\n{BOLD}asset-tag-import{RESET} [csv_file] [--quiet] [--verbose] [--parallel] [--async] [--max-concurrency <num>] [--resume]")
         print("    Description: Import tags for assets from CSV file")
         print("    Arguments:")
         print("      csv_file: Path to CSV file (defaults to transformed_tag_assets_output.csv)")
         print("    Options:")
         print("      --quiet, -q: Suppress console output, show only summary")
         print("      --verbose, -v: Show detailed output including API calls")
+        print("      --resume: Continue an interrupted import, skipping assets already tagged")
         print("      --parallel, -p: Use parallel processing for faster import")
+        print("      --async: Use the asyncio engine for high-concurrency import (requires aiohttp)")
+        print("      --max-concurrency: Maximum in-flight requests in async mode (default: 100)")
         print("    Examples:")
         print("      asset-tag-import")
         print("      asset-tag-import --quiet")
         print("      asset-tag-import --verbose")
         print("      asset-tag-import --parallel")
+        print("      asset-tag-import --async --max-concurrency 200")
         print("      asset-tag-import /path/to/asset-data.csv --verbose --parallel")
         print("    Behavior:")
         print("      • Reads asset data from transformed_tag_assets_output.csv (or specified file)")
@@ -538,13 +560,14 @@ def show_command_help(command_name: str):
         print("      • Parallel mode: Temporary files merged into final output")
     
     elif command_name == 'policy-export':
-        print(f"\n{BOLD}policy-export{RESET} [--type <export_type>] [--filter <filter_value>] [--quiet] [--verbose] [--batch-size <size>] [--parallel] [--max-threads <threads>] [--no-filter-versions]")
+        print(f"\n{BOLD}policy-export{RESET} [--type <export_type>] [--filter <filter_value>] [--quiet] [--verbose] [--batch-size <size>] [--parallel] [--max-threads <threads>] [--no-filter-versions] [--resume]")
         print("    Description: Export policy definitions by different categories from source environment to ZIP files")
         print("    Arguments:")
         print("      --type: Export type (rule-types, engine-types, assemblies, source-types)")
         print("      --filter: Optional filter value within the export type")
         print("      --quiet: Suppress console output, show only summary")
         print("      --verbose: Show detailed output including headers and responses")
+        print("      --resume: Continue an interrupted parallel export, skipping batches already exported")
         print("      --batch-size: Number of policies to export in each batch (default: 50)")
         print("      --parallel: Use parallel processing for faster export")
         print("      --max-threads: Maximum number of threads for parallel processing (default: 5)")
@@ -573,21 +596,23 @@ def show_command_help(command_name: str):
         print("      • Shows batch-by-batch progress in quiet mode")
         print("      • Shows detailed request/response in verbose mode")
         print("      • Provides comprehensive statistics upon completion")
-        print("      • Parallel mode: Uses up to 5 threads to process different policy types simultaneously")
-        print("      • Parallel mode: Each thread has its own progress bar showing batch completion")
+        print("      • Parallel mode: Uses up to 5 threads pulling export batches of all policy types from a shared queue")
+        print("      • Parallel mode: Batch sizes adapt to observed response times; a shared progress bar counts policies")
         print("      • Parallel mode: Significantly faster for large exports with multiple policy types")
         print("      • Version filtering: By default, keeps only the latest version of each policy (sorts by ruleVersion)")
         print("      • Version filtering: Ensures imported policies use the most recent configuration (e.g., Additional metadata)")
-        print("      • Version filtering: Creates backup of original ZIP before filtering (adds .backup extension)")
+        print("      • Version filtering: Creates backup of original ZIP when versions are removed (adds .backup extension)")
+        print("      • Version filtering: Rewrites only the affected JSON files; other ZIP entries are copied as-is")
         print("      • Use --no-filter-versions to preserve all policy versions (may cause import issues)")
     
     elif command_name == 'policy-import':
-        print(f"\n{BOLD}policy-import{RESET} <file_or_pattern> [--quiet] [--verbose]")
+        print(f"\n{BOLD}policy-import{RESET} <file_or_pattern> [--quiet] [--verbose] [--resume]")
         print("    Description: Import policy definitions from ZIP files to target environment")
         print("    Arguments:")
         print("      file_or_pattern: ZIP file path or glob pattern (e.g., *.zip)")
         print("      --quiet: Suppress console output, show only summary")
         print("      --verbose: Show detailed output including headers and responses")
+        print("      --resume: Continue an interrupted import, skipping ZIP files already imported")
         print("    Examples:")
         print("      policy-import *.zip")
         print("      policy-import /path/to/specific-file.zip")
@@ -643,6 +668,8 @@ def show_command_help(command_name: str):
         print("      --output-dir: Output directory (defaults to organized subdirectories)")
         print("      --quiet: Suppress console output, show only summary")
         print("      --verbose: Show detailed output including processing details")
+        print("      --parallel: Process files in one worker process per CPU core")
+        print("      --processes <n>: Process files in n worker processes")
         print("    Examples:")
         print("      policy-xfr --string-transform \"PROD_DB\":\"DEV_DB\", \"PROD_URL\":\"DEV_URL\"")
         print("      policy-xfr --input data/samples --string-transform \"old\":\"new\", \"test\":\"prod\"")
@@ -792,23 +819,37 @@ def show_command_help(command_name: str):
         print("      • DEBUG: All messages including debug information")
     
     elif command_name == 'set-http-config':
-        print(f"\n{BOLD}set-http-config{RESET} [--timeout x] [--retry x] [--proxy url]")
+        print(f"\n{BOLD}set-http-config{RESET} [--timeout x] [--retry x] [--proxy url] [--pool-connections x] [--pool-maxsize x] [--adaptive-concurrency on|off] [--max-in-flight x] [--response-cache on|off] [--cache-ttl x] [--cache-max-mb x]")
         print("    Description: Configure HTTP timeout, retry, and proxy settings for all API requests")
         print("    Arguments:")
         print("      --timeout x: Request timeout in seconds (integer)")
         print("      --retry x: Number of retry attempts (integer)")
         print("      --proxy url: Proxy URL (e.g., http://proxy.example.com:8080)")
+        print("      --pool-connections x: Number of host pools cached per shared adapter (default: 10)")
+        print("      --pool-maxsize x: Keep-alive connections per host shared by all threads (default: 32)")
+        print("      --adaptive-concurrency on|off: Back off on 429/502/503/504 and rising latency (default: on)")
+        print("      --max-in-flight x: Upper bound for concurrent API requests across all threads (default: 64)")
+        print("      --response-cache on|off: Cache GET responses in <output-dir>/cache/http-cache.sqlite3 (default: off)")
+        print("      --cache-ttl x: Default time-to-live for cached responses in seconds (default: 3600)")
+        print("      --cache-max-mb x: Size limit of the response cache; least recently used entries are evicted (default: 512)")
         print("    Examples:")
         print("      set-http-config --timeout 30")
         print("      set-http-config --retry 5")
         print("      set-http-config --proxy http://proxy.company.com:8080")
         print("      set-http-config --timeout 20 --retry 3 --proxy http://proxy:8080")
+        print("      set-http-config --pool-maxsize 64")
+        print("      set-http-config --adaptive-concurrency on --max-in-flight 32")
+        print("      set-http-config --response-cache on --cache-ttl 7200")
         print("    Features:")
         print("      • Shows current HTTP configuration before changes")
         print("      • Applies changes immediately to global HTTP config")
         print("      • Affects all future API requests")
         print("      • Supports retry with exponential backoff")
-        print("      • Retries on 429, 500, 502, 503, 504 status codes")
+        print("      • Retries on 429, 502, 503, 504 status codes and honours Retry-After")
+        print("      • Adaptive concurrency grows in-flight requests while latency is stable and halves them when throttled")
+        print("      • Worker threads share one connection pool per host; size it to at least the thread count")
+        print("      • Response cache makes reruns of exports and verifications skip GETs that already succeeded;")
+        print("        imports (PUT/POST) drop cached responses for the assets and rules they change")
         print("      • Proxy support for HTTP and HTTPS requests")
         print("      • Changes persist for the current session")
         print("      • Shows new configuration after changes")
@@ -1091,24 +1132,25 @@ def setup_autocomplete():
     # Define command-specific completions
     command_completions = {
         'help': commands,  # help can be followed by any command
-        'asset-config-export': ['--output-file', '--quiet', '--verbose', '--parallel'],
-        'asset-config-import': ['--dry-run', '--quiet', '--verbose', '--parallel'],
-                    'asset-list-export': ['--quiet', '--verbose', '--parallel', '--target', '--page-size'],
+        'asset-config-export': ['--output-file', '--quiet', '--verbose', '--parallel', '--resume', '--format'],
+        'asset-config-import': ['--dry-run', '--quiet', '--verbose', '--parallel', '--resume'],
+                    'asset-list-export': ['--quiet', '--verbose', '--parallel', '--async', '--max-concurrency', '--target', '--page-size'],
                     'asset-tag-export': ['--quiet', '--verbose', '--target', '--max-threads'],
                     'tag-xfr': ['--string-transform', '--quiet', '--verbose', '--max-threads'],
-        'asset-profile-export': ['--output-file', '--quiet', '--verbose', '--parallel'],
-        'asset-profile-import': ['--dry-run', '--quiet', '--verbose'],
+        'asset-profile-export': ['--output-file', '--quiet', '--verbose', '--parallel', '--async', '--max-concurrency', '--resume', '--format'],
+        'asset-profile-import': ['--dry-run', '--quiet', '--verbose', '--resume'],
         'verify-profiles': ['--quiet', '--verbose', '--max-threads'],
         'verify-configs': ['--quiet', '--verbose', '--max-threads'],
-        'asset-tag-import': ['--quiet', '--verbose', '--parallel'],
+        'asset-tag-import': ['--quiet', '--verbose', '--parallel', '--async', '--max-concurrency', '--resume'],
     
-        'policy-export': ['--type', '--filter', '--quiet', '--verbose', '--batch-size', '--parallel'],
-        'policy-import': ['--quiet', '--verbose'],
+        'policy-export': ['--type', '--filter', '--quiet', '--verbose', '--batch-size', '--parallel', '--resume'],
+        'policy-import': ['--quiet', '--verbose', '--resume'],
         'policy-list-export': ['--quiet', '--verbose', '--parallel', '--existing-target-assets'],
-        'policy-xfr': ['--input', '--source-env-string', '--target-env-string', '--quiet', '--verbose'],
+        'policy-xfr': ['--input', '--source-env-string', '--target-env-string', '--quiet', '--verbose',
+                       '--parallel', '--processes'],
         'transform-and-merge': ['--string-transform', '--quiet', '--verbose'],
         'rule-tag-export': ['--quiet', '--verbose', '--parallel'],
-        'segments-export': ['--output-file', '--quiet'],
+        'segments-export': ['--output-file', '--quiet', '--format'],
         'segments-import': ['--dry-run', '--quiet', '--verbose'],
         'vcs-config': ['--vcs-type', '--remote-url', '--username', '--token', '--ssh-key-path', '--ssh-passphrase', '--proxy-url', '--proxy-username', '--proxy-password'],
         'vcs-init': [],
@@ -1118,7 +1160,7 @@ def setup_autocomplete():
         'PUT': ['--target'],  # REST API commands
         'set-output-dir': [],
         'set-log-level': ['ERROR', 'WARNING', 'INFO', 'DEBUG'],
-        'set-http-config': ['--timeout', '--retry', '--proxy'],
+        'set-http-config': ['--timeout', '--retry', '--proxy', '--pool-connections', '--pool-maxsize', '--adaptive-concurrency', '--max-in-flight', '--response-cache', '--cache-ttl', '--cache-max-mb'],
         'show-config': []
     }
     
@@ -1511,10 +1553,12 @@ def run_interactive(args):
                 
                 # Check if it's a segments-export command
                 if command.lower().startswith('segments-export'):
-                    from .command_parsing import parse_segments_export_command
+                    from .command_parsing import parse_segments_export_command, strip_format_option, default_record_output_file
+                    command, record_format = strip_format_option(command)
                     csv_file, output_file, quiet_mode = parse_segments_export_command(command)
+                    output_file = default_record_output_file(command, output_file, record_format)
                     if csv_file:
-                        execute_segments_export(csv_file, client, logger, output_file, quiet_mode)
+                        execute_segments_export(csv_file, client, logger, output_file, quiet_mode, record_format=record_format)
                     continue
                 
                 # Check if it's a segments-import command
@@ -1527,23 +1571,37 @@ def run_interactive(args):
                 
                 # Check if it's an asset-profile-export command
                 if command.lower().startswith('asset-profile-export'):
-                    from .command_parsing import parse_asset_profile_export_command
-                    csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, allowed_types, max_threads, source_context_id, target_context_id = parse_asset_profile_export_command(command)
+                    from .command_parsing import parse_asset_profile_export_command, strip_resume_flag, strip_format_option, default_record_output_file
+                    command, resume_mode = strip_resume_flag(command)
+                    command, record_format = strip_format_option(command)
+                    csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, allowed_types, max_threads, source_context_id, target_context_id, async_mode, max_concurrency = parse_asset_profile_export_command(command)
                     if csv_file:
-                        if parallel_mode:
-                            execute_asset_profile_export_parallel(csv_file, client, logger, output_file, quiet_mode, verbose_mode, allowed_types, max_threads, source_context_id, target_context_id)
+                        if async_mode:
+                            if resume_mode:
+                                print("⚠️  --resume is only supported with --parallel; running a full export")
+                            if record_format != 'csv':
+                                print("⚠️  --format is not supported with --async; writing CSV")
+                            from .async_asset_operations import execute_asset_profile_export_async
+                            execute_asset_profile_export_async(csv_file, client, logger, output_file, quiet_mode, verbose_mode, allowed_types, max_concurrency, source_context_id, target_context_id)
+                        elif parallel_mode:
+                            output_file = default_record_output_file(command, output_file, record_format)
+                            execute_asset_profile_export_parallel(csv_file, client, logger, output_file, quiet_mode, verbose_mode, allowed_types, max_threads, source_context_id, target_context_id, resume=resume_mode, record_format=record_format)
                         else:
-                            execute_asset_profile_export(csv_file, client, logger, output_file, quiet_mode, verbose_mode, allowed_types, source_context_id, target_context_id)
+                            if resume_mode:
+                                print("⚠️  --resume is only supported with --parallel; running a full export")
+                            output_file = default_record_output_file(command, output_file, record_format)
+                            execute_asset_profile_export(csv_file, client, logger, output_file, quiet_mode, verbose_mode, allowed_types, source_context_id, target_context_id, record_format=record_format)
                     continue
                 
                 # Check if it's an asset-profile-import command
                 if command.lower().startswith('asset-profile-import'):
-                    from .command_parsing import parse_asset_profile_import_command
+                    from .command_parsing import parse_asset_profile_import_command, strip_resume_flag
+                    command, resume_mode = strip_resume_flag(command)
                     csv_file, dry_run, quiet_mode, verbose_mode, max_threads, notification_mapping_csv, interactive_duplicate_resolution = parse_asset_profile_import_command(command)
                     if csv_file:
                         # If execute_asset_profile_import supports max_threads, pass it; otherwise, ignore
                         try:
-                            execute_asset_profile_import(csv_file, client, logger, dry_run, quiet_mode, verbose_mode, max_threads, notification_mapping_csv, interactive_duplicate_resolution)
+                            execute_asset_profile_import(csv_file, client, logger, dry_run, quiet_mode, verbose_mode, max_threads, notification_mapping_csv, interactive_duplicate_resolution, resume=resume_mode)
                         except TypeError:
                             execute_asset_profile_import(csv_file, client, logger, dry_run, quiet_mode, verbose_mode, max_threads)
                     continue
@@ -1551,8 +1609,11 @@ def run_interactive(args):
                 # Check if it's an asset-list-export command (check this first to avoid conflicts)
                 if command.lower().startswith('asset-list-export'):
                     from .command_parsing import parse_asset_list_export_command
-                    quiet_mode, verbose_mode, parallel_mode, use_target, page_size, source_type_ids, asset_type_ids, assembly_ids, max_threads = parse_asset_list_export_command(command)
-                    if parallel_mode:
+                    quiet_mode, verbose_mode, parallel_mode, use_target, page_size, source_type_ids, asset_type_ids, assembly_ids, max_threads, async_mode, max_concurrency = parse_asset_list_export_command(command)
+                    if async_mode:
+                        from .async_asset_operations import execute_asset_list_export_async
+                        execute_asset_list_export_async(client, logger, source_type_ids, asset_type_ids, assembly_ids, quiet_mode, verbose_mode, use_target, page_size, max_concurrency)
+                    elif parallel_mode:
                         execute_asset_list_export_parallel(client, logger, source_type_ids, asset_type_ids, assembly_ids, quiet_mode, verbose_mode, use_target, page_size, max_threads)
                     else:
                         execute_asset_list_export(client, logger, source_type_ids, asset_type_ids, assembly_ids, quiet_mode, verbose_mode, use_target, page_size)
@@ -1575,18 +1636,26 @@ def run_interactive(args):
                 
                 # Check if it's an asset-config-export command
                 if command.lower().startswith('asset-config-export'):
-                    from .command_parsing import parse_asset_config_export_command
+                    from .command_parsing import parse_asset_config_export_command, strip_resume_flag, strip_format_option, default_record_output_file
+                    command, resume_mode = strip_resume_flag(command)
+                    command, record_format = strip_format_option(command)
                     csv_file, output_file, quiet_mode, verbose_mode, parallel_mode, max_threads, allowed_types = parse_asset_config_export_command(command)
                     if csv_file:
                         if parallel_mode:
-                            execute_asset_config_export_parallel(csv_file, client, logger, output_file, quiet_mode, verbose_mode, max_threads, allowed_types)
+                            output_file = default_record_output_file(command, output_file, record_format)
+                            execute_asset_config_export_parallel(csv_file, client, logger, output_file, quiet_mode, verbose_mode, max_threads, allowed_types, resume=resume_mode, record_format=record_format)
                         else:
+                            if resume_mode:
+                                print("⚠️  --resume is only supported with --parallel; running a full export")
+                            if record_format != 'csv':
+                                print("⚠️  --format is only supported with --parallel; writing CSV")
                             execute_asset_config_export(csv_file, client, logger, output_file, quiet_mode, verbose_mode)
                     continue
                 
                 # Check if it's an asset-config-import command
                 if command.lower().startswith('asset-config-import'):
-                    from .command_parsing import parse_asset_config_import_command
+                    from .command_parsing import parse_asset_config_import_command, strip_resume_flag
+                    command, resume_mode = strip_resume_flag(command)
                     csv_file, dry_run, quiet_mode, verbose_mode, parallel_mode, max_threads = parse_asset_config_import_command(command)
                     
                     # Use default CSV file if not specified
@@ -1604,13 +1673,14 @@ def run_interactive(args):
                             else:
                                 csv_file = "asset-config-import-ready.csv"
                     
-                    execute_asset_config_import(csv_file, client, logger, quiet_mode, verbose_mode, parallel_mode, dry_run, max_threads)
+                    execute_asset_config_import(csv_file, client, logger, quiet_mode, verbose_mode, parallel_mode, dry_run, max_threads, resume=resume_mode)
                     continue
                 
                 # Check if it's an asset-tag-import command
                 if command.lower().startswith('asset-tag-import'):
-                    from .command_parsing import parse_asset_tag_import_command
-                    csv_file, quiet_mode, verbose_mode, parallel_mode = parse_asset_tag_import_command(command)
+                    from .command_parsing import parse_asset_tag_import_command, strip_resume_flag
+                    command, resume_mode = strip_resume_flag(command)
+                    csv_file, quiet_mode, verbose_mode, parallel_mode, async_mode, max_concurrency = parse_asset_tag_import_command(command)
                     
                     # Use default CSV file if not specified (transformed_tag_assets_output.csv)
                     if not csv_file:
@@ -1646,7 +1716,7 @@ def run_interactive(args):
                                 else:
                                     csv_file = "transformed_tag_assets_output.csv"
                     
-                    execute_asset_tag_import(csv_file, client, logger, quiet_mode, verbose_mode, parallel_mode)
+                    execute_asset_tag_import(csv_file, client, logger, quiet_mode, verbose_mode, parallel_mode, async_mode, max_concurrency, resume=resume_mode)
                     continue
                 
 
@@ -1663,20 +1733,24 @@ def run_interactive(args):
                 
                 # Check if it's a policy-export command
                 if command.lower().startswith('policy-export'):
-                    from .command_parsing import parse_policy_export_command
+                    from .command_parsing import parse_policy_export_command, strip_resume_flag
+                    command, resume_mode = strip_resume_flag(command)
                     quiet_mode, verbose_mode, batch_size, export_type, filter_value, parallel_mode, max_threads, filter_versions = parse_policy_export_command(command)
                     if parallel_mode:
-                        execute_policy_export_parallel(client, logger, quiet_mode, verbose_mode, batch_size, export_type, filter_value, max_threads=max_threads, filter_versions=filter_versions)
+                        execute_policy_export_parallel(client, logger, quiet_mode, verbose_mode, batch_size, export_type, filter_value, max_threads=max_threads, filter_versions=filter_versions, resume=resume_mode)
                     else:
+                        if resume_mode:
+                            print("⚠️  --resume is only supported with --parallel; running a full export")
                         execute_policy_export(client, logger, quiet_mode, verbose_mode, batch_size, export_type, filter_value, filter_versions=filter_versions)
                     continue
                 
                 # Check if it's a policy-import command
                 if command.lower().startswith('policy-import'):
-                    from .command_parsing import parse_policy_import_command
+                    from .command_parsing import parse_policy_import_command, strip_resume_flag
+                    command, resume_mode = strip_resume_flag(command)
                     file_pattern, quiet_mode, verbose_mode, apply_config = parse_policy_import_command(command)
                     if file_pattern:
-                        execute_policy_import(client, logger, file_pattern, quiet_mode, verbose_mode, apply_config)
+                        execute_policy_import(client, logger, file_pattern, quiet_mode, verbose_mode, apply_config, resume=resume_mode)
                     continue
                 
                 # Check if it's a rule-tag-export command
@@ -1691,9 +1765,12 @@ def run_interactive(args):
                 
                 # Check if it's a policy-xfr command
                 if command.lower().startswith('policy-xfr'):
+                    from .command_parsing import strip_processes_option
+                    command, processes = strip_processes_option(command)
                     input_dir, string_transforms, output_dir, quiet_mode, verbose_mode = parse_formatter_command(command)
                     # Execute regardless of whether string_transforms is empty (direct processing mode)
-                    execute_formatter(input_dir, string_transforms, output_dir, quiet_mode, verbose_mode, logger)
+                    execute_formatter(input_dir, string_transforms, output_dir, quiet_mode, verbose_mode, logger,
+                                      processes=processes)
                     continue
                 
                 # Check if it's an asset-xfr command
@@ -1876,13 +1953,24 @@ def run_interactive(args):
                         print(f"  Timeout: {current['timeout']}s")
                         print(f"  Retry:   {current['retry']}")
                         print(f"  Proxy:   {current['proxy']}")
+                        print(f"  Pool:    {current['pool_connections']} host pools, {current['pool_maxsize']} connections per host")
+                        print(f"  Adaptive concurrency: {'on' if current['adaptive_concurrency'] else 'off'} (max in flight: {current['max_in_flight']})")
+                        print(f"  Response cache: {'on' if current['response_cache'] else 'off'} (default TTL: {current['response_cache_ttl']}s, max: {current['response_cache_max_mb']} MB)")
                         # Apply changes
                         changed = False
-                        for k in ['timeout', 'retry', 'proxy']:
+                        for k in ['timeout', 'retry', 'proxy', 'pool_connections', 'pool_maxsize', 'adaptive_concurrency', 'max_in_flight',
+                                  'response_cache', 'response_cache_ttl', 'response_cache_max_mb']:
                             if config[k] is not None:
                                 shared_globals.HTTP_CONFIG[k] = config[k]
                                 changed = True
                         if changed:
+                            # Rebuild shared connection pools with the new retry and pool sizes
+                            from adoc_migration_toolkit.shared.api_client import reset_connection_pools
+                            from adoc_migration_toolkit.shared.concurrency import reset_concurrency_limiter
+                            from adoc_migration_toolkit.shared.response_cache import reset_response_cache
+                            reset_connection_pools()
+                            reset_concurrency_limiter()
+                            reset_response_cache()
                             print("\n✅ HTTP config updated.")
                         else:
                             print("\n(No changes made)")
@@ -1892,6 +1980,9 @@ def run_interactive(args):
                         print(f"  Timeout: {new['timeout']}s")
                         print(f"  Retry:   {new['retry']}")
                         print(f"  Proxy:   {new['proxy']}")
+                        print(f"  Pool:    {new['pool_connections']} host pools, {new['pool_maxsize']} connections per host")
+                        print(f"  Adaptive concurrency: {'on' if new['adaptive_concurrency'] else 'off'} (max in flight: {new['max_in_flight']})")
+                        print(f"  Response cache: {'on' if new['response_cache'] else 'off'} (default TTL: {new['response_cache_ttl']}s, max: {new['response_cache_max_mb']} MB)")
                     continue
 
                 # Check if it's a show-config command
@@ -1911,6 +2002,9 @@ def run_interactive(args):
                         print(f"  Global Timeout: {http_config['timeout']} seconds")
                         print(f"  Retry:   {http_config['retry']} attempts")
                         print(f"  Proxy:   {http_config['proxy'] or 'None'}")
+                        print(f"  Pool:    {http_config['pool_connections']} host pools, {http_config['pool_maxsize']} connections per host")
+                        print(f"  Adaptive concurrency: {'on' if http_config['adaptive_concurrency'] else 'off'} (max in flight: {http_config['max_in_flight']})")
+                        print(f"  Response cache: {'on' if http_config['response_cache'] else 'off'} (default TTL: {http_config['response_cache_ttl']}s, max: {http_config['response_cache_max_mb']} MB)")
                         
                         # Detailed Timeout Configuration
                         print(f"\n⏱️  DETAILED TIMEOUT CONFIGURATION:")
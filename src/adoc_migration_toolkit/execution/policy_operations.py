@@ -11,13 +11,21 @@ import logging
 import os
 import tempfile
 import threading
+import time
 from datetime import datetime
 from glob import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from .utils import create_progress_bar, get_thread_names
+from .utils import create_progress_bar, get_thread_names, get_thread_client
 from ..shared import globals
 from ..shared.file_utils import get_output_file_path
+from ..shared.api_client import DownloadResult
+from ..shared.zip_stream import copy_member_raw, write_member
+from .checkpoint import CheckpointJournal
+from .work_queue import WorkQueue, run_work_queue
+from .batch_sizing import AdaptiveBatchSizer, is_timeout_error, iter_policy_batches, split_batch
 
 # Hard-coded batch sizes for different policy types
 POLICY_TYPE_BATCH_SIZES = {
@@ -88,6 +96,27 @@ def get_batch_sizes_for_policy_types(user_batch_size: int = None) -> dict:
         return batch_sizes
 
 
+def download_export_zip(client, endpoint: str, output_file: Path) -> Optional[DownloadResult]:
+    """Download a policy export ZIP to a file.
+    
+    The response is streamed to disk (see AcceldataAPIClient.download_to_file),
+    which only ever leaves complete files behind.
+    
+    Args:
+        client: API client instance
+        endpoint: Export endpoint including the query string
+        output_file: Destination ZIP path
+        
+    Returns:
+        DownloadResult, or None if the server returned an empty body
+    """
+    download = client.download_to_file(endpoint, output_file)
+    if download.size == 0:
+        output_file.unlink()
+        return None
+    return download
+
+
 def execute_policy_list_export(client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, existing_target_assets_mode: bool = False):
     """Execute the policy-list-export command.
     
@@ -822,12 +851,7 @@ def execute_policy_list_export_parallel(client, logger: logging.Logger, quiet_mo
         def process_policy_chunk(thread_id, start_index, end_index):
             """Process a chunk of policies for a specific thread."""
             # Create a thread-local client instance
-            thread_client = type(client)(
-                host=client.host,
-                access_key=client.access_key,
-                secret_key=client.secret_key,
-                tenant=getattr(client, 'tenant', None)
-            )
+            thread_client = get_thread_client(client)
             
             # Create temporary file for this thread
             temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8')
@@ -1462,12 +1486,8 @@ def execute_policy_export(client, logger: logging.Logger, quiet_mode: bool = Fal
                     print("="*80)
                 
                 try:
-                    # Make API call to get ZIP file
-                    response = client.make_api_call(
-                        endpoint=full_endpoint,
-                        method='GET',
-                        return_binary=True
-                    )
+                    # Download the ZIP file straight to the output directory
+                    download = download_export_zip(client, full_endpoint, output_file)
                     
                     if verbose_mode:
                         print(f"\n" + "="*80)
@@ -1475,22 +1495,14 @@ def execute_policy_export(client, logger: logging.Logger, quiet_mode: bool = Fal
                         print("="*80)
                         print(f"Status: Success")
                         print(f"Content-Type: application/zip")
-                        print(f"Response Size: {len(response) if response else 0} bytes")
-                        if response:
-                            print(f"File Size (KB): {len(response) / 1024:.2f} KB")
-                            print(f"File Size (MB): {len(response) / (1024 * 1024):.2f} MB")
-                        print(f"Response Type: {type(response).__name__}")
-                        print(f"Response is Binary: {isinstance(response, bytes)}")
-                        if response:
-                            print(f"First 100 bytes (hex): {response[:100].hex()}")
-                            print(f"Last 100 bytes (hex): {response[-100:].hex()}")
+                        print(f"Response Size: {download.size if download else 0} bytes")
+                        if download:
+                            print(f"File Size (KB): {download.size / 1024:.2f} KB")
+                            print(f"File Size (MB): {download.size / (1024 * 1024):.2f} MB")
+                            print(f"SHA-256: {download.sha256}")
                         print("="*80)
                     
-                    # Write ZIP file to output directory
-                    if response:
-                        with open(output_file, 'wb') as f:
-                            f.write(response)
-                        
+                    if download:
                         # Filter policy versions if enabled
                         if filter_versions:
                             try:
@@ -1510,7 +1522,8 @@ def execute_policy_export(client, logger: logging.Logger, quiet_mode: bool = Fal
                             'success': True,
                             'filename': batch_filename,
                             'count': len(batch_ids),
-                            'file_size': len(response),
+                            'file_size': download.size,
+                            'sha256': download.sha256,
                             'range': f"{start_idx}-{end_idx-1}"
                         }
                         successful_exports += 1
@@ -1526,7 +1539,6 @@ def execute_policy_export(client, logger: logging.Logger, quiet_mode: bool = Fal
                             print(f"Expected Content: ZIP file")
                             print(f"Actual Response: None/Empty")
                             print(f"Response Size: 0 bytes")
-                            print(f"Response Type: {type(response).__name__}")
                             print("="*80)
                         logger.error(error_msg)
                         
@@ -1668,7 +1680,7 @@ def execute_policy_export(client, logger: logging.Logger, quiet_mode: bool = Fal
         logger.error(error_msg)
 
 
-def execute_policy_import(client, logger: logging.Logger, file_pattern: str, quiet_mode: bool = False, verbose_mode: bool = False, apply_config: dict = None):
+def execute_policy_import(client, logger: logging.Logger, file_pattern: str, quiet_mode: bool = False, verbose_mode: bool = False, apply_config: dict = None, resume: bool = False):
     """Execute the policy-import command.
     
     Args:
@@ -1678,6 +1690,7 @@ def execute_policy_import(client, logger: logging.Logger, file_pattern: str, qui
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
         apply_config: Custom apply config JSON to override default settings
+        resume: Skip ZIP files imported by an earlier interrupted run (see checkpoint.py)
     """
     try:
         if not quiet_mode:
@@ -1754,6 +1767,16 @@ def execute_policy_import(client, logger: logging.Logger, file_pattern: str, qui
             print(f"Found {len(zip_files)} ZIP files to import")
             print("="*80)
         
+        # Files are journaled by name and size in the search directory, so a resumed run skips applied ZIPs
+        def checkpoint_key(zip_file):
+            return f"{os.path.basename(zip_file)}:{os.path.getsize(zip_file)}"
+        
+        journal = CheckpointJournal(search_dir, "policy-import", resume=resume, logger=logger)
+        if journal.resumed:
+            total_files = len(zip_files)
+            zip_files = [z for z in zip_files if not (os.path.exists(z) and journal.is_done(checkpoint_key(z)))]
+            print(f"⏩ Resuming: {total_files - len(zip_files)} of {total_files} ZIP files already imported")
+        
         # Statistics aggregation
         aggregated_stats = {
             'conflictingAssemblies': 0,
@@ -1855,22 +1878,12 @@ def execute_policy_import(client, logger: logging.Logger, file_pattern: str, qui
                     continue
                 
                 # Prepare the multipart form data
-                # Read the file content first, then prepare the files dictionary
-                with open(zip_file, 'rb') as f:
-                    file_content = f.read()
-                
-                # Prepare files dictionary with proper format for multipart upload
-                files = {
-                    'policy-config-file': (
-                        os.path.basename(zip_file),  # filename
-                        file_content,                # file content as bytes
-                        'application/zip'            # content type
-                    )
-                }
+                # The file is streamed from disk by the API client rather than read into memory
+                file_size = os.path.getsize(zip_file)
                 
                 if verbose_mode:
                     print(f"  📁 File Details:")
-                    print(f"    File size: {len(file_content)} bytes ({len(file_content) / 1024:.2f} KB)")
+                    print(f"    File size: {file_size} bytes ({file_size / 1024:.2f} KB)")
                     print(f"    File name: {os.path.basename(zip_file)}")
                     print(f"    Content type: application/zip")
                     print(f"    Form field name: policy-config-file")
@@ -1897,14 +1910,23 @@ def execute_policy_import(client, logger: logging.Logger, file_pattern: str, qui
                     print(f"  File: {zip_file}")
                 
                 # Add longer timeout for file uploads
-                upload_response = client.make_api_call(
-                    endpoint="/catalog-server/api/rules/import/policy-definitions/upload-config",
-                    method='POST',
-                    files=files,
-                    use_target_auth=True,
-                    use_target_tenant=True,
-                    timeout=300  # Increase timeout for file uploads to 5 minutes
-                )
+                with open(zip_file, 'rb') as f:
+                    # Prepare files dictionary with proper format for multipart upload
+                    files = {
+                        'policy-config-file': (
+                            os.path.basename(zip_file),  # filename
+                            f,                           # open file, streamed during upload
+                            'application/zip'            # content type
+                        )
+                    }
+                    upload_response = client.make_api_call(
+                        endpoint="/catalog-server/api/rules/import/policy-definitions/upload-config",
+                        method='POST',
+                        files=files,
+                        use_target_auth=True,
+                        use_target_tenant=True,
+                        timeout=300  # Increase timeout for file uploads to 5 minutes
+                    )
                 
                 if not upload_response:
                     error_msg = f"Upload config failed - empty response for {zip_file}"
@@ -2013,6 +2035,7 @@ def execute_policy_import(client, logger: logging.Logger, file_pattern: str, qui
                     aggregated_stats['apply_configs_successful'] += 1
                     aggregated_stats['files_processed'] += 1
                     successful_imports += 1
+                    journal.record(checkpoint_key(zip_file))
                     
                     # Aggregate statistics from upload response
                     for key in aggregated_stats.keys():
@@ -2052,6 +2075,8 @@ def execute_policy_import(client, logger: logging.Logger, file_pattern: str, qui
                 failed_imports += 1
                 aggregated_stats['files_failed'] += 1
         
+        journal.finish(failed=failed_imports)
+        
         # Print summary
         print("\n" + "="*80)
         print("POLICY IMPORT SUMMARY")
@@ -2398,7 +2423,7 @@ def execute_rule_tag_export(client, logger: logging.Logger, quiet_mode: bool = F
         logger.error(error_msg)
 
 
-def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, batch_size: int = 50, export_type: str = None, filter_value: str = None, max_threads: int = 5, filter_versions: bool = True):
+def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: bool = False, verbose_mode: bool = False, batch_size: int = 50, export_type: str = None, filter_value: str = None, max_threads: int = 5, filter_versions: bool = True, resume: bool = False):
     """Execute the policy-export command with parallel processing.
     
     Args:
@@ -2411,6 +2436,7 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
         filter_value: Optional filter value within the export type
         max_threads: Maximum number of threads to use (default: 5)
         filter_versions: Whether to filter policy versions to keep only the latest (default: True)
+        resume: Skip batches exported by an earlier interrupted run (see checkpoint.py)
     """
     try:
         # Get batch sizes for policy types (hard-coded or interactive)
@@ -2574,73 +2600,98 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
         # Generate timestamp for all files
         timestamp = datetime.now().strftime("%m-%d-%Y-%H-%M")
         
-        # Step 3: Calculate thread configuration
-        min_categories_per_thread = 1
-        if len(policies_by_category) < min_categories_per_thread:
-            num_threads = 1
-            categories_per_thread = len(policies_by_category)
-        else:
-            num_threads = min(max_threads, (len(policies_by_category) + min_categories_per_thread - 1) // min_categories_per_thread)
-            categories_per_thread = (len(policies_by_category) + num_threads - 1) // num_threads
+        # Exported policies are journaled by policy type and ID, so a resumed run skips them even
+        # though the adaptive batch boundaries differ from run to run
+        journal = CheckpointJournal(input_file, "policy-export", resume=resume, logger=logger)
+        skipped_policies = 0
+        if journal.resumed:
+            for category in list(policies_by_category):
+                remaining_ids = [pid for pid in policies_by_category[category] if not journal.is_done(f"{category}:{pid}")]
+                skipped_policies += len(policies_by_category[category]) - len(remaining_ids)
+                if remaining_ids:
+                    policies_by_category[category] = remaining_ids
+                else:
+                    del policies_by_category[category]
+            if not quiet_mode:
+                print(f"⏩ Resuming: {skipped_policies} policies already exported")
+        remaining_policies = sum(len(policy_ids) for policy_ids in policies_by_category.values())
+        
+        # Step 3: Batches are independent jobs across all categories, so parallelism follows the number
+        # of batches rather than the number of categories. Custom sizes entered by the user stay fixed.
+        sizer = AdaptiveBatchSizer(policy_batch_sizes, adaptive=batch_size != 1)
+        num_threads = max(1, min(max_threads, sizer.estimate_batches(policies_by_category)))
         
         if not quiet_mode:
-            print(f"Using {num_threads} threads to process {len(policies_by_category)} categories")
-            print(f"Categories per thread: {categories_per_thread}")
+            print(f"Using {num_threads} threads to process {remaining_policies} policies across {len(policies_by_category)} categories")
+            print(f"Batch sizes: {'adaptive' if sizer.adaptive else 'fixed'}")
             print("="*80)
         
-        # Step 4: Process categories in parallel
-        thread_results = []
-        
+        # Step 4: Process batches in parallel
         # Funny thread names for progress indicators (all same length)
         thread_names = get_thread_names()
         
-        def process_category_chunk(thread_id, start_index, end_index):
-            """Process a chunk of categories for a specific thread."""
+        # Shared progress bar, advanced by the number of policies in each finished batch
+        progress_bar = create_progress_bar(
+            total=remaining_policies,
+            desc="Exporting policies",
+            unit="policies",
+            disable=quiet_mode
+        )
+        progress_lock = threading.Lock()
+        
+        # Batches are cut lazily from the category with the most policies left, so each one is sized
+        # with the latest measurements
+        work_queue = WorkQueue(iter_policy_batches(policies_by_category, sizer), max_pending=num_threads)
+        
+        # Version filtering runs as a separate stage, overlapping with the next downloads
+        filter_executor = ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix="policy-zip-filter") if filter_versions else None
+        filter_futures = []
+        
+        # Batches whose version filtering failed, by batch key
+        filter_failures = {}
+        
+        def finish_batch(thread_name, category, batch_key, batch_ids, output_file):
+            """Filter policy versions of a downloaded batch (if enabled) and journal its policies."""
+            if filter_versions:
+                try:
+                    success, policies_processed, versions_removed = filter_policy_versions(
+                        output_file, quiet_mode, verbose_mode
+                    )
+                    if success and verbose_mode:
+                        print(f"🔧 {thread_name}: Filtered {policies_processed} SCHEMA_DRIFT policies, removed {versions_removed} older versions from {output_file.name}")
+                    if not success:
+                        filter_failures[batch_key] = f"Version filtering failed for {output_file.name}"
+                except Exception as filter_error:
+                    filter_failures[batch_key] = f"Version filtering failed for {output_file.name}: {filter_error}"
+                if batch_key in filter_failures:
+                    if verbose_mode:
+                        print(f"⚠️  {thread_name}: {filter_failures[batch_key]}")
+                    logger.warning(f"Thread {thread_name}: {filter_failures[batch_key]}")
+                    # Not journaled, so a resumed run exports the batch again
+                    return
+            # Journal only finished ZIPs, so a resumed run never skips an unfiltered one
+            for policy_id in batch_ids:
+                journal.record(f"{category}:{policy_id}")
+        
+        def process_batches(thread_id):
+            """Export batches from the shared queue until it is drained."""
             # Create a thread-local client instance
-            thread_client = type(client)(
-                host=client.host,
-                access_key=client.access_key,
-                secret_key=client.secret_key,
-                tenant=getattr(client, 'tenant', None)
-            )
-            
-            # Get categories for this thread
-            category_items = list(policies_by_category.items())[start_index:end_index]
-            
-            # Create progress bar for this thread using policy-type-specific batch sizes
-            total_batches = 0
-            for category, policy_ids in category_items:
-                type_batch_size = policy_batch_sizes.get(category, policy_batch_sizes['default'])
-                total_batches += (len(policy_ids) + type_batch_size - 1) // type_batch_size
-            thread_names = get_thread_names()
+            thread_client = get_thread_client(client)
             thread_name = thread_names[thread_id] if thread_id < len(thread_names) else f"Thread {thread_id}"
-            progress_bar = create_progress_bar(
-                total=total_batches,
-                desc=thread_name,
-                unit="batches",
-                disable=quiet_mode,
-                position=thread_id,
-                leave=False
-            )
             
             successful_exports = 0
             failed_exports = 0
             export_results = {}
             
-            # Process each category in this thread's range
-            for category, policy_ids in category_items:
-                # Get batch size for this specific policy type
-                type_batch_size = policy_batch_sizes.get(category, policy_batch_sizes['default'])
-                
-                type_total_batches = (len(policy_ids) + type_batch_size - 1) // type_batch_size
-                
-                for batch_num in range(type_total_batches):
-                    start_idx = batch_num * type_batch_size
-                    end_idx = min((batch_num + 1) * type_batch_size, len(policy_ids))
-                    batch_ids = policy_ids[start_idx:end_idx]
+            for category, batch_num, start_idx, end_idx, batch_ids in work_queue.consume():
+                # Batches that time out are retried as two halves
+                pending_batches = [(start_idx, batch_ids)]
+                while pending_batches:
+                    start_idx, batch_ids = pending_batches.pop(0)
+                    end_idx = start_idx + len(batch_ids)
                     
                     # Generate filename with range information
-                    safe_category = "".join(c for c in policy_type if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                    safe_category = "".join(c for c in category if c.isalnum() or c in (' ', '-', '_')).rstrip()
                     safe_category = safe_category.replace(' ', '_').lower()
                     batch_filename = f"{safe_category}-{timestamp}-{start_idx}-{end_idx-1}.zip"
                     output_file = output_dir / batch_filename
@@ -2674,45 +2725,40 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
                             else:
                                 print(f"    {k}: {v}")
                     
+                    batch_key = f"{category}_batch_{start_idx}"
                     try:
                         # Make API call to get ZIP file
-                        response = thread_client.make_api_call(
-                            endpoint=full_endpoint,
-                            method='GET',
-                            return_binary=True
-                        )
+                        # Download the ZIP file straight to the output directory
+                        started = time.monotonic()
+                        download = download_export_zip(thread_client, full_endpoint, output_file)
+                        elapsed = time.monotonic() - started
                         
                         if verbose_mode:
                             print(f"\n{thread_name} - Response:")
                             print(f"  Status: Success")
                             print(f"  Content-Type: application/zip")
-                            print(f"  File size: {len(response) if response else 0} bytes")
+                            print(f"  File size: {download.size if download else 0} bytes")
+                            if download:
+                                print(f"  SHA-256: {download.sha256}")
+                            print(f"  Time: {elapsed:.2f}s")
                         
-                        # Write ZIP file to output directory
-                        if response:
-                            with open(output_file, 'wb') as f:
-                                f.write(response)
+                        if download:
+                            sizer.record_success(category, len(batch_ids), elapsed, download.size)
                             
-                            # Filter policy versions if enabled
-                            if filter_versions:
-                                try:
-                                    success, policies_processed, versions_removed = filter_policy_versions(
-                                        output_file, quiet_mode, verbose_mode
-                                    )
-                                    if success and verbose_mode:
-                                        print(f"🔧 {thread_name}: Filtered {policies_processed} SCHEMA_DRIFT policies, removed {versions_removed} older versions from {batch_filename}")
-                                except Exception as filter_error:
-                                    if verbose_mode:
-                                        print(f"⚠️  {thread_name}: Version filtering failed for {batch_filename}: {filter_error}")
-                                    logger.warning(f"Thread {thread_name}: Version filtering failed for {batch_filename}: {filter_error}")
+                            # Filter policy versions on the filter pool while this thread downloads the next batch
+                            if filter_executor is not None:
+                                filter_futures.append(filter_executor.submit(
+                                    finish_batch, thread_name, category, batch_key, batch_ids, output_file))
+                            else:
+                                finish_batch(thread_name, category, batch_key, batch_ids, output_file)
                             
                             # Store result for this batch
-                            batch_key = f"{category}_batch_{batch_num + 1}"
                             export_results[batch_key] = {
                                 'success': True,
                                 'filename': batch_filename,
                                 'count': len(batch_ids),
-                                'file_size': len(response),
+                                'file_size': download.size,
+                                'sha256': download.sha256,
                                 'range': f"{start_idx}-{end_idx-1}"
                             }
                             successful_exports += 1
@@ -2722,7 +2768,6 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
                                 print(f"\n{thread_name} - ❌ {error_msg}")
                             logger.error(f"Thread {thread_name}: {error_msg}")
                             
-                            batch_key = f"{category}_batch_{batch_num + 1}"
                             export_results[batch_key] = {
                                 'success': False,
                                 'filename': batch_filename,
@@ -2733,12 +2778,20 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
                             failed_exports += 1
                             
                     except Exception as e:
+                        if is_timeout_error(e) and len(batch_ids) > 1:
+                            # Retry as two smaller batches and shrink the following batches of this type
+                            sizer.record_timeout(category, len(batch_ids))
+                            halves = split_batch(batch_ids)
+                            pending_batches[:0] = [(start_idx, halves[0]), (start_idx + len(halves[0]), halves[1])]
+                            logger.warning(f"Thread {thread_name}: {category} batch {start_idx}-{end_idx-1} timed out, "
+                                           f"retrying as batches of {len(halves[0])} and {len(halves[1])} policies")
+                            continue
+                        
                         error_msg = f"Failed to export {category} batch {batch_num + 1}: {e}"
                         if verbose_mode:
                             print(f"\n{thread_name} - ❌ {error_msg}")
                         logger.error(f"Thread {thread_name}: {error_msg}")
                         
-                        batch_key = f"{category}_batch_{batch_num + 1}"
                         export_results[batch_key] = {
                             'success': False,
                             'filename': batch_filename,
@@ -2748,10 +2801,8 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
                         }
                         failed_exports += 1
                     
-                    # Update progress bar
-                    progress_bar.update(1)
-            
-            progress_bar.close()
+                    with progress_lock:
+                        progress_bar.update(len(batch_ids))
             
             return {
                 'thread_id': thread_id,
@@ -2760,33 +2811,32 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
                 'export_results': export_results
             }
         
-        # Step 5: Start threads
-        threads = []
-        for i in range(num_threads):
-            start_index = i * categories_per_thread
-            end_index = min(start_index + categories_per_thread, len(policies_by_category))
-            
-            thread = threading.Thread(
-                target=lambda tid=i, start=start_index, end=end_index: thread_results.append(
-                    process_category_chunk(tid, start, end)
-                )
-            )
-            threads.append(thread)
-            thread.start()
-        
-        # Step 6: Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Step 5: Run worker threads until every batch is exported
+        thread_results = run_work_queue(work_queue, process_batches, num_threads, logger)
+        if filter_executor is not None:
+            for future in filter_futures:
+                future.result()
+            filter_executor.shutdown()
+        progress_bar.close()
+        thread_results.sort(key=lambda result: result['thread_id'])
         
-        # Step 7: Consolidate results
+        # Step 6: Consolidate results
         total_successful_exports = 0
         total_failed_exports = 0
         all_export_results = {}
         
         for result in thread_results:
+            # Batches whose version filtering failed count as failed exports
+            for batch_key, error_msg in filter_failures.items():
+                batch_result = result['export_results'].get(batch_key)
+                if batch_result is not None and batch_result['success']:
+                    batch_result.update(success=False, error=error_msg)
+                    result['successful_exports'] -= 1
+                    result['failed_exports'] += 1
             total_successful_exports += result['successful_exports']
             total_failed_exports += result['failed_exports']
             all_export_results.update(result['export_results'])
+        journal.finish(failed=total_failed_exports)
         
         # Print summary
         print("\n" + "="*80)
@@ -2794,8 +2844,12 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
         print("="*80)
         print(f"Output directory: {output_dir}")
         print(f"Timestamp: {timestamp}")
-        print(f"Batch size: {batch_size}")
+        if sizer.adaptive:
+            print(f"Final batch sizes: {', '.join(f'{category}={sizer.batch_size(category)}' for category in policies_by_category)}")
+        else:
+            print(f"Batch size: {batch_size}")
         print(f"Total policy types processed: {len(policies_by_category)}")
+        print(f"Total batches: {total_successful_exports + total_failed_exports}")
         print(f"Threads used: {num_threads}")
         
         for result in thread_results:
@@ -2804,6 +2858,9 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
         
         print(f"\nTotal successful exports: {total_successful_exports}")
         print(f"Total failed exports: {total_failed_exports}")
+        if skipped_policies:
+            print(f"Skipped (already exported): {skipped_policies} policies")
+        print(work_queue.format_latency_stats())
         
         print(f"\nExport Results:")
         # Group results by policy type for better display
@@ -2816,7 +2873,8 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
         
         for policy_type, batch_results in results_by_type.items():
             print(f"  {policy_type}:")
-            for result in batch_results:
+            # Batches finish out of order; list them by position within the type
+            for result in sorted(batch_results, key=lambda r: int(r['range'].split('-')[0])):
                 if result['success']:
                     print(f"    ✅ Batch {result['range']}: {result['count']} policies -> {result['filename']} ({result['file_size']} bytes)")
                 else:
@@ -2826,6 +2884,7 @@ def execute_policy_export_parallel(client, logger: logging.Logger, quiet_mode: b
         
         if total_failed_exports > 0:
             print("⚠️  Export completed with errors. Check log file for details.")
+            print("💡 Re-run with --resume to retry only the failed batches")
         else:
             print("✅ Export completed successfully!")
             
@@ -2956,12 +3015,7 @@ def execute_rule_tag_export_parallel(client, logger: logging.Logger, quiet_mode:
         def process_rule_chunk(thread_id, start_index, end_index):
             """Process a chunk of rules for a specific thread."""
             # Create a thread-local client instance
-            thread_client = type(client)(
-                host=client.host,
-                access_key=client.access_key,
-                secret_key=client.secret_key,
-                tenant=getattr(client, 'tenant', None)
-            )
+            thread_client = get_thread_client(client)
             
             # Get rules for this thread
             thread_rule_ids = rule_ids[start_index:end_index]
@@ -3210,135 +3264,141 @@ def execute_rule_tag_export_parallel(client, logger: logging.Logger, quiet_mode:
         raise
 
 
+def _filter_schema_drift_versions(policies: list, verbose_mode: bool = False) -> int:
+    """Keep only the latest version of each SCHEMA_DRIFT policy, in place.
+    
+    Args:
+        policies: Policies loaded from an export JSON file
+        verbose_mode: Whether to enable verbose logging
+        
+    Returns:
+        Number of versions removed
+    """
+    versions_removed = 0
+    for policy in policies:
+        if 'items' not in policy or not policy['items']:
+            continue
+        
+        # Only filter SCHEMA_DRIFT policies
+        policy_type = policy.get('type', '')
+        if policy_type != 'SCHEMA_DRIFT':
+            if verbose_mode:
+                policy_name = policy.get('name', 'Unknown')
+                print(f"    Policy '{policy_name}' (type: {policy_type}): skipping - not SCHEMA_DRIFT")
+            continue
+        
+        items = policy['items']
+        if len(items) <= 1:
+            if verbose_mode:
+                policy_name = policy.get('name', 'Unknown')
+                print(f"    Policy '{policy_name}': skipping - only one version")
+            continue  # No filtering needed if only one version
+        
+        # Keep only the latest version; ruleVersion might be missing
+        latest_item = max(items, key=lambda item: item.get('ruleVersion', 0))
+        policy['items'] = [latest_item]
+        versions_removed += len(items) - 1
+        
+        if verbose_mode:
+            policy_name = policy.get('name', 'Unknown')
+            print(f"    Policy '{policy_name}' (SCHEMA_DRIFT): kept version {latest_item.get('ruleVersion', 0)}, removed {len(items) - 1} older versions")
+    return versions_removed
+
+
 def filter_policy_versions(zip_file_path: Path, quiet_mode: bool = False, verbose_mode: bool = False):
     """
     Filter policy versions in a ZIP file to keep only the latest version for SCHEMA_DRIFT policies.
     
+    The archive is rewritten member by member: JSON files that lose SCHEMA_DRIFT
+    versions are re-serialized, every other member is copied byte-for-byte
+    without recompression. If nothing needs filtering the ZIP is left untouched.
+    
     Args:
         zip_file_path: Path to the ZIP file containing policy definitions
         quiet_mode: Whether to suppress console output
         verbose_mode: Whether to enable verbose logging
+        
+    Returns:
+        Tuple of (success, policies_processed, versions_removed)
     """
     import zipfile
-    import tempfile
-    import shutil
     
+    zip_file_path = Path(zip_file_path)
+    part_path = zip_file_path.with_name(zip_file_path.name + '.filtering')
     try:
         if not quiet_mode:
             print(f"🔧 Filtering SCHEMA_DRIFT policy versions in: {zip_file_path}")
         
-        # Create a temporary directory for processing
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path = Path(temp_dir)
-            
-            # Extract the ZIP file
-            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir_path)
-            
-            # Process each JSON file in the ZIP
-            json_files = list(temp_dir_path.glob("*.json"))
-            total_policies_processed = 0
-            total_versions_removed = 0
-            
-            for json_file in json_files:
-                if verbose_mode:
-                    print(f"  Processing: {json_file.name}")
-                
-                try:
-                    # Read the JSON file
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        policies = json.load(f)
-                    
-                    if not isinstance(policies, list):
+        total_policies_processed = 0
+        total_versions_removed = 0
+        target = None
+        try:
+            with zipfile.ZipFile(zip_file_path, 'r') as source:
+                members = source.infolist()
+                for index, info in enumerate(members):
+                    filtered_data = None
+                    # Policy definitions are the top-level JSON files
+                    if not info.is_dir() and '/' not in info.filename and info.filename.endswith('.json'):
                         if verbose_mode:
-                            print(f"    Skipping {json_file.name}: not a list of policies")
-                        continue
-                    
-                    original_policy_count = len(policies)
-                    original_total_versions = sum(len(policy.get('items', [])) for policy in policies)
-                    
-                    # Process each policy
-                    for policy in policies:
-                        if 'items' not in policy or not policy['items']:
-                            continue
-                        
-                        # Only filter SCHEMA_DRIFT policies
-                        policy_type = policy.get('type', '')
-                        if policy_type != 'SCHEMA_DRIFT':
-                            if verbose_mode:
-                                policy_name = policy.get('name', 'Unknown')
-                                print(f"    Policy '{policy_name}' (type: {policy_type}): skipping - not SCHEMA_DRIFT")
-                            continue
-                        
-                        items = policy['items']
-                        if len(items) <= 1:
+                            print(f"  Processing: {info.filename}")
+                        try:
+                            policies = json.loads(source.read(info))
+                            if isinstance(policies, list):
+                                versions_removed = _filter_schema_drift_versions(policies, verbose_mode)
+                                total_policies_processed += len(policies)
+                                total_versions_removed += versions_removed
+                                if versions_removed:
+                                    filtered_data = json.dumps(policies, indent=2, ensure_ascii=False).encode('utf-8')
+                                if verbose_mode:
+                                    print(f"    {info.filename}: {len(policies)} policies, removed {versions_removed} SCHEMA_DRIFT versions")
+                            elif verbose_mode:
+                                print(f"    Skipping {info.filename}: not a list of policies")
+                        except Exception as e:
                             if verbose_mode:
-                                policy_name = policy.get('name', 'Unknown')
-                                print(f"    Policy '{policy_name}': skipping - only one version")
-                            continue  # No filtering needed if only one version
-                        
-                        # Sort items by ruleVersion in descending order (latest first)
-                        # Handle cases where ruleVersion might be missing
-                        def get_rule_version(item):
-                            return item.get('ruleVersion', 0)
-                        
-                        items.sort(key=get_rule_version, reverse=True)
-                        
-                        # Keep only the first item (latest version)
-                        latest_item = items[0]
-                        policy['items'] = [latest_item]
-                        
-                        if verbose_mode:
-                            policy_name = policy.get('name', 'Unknown')
-                            latest_version = get_rule_version(latest_item)
-                            removed_count = len(items) - 1
-                            print(f"    Policy '{policy_name}' (SCHEMA_DRIFT): kept version {latest_version}, removed {removed_count} older versions")
-                    
-                    # Write the filtered policies back to the JSON file
-                    with open(json_file, 'w', encoding='utf-8') as f:
-                        json.dump(policies, f, indent=2, ensure_ascii=False)
-                    
-                    # Calculate statistics
-                    final_total_versions = sum(len(policy.get('items', [])) for policy in policies)
-                    versions_removed = original_total_versions - final_total_versions
+                                print(f"    Error processing {info.filename}: {e}")
                     
-                    total_policies_processed += original_policy_count
-                    total_versions_removed += versions_removed
+                    # Start the new archive at the first member that changes
+                    if filtered_data is not None and target is None:
+                        target = zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED)
+                        for earlier in members[:index]:
+                            copy_member_raw(source, earlier, target)
                     
-                    if verbose_mode:
-                        print(f"    {json_file.name}: {original_policy_count} policies, removed {versions_removed} SCHEMA_DRIFT versions")
-                
-                except Exception as e:
-                    if verbose_mode:
-                        print(f"    Error processing {json_file.name}: {e}")
-                    continue
-            
-            # Create a new ZIP file with the filtered content
-            backup_path = zip_file_path.with_suffix('.zip.backup')
-            if backup_path.exists():
-                backup_path.unlink()
-            
-            # Rename original to backup
-            zip_file_path.rename(backup_path)
-            
-            # Create new ZIP with filtered content
-            with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-                for file_path in temp_dir_path.rglob('*'):
-                    if file_path.is_file():
-                        arc_name = file_path.relative_to(temp_dir_path)
-                        new_zip.write(file_path, arc_name)
-            
+                    if target is None:
+                        continue
+                    if filtered_data is not None:
+                        write_member(target, info, filtered_data)
+                    else:
+                        copy_member_raw(source, info, target)
+            if target is not None:
+                target.close()
+        finally:
+            if target is not None and target.fp is not None:
+                target.close()
+        
+        if target is None:
             if not quiet_mode:
-                print(f"✅ Version filtering completed:")
+                print(f"✅ Version filtering completed: no older SCHEMA_DRIFT versions, ZIP left unchanged")
                 print(f"   Policies processed: {total_policies_processed}")
-                print(f"   Versions removed: {total_versions_removed}")
-                print(f"   Backup saved as: {backup_path}")
-            
-            return True, total_policies_processed, total_versions_removed
+            return True, total_policies_processed, 0
+        
+        # Keep the original as a backup and move the filtered archive into place
+        backup_path = zip_file_path.with_suffix('.zip.backup')
+        os.replace(zip_file_path, backup_path)
+        os.replace(part_path, zip_file_path)
+        
+        if not quiet_mode:
+            print(f"✅ Version filtering completed:")
+            print(f"   Policies processed: {total_policies_processed}")
+            print(f"   Versions removed: {total_versions_removed}")
+            print(f"   Backup saved as: {backup_path}")
+        
+        return True, total_policies_processed, total_versions_removed
     
     except Exception as e:
         error_msg = f"Error filtering policy versions in {zip_file_path}: {e}"
         if not quiet_mode:
             print(f"❌ {error_msg}")
         return False, 0, 0
-
+    finally:
+        if part_path.exists():
+            part_path.unlink()
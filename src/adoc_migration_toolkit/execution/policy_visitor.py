@@ -0,0 +1,210 @@
+"""
+Single-pass traversal of policy definition documents.
+
+policy-xfr used to walk every policy JSON document several times: once to
+rewrite strings, once per policy to collect asset UIDs, once to classify
+segmented policies, and the Custom SQL check parsed the same exports again.
+``walk_policies`` visits each document once, without recursion, and hands
+every policy and every field to the registered ``PolicyVisitor`` objects:
+
+- ``enter_policy`` is called for each policy (the items of a top-level list,
+  or a top-level object).
+- ``visit_field`` is called for every key/value pair inside a policy, with
+  the original value.
+- ``transform_string`` rewrites string values; the walk returns a rewritten
+  copy of the document when any visitor transforms strings.
+
+Only visitors that override a hook are called for it, so a walk with just
+policy-level visitors does not descend into the policies at all.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from ..shared.asset_uids import is_uid_key
+
+# db.schema.table references in Custom SQL expressions
+TABLE_REFERENCE_REGEX = re.compile(r'([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)\.([A-Za-z0-9_]+)', re.IGNORECASE)
+
+
+class PolicyVisitor:
+    """Base class for policy visitors; subclasses override the hooks they need."""
+
+    def enter_policy(self, policy: Dict[str, Any]) -> None:
+        """Called once for each policy in the document."""
+
+    def visit_field(self, key: str, value: Any) -> None:
+        """Called for every key/value pair inside a policy, before strings are transformed."""
+
+    def transform_string(self, value: str) -> str:
+        """Return the replacement for a string value."""
+        return value
+
+
+def _overrides(visitor: PolicyVisitor, hook: str) -> bool:
+    return getattr(type(visitor), hook) is not getattr(PolicyVisitor, hook)
+
+
+def walk_policies(data: Any, visitors: Iterable[PolicyVisitor]) -> Any:
+    """Walk a policy document once, calling every visitor.
+
+    Args:
+        data: Parsed JSON document (a list of policies or a single policy)
+        visitors: Visitors to call
+
+    Returns:
+        The document with transformed strings, or the document itself if no
+        visitor transforms strings
+    """
+    visitors = list(visitors)
+    policy_visitors = [v for v in visitors if _overrides(v, 'enter_policy')]
+    field_visitors = [v for v in visitors if _overrides(v, 'visit_field')]
+    string_visitors = [v for v in visitors if _overrides(v, 'transform_string')]
+
+    if isinstance(data, list):
+        policies = [item for item in data if isinstance(item, dict)]
+    elif isinstance(data, dict):
+        policies = [data]
+    else:
+        policies = []
+    for policy in policies:
+        for visitor in policy_visitors:
+            visitor.enter_policy(policy)
+
+    if not field_visitors and not string_visitors:
+        return data
+
+    def transform(value: str) -> str:
+        for visitor in string_visitors:
+            value = visitor.transform_string(value)
+        return value
+
+    def copy_container(value: Any) -> Any:
+        # Without string transforms the document is only read, not copied
+        if not string_visitors:
+            return value
+        return {} if isinstance(value, dict) else []
+
+    if not isinstance(data, (dict, list)):
+        return transform(data) if isinstance(data, str) else data
+
+    root = copy_container(data)
+    # Each frame is (source container, output container, inside a policy)
+    stack = [(data, root, isinstance(data, dict))]
+    while stack:
+        source, target, in_policy = stack.pop()
+        is_dict = isinstance(source, dict)
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            if in_policy and is_dict:
+                for visitor in field_visitors:
+                    visitor.visit_field(key, value)
+            if isinstance(value, (dict, list)):
+                child = copy_container(value)
+                # Objects in a top-level list are policies
+                stack.append((value, child, in_policy or (source is data and isinstance(value, dict))))
+            elif isinstance(value, str) and string_visitors:
+                child = transform(value)
+            else:
+                child = value
+            if string_visitors:
+                if is_dict:
+                    target[key] = child
+                else:
+                    target.append(child)
+    return root
+
+
+class StringTransformVisitor(PolicyVisitor):
+    """Rewrites string values and counts the strings that changed."""
+
+    def __init__(self, transform: Callable[[str], str]):
+        """Initialize the visitor.
+
+        Args:
+            transform: Function returning the replacement for a string
+        """
+        self.transform = transform
+        self.changes = 0
+
+    def transform_string(self, value: str) -> str:
+        new_value = self.transform(value)
+        if new_value != value:
+            self.changes += 1
+        return new_value
+
+
+class AssetUidVisitor(PolicyVisitor):
+    """Collects every asset UID referenced anywhere in a policy.
+
+    A UID is any non-blank string in a field classified by ``is_uid_key``.
+    """
+
+    def __init__(self, asset_uids: Optional[Set[str]] = None):
+        """Initialize the visitor.
+
+        Args:
+            asset_uids: Set to add the UIDs to (a new set if not given)
+        """
+        self.asset_uids = asset_uids if asset_uids is not None else set()
+        self.fields_scanned = 0
+
+    def visit_field(self, key: str, value: Any) -> None:
+        self.fields_scanned += 1
+        if isinstance(value, str) and is_uid_key(key):
+            uid = value.strip()
+            if uid:
+                self.asset_uids.add(uid)
+
+
+class SegmentedPolicyVisitor(PolicyVisitor):
+    """Classifies policies by segmentation and engine and collects the backing
+    assets of segmented SPARK policies."""
+
+    COUNT_KEYS = ("total_policies_processed", "segmented_spark_policies",
+                  "segmented_jdbc_policies", "non_segmented_policies")
+
+    def __init__(self, extracted_assets: Optional[Set[str]] = None):
+        """Initialize the visitor.
+
+        Args:
+            extracted_assets: Set to add the backing asset UIDs to (a new set if not given)
+        """
+        self.extracted_assets = extracted_assets if extracted_assets is not None else set()
+        self.counts = dict.fromkeys(self.COUNT_KEYS, 0)
+
+    def enter_policy(self, policy: Dict[str, Any]) -> None:
+        is_segmented = policy.get("isSegmented", False)
+        engine_type = policy.get("engineType", "")
+        self.counts["total_policies_processed"] += 1
+        if not is_segmented:
+            self.counts["non_segmented_policies"] += 1
+        elif engine_type == "JDBC_SQL":
+            self.counts["segmented_jdbc_policies"] += 1
+        elif engine_type == "SPARK":
+            self.counts["segmented_spark_policies"] += 1
+            for asset in policy.get("backingAssets", []) or []:
+                if isinstance(asset, dict) and asset.get("uid") is not None:
+                    self.extracted_assets.add(asset["uid"])
+
+
+class CustomSqlTableVisitor(PolicyVisitor):
+    """Collects the db.schema.table references of Custom SQL policies by policy name."""
+
+    def __init__(self, tables: Optional[Dict[str, Set[str]]] = None):
+        """Initialize the visitor.
+
+        Args:
+            tables: Dictionary of policy name to table references to add to (a new one if not given)
+        """
+        self.tables = tables if tables is not None else {}
+
+    def enter_policy(self, policy: Dict[str, Any]) -> None:
+        policy_name = str(policy.get('name', '')).strip()
+        if not policy_name:
+            return
+        config = policy.get('customSqlConfig')
+        configs: List[Any] = config if isinstance(config, list) else [config]
+        for item in configs:
+            if isinstance(item, dict) and item.get('sqlExpression'):
+                for db, schema, table in TABLE_REFERENCE_REGEX.findall(item['sqlExpression']):
+                    self.tables.setdefault(policy_name, set()).add(f"{db}.{schema}.{table}")
@@ -5,13 +5,13 @@ This module contains execution functions for segment-related operations
 including segment export and import.
 """
 
-import csv
 import json
 import logging
 from pathlib import Path
 from typing import Optional
 
 from ..shared.file_utils import get_output_file_path
+from ..shared.record_io import FORMAT_CSV, RecordWriter, open_records, record_file_path, resolve_record_file
 from adoc_migration_toolkit.execution.utils import read_csv_uids
 from adoc_migration_toolkit.shared import globals
 
@@ -19,7 +19,11 @@ from adoc_migration_toolkit.shared import globals
 verbose_mode = False
 failed_indices = set()
 
-def execute_segments_export(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False):
+# Columns of segments-export output; segments_json holds the segments response
+SEGMENTS_COLUMNS = ['target-env', 'segments_json']
+
+def execute_segments_export(csv_file: str, client, logger: logging.Logger, output_file: str = None, quiet_mode: bool = False,
+                            record_format: str = FORMAT_CSV):
     """Execute the segments-export command.
     
     Args:
@@ -28,6 +32,7 @@ def execute_segments_export(csv_file: str, client, logger: logging.Logger, outpu
         logger: Logger instance
         output_file: Path to output file for writing results
         quiet_mode: Whether to suppress console output
+        record_format: Output format, FORMAT_CSV or FORMAT_JSONL
     """
     try:
         # Check if CSV file exists
@@ -52,7 +57,8 @@ def execute_segments_export(csv_file: str, client, logger: logging.Logger, outpu
         
         # Generate default output file if not provided - use policy-import category
         if not output_file:
-            output_file = get_output_file_path(csv_file, "segments_output.csv", category="policy-import")
+            output_file = str(record_file_path(
+                get_output_file_path(csv_file, "segments_output.csv", category="policy-import"), record_format))
         
         if not quiet_mode:
             print(f"\nProcessing {len(env_mappings)} environment mappings from CSV file: {csv_file}")
@@ -69,10 +75,11 @@ def execute_segments_export(csv_file: str, client, logger: logging.Logger, outpu
         failed = 0
         
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer = RecordWriter(f, SEGMENTS_COLUMNS, ('segments_json',), record_format,
+                                  json_separators=(', ', ': '))
             
             # Write header
-            writer.writerow(['target-env', 'segments_json'])
+            writer.write_header()
             
             for i, (source_env, target_env) in enumerate(env_mappings, 1):
                 if verbose_mode:
@@ -194,8 +201,7 @@ def execute_segments_export(csv_file: str, client, logger: logging.Logger, outpu
                         logger.info(msg)
                         continue
                     
-                    segments_json = json.dumps(segments_response, ensure_ascii=False)
-                    writer.writerow([target_env, segments_json])
+                    writer.write([target_env, segments_response])
                     
                     if not quiet_mode:
                         print(f"✅ Written to file: {target_env}")
@@ -216,17 +222,17 @@ def execute_segments_export(csv_file: str, client, logger: logging.Logger, outpu
             print("\nVerifying CSV file can be read correctly...")
         
         try:
-            with open(output_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                header = next(reader)
+            with open_records(output_path) as reader:
+                header = reader.header
                 row_count = 0
                 validation_errors = []
                 
-                # Validate header
-                if len(header) != 2:
-                    validation_errors.append(f"Invalid header: expected 2 columns, got {len(header)}")
-                elif header[0] != 'target-env' or header[1] != 'segments_json':
-                    validation_errors.append(f"Invalid header: expected ['target-env', 'segments_json'], got {header}")
+                # Validate header (an empty JSON Lines file has none)
+                if header or reader.record_format == FORMAT_CSV:
+                    if len(header) != 2:
+                        validation_errors.append(f"Invalid header: expected 2 columns, got {len(header)}")
+                    elif header != SEGMENTS_COLUMNS:
+                        validation_errors.append(f"Invalid header: expected {SEGMENTS_COLUMNS}, got {header}")
                 
                 # Validate each row
                 for row_num, row in enumerate(reader, start=2):
@@ -237,19 +243,19 @@ def execute_segments_export(csv_file: str, client, logger: logging.Logger, outpu
                         validation_errors.append(f"Row {row_num}: Expected 2 columns, got {len(row)}")
                         continue
                     
-                    target_env, segments_json_str = row
+                    target_env, segments_value = row
                     
                     # Check for empty values
                     if not target_env.strip():
                         validation_errors.append(f"Row {row_num}: Empty target-env value")
                     
-                    if not segments_json_str.strip():
+                    if isinstance(segments_value, str) and not segments_value.strip():
                         validation_errors.append(f"Row {row_num}: Empty segments_json value")
                         continue
                     
                     # Verify JSON is parsable
                     try:
-                        segments_data = json.loads(segments_json_str)
+                        segments_data = reader.json(segments_value)
                         
                         # Additional validation: check if it's a valid segments response
                         if not isinstance(segments_data, dict):
@@ -304,7 +310,8 @@ def execute_segments_import(csv_file: str, client, logger: logging.Logger, dry_r
         verbose_mode: Whether to enable verbose logging
     """
     try:
-        # Read target-env and segments_json from CSV file
+        # Read target-env and segments_json from CSV or JSON Lines file
+        csv_file = str(resolve_record_file(csv_file))
         if not Path(csv_file).exists():
             error_msg = f"CSV file does not exist: {csv_file}"
             print(f"❌ {error_msg}")
@@ -334,11 +341,10 @@ def execute_segments_import(csv_file: str, client, logger: logging.Logger, dry_r
         
         # Read CSV file
         import_mappings = []
-        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        with open_records(csv_file) as reader:
+            header = reader.header
             
-            if len(header) != 2 or header[0] != 'target-env' or header[1] != 'segments_json':
+            if header != SEGMENTS_COLUMNS:
                 error_msg = f"Invalid CSV format. Expected header: ['target-env', 'segments_json'], got: {header}"
                 print(f"❌ {error_msg}")
                 logger.error(error_msg)
@@ -350,7 +356,7 @@ def execute_segments_import(csv_file: str, client, logger: logging.Logger, dry_r
                     continue
                 
                 target_env = row[0].strip()
-                segments_json = row[1].strip()
+                segments_json = row[1].strip() if reader.record_format == FORMAT_CSV else row[1]
                 
                 if target_env and segments_json:
                     import_mappings.append((target_env, segments_json))
@@ -445,7 +451,7 @@ def execute_segments_import(csv_file: str, client, logger: logging.Logger, dry_r
                 
                 # Step 3: Parse segments JSON and extract segments array
                 try:
-                    segments_data = json.loads(segments_json)
+                    segments_data = reader.json(segments_json)
                     
                     # Extract segments from the JSON structure
                     if 'assetSegments' in segments_data and 'segments' in segments_data['assetSegments']:
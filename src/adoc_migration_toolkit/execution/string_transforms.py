@@ -0,0 +1,140 @@
+"""
+Compiled string transformation engine.
+
+The formatters and transform-and-merge rewrite environment names in UIDs and
+JSON string values using ``{source: target}`` mappings. Each source is only
+replaced where it appears as a complete word (``\\b`` boundaries on both
+sides), and replacements are atomic: the output of one mapping is never
+matched by another.
+
+Running one ``re.search``/``re.sub`` per mapping on every string is
+quadratic with hundreds of mappings, so ``StringTransformEngine`` compiles all
+sources into a single alternation and rewrites each string in one scan. Where
+matches overlap, the leftmost one wins; sources matching at the same position
+are tried in mapping order.
+
+Most exported files contain none of the sources. ``may_match`` is a cheap
+pre-scan of a file's raw bytes that lets callers copy such files without
+parsing them.
+"""
+
+import re
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+# Characters that a JSON document may write as an escape sequence inside a string
+_JSON_ESCAPED = frozenset('"\\/')
+
+
+class StringTransformEngine:
+    """Single-pass, word-boundary string replacement for a set of mappings."""
+
+    def __init__(self, string_transforms: Optional[Dict[str, str]] = None):
+        """Compile the mappings.
+
+        Args:
+            string_transforms: Dictionary of string transformations {source: target}.
+                Empty sources and identity mappings are ignored.
+        """
+        self.string_transforms = dict(string_transforms or {})
+        self._targets = {source: target for source, target in self.string_transforms.items()
+                         if source and source != target}
+        self._pattern = None
+        self._bytes_pattern = None
+        self._escapable_sources = False
+        self._max_source_bytes = 0
+        if self._targets:
+            alternation = '|'.join(re.escape(source) for source in self._targets)
+            self._pattern = re.compile(r'\b(?:' + alternation + r')\b')
+            # Sources as they may appear in UTF-8 or latin-1 encoded files
+            encoded = {source.encode(encoding) for source in self._targets
+                       for encoding in ('utf-8', 'latin-1') if self._encodable(source, encoding)}
+            self._bytes_pattern = re.compile(b'|'.join(re.escape(source) for source in encoded))
+            self._max_source_bytes = max(len(source) for source in encoded)
+            self._escapable_sources = any(not char.isascii() or not char.isprintable() or char in _JSON_ESCAPED
+                                          for source in self._targets for char in source)
+
+    @staticmethod
+    def _encodable(value: str, encoding: str) -> bool:
+        try:
+            value.encode(encoding)
+        except UnicodeEncodeError:
+            return False
+        return True
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def may_match(self, data: bytes) -> bool:
+        """Check whether a raw JSON document may contain any source.
+
+        A False answer is exact: no string in the document can be changed by
+        ``apply``. A True answer only means the document has to be parsed.
+
+        Args:
+            data: Raw content of a UTF-8 or latin-1 encoded JSON document
+
+        Returns:
+            False if the document cannot contain a source
+        """
+        if self._pattern is None:
+            return False
+        # Any character may be written as a \\u escape, and some always are
+        if b'\\' in data and (self._escapable_sources or b'\\u' in data):
+            return True
+        return self._bytes_pattern.search(data) is not None
+
+    def may_match_stream(self, stream: BinaryIO, chunk_size: int = 1024 * 1024) -> bool:
+        """Run ``may_match`` over a binary stream without reading it into memory.
+
+        Args:
+            stream: Binary stream with the raw JSON document
+            chunk_size: Number of bytes to read at a time
+
+        Returns:
+            False if the document cannot contain a source
+        """
+        if self._pattern is None:
+            return False
+        # Keep enough of the previous chunk to catch a source or escape split between reads
+        overlap = max(self._max_source_bytes, 2) - 1
+        tail = b''
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return False
+            data = tail + chunk
+            if self.may_match(data):
+                return True
+            tail = data[-overlap:]
+
+    def apply(self, value: str) -> str:
+        """Apply every transformation to a string in one scan.
+
+        Args:
+            value: The string value to transform
+
+        Returns:
+            The transformed string
+        """
+        if self._pattern is None:
+            return value
+        return self._pattern.sub(lambda match: self._targets[match.group(0)], value)
+
+    def apply_with_matches(self, value: str) -> Tuple[str, List[str]]:
+        """Apply every transformation and report which sources were replaced.
+
+        Args:
+            value: The string value to transform
+
+        Returns:
+            Tuple of (transformed string, sources replaced in first-match order without repeats)
+        """
+        if self._pattern is None:
+            return value, []
+        matched: Dict[str, None] = {}
+
+        def replace(match) -> str:
+            matched[match.group(0)] = None
+            return self._targets[match.group(0)]
+
+        return self._pattern.sub(replace, value), list(matched)
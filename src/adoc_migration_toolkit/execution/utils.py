@@ -236,6 +236,39 @@ def get_source_to_target_asset_id_map(csv_file: str, logger, quiet_mode: bool =
         return None 
 
 
+def get_thread_client(client):
+    """Get an API client for the calling worker thread.
+    
+    Real clients hand out a per-thread clone that shares the process-wide
+    connection pools, so workers reuse keep-alive connections. Other client
+    objects fall back to constructing a fresh instance and copying the
+    target credentials across.
+    
+    Args:
+        client: API client instance used by the calling command
+        
+    Returns:
+        API client safe to use from the calling thread
+    """
+    if callable(getattr(type(client), 'for_thread', None)):
+        return client.for_thread()
+    
+    thread_client = type(client)(
+        host=client.host,
+        access_key=client.access_key,
+        secret_key=client.secret_key,
+        tenant=getattr(client, 'tenant', None)
+    )
+    # Copy target credentials to thread client
+    thread_client.target_access_key = getattr(client, 'target_access_key', None)
+    thread_client.target_secret_key = getattr(client, 'target_secret_key', None)
+    thread_client.target_tenant = getattr(client, 'target_tenant', None)
+    thread_client.target_host = getattr(client, 'target_host', None)
+    # Copy host template for tenant substitution
+    thread_client.host_template = getattr(client, 'host_template', None)
+    return thread_client
+
+
 def get_thread_names():
     """Return a list of thread names for progress bars."""
     thread_names = [
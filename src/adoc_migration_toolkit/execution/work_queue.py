@@ -0,0 +1,229 @@
+"""
+Work-queue execution for parallel asset commands.
+
+This module contains a shared work queue used by the parallel asset commands.
+Instead of splitting the input into one contiguous slice per thread up front,
+every worker pulls the next item from the queue when it finishes the previous
+one, so a handful of slow assets no longer keeps one thread busy while the
+others sit idle. The time spent on each item is recorded so every run can
+report its tail latency.
+
+With ``max_pending`` set, items are pulled from the input iterable by a
+feeder thread into a bounded queue, so a generator over a multi-gigabyte file
+is never held in memory at once.
+
+``SubRequestPool`` lets a worker fan out the independent API calls one item
+needs, so the item takes as long as its slowest call instead of the sum of
+all of them.
+"""
+
+import math
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Marks the end of a streaming queue
+_END = object()
+
+
+class WorkQueue:
+    """Thread-safe queue of work items with per-item latency tracking.
+
+    Workers iterate over ``consume()``; each iteration hands out the next
+    unclaimed item. The item counts as finished (and its latency is recorded)
+    when the worker comes back for the next one, so existing loop bodies that
+    ``continue`` early need no changes.
+    """
+
+    def __init__(self, items: Iterable[Any], progress_bar=None, max_pending: int = 0, total: Optional[int] = None):
+        """Initialize the queue.
+
+        Args:
+            items: Work items, handed out in order
+            progress_bar: Optional shared progress bar advanced once per finished item
+            max_pending: If positive, read items lazily from a feeder thread and keep at
+                most this many waiting; otherwise all items are queued up front
+            total: Number of items, if known (streaming mode only)
+        """
+        self.progress_bar = progress_bar
+        self.error: Optional[Exception] = None
+        self._latencies: List[float] = []
+        self._lock = threading.Lock()
+        self._streaming = max_pending > 0
+        self._closed = threading.Event()
+        if self._streaming:
+            self._queue = queue.Queue(maxsize=max_pending)
+            self.total = total
+            self._feeder = threading.Thread(target=self._feed, args=(iter(items),), name="work-queue-feeder", daemon=True)
+            self._feeder.start()
+        else:
+            self._queue = queue.Queue()
+            for item in items:
+                self._queue.put(item)
+            self.total = self._queue.qsize()
+
+    def __len__(self) -> int:
+        return self.total or 0
+
+    def _feed(self, items: Iterator[Any]) -> None:
+        """Move items into the bounded queue until the input ends or the queue is closed."""
+        try:
+            for item in items:
+                if not self._put(item):
+                    return
+        except Exception as e:
+            self.error = e
+        self._put(_END)
+
+    def _put(self, item: Any) -> bool:
+        """Put an item, waiting for space; returns False if the queue was closed meanwhile."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self) -> None:
+        """Stop the feeder thread, e.g. after every worker has failed."""
+        self._closed.set()
+
+    def consume(self) -> Iterator[Any]:
+        """Yield items on demand until the queue is drained.
+
+        Yields:
+            The next unclaimed work item
+        """
+        while True:
+            if self._streaming:
+                item = self._queue.get()
+                if item is _END:
+                    self._queue.put(_END)  # Let the other workers see the end too
+                    return
+            else:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    return
+            started = time.monotonic()
+            try:
+                yield item
+            finally:
+                self._complete(time.monotonic() - started)
+
+    def _complete(self, latency: float) -> None:
+        """Record a finished item and advance the shared progress bar."""
+        with self._lock:
+            self._latencies.append(latency)
+            if self.progress_bar is not None:
+                self.progress_bar.update(1)
+
+    def latency_stats(self) -> Dict[str, float]:
+        """Get per-item latency statistics for the run.
+
+        Returns:
+            Dictionary with count, mean, p50, p90, p99 and max latency in seconds
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+        return {
+            'count': len(latencies),
+            'mean': sum(latencies) / len(latencies),
+            'p50': _percentile(latencies, 50),
+            'p90': _percentile(latencies, 90),
+            'p99': _percentile(latencies, 99),
+            'max': latencies[-1]
+        }
+
+    def format_latency_stats(self) -> str:
+        """Format latency statistics as a single summary line."""
+        stats = self.latency_stats()
+        return (f"Item latency ({stats['count']} items): p50 {stats['p50']:.2f}s | p90 {stats['p90']:.2f}s | "
+                f"p99 {stats['p99']:.2f}s | max {stats['max']:.2f}s | mean {stats['mean']:.2f}s")
+
+
+class SubRequestPool:
+    """Thread pool for the independent sub-requests of a work item.
+
+    The pool is separate from the worker threads, so a worker waiting on its
+    sub-requests can never starve them of a thread.
+    """
+
+    def __init__(self, max_workers: int):
+        """Initialize the pool.
+
+        Args:
+            max_workers: Maximum number of sub-requests running at once, usually the
+                number of worker threads times the sub-requests per item
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="sub-request")
+
+    def fan_out(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Future]:
+        """Start every call of a work item concurrently.
+
+        Calls must not depend on the caller's loop variables changing later
+        (bind arguments with ``functools.partial``), since a call may still be
+        running after the caller gives up on the item.
+
+        Args:
+            calls: Dictionary of name -> function taking no arguments
+
+        Returns:
+            Dictionary of name -> Future; ``result()`` returns the call's value
+            or raises its exception
+        """
+        return {name: self._executor.submit(call) for name, call in calls.items()}
+
+    def close(self) -> None:
+        """Wait for running sub-requests and stop the pool."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "SubRequestPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_work_queue(work_queue: WorkQueue, worker: Callable[[int], Any], num_threads: int,
+                   logger: Optional[logging.Logger] = None) -> List[Any]:
+    """Run worker threads that drain a work queue.
+
+    Args:
+        work_queue: Queue the workers consume from
+        worker: Function called with the thread id; it should loop over ``work_queue.consume()``
+        num_threads: Number of worker threads
+        logger: Logger instance for thread failures and the latency summary
+
+    Returns:
+        List of worker return values, in completion order
+    """
+    logger = logger or logging.getLogger(__name__)
+    if work_queue.total is not None:
+        num_threads = min(num_threads, work_queue.total)
+    num_threads = max(1, num_threads)
+    results = []
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [executor.submit(worker, thread_id) for thread_id in range(num_threads)]
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Thread execution error: {e}")
+    work_queue.close()
+    if work_queue.error is not None:
+        logger.error(f"Reading work items failed: {work_queue.error}")
+    logger.info(work_queue.format_latency_stats())
+    return results
@@ -12,6 +12,11 @@ Key Features:
 - File upload support via multipart/form-data
 - Environment file configuration support
 - Session management for connection reuse
+- Shared per-host connection pools reused by every client and worker thread
+- Keep-alive multipart uploads streamed from disk
+- Binary downloads streamed to disk with a checksum and atomic rename
+- Adaptive concurrency with Retry-After aware backpressure shared by all threads
+- Optional asyncio engine (AsyncAcceldataAPIClient) for high-concurrency bulk commands
 
 Example Usage:
     # Create client from environment file
@@ -30,19 +35,207 @@ Example Usage:
 """
 
 import os
+import copy
+import uuid
+import hashlib
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any, Optional, Union
+import threading
+from typing import Dict, Any, NamedTuple, Optional, Union
 from pathlib import Path
 import requests
 from requests.exceptions import RequestException, Timeout, ConnectionError
+from requests.structures import CaseInsensitiveDict
 from adoc_migration_toolkit.shared.globals import HTTP_CONFIG
+from adoc_migration_toolkit.shared.concurrency import get_concurrency_limiter, THROTTLE_STATUS_CODES
+from adoc_migration_toolkit.shared.response_cache import ResponseCache, get_response_cache, get_endpoint_ttl
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from urllib3.exceptions import ReadTimeoutError
+
+# aiohttp is optional - only required by the async engine
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
 # Default timeout for all API calls (10 seconds)
 DEFAULT_TIMEOUT = 10
 
+# Default number of in-flight requests for the async engine
+DEFAULT_MAX_CONCURRENCY = 100
+
+# Status codes retried by both the sync and async engines
+RETRY_STATUS_CODES = [429, 502, 503, 504]
+
+# Bytes read from the socket per chunk by download_to_file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class DownloadResult(NamedTuple):
+    """File written by AcceldataAPIClient.download_to_file."""
+    path: Path
+    size: int
+    sha256: str
+
+# Shared HTTP adapters keyed by (host URL, retry enabled). HTTPAdapter (and the
+# urllib3 pool behind it) is thread-safe, so every client and worker thread
+# talking to the same host/tenant reuses the same keep-alive connections.
+_POOLED_ADAPTERS: Dict[tuple, HTTPAdapter] = {}
+_POOLED_ADAPTERS_LOCK = threading.Lock()
+
+
+def _build_retry_strategy() -> Retry:
+    """Build the urllib3 retry strategy from HTTP_CONFIG."""
+    # With adaptive concurrency on, throttled statuses are retried by
+    # make_api_call so the shared limiter sees them and can back off;
+    # urllib3 then only retries connection errors.
+    status_forcelist = [] if HTTP_CONFIG.get('adaptive_concurrency', True) else RETRY_STATUS_CODES
+    # Exclude 500 errors to avoid retrying server errors
+    return Retry(
+        total=HTTP_CONFIG.get('retry', 3),
+        backoff_factor=0.5,
+        status_forcelist=status_forcelist,
+        allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT"]
+    )
+
+
+def get_pooled_adapter(host_url: str, retry: bool = True) -> HTTPAdapter:
+    """
+    Get the shared HTTP adapter for a host, creating it on first use.
+    
+    Pool sizes come from HTTP_CONFIG['pool_connections'] and
+    HTTP_CONFIG['pool_maxsize'].
+    
+    Args:
+        host_url: Base URL of the host (scheme and netloc, tenant already substituted)
+        retry: Whether the adapter retries failed requests. File uploads use a
+            separate no-retry pool so server errors are never replayed.
+        
+    Returns:
+        HTTPAdapter shared by all sessions talking to this host
+    """
+    key = (host_url, retry)
+    with _POOLED_ADAPTERS_LOCK:
+        adapter = _POOLED_ADAPTERS.get(key)
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_CONFIG.get('pool_connections', 10),
+                pool_maxsize=HTTP_CONFIG.get('pool_maxsize', 32),
+                max_retries=_build_retry_strategy() if retry else 0
+            )
+            _POOLED_ADAPTERS[key] = adapter
+        return adapter
+
+
+def reset_connection_pools() -> None:
+    """
+    Close and discard all shared connection pools.
+    
+    Called after set-http-config changes pool sizes or retries so that new
+    requests pick up the updated configuration.
+    """
+    with _POOLED_ADAPTERS_LOCK:
+        for adapter in _POOLED_ADAPTERS.values():
+            adapter.close()
+        _POOLED_ADAPTERS.clear()
+
+
+class _StreamingMultipartBody:
+    """
+    File-like multipart/form-data body that reads file parts on demand.
+    
+    requests reads every file passed via ``files=`` into memory before sending.
+    This body exposes ``read()`` and ``__len__`` instead, so the upload is sent
+    with a Content-Length header while file contents are streamed from disk.
+    """
+
+    def __init__(self, files: Dict[str, Any]):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._parts = []
+        self._length = 0
+        for field, value in files.items():
+            if isinstance(value, (tuple, list)):
+                filename, content = value[0], value[1]
+                part_type = value[2] if len(value) > 2 else None
+            else:
+                filename, content, part_type = os.path.basename(getattr(value, 'name', field)), value, None
+            header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            if part_type:
+                header += f'Content-Type: {part_type}\r\n'
+            self._add_part((header + '\r\n').encode('utf-8'))
+            self._add_part(content)
+            self._add_part(b'\r\n')
+        self._add_part(f'--{self.boundary}--\r\n'.encode('utf-8'))
+        self._current = None
+
+    def _add_part(self, part: Any) -> None:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        if isinstance(part, bytes):
+            self._length += len(part)
+        else:
+            # File object: size is what remains from its current position
+            position = part.tell()
+            self._length += os.fstat(part.fileno()).st_size - position
+        self._parts.append(part)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and (size < 0 or size > 0):
+            part = self._parts[0]
+            if isinstance(part, bytes):
+                chunk = part if size < 0 else part[:size]
+                remainder = part[len(chunk):]
+                if remainder:
+                    self._parts[0] = remainder
+                else:
+                    self._parts.pop(0)
+            else:
+                chunk = part.read(size)
+                if not chunk:
+                    self._parts.pop(0)
+                    continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b''.join(chunks)
+
+
+def is_streamed_read_timeout(error: BaseException) -> bool:
+    """Check whether an error is a read timeout raised while streaming a response body.
+    
+    ``iter_content`` raises ``ConnectionError`` wrapping urllib3's
+    ``ReadTimeoutError`` instead of ``Timeout`` when the body stalls.
+    
+    Args:
+        error: Exception raised by a request
+        
+    Returns:
+        True if the error is a ConnectionError caused by a ReadTimeoutError
+    """
+    if not isinstance(error, ConnectionError):
+        return False
+    causes = list(error.args[:1]) + [error.__cause__, error.__context__]
+    return any(isinstance(cause, ReadTimeoutError) for cause in causes)
+
+
+def _is_streamable_upload(files: Dict[str, Any]) -> bool:
+    """Check whether any upload part is an open file that can be streamed from disk."""
+    for value in files.values():
+        content = value[1] if isinstance(value, (tuple, list)) else value
+        if hasattr(content, 'read') and hasattr(content, 'fileno'):
+            return True
+    return False
+
+
 class AcceldataAPIClient:
     """
     Robust HTTP client for Acceldata API interactions.
@@ -116,8 +309,11 @@ class AcceldataAPIClient:
         self.host = self.host.rstrip('/')
         # Setup session with default headers
         self.session = requests.Session()
+        self._upload_session = None  # Created on first file upload
         self._setup_default_headers()
         self._apply_http_config()
+        # Per-thread clones handed out by for_thread()
+        self._thread_clients = threading.local()
         self.logger.info(f"API Client initialized for host: {self.host}, tenant: {self.tenant}")
     
     def _validate_configuration(self) -> None:
@@ -310,9 +506,24 @@ class AcceldataAPIClient:
         close network connections and free resources.
         """
         if hasattr(self, 'session'):
-            self.session.close()
+            if getattr(self, '_upload_session', None) is not None:
+                self._close_session(self._upload_session)
+                self._upload_session = None
+            self._close_session(self.session)
             self.logger.info("API client session closed")
 
+    @staticmethod
+    def _close_session(session: requests.Session) -> None:
+        """Close a session without tearing down the connection pools other clients share."""
+        adapters = getattr(session, 'adapters', None)
+        if isinstance(adapters, dict):
+            with _POOLED_ADAPTERS_LOCK:
+                shared = [prefix for prefix, adapter in adapters.items()
+                          if any(adapter is pooled for pooled in _POOLED_ADAPTERS.values())]
+            for prefix in shared:
+                del adapters[prefix]
+        session.close()
+
     def _build_host_url(self, use_target_tenant: bool = False) -> str:
         """
         Build the host URL with the correct tenant substitution.
@@ -335,18 +546,15 @@ class AcceldataAPIClient:
             return self.host.rstrip('/')
 
     def _apply_http_config(self):
-        """Apply global HTTP_CONFIG for timeout, retry, and proxy."""
-        # Retry logic - exclude 500 errors for file uploads to avoid retrying server errors
-        retry_count = HTTP_CONFIG.get('retry', 3)
-        retry_strategy = Retry(
-            total=retry_count,
-            backoff_factor=0.5,
-            status_forcelist=[429, 502, 503, 504],  # Removed 500 to avoid retrying server errors
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        """Apply global HTTP_CONFIG for timeout, retry, proxy and connection pooling."""
+        # Fallback adapter for URLs outside the configured hosts
+        adapter = HTTPAdapter(max_retries=_build_retry_strategy())
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Shared pooled adapters for the source and target hosts
+        self._mount_pooled_adapter(self._build_host_url(use_target_tenant=False))
+        if getattr(self, 'target_tenant', None):
+            self._mount_pooled_adapter(self._build_host_url(use_target_tenant=True))
         # Proxy
         proxy_url = HTTP_CONFIG.get('proxy')
         if proxy_url:
@@ -357,6 +565,66 @@ class AcceldataAPIClient:
         else:
             self.session.proxies = {}
 
+    def _mount_pooled_adapter(self, host_url: str, session: Optional[requests.Session] = None,
+                              retry: bool = True) -> None:
+        """
+        Route requests for a host through its shared connection pool.
+        
+        Args:
+            host_url: Base URL of the host with tenant substituted
+            session: Session to mount on (defaults to the main session)
+            retry: Whether to use the retrying or the no-retry pool
+        """
+        session = session or self.session
+        adapter = get_pooled_adapter(host_url, retry=retry)
+        prefix = f"{host_url}/"
+        # Remount when the pools were reset by set-http-config
+        if session.adapters.get(prefix) is not adapter:
+            session.mount(prefix, adapter)
+
+    def _get_upload_session(self) -> requests.Session:
+        """
+        Get the keep-alive session used for multipart file uploads.
+        
+        Uploads are never retried (to avoid replaying server errors), so they
+        use a separate session backed by the shared no-retry pools. The session
+        lives as long as the client, so consecutive uploads to the same target
+        host reuse the same connection instead of a new TCP+TLS handshake each.
+        
+        Returns:
+            requests.Session for file uploads
+        """
+        if self._upload_session is None:
+            self._upload_session = requests.Session()
+            adapter = HTTPAdapter(max_retries=0)
+            self._upload_session.mount("http://", adapter)
+            self._upload_session.mount("https://", adapter)
+        proxy_url = HTTP_CONFIG.get('proxy')
+        self._upload_session.proxies = {'http': proxy_url, 'https': proxy_url} if proxy_url else {}
+        return self._upload_session
+
+    def for_thread(self) -> "AcceldataAPIClient":
+        """
+        Get a client for the calling thread that shares this client's connection pools.
+        
+        requests.Session is not safe to share between threads, so each worker
+        thread gets its own lightweight clone with its own session. The clone is
+        cached per thread and mounts the same pooled adapters, so workers reuse
+        keep-alive connections instead of opening new ones.
+        
+        Returns:
+            AcceldataAPIClient bound to the calling thread
+        """
+        thread_client = getattr(self._thread_clients, 'client', None)
+        if thread_client is None:
+            thread_client = copy.copy(self)
+            thread_client.session = requests.Session()
+            thread_client._upload_session = None
+            thread_client._setup_default_headers()
+            thread_client._apply_http_config()
+            self._thread_clients.client = thread_client
+        return thread_client
+
     def make_api_call(self, endpoint: str, method: str = 'GET', json_payload: Optional[Dict[str, Any]] = None, 
                      use_target_auth: bool = False, use_target_tenant: bool = False, return_binary: bool = False,
                      files: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None, dont_parse_reponse: bool = False) -> Any:
@@ -404,6 +672,7 @@ class AcceldataAPIClient:
         # Build the full URL with dynamic host
         host_url = self._build_host_url(use_target_tenant)
         url = f"{host_url}{endpoint}"
+        self._mount_pooled_adapter(host_url)
         
         # Setup headers for this request
         headers = self._build_request_headers(access_key, secret_key, tenant, files)
@@ -411,19 +680,28 @@ class AcceldataAPIClient:
         # Log request details
         self._log_request_details(method, url, timeout, use_target_auth, use_target_tenant, files)
         
-        # For file uploads, use a session without retries to avoid retrying server errors
+        # For file uploads, use the keep-alive session without retries to avoid retrying server errors
         if files:
-            # Create a temporary session without retries for file uploads
-            temp_session = requests.Session()
-            temp_session.headers.update(headers)
+            upload_session = self._get_upload_session()
+            self._mount_pooled_adapter(host_url, session=upload_session, retry=False)
+            # Stream open files from disk; in-memory content goes through requests as before
+            if _is_streamable_upload(files):
+                body = _StreamingMultipartBody(files)
+                request_kwargs = {'data': body, 'headers': {**headers, 'Content-Type': body.content_type}}
+            else:
+                request_kwargs = {'files': files, 'headers': headers}
             
             try:
                 if method == 'POST':
-                    response = temp_session.post(url, files=files, timeout=timeout)
+                    response = self._send_with_backpressure(
+                        lambda: upload_session.post(url, timeout=timeout, **request_kwargs), max_retries=0)
                 elif method == 'PUT':
-                    response = temp_session.put(url, files=files, timeout=timeout)
+                    response = self._send_with_backpressure(
+                        lambda: upload_session.put(url, timeout=timeout, **request_kwargs), max_retries=0)
                 else:
                     raise ValueError(f"File uploads only support POST and PUT methods, got {method}")
+                if response.ok:
+                    self._invalidate_cached_responses(endpoint)
                 if dont_parse_reponse:
                     return response
                 response.raise_for_status()
@@ -442,16 +720,31 @@ class AcceldataAPIClient:
                     self.logger.error("This is likely a server-side issue with the file format or server configuration")
                 
                 raise
-            finally:
-                temp_session.close()
         else:
+            # Serve idempotent GETs from the opt-in response cache
+            cache = get_response_cache() if method == 'GET' and not dont_parse_reponse else None
+            cache_key = ResponseCache.make_key(tenant, host_url, endpoint, return_binary) if cache else None
+            if cache:
+                cached_body = cache.get(cache_key)
+                if cached_body is not None:
+                    self.logger.info(f"Served GET {endpoint} from response cache")
+                    return cached_body if return_binary else json.loads(cached_body)
+            
             # Use normal session with retries for non-file requests
             try:
-                response = self._execute_request(method, url, headers, json_payload, files, timeout)
+                response = self._send_with_backpressure(
+                    lambda: self._execute_request(method, url, headers, json_payload, files, timeout),
+                    max_retries=HTTP_CONFIG.get('retry', 3)
+                )
                 response.raise_for_status()
+                if method != 'GET':
+                    self._invalidate_cached_responses(endpoint)
                 if dont_parse_reponse:
                     return response
-                return self._process_response(response, endpoint, method, return_binary)
+                result = self._process_response(response, endpoint, method, return_binary)
+                if cache:
+                    cache.put(cache_key, endpoint, response.content, get_endpoint_ttl(endpoint))
+                return result
             
             except Timeout:
                 self.logger.error(f"Request timed out for {method} {endpoint}")
@@ -466,6 +759,132 @@ class AcceldataAPIClient:
                 
                 raise
     
+    def download_to_file(self, endpoint: str, output_file: Union[str, Path], use_target_auth: bool = False,
+                         use_target_tenant: bool = False, timeout: Optional[int] = None,
+                         chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> DownloadResult:
+        """
+        Stream a binary GET response (e.g. a policy export ZIP) straight to disk.
+        
+        Chunks are written to ``<output_file>.part`` while a SHA-256 checksum is
+        computed, and the file is renamed into place only once the body is
+        complete. Memory use is bounded by ``chunk_size`` however large the
+        response is, and a failed download never leaves a truncated file behind.
+        
+        Args:
+            endpoint: The API endpoint, including the query string
+            output_file: Destination path
+            use_target_auth: Whether to use target access/secret keys instead of source
+            use_target_tenant: Whether to use target tenant instead of source
+            timeout: Request timeout in seconds (connect and per read)
+            chunk_size: Bytes read per chunk
+        
+        Returns:
+            DownloadResult with the path, size in bytes and SHA-256 hex digest
+        
+        Raises:
+            RequestException: If the download fails due to network or server errors
+            Timeout: If the request times out before the body is streamed
+            ConnectionError: If a read times out while the body is streamed
+                (see is_streamed_read_timeout)
+        """
+        if not endpoint or not endpoint.strip():
+            raise ValueError("Endpoint cannot be empty")
+        timeout = timeout or HTTP_CONFIG.get('timeout', self.DEFAULT_TIMEOUT)
+        
+        access_key, secret_key = self._get_auth_credentials(use_target_auth)
+        tenant = self._get_tenant(use_target_tenant)
+        host_url = self._build_host_url(use_target_tenant)
+        url = f"{host_url}{endpoint}"
+        self._mount_pooled_adapter(host_url)
+        headers = self._build_request_headers(access_key, secret_key, tenant, None)
+        self._log_request_details('GET', url, timeout, use_target_auth, use_target_tenant, None)
+        
+        output_path = Path(output_file)
+        part_path = output_path.with_name(output_path.name + '.part')
+        checksum = hashlib.sha256()
+        size = 0
+        try:
+            def write_body(response: requests.Response) -> None:
+                nonlocal size
+                with response:
+                    response.raise_for_status()
+                    with open(part_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            if chunk:
+                                f.write(chunk)
+                                checksum.update(chunk)
+                                size += len(chunk)
+            
+            # The body is streamed while the limiter slot is held, so a long download
+            # counts against the in-flight limit and a stalled one as a timeout
+            self._send_with_backpressure(
+                lambda: self.session.get(url, headers=headers, timeout=timeout, stream=True),
+                max_retries=HTTP_CONFIG.get('retry', 3),
+                consume=write_body
+            )
+            os.replace(part_path, output_path)
+        except RequestException as e:
+            # A read timeout while streaming the body arrives as a ConnectionError
+            if isinstance(e, Timeout) or is_streamed_read_timeout(e):
+                self.logger.error(f"Request timed out for GET {endpoint}")
+            else:
+                self._log_error_details(e, 'GET', endpoint)
+            raise
+        finally:
+            if part_path.exists():
+                part_path.unlink()
+        
+        digest = checksum.hexdigest()
+        self.logger.info(f"Downloaded {size} bytes from {endpoint} to {output_path} (sha256 {digest})")
+        return DownloadResult(output_path, size, digest)
+    
+    def _send_with_backpressure(self, send, max_retries: int, consume=None) -> Any:
+        """
+        Send a request through the shared adaptive concurrency limiter.
+        
+        Blocks while the process is at its in-flight limit or paused by a
+        Retry-After header, reports the outcome back to the limiter, and
+        retries throttled responses (429/502/503/504) after the shared pause.
+        
+        Args:
+            send: Callable that sends the request and returns the response
+            max_retries: Maximum number of retries for throttled responses
+            consume: Optional callable run on the final response before the
+                slot is released, e.g. to stream the body
+            
+        Returns:
+            HTTP response object, or the result of consume if given
+        """
+        limiter = get_concurrency_limiter()
+        if limiter is None:
+            response = send()
+            return consume(response) if consume else response
+        
+        attempt = 0
+        while True:
+            with limiter.slot() as slot:
+                response = send()
+                headers = getattr(response, 'headers', None) or {}
+                slot.complete(getattr(response, 'status_code', None), headers.get('Retry-After'))
+                if slot.status_code not in THROTTLE_STATUS_CODES or attempt >= max_retries:
+                    if consume is None:
+                        return response
+                    try:
+                        return consume(response)
+                    except RequestException as e:
+                        slot.timed_out = is_streamed_read_timeout(e)
+                        raise
+            attempt += 1
+            self.logger.warning(f"Server throttled request (HTTP {slot.status_code}), retrying after backoff "
+                                f"(attempt {attempt}/{max_retries}, concurrency limit {limiter.limit})")
+            response.close()
+    
+    def _invalidate_cached_responses(self, endpoint: str) -> None:
+        """Drop cached GET responses for the resource a successful write changed."""
+        cache = get_response_cache()
+        if cache:
+            cache.invalidate(endpoint)
+    
     def _get_auth_credentials(self, use_target_auth: bool) -> tuple[str, str]:
         """
         Get authentication credentials based on configuration.
@@ -643,6 +1062,312 @@ class AcceldataAPIClient:
                 self.logger.error(f"Could not log response content: {log_error}")
 
 
+class AsyncAcceldataAPIClient:
+    """
+    Asyncio-based HTTP client for Acceldata API interactions.
+    
+    Wraps a configured AcceldataAPIClient and reuses its authentication, tenant
+    substitution and header handling, but sends requests over a shared aiohttp
+    session so a single thread can keep many requests in flight. The number of
+    concurrent requests is capped by ``max_concurrency``.
+    
+    Responses are converted to ``requests.Response`` objects so that error
+    handling (``raise_for_status``, ``RequestException``, ``Timeout``) behaves
+    exactly like the synchronous client.
+    
+    Example Usage:
+        async with AsyncAcceldataAPIClient(client, max_concurrency=200) as async_client:
+            data = await async_client.make_api_call('/catalog-server/api/assets?uid=abc')
+    
+    Attributes:
+        client (AcceldataAPIClient): Synchronous client providing configuration
+        max_concurrency (int): Maximum number of in-flight requests
+        logger (logging.Logger): Logger instance for operation tracking
+    """
+    
+    def __init__(self, client: AcceldataAPIClient, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the async API client.
+        
+        Args:
+            client: Configured AcceldataAPIClient to take host, credentials and tenants from
+            max_concurrency: Maximum number of requests in flight at any time
+            logger: Logger instance (defaults to the wrapped client's logger)
+        Raises:
+            ImportError: If aiohttp is not installed
+            ValueError: If max_concurrency is not positive
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for the async engine. "
+                              "Install it with: pip install 'adoc-migration-toolkit[async]'")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.logger = logger or getattr(client, 'logger', None) or logging.getLogger(__name__)
+        self._session = None
+        self._semaphore = None
+    
+    async def __aenter__(self) -> "AsyncAcceldataAPIClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the aiohttp session, creating it on first use.
+        
+        The session must be created inside a running event loop, so it is
+        created lazily rather than in __init__.
+        
+        Returns:
+            Shared aiohttp.ClientSession for this client
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+    
+    async def close(self) -> None:
+        """
+        Close the aiohttp session and release pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            self.logger.info("Async API client session closed")
+        self._session = None
+        self._semaphore = None
+    
+    async def make_api_call(self, endpoint: str, method: str = 'GET', json_payload: Optional[Dict[str, Any]] = None,
+                            use_target_auth: bool = False, use_target_tenant: bool = False, return_binary: bool = False,
+                            files: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None, dont_parse_reponse: bool = False) -> Any:
+        """
+        Make a generic API call with configurable endpoint and method.
+        
+        Accepts the same arguments and returns the same values as
+        AcceldataAPIClient.make_api_call. File uploads are never retried;
+        other requests are retried on 429/502/503/504 and connection errors
+        using HTTP_CONFIG['retry'].
+        
+        Args:
+            endpoint: The API endpoint (e.g., '/catalog-server/api/assets?uid=123')
+            method: HTTP method ('GET', 'PUT', or 'POST')
+            json_payload: JSON payload for PUT/POST requests
+            use_target_auth: Whether to use target access/secret keys instead of source
+            use_target_tenant: Whether to use target tenant instead of source
+            return_binary: If True, return raw response content (for binary data like ZIP files)
+            files: Files to upload for multipart/form-data requests
+            timeout: Request timeout in seconds (default: HTTP_CONFIG['timeout'])
+        
+        Returns:
+            Dictionary containing the API response, or bytes if return_binary is True
+        
+        Raises:
+            ValueError: If required parameters are missing or invalid
+            RequestException: If the API call fails due to network or server errors
+            Timeout: If the request times out
+        """
+        method = method.upper()
+        if method not in ['GET', 'PUT', 'POST']:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        if not endpoint or not endpoint.strip():
+            raise ValueError("Endpoint cannot be empty")
+        
+        if method in ['PUT', 'POST'] and json_payload is None and files is None:
+            raise ValueError(f"JSON payload or files are required for {method} requests")
+        
+        if files and method == 'GET':
+            raise ValueError(f"File uploads only support POST and PUT methods, got {method}")
+        
+        timeout = timeout or HTTP_CONFIG.get('timeout', AcceldataAPIClient.DEFAULT_TIMEOUT)
+        
+        access_key, secret_key = self.client._get_auth_credentials(use_target_auth)
+        tenant = self.client._get_tenant(use_target_tenant)
+        host_url = self.client._build_host_url(use_target_tenant)
+        url = f"{host_url}{endpoint}"
+        headers = self.client._build_request_headers(access_key, secret_key, tenant, files)
+        
+        self.client._log_request_details(method, url, timeout, use_target_auth, use_target_tenant, files)
+        
+        # Same opt-in GET response cache as the sync client
+        cache = get_response_cache() if method == 'GET' and not dont_parse_reponse else None
+        cache_key = ResponseCache.make_key(tenant, host_url, endpoint, return_binary) if cache else None
+        if cache:
+            cached_body = cache.get(cache_key)
+            if cached_body is not None:
+                self.logger.info(f"Served GET {endpoint} from response cache")
+                return cached_body if return_binary else json.loads(cached_body)
+        
+        # Mirror the sync client: uploads use a no-retry path
+        max_retries = 0 if files else HTTP_CONFIG.get('retry', 3)
+        
+        try:
+            response = await self._send_with_retries(method, url, headers, json_payload, files, timeout, max_retries)
+            if method != 'GET' and response.ok:
+                self.client._invalidate_cached_responses(endpoint)
+            if files and dont_parse_reponse:
+                return response
+            response.raise_for_status()
+            if dont_parse_reponse:
+                return response
+            result = self.client._process_response(response, endpoint, method, return_binary)
+            if cache:
+                cache.put(cache_key, endpoint, response.content, get_endpoint_ttl(endpoint))
+            return result
+        
+        except Timeout:
+            self.logger.error(f"Request timed out for {method} {endpoint}")
+            raise
+        except RequestException as e:
+            self.client._log_error_details(e, method, endpoint)
+            if files and "500" in str(e):
+                self.logger.error(f"Server error (500) during file upload to {endpoint}")
+                self.logger.error("This is likely a server-side issue with the file format or server configuration")
+            raise
+    
+    async def _send_with_retries(self, method: str, url: str, headers: Dict[str, str],
+                                 json_payload: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+                                 timeout: int, max_retries: int) -> requests.Response:
+        """
+        Send a request, retrying retryable statuses and connection errors.
+        
+        Uses the same exponential backoff as the sync client's urllib3 Retry
+        (backoff_factor=0.5) and honours a numeric Retry-After header. Outcomes
+        are fed into the shared adaptive concurrency limiter so that throttling
+        seen here also pauses the threaded commands, and vice versa.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            json_payload: JSON payload for PUT/POST
+            files: Files for multipart upload
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries
+            
+        Returns:
+            HTTP response converted to requests.Response
+            
+        Raises:
+            Timeout: If the request times out
+            ConnectionError: If the connection fails after all retries
+        """
+        limiter = get_concurrency_limiter()
+        if limiter is not None and limiter.pause_remaining() > 0:
+            await asyncio.sleep(limiter.pause_remaining())
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                response = await self._send(method, url, headers, json_payload, files, timeout)
+            except asyncio.TimeoutError:
+                if limiter is not None:
+                    limiter.observe(time.monotonic() - started, timed_out=True)
+                raise Timeout(f"Request to {url} timed out after {timeout}s")
+            except aiohttp.ClientError as e:
+                if attempt >= max_retries:
+                    raise ConnectionError(f"Connection error for {method} {url}: {e}")
+                response = None
+            
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            if limiter is not None and response is not None:
+                limiter.observe(time.monotonic() - started, response.status_code, retry_after)
+            
+            if response is not None and (response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries):
+                return response
+            
+            delay = 0.5 * (2 ** attempt)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            if limiter is not None:
+                delay = max(delay, limiter.pause_remaining())
+            attempt += 1
+            self.logger.info(f"Retrying {method} {url} in {delay:.1f}s (attempt {attempt}/{max_retries})")
+            await asyncio.sleep(delay)
+    
+    async def _send(self, method: str, url: str, headers: Dict[str, str],
+                    json_payload: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+                    timeout: int) -> requests.Response:
+        """
+        Send a single request through the shared aiohttp session.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            json_payload: JSON payload for PUT/POST
+            files: Files for multipart upload
+            timeout: Request timeout in seconds
+            
+        Returns:
+            HTTP response converted to requests.Response
+        """
+        session = self._get_session()
+        request_kwargs = {
+            'headers': headers,
+            'timeout': aiohttp.ClientTimeout(total=timeout),
+            'proxy': HTTP_CONFIG.get('proxy') or None
+        }
+        if files:
+            request_kwargs['data'] = self._build_form_data(files)
+        elif json_payload is not None and method != 'GET':
+            request_kwargs['data'] = json.dumps(json_payload)
+        
+        async with self._semaphore:
+            async with session.request(method, url, **request_kwargs) as aio_response:
+                content = await aio_response.read()
+                return self._build_response(aio_response, content, url)
+    
+    @staticmethod
+    def _build_form_data(files: Dict[str, Any]) -> "aiohttp.FormData":
+        """
+        Convert a requests-style ``files`` mapping into aiohttp form data.
+        
+        Args:
+            files: Mapping of field name to (filename, content[, content_type]) or content
+            
+        Returns:
+            aiohttp.FormData for a multipart/form-data request
+        """
+        form = aiohttp.FormData()
+        for field_name, value in files.items():
+            if isinstance(value, tuple):
+                filename = value[0]
+                content = value[1]
+                content_type = value[2] if len(value) > 2 else 'application/octet-stream'
+                form.add_field(field_name, content, filename=filename, content_type=content_type)
+            else:
+                form.add_field(field_name, value, filename=field_name)
+        return form
+    
+    @staticmethod
+    def _build_response(aio_response: "aiohttp.ClientResponse", content: bytes, url: str) -> requests.Response:
+        """
+        Convert an aiohttp response into a requests.Response.
+        
+        Args:
+            aio_response: The aiohttp response
+            content: Response body that has already been read
+            url: Request URL
+            
+        Returns:
+            Populated requests.Response
+        """
+        response = requests.Response()
+        response.status_code = aio_response.status
+        response.reason = aio_response.reason
+        response.headers = CaseInsensitiveDict(aio_response.headers)
+        response.url = url
+        response.encoding = aio_response.charset
+        response._content = content
+        return response
+
+
 def create_api_client(env_file: Optional[str] = None, 
                      host: Optional[str] = None, 
                      access_key: Optional[str] = None,
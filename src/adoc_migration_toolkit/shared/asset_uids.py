@@ -0,0 +1,73 @@
+"""
+Asset UID scanning for policy documents.
+
+policy-xfr collects every asset UID referenced by a policy export: any
+non-blank string in a field whose name contains ``uid`` (``uid``,
+``parentAssetUid``, ``assetUid``, ``backingAssetUid``, ...) or in
+``backingAssetId``.
+
+``scan_asset_uids`` walks a document with an explicit stack, so deeply
+nested exports cannot hit the recursion limit. Field names are classified
+once and cached, and JSON paths for log messages are only built when debug
+logging is enabled. Callers get aggregate counts instead of a log line per
+UID.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Set
+
+# Fields holding an asset UID in addition to those with "uid" in their name
+EXTRA_UID_KEYS = frozenset(['backingAssetId'])
+
+
+class UidScanResult(NamedTuple):
+    """Aggregate counts of a UID scan."""
+    nodes: int        # Values visited
+    uid_fields: int   # Fields holding a UID
+
+
+@lru_cache(maxsize=4096)
+def is_uid_key(key: str) -> bool:
+    """Check whether a field holds an asset UID; the answer is cached per field name."""
+    return 'uid' in key.lower() or key in EXTRA_UID_KEYS
+
+
+def scan_asset_uids(obj: Any, asset_uids: Set[str], logger: Optional[logging.Logger] = None) -> UidScanResult:
+    """Add every asset UID in a document to a set.
+
+    Args:
+        obj: Parsed JSON document or part of one
+        asset_uids: Set to add the UIDs to
+        logger: Logger for per-UID debug messages (paths are only built at debug level)
+
+    Returns:
+        UidScanResult with the number of values visited and UID fields found
+    """
+    debug = logger is not None and logger.isEnabledFor(logging.DEBUG)
+    nodes = 1
+    uid_fields = 0
+    # Each entry is (container, JSON path or None when not debugging)
+    stack = [(obj, '' if debug else None)]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict):
+            nodes += len(node)
+            for key, value in node.items():
+                if isinstance(value, str):
+                    if is_uid_key(key):
+                        uid = value.strip()
+                        if uid:
+                            asset_uids.add(uid)
+                            uid_fields += 1
+                            if debug:
+                                logger.debug(f"Found asset UID at {path}.{key}: {uid}" if path
+                                             else f"Found asset UID at {key}: {uid}")
+                elif isinstance(value, (dict, list)):
+                    stack.append((value, (f"{path}.{key}" if path else key) if debug else None))
+        elif isinstance(node, list):
+            nodes += len(node)
+            for index, item in enumerate(node):
+                if isinstance(item, (dict, list)):
+                    stack.append((item, f"{path}[{index}]" if debug else None))
+    return UidScanResult(nodes, uid_fields)
@@ -0,0 +1,289 @@
+"""
+Adaptive concurrency control for API requests.
+
+This module provides an AIMD (additive increase, multiplicative decrease)
+concurrency limiter shared by every command that talks to the Acceldata API.
+Instead of letting each worker thread fire requests as fast as it can, the
+limiter caps the number of requests in flight across the whole process and
+adjusts that cap from what the server tells us:
+
+- The limit grows by roughly one request per round trip while latency is stable.
+- The limit is halved when the server throttles (429/502/503/504), when a
+  request times out, or when recent latency climbs well above its long-term
+  average.
+- A Retry-After header pauses every caller, not just the one that got it.
+"""
+
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from adoc_migration_toolkit.shared.globals import HTTP_CONFIG
+
+# Status codes that signal the server is overloaded or throttling us
+THROTTLE_STATUS_CODES = [429, 502, 503, 504]
+
+# Starting and minimum number of requests in flight
+DEFAULT_INITIAL_LIMIT = 16
+DEFAULT_MIN_LIMIT = 1
+
+# Upper bound for a single Retry-After pause, in seconds
+MAX_RETRY_AFTER = 600
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), MAX_RETRY_AFTER)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return min(max(0.0, retry_at.timestamp() - time.time()), MAX_RETRY_AFTER)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe AIMD limiter for in-flight API requests.
+
+    Callers wrap each request in ``with limiter.slot() as slot:`` and report
+    the outcome with ``slot.complete(status_code, retry_after)``. ``slot()``
+    blocks while the process is at its limit or paused by Retry-After.
+    """
+
+    def __init__(self, initial_limit: int = DEFAULT_INITIAL_LIMIT, min_limit: int = DEFAULT_MIN_LIMIT,
+                 max_limit: int = 64, backoff_ratio: float = 0.5, latency_tolerance: float = 2.0,
+                 backoff_factor: float = 0.5, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Number of requests allowed in flight at start
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            backoff_ratio: Multiplier applied to the limit on a congestion signal
+            latency_tolerance: Recent/long-term latency ratio treated as congestion
+            backoff_factor: Base pause in seconds after throttling without Retry-After
+            logger: Logger instance for logging limit changes
+
+        Raises:
+            ValueError: If the limits are inconsistent
+        """
+        if min_limit <= 0 or max_limit < min_limit:
+            raise ValueError(f"Invalid concurrency limits: min={min_limit}, max={max_limit}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.backoff_factor = backoff_factor
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._consecutive_throttles = 0
+        # Short- and long-term exponentially weighted latency averages
+        self._short_latency = None
+        self._long_latency = None
+        self._samples = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    def pause_remaining(self) -> float:
+        """Seconds left on the current Retry-After pause (0 if not paused)."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._condition:
+            while True:
+                pause = self.pause_remaining()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self._in_flight >= int(self._limit):
+                    self._condition.wait()
+                else:
+                    self._in_flight += 1
+                    return
+
+    def release(self, latency: Optional[float] = None, status_code: Optional[int] = None,
+                retry_after: Optional[str] = None, timed_out: bool = False) -> None:
+        """
+        Release a slot and feed the request outcome back into the limit.
+
+        Args:
+            latency: Request latency in seconds
+            status_code: HTTP status code, if a response was received
+            retry_after: Retry-After header value, if any
+            timed_out: Whether the request timed out
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._observe(latency, status_code, retry_after, timed_out)
+            self._condition.notify_all()
+
+    def observe(self, latency: Optional[float] = None, status_code: Optional[int] = None,
+                retry_after: Optional[str] = None, timed_out: bool = False) -> None:
+        """
+        Feed a request outcome into the limit without holding a slot.
+
+        Used by the asyncio engine, which bounds its own concurrency but
+        should still honour and contribute to the shared backpressure.
+
+        Args:
+            latency: Request latency in seconds
+            status_code: HTTP status code, if a response was received
+            retry_after: Retry-After header value, if any
+            timed_out: Whether the request timed out
+        """
+        with self._condition:
+            self._observe(latency, status_code, retry_after, timed_out)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        Context manager that holds a slot for one request.
+
+        Yields:
+            _Slot used to report the response; exceptions are reported automatically
+        """
+        self.acquire()
+        slot = _Slot()
+        try:
+            yield slot
+        except Exception as e:
+            timed_out = slot.timed_out or type(e).__name__ in ('Timeout', 'ReadTimeout', 'ConnectTimeout',
+                                                               'TimeoutError')
+            self.release(slot.elapsed(), slot.status_code, slot.retry_after, timed_out=timed_out)
+            raise
+        else:
+            self.release(slot.elapsed(), slot.status_code, slot.retry_after)
+
+    def _observe(self, latency: Optional[float], status_code: Optional[int],
+                 retry_after: Optional[str], timed_out: bool) -> None:
+        """Update latency averages and the limit. Caller holds the condition lock."""
+        now = time.monotonic()
+        throttled = status_code in THROTTLE_STATUS_CODES
+
+        if throttled:
+            self._consecutive_throttles += 1
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                # Exponential pause with jitter so callers do not retry in lockstep
+                delay = self.backoff_factor * (2 ** min(self._consecutive_throttles - 1, 6))
+                delay *= random.uniform(0.5, 1.0)
+            self._paused_until = max(self._paused_until, now + delay)
+            self._decrease(now, f"HTTP {status_code}, pausing {delay:.1f}s")
+            return
+
+        if timed_out:
+            self._decrease(now, "request timed out")
+            return
+
+        if status_code is not None:
+            self._consecutive_throttles = 0
+
+        if latency is None:
+            return
+        self._samples += 1
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency
+        else:
+            self._short_latency += 0.2 * (latency - self._short_latency)
+            self._long_latency += 0.02 * (latency - self._long_latency)
+
+        # Wait for a few samples before trusting the latency trend
+        if self._samples >= 20 and self._short_latency > self._long_latency * self.latency_tolerance:
+            self._decrease(now, f"latency rising ({self._short_latency:.2f}s vs {self._long_latency:.2f}s)")
+        elif self._limit < self.max_limit:
+            # Additive increase: about one extra request per round trip at the current limit
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def _decrease(self, now: float, reason: str) -> None:
+        """Multiplicative decrease, at most once per round trip."""
+        cooldown = self._short_latency or 0.1
+        if now - self._last_decrease < cooldown:
+            return
+        old_limit = int(self._limit)
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        self._last_decrease = now
+        self.logger.info(f"Reducing API concurrency from {old_limit} to {int(self._limit)}: {reason}")
+
+
+class _Slot:
+    """Outcome of a single request held by AdaptiveConcurrencyLimiter.slot()."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.status_code = None
+        self.retry_after = None
+        # Set by callers whose timeouts are not raised as a Timeout exception
+        self.timed_out = False
+
+    def complete(self, status_code: Optional[int], retry_after: Optional[str] = None) -> None:
+        """Record the response status and Retry-After header."""
+        self.status_code = status_code if isinstance(status_code, int) else None
+        self.retry_after = retry_after if isinstance(retry_after, str) else None
+
+    def elapsed(self) -> float:
+        """Seconds since the slot was acquired."""
+        return time.monotonic() - self.started
+
+
+_LIMITER: Optional[AdaptiveConcurrencyLimiter] = None
+_LIMITER_LOCK = threading.Lock()
+
+
+def get_concurrency_limiter() -> Optional[AdaptiveConcurrencyLimiter]:
+    """
+    Get the process-wide concurrency limiter.
+
+    Returns:
+        AdaptiveConcurrencyLimiter, or None if HTTP_CONFIG['adaptive_concurrency'] is off
+    """
+    global _LIMITER
+    if not HTTP_CONFIG.get('adaptive_concurrency', True):
+        return None
+    with _LIMITER_LOCK:
+        if _LIMITER is None:
+            max_limit = max(DEFAULT_MIN_LIMIT, HTTP_CONFIG.get('max_in_flight', 64))
+            _LIMITER = AdaptiveConcurrencyLimiter(
+                initial_limit=min(DEFAULT_INITIAL_LIMIT, max_limit),
+                max_limit=max_limit
+            )
+        return _LIMITER
+
+
+def reset_concurrency_limiter() -> None:
+    """Discard the process-wide limiter so the next request picks up HTTP_CONFIG changes."""
+    global _LIMITER
+    with _LIMITER_LOCK:
+        _LIMITER = None
@@ -6,9 +6,12 @@ and file operations used across the adoc migration toolkit.
 """
 
 import csv
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, List, Optional
 
 # Import the globals module to access the global variable dynamically
 from . import globals
@@ -56,4 +59,116 @@ def get_output_file_path(csv_file: str, default_filename: str, custom_output_fil
     # Generate output file path
     output_file = output_dir / default_filename
     
-    return output_file 
\ No newline at end of file
+    return output_file
+
+
+# Markers passed through the queue of a BatchedOutputWriter
+_FLUSH = object()
+_STOP = object()
+
+
+class BatchedOutputWriter:
+    """Funnels output of many worker threads through a single writer thread.
+
+    Parallel exporters used to have every worker take a lock, write its row
+    and flush the file for each asset, so workers queued up behind each other
+    and every row cost a flush. Workers now ``put`` items on a bounded queue
+    and return to their API calls. The writer thread collects items into
+    batches and hands each batch to ``write_batch``, which writes and flushes
+    them. A batch is written once it holds ``batch_size`` items or its first
+    item has waited ``flush_interval`` seconds, whichever comes first.
+
+    ``put`` blocks while the queue is full, so a slow disk throttles the
+    workers instead of growing memory. If ``write_batch`` raises, the error
+    is raised again by the next ``put``, ``flush`` or ``close``.
+    """
+
+    def __init__(self, write_batch: Callable[[List[Any]], None], max_queue: int = 10000,
+                 batch_size: int = 1000, flush_interval: float = 1.0, name: str = "output-writer"):
+        """Start the writer thread.
+
+        Args:
+            write_batch: Called from the writer thread with a list of items to write and flush
+            max_queue: Maximum number of items waiting to be written
+            batch_size: Items written at most per batch
+            flush_interval: Seconds an item may wait before its batch is written
+            name: Name of the writer thread
+        """
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        # Daemon thread, so a command that fails without closing the writer cannot hang the process
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def put(self, item: Any) -> None:
+        """Queue an item for writing, waiting while the queue is full.
+
+        Raises:
+            ValueError: If the writer is closed
+        """
+        if self._closed:
+            raise ValueError("Output writer is closed")
+        self._raise_error()
+        self._queue.put(item)
+
+    def flush(self) -> None:
+        """Wait until every item queued so far has been written."""
+        if not self._closed:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write the remaining items and stop the writer thread."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def _write(self, batch: List[Any]) -> None:
+        if batch and self._error is None:
+            try:
+                self.write_batch(batch)
+            except BaseException as e:
+                # Keep draining the queue so blocked workers are released
+                self._error = e
+
+    def _run(self) -> None:
+        batch: List[Any] = []
+        taken = 0
+        deadline = 0.0
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()) if batch else None)
+            except queue.Empty:
+                item = _FLUSH  # The oldest item has waited long enough
+            else:
+                taken += 1
+            if item is not _FLUSH and item is not _STOP:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            self._write(batch)
+            batch = []
+            for _ in range(taken):
+                self._queue.task_done()
+            taken = 0
+            if item is _STOP:
+                return
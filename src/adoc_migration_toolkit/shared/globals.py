@@ -13,11 +13,18 @@ from typing import Optional
 # Global variable to store the output directory
 GLOBAL_OUTPUT_DIR: Optional[Path] = None
 
-# Global HTTP config for timeout, retry, and proxy
+# Global HTTP config for timeout, retry, proxy and connection pooling
 HTTP_CONFIG = {
     'timeout': 300,   # seconds
     'retry': 3,     # number of retries
-    'proxy': None   # proxy URL or None
+    'proxy': None,   # proxy URL or None
+    'pool_connections': 10,   # number of host pools cached per shared adapter
+    'pool_maxsize': 32,   # connections kept alive per host, shared by all worker threads
+    'adaptive_concurrency': True,   # AIMD backpressure on 429/502/503/504 and rising latency
+    'max_in_flight': 64,   # upper bound for the adaptive in-flight request limit
+    'response_cache': False,   # cache idempotent GET responses on disk (opt-in)
+    'response_cache_ttl': 3600,   # default time-to-live for cached responses, in seconds
+    'response_cache_max_mb': 512   # size limit of the response cache before LRU eviction
 }
 
 
@@ -0,0 +1,172 @@
+"""
+Incremental reading and writing of large JSON arrays.
+
+Policy definition exports are JSON arrays with one object per policy and can
+reach several gigabytes. Loading such a file with ``json.load`` and building
+a transformed copy needs about three times its size in memory.
+``iter_json_array`` instead decodes one array item at a time from a text
+stream, and ``write_json_array`` writes items as they are produced, so
+memory use is bounded by the largest single policy.
+
+Files below ``STREAMING_THRESHOLD`` bytes are faster to load in one go and
+keep using ``json.load``.
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Iterable, Iterator, TextIO
+
+# Files at least this large are processed one array item at a time
+STREAMING_THRESHOLD = 64 * 1024 * 1024
+
+# Characters read from the stream at a time
+READ_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+def detect_encoding(stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE) -> str:
+    """Detect whether a seekable binary stream is UTF-8, leaving it at the start.
+
+    Exports that are not valid UTF-8 are read as latin-1, which can decode any
+    byte sequence, the same fallback used when a document is loaded whole.
+
+    Args:
+        stream: Binary stream positioned at the start of the document
+        chunk_size: Number of bytes read at a time
+
+    Returns:
+        'utf-8' if the whole stream decodes as UTF-8, otherwise 'latin-1'
+    """
+    start = stream.tell()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        while True:
+            chunk = stream.read(chunk_size)
+            decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+    finally:
+        stream.seek(start)
+
+
+def is_json_array(stream: TextIO) -> bool:
+    """Check whether a seekable text stream holds a JSON array, leaving it at the start.
+
+    Args:
+        stream: Text stream positioned at the start of the document
+
+    Returns:
+        True if the first non-whitespace character is '['
+    """
+    start = stream.tell()
+    try:
+        while True:
+            chunk = stream.read(4096)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip(_WHITESPACE + '\ufeff')
+            if stripped:
+                return stripped[0] == '['
+    finally:
+        stream.seek(start)
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array one at a time.
+
+    Args:
+        stream: Text stream holding a JSON array
+        chunk_size: Number of characters to read at a time
+
+    Yields:
+        Decoded array items in order
+
+    Raises:
+        json.JSONDecodeError: If the document is not a valid JSON array
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def read_more(size: int) -> None:
+        nonlocal buffer, pos, eof
+        chunk = stream.read(size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            read_more(chunk_size)
+
+    read_more(chunk_size)
+    if buffer.startswith('\ufeff'):
+        pos = 1
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != '[':
+        raise json.JSONDecodeError("Expected a JSON array", buffer, pos)
+    pos += 1
+
+    expect_item = True
+    first = True
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+        char = buffer[pos]
+        if char == ']' and (first or not expect_item):
+            return
+        if not expect_item:
+            if char != ',':
+                raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos)
+            pos += 1
+            expect_item = True
+            continue
+
+        # Decode the next item, reading more until it is complete. A value that
+        # ends exactly at the end of the buffer (e.g. a number) may continue.
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            # Grow reads with the buffer so a very large item is decoded in linear time
+            read_more(max(chunk_size, len(buffer)))
+        pos = end
+        expect_item = False
+        first = False
+        yield item
+
+
+def write_json_array(items: Iterable[Any], stream: TextIO) -> int:
+    """Write items as a compact JSON array, one item at a time.
+
+    Args:
+        items: Items to write
+        stream: Text stream to write to
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    stream.write('[')
+    for item in items:
+        if count:
+            stream.write(',')
+        stream.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')))
+        count += 1
+    stream.write(']')
+    return count
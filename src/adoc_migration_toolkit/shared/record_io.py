@@ -0,0 +1,202 @@
+"""
+Record files for export and import artefacts.
+
+asset-profile-export, asset-config-export and segments-export write one
+record per asset, with whole JSON documents in some columns. The default
+format is CSV with every cell quoted, so each JSON document is escaped into
+a single cell and readers need ``csv.field_size_limit(sys.maxsize)``.
+
+JSON Lines (``--format jsonl``) writes one JSON object per line instead,
+keyed by the same column names, with the JSON columns embedded as objects.
+Nothing is escaped twice, a reader parses each document exactly once, and
+since every record is a single line, appending and streaming are safe.
+
+Readers detect the format from the file content, so imports accept either
+format whatever the file is called.
+"""
+
+import csv
+import io
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+FORMAT_CSV = 'csv'
+FORMAT_JSONL = 'jsonl'
+RECORD_FORMATS = (FORMAT_CSV, FORMAT_JSONL)
+
+# Bytes read to detect the format of a file
+_DETECT_SIZE = 4096
+
+
+def record_file_path(path, record_format: str) -> Path:
+    """Get the path of a record file for a format, e.g. export.csv -> export.jsonl.
+
+    Args:
+        path: Path of the file in CSV format
+        record_format: FORMAT_CSV or FORMAT_JSONL
+
+    Returns:
+        The path with the suffix of the format
+    """
+    path = Path(path)
+    if record_format == FORMAT_JSONL and path.suffix.lower() == '.csv':
+        return path.with_suffix('.jsonl')
+    return path
+
+
+def resolve_record_file(path) -> Path:
+    """Find an input record file, falling back to its JSON Lines counterpart.
+
+    Args:
+        path: Expected path, usually the default CSV file of a command
+
+    Returns:
+        The path itself if it exists, else the .jsonl file next to it if that
+        exists, else the path unchanged
+    """
+    path = Path(path)
+    if not path.exists():
+        jsonl_path = record_file_path(path, FORMAT_JSONL)
+        if jsonl_path != path and jsonl_path.exists():
+            return jsonl_path
+    return path
+
+
+def detect_record_format(path) -> str:
+    """Detect whether a record file holds CSV or JSON Lines.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        FORMAT_JSONL if the first non-blank character is '{', else FORMAT_CSV
+    """
+    with open(path, 'rb') as f:
+        start = f.read(_DETECT_SIZE).lstrip(b'\xef\xbb\xbf \t\r\n')
+    return FORMAT_JSONL if start.startswith(b'{') else FORMAT_CSV
+
+
+class RecordWriter:
+    """Writes records as quoted CSV or as JSON Lines.
+
+    Rows are sequences aligned with ``columns``. Values of ``json_columns``
+    are parsed JSON values: CSV serializes them into their cell, JSON Lines
+    embeds them as they are.
+    """
+
+    def __init__(self, stream: TextIO, columns: Sequence[str], json_columns: Iterable[str] = (),
+                 record_format: str = FORMAT_CSV, json_separators: Tuple[str, str] = (',', ':')):
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream opened with newline=''
+            columns: Column names, in row order
+            json_columns: Columns holding JSON documents
+            record_format: FORMAT_CSV or FORMAT_JSONL
+            json_separators: Separators for JSON documents in CSV cells
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if record_format not in RECORD_FORMATS:
+            raise ValueError(f"Unknown record format: {record_format}. Use one of: {', '.join(RECORD_FORMATS)}")
+        self.stream = stream
+        self.columns = list(columns)
+        self.record_format = record_format
+        self.json_separators = json_separators
+        self._json_indexes = [index for index, column in enumerate(self.columns) if column in set(json_columns)]
+
+    def write_header(self) -> None:
+        """Write the header row; JSON Lines records carry their column names instead."""
+        if self.record_format == FORMAT_CSV:
+            csv.writer(self.stream, quoting=csv.QUOTE_ALL).writerow(self.columns)
+
+    def encode(self, row: Sequence[Any]) -> str:
+        """Encode one record, including its line terminator."""
+        if self.record_format == FORMAT_JSONL:
+            return json.dumps(dict(zip(self.columns, row)), ensure_ascii=False, separators=(',', ':')) + '\n'
+        values = list(row)
+        for index in self._json_indexes:
+            values[index] = json.dumps(values[index], ensure_ascii=False, separators=self.json_separators)
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_ALL).writerow(values)
+        return buffer.getvalue()
+
+    def write(self, row: Sequence[Any]) -> None:
+        """Write one record."""
+        self.stream.write(self.encode(row))
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Write every record of an iterable."""
+        for row in rows:
+            self.write(row)
+
+
+class RecordReader:
+    """Iterates over the rows of a CSV or JSON Lines record file.
+
+    Rows are lists aligned with ``header``. In CSV files every value is a
+    string; in JSON Lines files the JSON columns are already parsed. Use
+    ``json()`` and ``text()`` to read JSON columns the same way in both.
+    """
+
+    def __init__(self, stream: TextIO, record_format: str):
+        """Initialize the reader and read the header.
+
+        Args:
+            stream: Text stream opened with newline=''
+            record_format: FORMAT_CSV or FORMAT_JSONL
+        """
+        self.record_format = record_format
+        self._first: Optional[dict] = None
+        if record_format == FORMAT_JSONL:
+            self._lines = (line for line in stream if line.strip())
+            first_line = next(self._lines, None)
+            self._first = json.loads(first_line) if first_line is not None else None
+            self.header = list(self._first) if self._first is not None else []
+        else:
+            self._reader = csv.reader(stream)
+            self.header = next(self._reader, [])
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        if self.record_format == FORMAT_CSV:
+            yield from self._reader
+            return
+        if self._first is not None:
+            yield self._row(self._first)
+        for line in self._lines:
+            yield self._row(json.loads(line))
+
+    def _row(self, record: dict) -> List[Any]:
+        return [record.get(column, '') for column in self.header]
+
+    def json(self, value: Any) -> Any:
+        """Get the parsed value of a JSON column."""
+        return json.loads(value) if self.record_format == FORMAT_CSV else value
+
+    def text(self, value: Any) -> str:
+        """Get a JSON column as JSON text."""
+        if self.record_format == FORMAT_CSV:
+            return value
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+@contextmanager
+def open_records(path) -> Iterator[RecordReader]:
+    """Open a record file for reading, detecting its format.
+
+    Args:
+        path: Path of a CSV or JSON Lines file
+
+    Yields:
+        RecordReader over the file
+    """
+    record_format = detect_record_format(path)
+    if record_format == FORMAT_CSV:
+        # Needed for JSON cells above the default 128 KB field limit
+        csv.field_size_limit(sys.maxsize)
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        yield RecordReader(f, record_format)
@@ -0,0 +1,311 @@
+"""
+Persistent response cache for idempotent GET requests.
+
+Rerunning an export or verification after a partial failure used to fetch
+every asset, rule and configuration again. When enabled with
+``set-http-config --response-cache on``, AcceldataAPIClient keeps successful
+GET responses in a SQLite file under the output directory
+(``<output-dir>/cache/http-cache.sqlite3``) so reruns and dry runs only call
+the API for what is missing or expired.
+
+- Entries are keyed by tenant, host and endpoint (including the query string).
+- Each endpoint family has its own time-to-live (see ``ENDPOINT_TTLS``).
+- The file is bounded by ``HTTP_CONFIG['response_cache_max_mb']``; the least
+  recently used entries are evicted first.
+- A successful PUT or POST drops cached responses for the resource it
+  changed, so a verification run after an import never sees stale data.
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+from adoc_migration_toolkit.shared import globals
+from adoc_migration_toolkit.shared.globals import HTTP_CONFIG
+
+# Time-to-live in seconds per endpoint prefix; the first matching prefix wins.
+# A TTL of 0 disables caching for that prefix.
+ENDPOINT_TTLS = [
+    ('/catalog-server/api/assets?uid=', 24 * 60 * 60),       # UID to asset lookups rarely change
+    ('/catalog-server/api/assets/search', 24 * 60 * 60),
+    ('/catalog-server/api/rules?', 60 * 60),                 # Policy list pages
+    ('/catalog-server/api/rules/export', 0),                 # Export jobs return fresh ZIPs
+    ('/api/notifications/', 60 * 60),
+]
+
+# Fraction of the size limit to shrink to when evicting, so eviction does not run on every insert
+EVICTION_TARGET = 0.9
+
+CACHE_FILE_NAME = "http-cache.sqlite3"
+
+
+def get_endpoint_ttl(endpoint: str) -> int:
+    """
+    Get the time-to-live for an endpoint.
+
+    Args:
+        endpoint: API endpoint including the query string
+
+    Returns:
+        TTL in seconds (0 means the endpoint is not cached)
+    """
+    for prefix, ttl in ENDPOINT_TTLS:
+        if endpoint.startswith(prefix):
+            return ttl
+    return HTTP_CONFIG.get('response_cache_ttl', 3600)
+
+
+def get_resource_root(endpoint: str) -> str:
+    """
+    Get the resource path a write to an endpoint can affect.
+
+    The root runs up to and including the first numeric ID segment
+    (``/catalog-server/api/assets/123/config`` -> ``/catalog-server/api/assets/123``),
+    or is the service collection for endpoints without an ID
+    (``/catalog-server/api/rules/import/...`` -> ``/catalog-server/api/rules``).
+
+    Args:
+        endpoint: API endpoint that was written to
+
+    Returns:
+        Path prefix of cached GET responses to invalidate
+    """
+    segments = [s for s in urlsplit(endpoint).path.split('/') if s]
+    for index, segment in enumerate(segments):
+        if segment.isdigit():
+            return '/' + '/'.join(segments[:index + 1])
+    return '/' + '/'.join(segments[:3])
+
+
+class ResponseCache:
+    """
+    SQLite-backed GET response cache with per-entry expiry and LRU eviction.
+
+    Safe to use from multiple threads; each thread gets its own connection.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cache and create the database file if needed.
+
+        Args:
+            path: Path to the SQLite file
+            max_bytes: Upper bound for the total size of cached bodies
+            logger: Logger instance
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_endpoint ON responses (endpoint)")
+        self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(tenant: str, host_url: str, endpoint: str, binary: bool = False) -> str:
+        """Build the cache key for a request."""
+        return f"{tenant}|{host_url}|{'bin' if binary else 'json'}|{endpoint}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached response body.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Response body, or None if missing or expired
+        """
+        now = time.time()
+        try:
+            conn = self._connection()
+            row = conn.execute("SELECT body, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                with self._lock:
+                    self.misses += 1
+                return None
+            with conn:
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache read failed: {e}")
+            return None
+        with self._lock:
+            self.hits += 1
+        return row[0]
+
+    def put(self, key: str, endpoint: str, body: bytes, ttl: int) -> None:
+        """
+        Store a response body.
+
+        Args:
+            key: Cache key from make_key()
+            endpoint: API endpoint, used for invalidation
+            body: Raw response body
+            ttl: Time-to-live in seconds
+        """
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            conn = self._connection()
+            with conn:
+                old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, body, size, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, sqlite3.Binary(body), len(body), now + ttl, now)
+                )
+            with self._lock:
+                self._total_bytes += len(body) - (old[0] if old else 0)
+                over_limit = self._total_bytes > self.max_bytes
+            if over_limit:
+                self.evict()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache write failed: {e}")
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Drop cached responses for the resource an endpoint belongs to.
+
+        Args:
+            endpoint: Endpoint that was written to
+
+        Returns:
+            Number of entries removed
+        """
+        root = get_resource_root(endpoint)
+        try:
+            conn = self._connection()
+            with conn:
+                removed = conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ? OR endpoint LIKE ? ESCAPE '\\' OR endpoint LIKE ? ESCAPE '\\'",
+                    (root, _like_prefix(root + '/'), _like_prefix(root + '?'))
+                ).rowcount
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache invalidation failed: {e}")
+            return 0
+        if removed:
+            self._resync_size()
+            self.logger.debug(f"Invalidated {removed} cached responses under {root}")
+        return removed
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used ones until under the size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        target = int(self.max_bytes * EVICTION_TARGET)
+        conn = self._connection()
+        with self._lock, conn:
+            removed = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > target:
+                freed = 0
+                victims = []
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+                    if total - freed <= target:
+                        break
+                    victims.append((key,))
+                    freed += size
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                removed += len(victims)
+                total -= freed
+            self._total_bytes = total
+        self.logger.debug(f"Evicted {removed} cached responses, {total} bytes remain")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        conn = self._connection()
+        with self._lock, conn:
+            conn.execute("DELETE FROM responses")
+            self._total_bytes = 0
+
+    def _resync_size(self) -> None:
+        """Re-read the total body size (other processes may share the file)."""
+        total = self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        with self._lock:
+            self._total_bytes = total
+
+    def stats(self) -> Tuple[int, int]:
+        """Get (entries, bytes) currently stored."""
+        return self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _like_prefix(prefix: str) -> str:
+    """Build a LIKE pattern matching strings that start with prefix."""
+    return prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def get_response_cache_path() -> Path:
+    """Get the cache file location: the output directory if set, else the user config directory."""
+    if globals.GLOBAL_OUTPUT_DIR:
+        return Path(globals.GLOBAL_OUTPUT_DIR) / "cache" / CACHE_FILE_NAME
+    return Path.home() / ".adoc_migration_toolkit" / "cache" / CACHE_FILE_NAME
+
+
+_CACHE: Optional[ResponseCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache.
+
+    Returns:
+        ResponseCache, or None if HTTP_CONFIG['response_cache'] is off or the file cannot be opened
+    """
+    global _CACHE
+    if not HTTP_CONFIG.get('response_cache', False):
+        return None
+    path = get_response_cache_path()
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.path != path:
+            max_bytes = max(1, HTTP_CONFIG.get('response_cache_max_mb', 512)) * 1024 * 1024
+            try:
+                _CACHE = ResponseCache(path, max_bytes)
+            except (OSError, sqlite3.Error) as e:
+                logging.getLogger(__name__).warning(f"Response cache disabled, cannot open {path}: {e}")
+                return None
+        return _CACHE
+
+
+def reset_response_cache() -> None:
+    """Discard the process-wide cache so the next request picks up HTTP_CONFIG changes."""
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = None
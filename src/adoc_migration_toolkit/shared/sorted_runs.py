@@ -0,0 +1,132 @@
+"""
+External merge sort for large CSV exports.
+
+asset-list-export-parallel used to concatenate the pages of every thread,
+read the whole result back and sort it in memory, which takes several
+gigabytes for a tenant with a million assets. Workers now feed their rows to
+a ``SortedRunWriter`` instead. It keeps at most ``max_rows`` rows in memory,
+then sorts them and spills them to a temporary CSV file (a sorted run).
+``merge_sorted_runs`` streams all runs through a k-way merge, so the final
+file is written in a single pass and memory use no longer grows with the
+size of the export.
+
+The merge is stable: rows with equal keys come out in the order of the runs
+they were read from, and in the order they were added within a run.
+"""
+
+import csv
+import heapq
+import os
+import tempfile
+from contextlib import ExitStack
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+# Rows kept in memory by a writer before they are spilled as a run
+DEFAULT_RUN_ROWS = 50000
+
+# Runs merged at once; more runs are first merged in batches
+MAX_OPEN_RUNS = 128
+
+Row = List[str]
+
+
+def _write_run(rows: Iterable[Row], directory: Optional[str] = None) -> str:
+    """Write rows to a new temporary run file and return its path."""
+    fd, path = tempfile.mkstemp(suffix='.run.csv', dir=directory)
+    with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f, quoting=csv.QUOTE_ALL).writerows(rows)
+    return path
+
+
+def remove_runs(runs: Iterable[str]) -> None:
+    """Delete run files, ignoring files that are already gone."""
+    for path in runs:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class SortedRunWriter:
+    """Collects rows and spills them to disk as sorted runs.
+
+    Values are stored as CSV text, so they are converted to strings the way
+    csv.writer converts them (None becomes ''). The sort key is applied to
+    these string rows, both here and in merge_sorted_runs.
+    """
+
+    def __init__(self, key: Callable[[Row], Any], max_rows: int = DEFAULT_RUN_ROWS,
+                 directory: Optional[str] = None):
+        """Initialize the writer.
+
+        Args:
+            key: Sort key for a row of strings
+            max_rows: Rows to keep in memory before spilling a run
+            directory: Directory for run files (system temp directory by default)
+        """
+        self.key = key
+        self.max_rows = max_rows
+        self.directory = directory
+        self.runs: List[str] = []
+        self._rows: List[Row] = []
+
+    def add(self, row: Sequence[Any]) -> None:
+        """Add a row, spilling a run once max_rows rows are buffered."""
+        self._rows.append(['' if value is None else str(value) for value in row])
+        if len(self._rows) >= self.max_rows:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._rows:
+            self._rows.sort(key=self.key)
+            self.runs.append(_write_run(self._rows, self.directory))
+            self._rows = []
+
+    def close(self) -> List[str]:
+        """Spill the remaining rows.
+
+        Returns:
+            Paths of the sorted runs, in the order they were written
+        """
+        self._spill()
+        return self.runs
+
+
+def _merge(runs: Sequence[str], key: Callable[[Row], Any]) -> Iterator[Row]:
+    with ExitStack() as stack:
+        readers = [csv.reader(stack.enter_context(open(path, 'r', newline='', encoding='utf-8')))
+                   for path in runs]
+        yield from heapq.merge(*readers, key=key)
+
+
+def merge_sorted_runs(runs: Sequence[str], key: Callable[[Row], Any], max_open: int = MAX_OPEN_RUNS,
+                      directory: Optional[str] = None) -> Iterator[Row]:
+    """Yield the rows of sorted runs in key order.
+
+    Args:
+        runs: Run files sorted by key; ties are resolved in this order
+        key: Sort key the runs were sorted with
+        max_open: Maximum number of files to merge at once
+        directory: Directory for intermediate runs
+
+    Yields:
+        Rows of all runs in key order. The given run files are left in place.
+    """
+    runs = list(runs)
+    intermediate: List[str] = []
+    try:
+        # Merge consecutive batches first so ties keep their run order
+        while len(runs) > max_open:
+            merged = []
+            for start in range(0, len(runs), max_open):
+                batch = runs[start:start + max_open]
+                if len(batch) == 1:
+                    merged.append(batch[0])
+                    continue
+                path = _write_run(_merge(batch, key), directory)
+                intermediate.append(path)
+                merged.append(path)
+            runs = merged
+        yield from _merge(runs, key)
+    finally:
+        remove_runs(intermediate)
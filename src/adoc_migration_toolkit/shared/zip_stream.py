@@ -0,0 +1,170 @@
+"""
+In-memory ZIP rewriting.
+
+Policy ZIPs used to be extracted to a temporary directory, edited on disk and
+zipped up again, which made policy-xfr over thousands of archives spend most
+of its time creating and deleting temp files. ``rewrite_zip`` streams the
+members of an archive straight into a new one instead:
+
+- Members picked by ``select`` are read into memory and handed to the
+  transform. If it returns new bytes they are compressed into the output.
+- Every other member, and every member the transform leaves unchanged, is
+  copied as raw compressed bytes with ``copy_member_raw``, so it is neither
+  decompressed nor recompressed.
+
+Members too large to hold in memory can be handed to a ``stream_transform``
+instead, which reads the member as a stream and returns its new content as a
+readable file object.
+
+The output is written to ``<output>.part`` and moved into place once it is
+complete, so an interrupted run never leaves a truncated archive behind.
+"""
+
+import copy
+import os
+import shutil
+import struct
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Callable, NamedTuple, Optional
+
+# Read size for copying compressed member data
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class ZipRewriteResult(NamedTuple):
+    """Summary of a ZIP rewrite."""
+    members: int    # Members in the archive
+    rewritten: int  # Members replaced with transformed content
+    copied: int     # Members copied without recompression
+
+
+def copy_member_raw(source: zipfile.ZipFile, info: zipfile.ZipInfo, target: zipfile.ZipFile) -> None:
+    """Copy a ZIP member's compressed bytes into another archive without recompressing them.
+
+    Args:
+        source: ZipFile opened for reading
+        info: ZipInfo of the member to copy
+        target: ZipFile opened for writing
+    """
+    # Skip the local file header; its extra field may differ from the central directory's
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+
+    copied = copy.copy(info)
+    copied.flag_bits &= ~0x08  # CRC and sizes go into the local header instead of a data descriptor
+    target.fp.seek(target.start_dir)
+    copied.header_offset = target.fp.tell()
+    target.fp.write(copied.FileHeader())
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = source.fp.read(min(remaining, COPY_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member {info.filename}")
+        target.fp.write(chunk)
+        remaining -= len(chunk)
+
+    # Register the member the way ZipFile.write does, so close() writes it to the central directory
+    target.filelist.append(copied)
+    target.NameToInfo[copied.filename] = copied
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def write_member(target: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes) -> None:
+    """Write new content for a member, keeping its name, timestamp and attributes.
+
+    Args:
+        target: ZipFile opened for writing
+        info: ZipInfo of the member being replaced
+        data: New member content
+    """
+    new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    new_info.compress_type = zipfile.ZIP_DEFLATED
+    new_info.external_attr = info.external_attr
+    target.writestr(new_info, data)
+
+
+def write_member_stream(target: zipfile.ZipFile, info: zipfile.ZipInfo, stream: BinaryIO) -> None:
+    """Write new content for a member from a file object, keeping its name, timestamp and attributes.
+
+    Args:
+        target: ZipFile opened for writing
+        info: ZipInfo of the member being replaced
+        stream: Readable binary file object with the new content
+    """
+    new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    new_info.compress_type = zipfile.ZIP_DEFLATED
+    new_info.external_attr = info.external_attr
+    # The new size is unknown up front, so allow ZIP64 for members near the limit
+    with target.open(new_info, 'w', force_zip64=info.file_size >= zipfile.ZIP64_LIMIT // 2) as member:
+        shutil.copyfileobj(stream, member, COPY_CHUNK_SIZE)
+
+
+def is_json_member(info: zipfile.ZipInfo) -> bool:
+    """Check whether a member is a JSON file."""
+    return not info.is_dir() and info.filename.endswith('.json')
+
+
+def rewrite_zip(input_path, output_path,
+                transform: Callable[[zipfile.ZipInfo, bytes], Optional[bytes]],
+                select: Callable[[zipfile.ZipInfo], bool] = is_json_member,
+                stream_transform: Optional[Callable[[zipfile.ZipInfo, BinaryIO], Optional[BinaryIO]]] = None,
+                stream_select: Optional[Callable[[zipfile.ZipInfo], bool]] = None) -> ZipRewriteResult:
+    """Copy an archive member by member, transforming the selected members in memory.
+
+    Args:
+        input_path: ZIP file to read
+        output_path: ZIP file to create (replaced if it exists)
+        transform: Called with the ZipInfo and content of every selected member.
+            Returns the new content, or None to keep the member as it is.
+        select: Picks the members to pass to the transform (JSON files by default)
+        stream_transform: Called with the ZipInfo and an open stream of every member
+            picked by stream_select. Returns a readable file object with the new
+            content, or None to keep the member as it is.
+        stream_select: Picks the members to pass to stream_transform instead of transform
+
+    Returns:
+        ZipRewriteResult with the number of members, rewritten members and copied members
+
+    Raises:
+        zipfile.BadZipFile: If the input is not a valid ZIP file
+    """
+    output_path = Path(output_path)
+    part_path = output_path.with_name(output_path.name + '.part')
+    rewritten = 0
+    copied = 0
+    try:
+        with zipfile.ZipFile(input_path, 'r') as source, \
+                zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                if stream_transform is not None and stream_select is not None and stream_select(info):
+                    with source.open(info) as member:
+                        new_stream = stream_transform(info, member)
+                    if new_stream is not None:
+                        with new_stream:
+                            write_member_stream(target, info, new_stream)
+                        rewritten += 1
+                        continue
+                    copy_member_raw(source, info, target)
+                    copied += 1
+                    continue
+                data = None
+                if select(info):
+                    original = source.read(info)
+                    data = transform(info, original)
+                    if data == original:
+                        data = None
+                if data is None:
+                    copy_member_raw(source, info, target)
+                    copied += 1
+                else:
+                    write_member(target, info, data)
+                    rewritten += 1
+        os.replace(part_path, output_path)
+    finally:
+        if part_path.exists():
+            part_path.unlink()
+    return ZipRewriteResult(rewritten + copied, rewritten, copied)
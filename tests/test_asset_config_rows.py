@@ -0,0 +1,55 @@
+"""
+Test cases for asset-config-export row assembly.
+
+This module contains tests for building rows from parsed API responses,
+serializing them once and checking them before they are written.
+"""
+
+import json
+
+from src.adoc_migration_toolkit.execution.asset_config_rows import (
+    AssetConfigExportRow,
+    CONFIG_EXPORT_HEADER,
+    child_asset_uid_map
+)
+
+
+CHILD_ASSETS = {"childAssets": [{"assetId": 11, "uid": "db.t1.c1"}, {"assetId": 12, "uid": "db.t1.c2"}]}
+
+
+def make_row(**overrides):
+    values = dict(
+        target_uid="target.db.t1",
+        asset_config={"assetConfiguration": {"name": "café"}},
+        profile_anomaly_config={"rules": []},
+        asset_id_to_uid_map=child_asset_uid_map(CHILD_ASSETS),
+        target_asset_id_to_uid_map={21: "target.db.t1.c1"},
+        source_uid="source.db.t1"
+    )
+    values.update(overrides)
+    return AssetConfigExportRow(**values)
+
+
+def test_csv_row_matches_previous_serialization():
+    """Test that each column is the compact JSON the export used to write."""
+    row = make_row().to_csv_row()
+
+    assert len(row) == len(CONFIG_EXPORT_HEADER)
+    assert row[0] == "target.db.t1" and row[5] == "source.db.t1"
+    assert row[1] == '{"assetConfiguration":{"name":"café"}}'
+    assert json.loads(row[3]) == {"11": "db.t1.c1", "12": "db.t1.c2"}
+    assert row[4] == '{"21":"target.db.t1.c1"}'
+
+
+def test_validate_reports_empty_and_invalid_columns():
+    """Test that rows are checked on the parsed values."""
+    assert make_row().validate() == []
+
+    errors = make_row(target_uid=" ", profile_anomaly_config={}, asset_config=[1],
+                      target_asset_id_to_uid_map={}).validate()
+    assert errors == [
+        "Empty target_uid value",
+        "asset_config_json is not a valid JSON object",
+        "asset_profile_anomaly_config_json is empty",
+        "asset_target_id_to_uid_map_json is empty"
+    ]
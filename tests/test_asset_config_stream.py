@@ -0,0 +1,129 @@
+"""
+Test cases for the streaming asset-config-import reader.
+
+This module contains tests for the supported CSV layouts, header detection,
+row selection and duplicate detection used by asset-config-import.
+"""
+
+import csv
+import json
+import tempfile
+import shutil
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.adoc_migration_toolkit.execution.asset_config_stream import (
+    CONFIG_CUSTOM, CONFIG_NULL, CONFIG_MISSING, CONFIG_INVALID,
+    classify_asset_config, find_duplicate_rows, iter_asset_config_rows, scan_asset_config_csv
+)
+from src.adoc_migration_toolkit.execution.asset_operations import execute_asset_config_import
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(rows)
+    return str(path)
+
+
+class TestAssetConfigStream:
+    """Test cases for iter_asset_config_rows and scan_asset_config_csv."""
+
+    def test_six_column_format(self, temp_dir):
+        """Test that the source UID is read from the sixth column."""
+        csv_file = _write_csv(temp_dir / "six.csv", [
+            ['target_uid', 'asset_config_json', 'profile', 'id_map', 'target_id_map', 'source_uid'],
+            ['DEV.a', '{"assetConfiguration": {}}', '', '', '', 'PROD.a'],
+        ])
+        rows = list(iter_asset_config_rows(csv_file))
+        assert rows == [{'row_number': 2, 'target_uid': 'DEV.a',
+                         'config_json': '{"assetConfiguration": {}}', 'source_uid': 'PROD.a'}]
+
+    def test_three_and_two_column_formats(self, temp_dir):
+        """Test the 3-column format and the legacy 2-column format without a source UID."""
+        three = _write_csv(temp_dir / "three.csv", [['target_uid', 'config_json', 'source_uid'],
+                                                    ['DEV.a', '{}', 'PROD.a']])
+        two = _write_csv(temp_dir / "two.csv", [['target_uid', 'config_json'], ['DEV.b', '{}']])
+        assert [r['source_uid'] for r in iter_asset_config_rows(three)] == ['PROD.a']
+        assert [r['source_uid'] for r in iter_asset_config_rows(two)] == ['Unknown']
+
+    def test_headerless_file_and_empty_rows(self, temp_dir):
+        """Test that a 6-column file without a header keeps its first row and empty rows are skipped."""
+        csv_file = _write_csv(temp_dir / "data.csv", [
+            ['DEV.a', '{}', '', '', '', 'PROD.a'],
+            [],
+            ['', '{}', '', '', '', 'PROD.x'],
+            ['DEV.b', '{}', '', '', '', 'PROD.b'],
+        ])
+        assert [(r['row_number'], r['target_uid']) for r in iter_asset_config_rows(csv_file)] == \
+            [(1, 'DEV.a'), (4, 'DEV.b')]
+
+    def test_row_selection_and_scan(self, temp_dir):
+        """Test that only selected rows are yielded and the scan classifies configurations."""
+        csv_file = _write_csv(temp_dir / "data.csv", [
+            ['target_uid', 'config_json', 'source_uid'],
+            ['DEV.a', '{"assetConfiguration": {"x": 1}}', 'PROD.a'],
+            ['DEV.b', '{"assetConfiguration": null}', 'PROD.b'],
+            ['DEV.c', '{"other": 1}', 'PROD.c'],
+            ['DEV.d', 'not json', 'PROD.d'],
+        ])
+        assert [r['target_uid'] for r in iter_asset_config_rows(csv_file, {3, 5})] == ['DEV.b', 'DEV.d']
+        index = scan_asset_config_csv(csv_file, classify=True)
+        assert [info.config_kind for info in index] == [CONFIG_CUSTOM, CONFIG_NULL, CONFIG_MISSING, CONFIG_INVALID]
+        assert scan_asset_config_csv(csv_file)[0].config_kind is None
+        assert classify_asset_config(None) == CONFIG_INVALID
+
+    def test_find_duplicate_rows(self, temp_dir):
+        """Test that duplicate target UIDs map to all of their row numbers."""
+        csv_file = _write_csv(temp_dir / "data.csv", [
+            ['target_uid', 'config_json', 'source_uid'],
+            ['DEV.a', '{}', 'PROD.a1'],
+            ['DEV.b', '{}', 'PROD.b'],
+            ['DEV.a', '{}', 'PROD.a2'],
+        ])
+        assert find_duplicate_rows(scan_asset_config_csv(csv_file)) == {'DEV.a': [2, 4]}
+
+    def test_jsonl_format(self, temp_dir):
+        """Test that JSON Lines files yield config_json as JSON text, numbered by line."""
+        jsonl_file = temp_dir / "data.jsonl"
+        records = [
+            {'target_uid': 'DEV.a', 'asset_config_json': {'assetConfiguration': {'x': 1}}, 'source_uid': 'PROD.a'},
+            {'target_uid': 'DEV.b', 'asset_config_json': {'assetConfiguration': None}, 'source_uid': 'PROD.b'},
+        ]
+        jsonl_file.write_text(''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+
+        rows = list(iter_asset_config_rows(str(jsonl_file)))
+        assert [(r['row_number'], r['target_uid'], r['source_uid']) for r in rows] == \
+            [(1, 'DEV.a', 'PROD.a'), (2, 'DEV.b', 'PROD.b')]
+        assert json.loads(rows[0]['config_json']) == {'assetConfiguration': {'x': 1}}
+        assert [info.config_kind for info in scan_asset_config_csv(str(jsonl_file), classify=True)] == \
+            [CONFIG_CUSTOM, CONFIG_NULL]
+
+
+class TestStreamingAssetConfigImport:
+    """Test cases for asset-config-import reading rows from the stream."""
+
+    def test_only_chosen_duplicate_is_imported(self, temp_dir):
+        """Test that the row picked during duplicate resolution is the one sent to the API."""
+        csv_file = _write_csv(temp_dir / "data.csv", [
+            ['target_uid', 'config_json', 'source_uid'],
+            ['DEV.a', '{"assetConfiguration": {"v": 1}}', 'PROD.a1'],
+            ['DEV.b', '{"assetConfiguration": {"v": 2}}', 'PROD.b'],
+            ['DEV.a', '{"assetConfiguration": {"v": 3}}', 'PROD.a2'],
+        ])
+        client = Mock()
+        client.make_api_call.return_value = {'data': [{'id': 7}]}
+        with patch('builtins.input', return_value='2'):
+            execute_asset_config_import(csv_file, client, Mock())
+        payloads = [call.kwargs['json_payload'] for call in client.make_api_call.call_args_list
+                    if call.kwargs.get('method') == 'PUT']
+        assert len(payloads) == 2
+        assert [p['assetConfiguration'].get('v') for p in payloads] == [2, 3]
@@ -10,6 +10,7 @@ import json
 import csv
 import tempfile
 import logging
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from io import StringIO
@@ -24,6 +25,7 @@ from src.adoc_migration_toolkit.execution.asset_operations import (
     execute_asset_list_export,
     execute_asset_list_export_parallel
 )
+from src.adoc_migration_toolkit.execution.async_asset_operations import execute_asset_list_export_async
 from src.adoc_migration_toolkit.shared import globals
 
 
@@ -594,6 +596,38 @@ class TestExecuteAssetConfigImport:
 class TestExecuteAssetConfigExportParallel:
     """Test cases for execute_asset_config_export_parallel function."""
     
+    def test_sub_requests_use_per_thread_clients(self, temp_dir, mock_logger):
+        """Test that fanned-out GETs go through a client of the pool thread, not the shared client."""
+        csv_file = temp_dir / "test_parallel_export.csv"
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['source_id', 'source_uid', 'target_id', 'target_uid', 'tags', 'source_asset_type'])
+            writer.writerow(['1', 'uid1', '11', 'target_uid1', '', 'table'])
+            writer.writerow(['2', 'uid2', '12', 'target_uid2', '', 'table'])
+        
+        calls = []
+        
+        class ThreadBoundClient:
+            def __init__(self, owner=None):
+                self.owner = owner
+                self.clones = threading.local()
+            
+            def for_thread(self):
+                if not hasattr(self.clones, 'client'):
+                    self.clones.client = ThreadBoundClient(threading.current_thread())
+                return self.clones.client
+            
+            def make_api_call(self, endpoint, **kwargs):
+                calls.append((self.owner, threading.current_thread()))
+                return {"data": {}}
+        
+        with patch('src.adoc_migration_toolkit.execution.asset_operations.globals.GLOBAL_OUTPUT_DIR', temp_dir):
+            execute_asset_config_export_parallel(str(csv_file), ThreadBoundClient(), mock_logger, quiet_mode=True,
+                                                 max_threads=2)
+        
+        assert len(calls) == 8
+        assert all(owner is thread for owner, thread in calls)
+    
     def test_execute_asset_config_export_parallel_success(self, temp_dir, mock_client, mock_logger):
         """Test successful parallel asset config export."""
         # Create test CSV file with 5 columns
@@ -1149,6 +1183,93 @@ class TestExecuteAssetListExport:
         # Verify that autoTagged tags are filtered out in parallel mode too
         assert rows[1] == ['asset-1', '1', 'asset-1', 'manual-tag1:manual-tag2']  # Only manual tags
         assert rows[2] == ['asset-2', '2', 'asset-2', 'manual-tag3']  # Only manual tag
+    
+    def test_execute_asset_list_export_parallel_merges_sorted_pages(self, temp_dir, mock_client, mock_logger):
+        """Test that pages from all threads are merged by source_uid and source_id, keeping the first row per assetId."""
+        pages = {
+            0: [{"assetId": 10, "assetUid": "c.uid", "assemblyId": 1, "assetType": "table"},
+                {"assetId": 2, "assetUid": "a.uid", "assemblyId": 1, "assetType": "table"}],
+            1: [{"assetId": 9, "assetUid": "a.uid", "assemblyId": 1, "assetType": "view"},
+                {"assetId": 10, "assetUid": "c.uid", "assemblyId": 1, "assetType": "table"}],
+            2: [{"assetId": 5, "assetUid": "b.uid", "assemblyId": 2, "assetType": "table"},
+                {"assetId": 2, "assetUid": "renamed.uid", "assemblyId": 1, "assetType": "table"}]
+        }
+        
+        def make_api_call(endpoint, **kwargs):
+            page = int(endpoint.split("page=")[1].split("&")[0])
+            return {"assets": pages[page], "meta": {"total": 6}}
+        
+        mock_client.make_api_call.side_effect = make_api_call
+        
+        with patch('src.adoc_migration_toolkit.execution.asset_operations.globals.GLOBAL_OUTPUT_DIR', temp_dir), \
+             patch('src.adoc_migration_toolkit.execution.asset_operations.get_thread_client', return_value=mock_client):
+            execute_asset_list_export_parallel(
+                client=mock_client,
+                logger=mock_logger,
+                quiet_mode=True,
+                page_size=2,
+                max_threads=3
+            )
+        
+        output_file = temp_dir / "asset-export" / "asset-all-source-export.csv"
+        with open(output_file, 'r') as f:
+            rows = list(csv.reader(f))
+        
+        assert rows[0] == ['source_uid', 'source_id', 'target_uid', 'tags', 'assembly_id', 'asset_type']
+        assert [row[:2] for row in rows[1:]] == [['a.uid', '2'], ['a.uid', '9'], ['b.uid', '5'], ['c.uid', '10']]
+        
+        with open(temp_dir / "asset-export" / "asset-all-source-export-duplicates.csv", 'r') as f:
+            duplicates = list(csv.reader(f))
+        assert sorted(row[:2] for row in duplicates[1:]) == [['c.uid', '10'], ['renamed.uid', '2']]
+        assert duplicates[1][-1] == 'Duplicate assetId found in multiple pages/threads'
+
+    
+    def test_execute_asset_list_export_async_matches_parallel(self, temp_dir, mock_client, mock_logger):
+        """Test that the async engine writes the same files as the parallel export."""
+        pages = {
+            0: [{"assetId": 10, "assetUid": "c.uid", "assemblyId": 1, "assetType": "table"},
+                {"assetId": 2, "assetUid": "a.uid", "assemblyId": 1, "assetType": "table"}],
+            1: [{"assetId": 2, "assetUid": "renamed.uid", "assemblyId": 1, "assetType": "table"},
+                {"assetId": 9, "assetUid": "a.uid", "assemblyId": 1, "assetType": "view"}]
+        }
+        
+        def make_api_call(endpoint, **kwargs):
+            page = int(endpoint.split("page=")[1].split("&")[0])
+            return {"assets": pages[page], "meta": {"total": 4}}
+        
+        class FakeAsyncClient:
+            def __init__(self, client, **kwargs):
+                pass
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc_info):
+                return False
+            
+            async def make_api_call(self, endpoint, **kwargs):
+                return make_api_call(endpoint)
+        
+        mock_client.make_api_call.side_effect = make_api_call
+        outputs = {}
+        for engine in ('parallel', 'async'):
+            output_dir = temp_dir / engine
+            with patch('src.adoc_migration_toolkit.execution.asset_operations.globals.GLOBAL_OUTPUT_DIR', output_dir), \
+                 patch('src.adoc_migration_toolkit.execution.asset_operations.get_thread_client', return_value=mock_client), \
+                 patch('src.adoc_migration_toolkit.execution.async_asset_operations.AsyncAcceldataAPIClient', FakeAsyncClient):
+                if engine == 'parallel':
+                    execute_asset_list_export_parallel(client=mock_client, logger=mock_logger, quiet_mode=True,
+                                                       page_size=2, max_threads=2)
+                else:
+                    execute_asset_list_export_async(client=mock_client, logger=mock_logger, quiet_mode=True,
+                                                    page_size=2)
+            export_dir = output_dir / "asset-export"
+            outputs[engine] = [(export_dir / name).read_bytes() for name in
+                               ("asset-all-source-export.csv", "asset-all-source-export-duplicates.csv")]
+        
+        assert outputs['async'] == outputs['parallel']
+        assert b'"renamed.uid","2"' in outputs['async'][1]
+
 
 
 class TestAssetOperationsIntegration:
@@ -0,0 +1,226 @@
+"""
+Test cases for the target asset UID resolver.
+
+This module contains tests for seeding the UID index from earlier CSV
+outputs, lazy API lookups, TTL handling, stale ID invalidation and the
+persisted on-disk cache.
+"""
+
+import csv
+import os
+import time
+import json
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from requests.exceptions import HTTPError
+from requests.models import Response
+
+from src.adoc_migration_toolkit.execution.asset_resolver import TargetAssetResolver, extract_assets_from_response
+from src.adoc_migration_toolkit.execution.asset_operations import execute_asset_config_import
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock API client."""
+    return Mock()
+
+
+def _not_found():
+    response = Response()
+    response.status_code = 404
+    return HTTPError("404 Client Error: Not Found", response=response)
+
+
+def _write_csv(path, header, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+class TestTargetAssetResolver:
+    """Test cases for TargetAssetResolver."""
+
+    def test_seed_from_merged_and_target_export(self, temp_dir, mock_client):
+        """Test that both CSV formats seed the index and avoid API calls."""
+        merged = temp_dir / "asset-import" / "asset-merged-all.csv"
+        _write_csv(merged, ['source_id', 'source_uid', 'target_id', 'target_uid', 'tags', 'source_asset_type'],
+                   [['1', 'PROD.t1', '101', 'DEV.t1', '', 'Table']])
+        export = temp_dir / "asset-export" / "asset-all-target-export.csv"
+        _write_csv(export, ['source_uid', 'source_id', 'target_uid', 'tags', 'assembly_id', 'asset_type'],
+                   [['DEV.t2', '102', 'DEV.t2', '', '7', 'Table']])
+
+        with patch('src.adoc_migration_toolkit.execution.asset_resolver.globals.GLOBAL_OUTPUT_DIR', temp_dir):
+            resolver = TargetAssetResolver.for_import(mock_client)
+
+        assert resolver.resolve('DEV.t1') == 101
+        assert resolver.resolve('DEV.t2') == 102
+        mock_client.make_api_call.assert_not_called()
+        assert resolver.hits == 2
+
+    def test_stale_csv_is_not_seeded(self, temp_dir, mock_client):
+        """Test that CSV files older than the TTL are ignored."""
+        merged = temp_dir / "asset-merged-all.csv"
+        _write_csv(merged, ['source_id', 'source_uid', 'target_id', 'target_uid'], [['1', 'PROD.t1', '101', 'DEV.t1']])
+        old = time.time() - 7200
+        os.utime(merged, (old, old))
+
+        resolver = TargetAssetResolver(mock_client, ttl=3600)
+        assert resolver.seed_from_csv(merged) == 0
+        assert len(resolver) == 0
+
+    def test_miss_uses_api_and_misses_are_not_cached(self, mock_client):
+        """Test lazy lookups for both response shapes and retry of not-found UIDs."""
+        mock_client.make_api_call.side_effect = [
+            {'data': [{'id': 5, 'assetType': {'name': 'Table'}}]},
+            {'data': {'assets': []}},
+            {'data': {'assets': [{'id': 6}]}}
+        ]
+        resolver = TargetAssetResolver(mock_client)
+
+        assert resolver.resolve_asset('DEV.a') == {'id': 5, 'asset_type': 'Table', 'ts': pytest.approx(time.time(), abs=5)}
+        assert resolver.resolve('DEV.a') == 5
+        assert resolver.resolve('DEV.b') is None
+        assert resolver.resolve('DEV.b') == 6
+        assert mock_client.make_api_call.call_count == 3
+        assert mock_client.make_api_call.call_args[1]['endpoint'] == '/catalog-server/api/assets?uid=DEV.b'
+        assert mock_client.make_api_call.call_args[1]['use_target_tenant'] is True
+
+    def test_prefetch_deduplicates(self, mock_client):
+        """Test that prefetch looks up each missing UID once."""
+        mock_client.make_api_call.side_effect = lambda endpoint, **kwargs: {'data': [{'id': endpoint[-1]}]}
+        resolver = TargetAssetResolver(mock_client)
+
+        assert resolver.prefetch(['x1', 'x2', 'x1', '', 'x2', 'x3'], max_threads=3) == 3
+        assert mock_client.make_api_call.call_count == 3
+        assert resolver.resolve('x2') == 2
+
+    def test_prefetch_misses_are_answered_once(self, mock_client):
+        """Test that a UID prefetch found no asset for is not looked up again right away."""
+        mock_client.make_api_call.return_value = {'data': []}
+        resolver = TargetAssetResolver(mock_client)
+
+        assert resolver.prefetch(['DEV.gone']) == 1
+        assert resolver.resolve('DEV.gone') is None
+        assert mock_client.make_api_call.call_count == 1
+        assert resolver.resolve('DEV.gone') is None
+        assert mock_client.make_api_call.call_count == 2
+
+    def test_retry_stale_resolves_again_after_not_found(self, temp_dir, mock_client):
+        """Test that a 404 against a cached ID drops it, looks the UID up again and retries once."""
+        cache_file = temp_dir / "ids.json"
+        merged = temp_dir / "asset-merged-all.csv"
+        _write_csv(merged, ['source_id', 'source_uid', 'target_id', 'target_uid'],
+                   [['1', 'PROD.t1', '101', 'DEV.t1'], ['2', 'PROD.t2', '102', 'DEV.t2']])
+        mock_client.make_api_call.side_effect = [{'data': [{'id': 201}]}, {'data': [{'id': 102}]}]
+        resolver = TargetAssetResolver(mock_client, cache_file=cache_file)
+        resolver.seed_from_csv(merged)
+
+        def request(asset_id):
+            if asset_id in (101, 102):
+                raise _not_found()
+            return f"updated {asset_id}"
+
+        assert resolver.retry_stale('DEV.t1', resolver.resolve('DEV.t1'), request) == (201, "updated 201")
+        assert resolver.resolve('DEV.t1') == 201
+        # Still not found under the ID the UID resolves to, so the error is raised
+        with pytest.raises(HTTPError):
+            resolver.retry_stale('DEV.t2', 102, request)
+        assert mock_client.make_api_call.call_count == 2
+
+        # Other errors do not invalidate the entry
+        with pytest.raises(ValueError):
+            resolver.retry_stale('DEV.t1', 201, Mock(side_effect=ValueError("bad payload")))
+        assert resolver.get_cached('DEV.t1')['id'] == 201
+
+        resolver.invalidate('DEV.t1')
+        assert resolver.get_cached('DEV.t1') is None
+        assert resolver.save()
+        assert set(json.loads(cache_file.read_text())['assets']) == {'DEV.t2'}
+
+    def test_save_and_load_round_trip(self, temp_dir, mock_client):
+        """Test that the index persists to disk and expired entries are dropped on load."""
+        cache_file = temp_dir / "cache" / "ids.json"
+        mock_client.make_api_call.return_value = {'data': [{'id': 9, 'assetType': {'name': 'View'}}]}
+        resolver = TargetAssetResolver(mock_client, cache_file=cache_file)
+        resolver.resolve('DEV.v')
+        assert resolver.save()
+        assert not resolver.save()  # Nothing new to write
+
+        reloaded = TargetAssetResolver(Mock(), cache_file=cache_file)
+        assert reloaded.load() == 1
+        assert reloaded.get_cached('DEV.v')['asset_type'] == 'View'
+
+        data = json.loads(cache_file.read_text())
+        data['assets']['DEV.v']['ts'] -= 2 * 24 * 60 * 60
+        cache_file.write_text(json.dumps(data))
+        assert TargetAssetResolver(Mock(), cache_file=cache_file).load() == 0
+
+    def test_no_disk_cache_without_target_environment(self, mock_client):
+        """Test that clients without a resolvable host and tenant keep the index in memory only."""
+        assert TargetAssetResolver(mock_client).cache_file is None
+
+    def test_extract_assets_from_response(self):
+        """Test extraction of the asset list from the supported response shapes."""
+        assert extract_assets_from_response({'data': [{'id': 1}]}) == [{'id': 1}]
+        assert extract_assets_from_response({'data': {'assets': [{'id': 2}]}}) == [{'id': 2}]
+        assert extract_assets_from_response({'data': {}}) == []
+        assert extract_assets_from_response(None) == []
+
+
+class TestAssetConfigImportResolution:
+    """Test cases for target asset ID resolution in asset-config-import."""
+
+    @pytest.mark.parametrize("parallel_mode", [False, True])
+    def test_seeded_ids_skip_uid_lookups(self, temp_dir, mock_client, parallel_mode):
+        """Test that both import paths take target IDs from the resolver instead of the API."""
+        _write_csv(temp_dir / "asset-import" / "asset-merged-all.csv",
+                   ['source_id', 'source_uid', 'target_id', 'target_uid', 'tags', 'source_asset_type'],
+                   [['1', 'PROD.t1', '101', 'DEV.t1', '', 'Table']])
+        csv_file = temp_dir / "asset-config-import-ready.csv"
+        _write_csv(csv_file, ['target_uid', 'config_json', 'source_uid'],
+                   [['DEV.t1', '{"assetConfiguration": {"freshnessColumnInfo": {}}}', 'PROD.t1']])
+        mock_client.make_api_call.return_value = {'ok': True}
+
+        with patch('src.adoc_migration_toolkit.execution.asset_resolver.globals.GLOBAL_OUTPUT_DIR', temp_dir):
+            execute_asset_config_import(str(csv_file), mock_client, Mock(), quiet_mode=True,
+                                        parallel_mode=parallel_mode, max_threads=1)
+
+        endpoints = [call.kwargs['endpoint'] for call in mock_client.make_api_call.call_args_list]
+        assert endpoints == ['/catalog-server/api/assets/101/config']
+
+    @pytest.mark.parametrize("parallel_mode", [False, True])
+    def test_stale_seeded_id_is_resolved_again(self, temp_dir, mock_client, parallel_mode):
+        """Test that both import paths look a UID up again when its seeded ID is not found."""
+        _write_csv(temp_dir / "asset-import" / "asset-merged-all.csv",
+                   ['source_id', 'source_uid', 'target_id', 'target_uid', 'tags', 'source_asset_type'],
+                   [['1', 'PROD.t1', '101', 'DEV.t1', '', 'Table']])
+        csv_file = temp_dir / "asset-config-import-ready.csv"
+        _write_csv(csv_file, ['target_uid', 'config_json', 'source_uid'],
+                   [['DEV.t1', '{"assetConfiguration": {"freshnessColumnInfo": {}}}', 'PROD.t1']])
+        mock_client.make_api_call.side_effect = [_not_found(), {'data': [{'id': 201}]}, {'ok': True}]
+
+        with patch('src.adoc_migration_toolkit.execution.asset_resolver.globals.GLOBAL_OUTPUT_DIR', temp_dir):
+            execute_asset_config_import(str(csv_file), mock_client, Mock(), quiet_mode=True,
+                                        parallel_mode=parallel_mode, max_threads=1)
+
+        calls = mock_client.make_api_call.call_args_list
+        assert [call.kwargs['endpoint'] for call in calls] == [
+            '/catalog-server/api/assets/101/config',
+            '/catalog-server/api/assets?uid=DEV.t1',
+            '/catalog-server/api/assets/201/config'
+        ]
+        assert calls[2].kwargs['json_payload']['assetConfiguration']['assetId'] == 201
@@ -103,37 +103,19 @@ class TestAssetTagImport:
         # Reset mock to ensure clean state
         mock_client.reset_mock()
         
-        # Mock API responses
-        mock_client.make_api_call.side_effect = [
-            # First asset response
-            {
-                'data': {
-                    'assets': [{'id': 'asset_id_1'}]
-                }
-            },
-            # First tag response
-            {'success': True},
-            # Second tag response
-            {'success': True},
-            # Second asset response
-            {
-                'data': {
-                    'assets': [{'id': 'asset_id_2'}]
-                }
-            },
-            # Third tag response
-            {'success': True},
-            # Fourth asset response
-            {
-                'data': {
-                    'assets': [{'id': 'asset_id_4'}]
-                }
-            },
-            # Fourth asset tags responses
-            {'success': True},
-            {'success': True},
-            {'success': True}
-        ]
+        # Mock API responses; asset IDs are looked up up front, in parallel
+        asset_ids = {
+            'DEV_DB.table1': 'asset_id_1',
+            'DEV_DB.table2': 'asset_id_2',
+            'DEV_DB.table4': 'asset_id_4'
+        }
+        
+        def api_call(endpoint, method, **kwargs):
+            if method == 'GET':
+                return {'data': {'assets': [{'id': asset_ids[endpoint.split('uid=')[1]]}]}}
+            return {'success': True}
+        
+        mock_client.make_api_call.side_effect = api_call
         
         with patch('builtins.print') as mock_print:
             execute_asset_tag_import(str(sample_csv_file), mock_client, mock_logger, quiet_mode=True)
@@ -144,18 +126,20 @@ class TestAssetTagImport:
             # Verify the calls were made correctly
             calls = mock_client.make_api_call.call_args_list
             
-            # First asset lookup
-            assert calls[0][1]['endpoint'] == '/catalog-server/api/assets?uid=DEV_DB.table1'
-            assert calls[0][1]['method'] == 'GET'
+            # Asset lookups
+            assert sorted(call[1]['endpoint'] for call in calls[:3]) == [
+                f'/catalog-server/api/assets?uid={uid}' for uid in sorted(asset_ids)
+            ]
+            assert all(call[1]['method'] == 'GET' for call in calls[:3])
             
             # First asset tags
-            assert calls[1][1]['endpoint'] == '/catalog-server/api/assets/asset_id_1/tag'
-            assert calls[1][1]['method'] == 'POST'
-            assert calls[1][1]['json_payload'] == {'name': 'tag1'}
+            assert calls[3][1]['endpoint'] == '/catalog-server/api/assets/asset_id_1/tag'
+            assert calls[3][1]['method'] == 'POST'
+            assert calls[3][1]['json_payload'] == {'name': 'tag1'}
             
-            assert calls[2][1]['endpoint'] == '/catalog-server/api/assets/asset_id_1/tag'
-            assert calls[2][1]['method'] == 'POST'
-            assert calls[2][1]['json_payload'] == {'name': 'tag2'}
+            assert calls[4][1]['endpoint'] == '/catalog-server/api/assets/asset_id_1/tag'
+            assert calls[4][1]['method'] == 'POST'
+            assert calls[4][1]['json_payload'] == {'name': 'tag2'}
     
     def test_execute_asset_tag_import_sequential_asset_not_found(self, sample_csv_file, mock_client, mock_logger):
         """Test sequential asset tag import when asset is not found."""
@@ -243,39 +227,46 @@ class TestAssetTagImport:
         from src.adoc_migration_toolkit.execution.command_parsing import parse_asset_tag_import_command
         
         # Test basic command
-        csv_file, quiet, verbose, parallel = parse_asset_tag_import_command("asset-tag-import")
+        csv_file, quiet, verbose, parallel, async_mode, max_concurrency = parse_asset_tag_import_command("asset-tag-import")
         assert csv_file is None
         assert quiet is False
         assert verbose is False
         assert parallel is False
         
         # Test with CSV file
-        csv_file, quiet, verbose, parallel = parse_asset_tag_import_command("asset-tag-import test.csv")
+        csv_file, quiet, verbose, parallel, async_mode, max_concurrency = parse_asset_tag_import_command("asset-tag-import test.csv")
         assert csv_file == "test.csv"
         assert quiet is False
         assert verbose is False
         assert parallel is False
         
         # Test with flags
-        csv_file, quiet, verbose, parallel = parse_asset_tag_import_command("asset-tag-import --quiet --verbose --parallel")
+        csv_file, quiet, verbose, parallel, async_mode, max_concurrency = parse_asset_tag_import_command("asset-tag-import --quiet --verbose --parallel")
         assert csv_file is None
         assert quiet is True
         assert verbose is True
         assert parallel is True
         
         # Test with CSV file and flags
-        csv_file, quiet, verbose, parallel = parse_asset_tag_import_command("asset-tag-import test.csv --quiet --parallel")
+        csv_file, quiet, verbose, parallel, async_mode, max_concurrency = parse_asset_tag_import_command("asset-tag-import test.csv --quiet --parallel")
         assert csv_file == "test.csv"
         assert quiet is True
         assert verbose is False
         assert parallel is True
         
         # Test help
-        csv_file, quiet, verbose, parallel = parse_asset_tag_import_command("asset-tag-import --help")
+        csv_file, quiet, verbose, parallel, async_mode, max_concurrency = parse_asset_tag_import_command("asset-tag-import --help")
         assert csv_file is None
         assert quiet is False
         assert verbose is False
         assert parallel is False
+        
+        # Test async engine flags
+        csv_file, quiet, verbose, parallel, async_mode, max_concurrency = parse_asset_tag_import_command("asset-tag-import test.csv --async --max-concurrency 250")
+        assert csv_file == "test.csv"
+        assert parallel is False
+        assert async_mode is True
+        assert max_concurrency == 250
     
     def test_csv_parsing_with_colon_separated_tags(self, temp_dir, mock_client, mock_logger):
         """Test CSV parsing with colon-separated tags."""
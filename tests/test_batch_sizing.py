@@ -0,0 +1,93 @@
+"""
+Test cases for adaptive policy-export batch sizing.
+
+This module contains tests for growing and shrinking batch sizes from
+observed exports, timeout detection and lazy batch generation.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+from urllib3.exceptions import ReadTimeoutError
+
+from src.adoc_migration_toolkit.execution.batch_sizing import (
+    AdaptiveBatchSizer,
+    MAX_BATCH_BYTES,
+    is_timeout_error,
+    iter_policy_batches,
+    split_batch
+)
+from src.adoc_migration_toolkit.shared import globals
+
+
+@pytest.fixture
+def sizer():
+    return AdaptiveBatchSizer({'DATA_QUALITY': 50, 'default': 10})
+
+
+class TestAdaptiveBatchSizer:
+    """Test cases for AdaptiveBatchSizer."""
+
+    def test_grows_while_fast_but_at_most_double(self, sizer):
+        """Test that fast exports grow the batch size by at most MAX_GROWTH per batch."""
+        with patch.dict(globals.HTTP_CONFIG, {'timeout': 300}):
+            sizer.record_success('DATA_QUALITY', 50, seconds=1.0, size_bytes=50 * 1024)
+            assert sizer.batch_size('DATA_QUALITY') == 100
+            sizer.record_success('DATA_QUALITY', 100, seconds=2.0, size_bytes=100 * 1024)
+            assert sizer.batch_size('DATA_QUALITY') == 200
+        assert sizer.batch_size('OTHER') == 10
+
+    def test_targets_share_of_timeout(self, sizer):
+        """Test that slow exports shrink batches towards a quarter of the HTTP timeout."""
+        with patch.dict(globals.HTTP_CONFIG, {'timeout': 100}):
+            sizer.record_success('DATA_QUALITY', 50, seconds=50.0, size_bytes=1024)
+        assert sizer.batch_size('DATA_QUALITY') == 25
+
+    def test_payload_size_limit(self, sizer):
+        """Test that large ZIPs cap the batch size."""
+        sizer.record_success('DATA_QUALITY', 50, seconds=0.1, size_bytes=MAX_BATCH_BYTES)
+        assert sizer.batch_size('DATA_QUALITY') == 50
+
+    def test_timeout_halves_and_fixed_sizes(self, sizer):
+        """Test that a timeout halves the size and that fixed sizers never change."""
+        sizer.record_timeout('DATA_QUALITY', 50)
+        assert sizer.batch_size('DATA_QUALITY') == 25
+        fixed = AdaptiveBatchSizer({'default': 10}, adaptive=False)
+        fixed.record_success('X', 10, seconds=0.01, size_bytes=10)
+        fixed.record_timeout('X', 10)
+        assert fixed.batch_size('X') == 10
+
+    def test_is_timeout_error_and_split(self):
+        """Test timeout detection and splitting of batches."""
+        assert is_timeout_error(Timeout())
+        assert is_timeout_error(HTTPError(response=Mock(status_code=504)))
+        assert not is_timeout_error(HTTPError(response=Mock(status_code=500)))
+        assert not is_timeout_error(ValueError())
+        assert split_batch(['a', 'b', 'c']) == [['a'], ['b', 'c']]
+        assert split_batch(['a']) == [['a']]
+
+    def test_read_timeout_while_streaming_is_a_timeout(self):
+        """Test that a body read timeout, which requests wraps in ConnectionError, counts as a timeout."""
+        try:
+            try:
+                raise ReadTimeoutError(None, "/api/export", "Read timed out.")
+            except ReadTimeoutError as e:
+                raise ConnectionError(e)  # As raised by Response.iter_content
+        except ConnectionError as e:
+            error = e
+        assert is_timeout_error(error)
+        assert not is_timeout_error(ConnectionError("Connection refused"))
+
+
+class TestIterPolicyBatches:
+    """Test cases for iter_policy_batches."""
+
+    def test_largest_type_first_and_sized_lazily(self, sizer):
+        """Test that batches come from the type with most policies left, at the size current when cut."""
+        policies = {'EQUALITY': ['e1', 'e2'], 'DATA_QUALITY': [f'q{i}' for i in range(100)]}
+        batches = iter_policy_batches(policies, sizer)
+        category, batch_num, start_idx, end_idx, batch_ids = next(batches)
+        assert (category, batch_num, start_idx, end_idx, len(batch_ids)) == ('DATA_QUALITY', 0, 0, 50, 50)
+        sizer.record_timeout('DATA_QUALITY', 50)
+        assert [(b[0], b[2], b[3]) for b in batches] == [('DATA_QUALITY', 50, 75), ('DATA_QUALITY', 75, 100),
+                                                         ('EQUALITY', 0, 2)]
@@ -0,0 +1,166 @@
+"""
+Test cases for resumable command checkpoints.
+
+This module contains tests for the append-only checkpoint journal, recovery
+from torn writes, the --resume flag and resuming an interrupted import.
+"""
+
+import csv
+import tempfile
+import shutil
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.adoc_migration_toolkit.execution.checkpoint import CheckpointJournal, checkpoint_paths
+from src.adoc_migration_toolkit.execution.command_parsing import strip_resume_flag
+from src.adoc_migration_toolkit.execution.asset_operations import execute_asset_config_import
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+class TestCheckpointJournal:
+    """Test cases for CheckpointJournal."""
+
+    def test_resume_skips_recorded_keys(self, temp_dir):
+        """Test that recorded keys survive a restart only when resuming."""
+        base = temp_dir / "input.csv"
+        journal = CheckpointJournal(base, "asset-config-import")
+        journal.record("DEV.a")
+        journal.record("DEV.b")
+        journal.close()
+
+        resumed = CheckpointJournal(base, "asset-config-import", resume=True)
+        assert resumed.resumed == 2
+        assert resumed.is_done("DEV.a") and "DEV.b" in resumed
+        assert not resumed.is_done("DEV.c")
+        resumed.close()
+
+        fresh = CheckpointJournal(base, "asset-config-import")
+        assert len(fresh) == 0
+        fresh.close()
+
+    def test_torn_row_is_truncated_on_resume(self, temp_dir):
+        """Test that rows written after the last journal record are dropped on resume."""
+        output = temp_dir / "export.csv"
+        journal = CheckpointJournal(output, "asset-profile-export", with_rows=True)
+        journal.append_row("a", ["t1", '{"x": 1}', "s1"])
+        journal.append_row("b", ["t2", '{"x": 2}', "s2"])
+        journal.close()
+
+        journal_path, partial_path = checkpoint_paths(output, "asset-profile-export")
+        with open(partial_path, 'ab') as f:
+            f.write(b'"t3","{\\"x\\"')  # Crash in the middle of a row
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"key": "c", "off')  # Crash in the middle of a journal record
+
+        resumed = CheckpointJournal(output, "asset-profile-export", resume=True, with_rows=True)
+        assert resumed.resumed == 2
+        resumed.append_row("c", ["t3", '{"x": 3}', "s3"])
+        assert list(resumed.iter_rows()) == [["t1", '{"x": 1}', "s1"], ["t2", '{"x": 2}', "s2"],
+                                              ["t3", '{"x": 3}', "s3"]]
+        resumed.close()
+
+    def test_rows_from_many_threads_resume_intact(self, temp_dir):
+        """Test that rows appended from worker threads are all journaled with their byte ranges."""
+        output = temp_dir / "export.csv"
+        journal = CheckpointJournal(output, "asset-config-export", with_rows=True)
+
+        def export(thread_id):
+            for i in range(50):
+                journal.append_row(f"{thread_id}-{i}", [f"t{thread_id}-{i}", '{"x": "a,b"}'])
+
+        threads = [threading.Thread(target=export, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(journal) == 200
+        journal.close()
+
+        resumed = CheckpointJournal(output, "asset-config-export", resume=True, with_rows=True)
+        assert resumed.resumed == 200
+        rows = list(resumed.iter_rows())
+        assert sorted(row[0] for row in rows) == sorted(f"t{t}-{i}" for t in range(4) for i in range(50))
+        resumed.close()
+
+    def test_copy_rows_to_matches_rewritten_rows(self, temp_dir):
+        """Test that copying the partial output gives the same file as re-writing its parsed rows."""
+        output = temp_dir / "export.csv"
+        journal = CheckpointJournal(output, "asset-config-export", with_rows=True)
+        journal.append_row("a", ["t1", '{"x": "a,b"}', "s1"])
+        journal.append_row("b", ["t2", 'line\nbreak', "s2"])
+
+        copied = temp_dir / "copied.csv"
+        with open(copied, 'w', newline='', encoding='utf-8') as f:
+            journal.copy_rows_to(f)
+        rewritten = temp_dir / "rewritten.csv"
+        with open(rewritten, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f, quoting=csv.QUOTE_ALL).writerows(journal.iter_rows())
+        journal.close()
+
+        assert copied.read_bytes() == rewritten.read_bytes()
+
+    def test_finish_keeps_journal_only_on_failure(self, temp_dir):
+        """Test that a clean run removes the journal and a failed run keeps it."""
+        output = temp_dir / "export.csv"
+        journal_path, partial_path = checkpoint_paths(output, "asset-config-export")
+
+        journal = CheckpointJournal(output, "asset-config-export", with_rows=True)
+        journal.append_row("a", ["t1"])
+        journal.finish(failed=1)
+        assert journal_path.exists() and partial_path.exists()
+
+        journal = CheckpointJournal(output, "asset-config-export", resume=True, with_rows=True)
+        journal.finish()
+        assert not journal_path.exists() and not partial_path.exists()
+
+    def test_directory_base(self, temp_dir):
+        """Test that journals for a directory are kept inside it as hidden files."""
+        journal_path, _ = checkpoint_paths(temp_dir, "policy-import")
+        assert journal_path == temp_dir / ".policy-import.journal"
+
+    def test_strip_resume_flag(self):
+        """Test that --resume is removed without touching the other arguments."""
+        assert strip_resume_flag("asset-config-import data.csv --resume --parallel") == \
+            ("asset-config-import data.csv --parallel", True)
+        assert strip_resume_flag("policy-import *.zip --quiet") == ("policy-import *.zip --quiet", False)
+
+
+class TestResumeAssetConfigImport:
+    """Test cases for resuming asset-config-import."""
+
+    def test_resume_retries_only_failed_assets(self, temp_dir):
+        """Test that a resumed run only calls the API for assets that failed before."""
+        csv_file = temp_dir / "asset-config-import-ready.csv"
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['target_uid', 'config_json', 'source_uid'])
+            writer.writerow(['DEV.a', '{"assetConfiguration": {}}', 'PROD.a'])
+            writer.writerow(['DEV.b', '{"assetConfiguration": {}}', 'PROD.b'])
+
+        def api(endpoint, method='GET', **kwargs):
+            if method == 'GET':
+                return {'data': [{'id': 1 if endpoint.endswith('DEV.a') else 2}]}
+            if endpoint == '/catalog-server/api/assets/2/config':
+                raise Exception("Connection reset")
+            return {'ok': True}
+
+        client = Mock()
+        client.make_api_call.side_effect = api
+        execute_asset_config_import(str(csv_file), client, Mock(), quiet_mode=True)
+        assert checkpoint_paths(csv_file, "asset-config-import")[0].exists()
+
+        client = Mock()
+        client.make_api_call.return_value = {'data': [{'id': 2}]}
+        execute_asset_config_import(str(csv_file), client, Mock(), quiet_mode=True, resume=True)
+        endpoints = [call.kwargs['endpoint'] for call in client.make_api_call.call_args_list]
+        assert endpoints == ['/catalog-server/api/assets?uid=DEV.b', '/catalog-server/api/assets/2/config']
+        assert not checkpoint_paths(csv_file, "asset-config-import")[0].exists()
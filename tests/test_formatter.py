@@ -17,6 +17,7 @@ from datetime import datetime
 
 from src.adoc_migration_toolkit.execution.formatter import (
     PolicyExportFormatter,
+    AssetExportFormatter,
     validate_arguments,
     parse_formatter_command,
     execute_formatter
@@ -439,7 +440,7 @@ class TestPolicyExportFormatter:
         
         # Create invalid JSON file
         json_file = temp_dir / "invalid.json"
-        json_file.write_text("{ invalid json }")
+        json_file.write_text("{ invalid PROD_DB json }")
         
         result = formatter.process_json_file(json_file)
         
@@ -484,6 +485,130 @@ class TestPolicyExportFormatter:
             assert "DEV_DB" in json_content
             assert "PROD_DB" not in json_content
     
+    def test_process_zip_file_keeps_unchanged_json(self, temp_dir):
+        """Test that JSON members without replacements keep their original bytes."""
+        formatter = PolicyExportFormatter(
+            input_dir=str(temp_dir),
+            string_transforms={"PROD_DB": "DEV_DB"}
+        )
+
+        original = '{\n  "name": "untouched",\n  "db": "OTHER_DB"\n}'
+        zip_file = temp_dir / "test.zip"
+        with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+            zip_ref.writestr("untouched.json", original)
+            zip_ref.writestr("changed.json", '{"db": "PROD_DB"}')
+
+        assert formatter.process_zip_file(zip_file) == True
+        assert formatter.stats["json_files_processed"] == 2
+
+        with zipfile.ZipFile(formatter.output_dir / "test-import-ready.zip", 'r') as zip_ref:
+            assert zip_ref.read("untouched.json").decode('utf-8') == original
+            assert json.loads(zip_ref.read("changed.json")) == {"db": "DEV_DB"}
+
+    def test_unchanged_files_are_copied_byte_for_byte(self, temp_dir):
+        """Test that files without replacements keep their original bytes and are not transformed."""
+        formatter = PolicyExportFormatter(
+            input_dir=str(temp_dir),
+            string_transforms={"PROD_DB": "DEV_DB"}
+        )
+        original = '{\n  "name": "untouched",\n  "db": "OTHER_DB"\n}'
+        (temp_dir / "untouched.json").write_text(original)
+        # The source only occurs in a key, which is never transformed
+        (temp_dir / "key_only.json").write_text('{ "PROD_DB": 1 }')
+
+        with patch.object(formatter, 'apply_string_transforms') as apply:
+            assert formatter.process_json_file(temp_dir / "untouched.json") == True
+        apply.assert_not_called()
+        assert formatter.process_json_file(temp_dir / "key_only.json") == True
+
+        assert (formatter.output_dir / "untouched.json").read_text() == original
+        assert (formatter.output_dir / "key_only.json").read_text() == '{ "PROD_DB": 1 }'
+        assert formatter.stats["files_unchanged"] == 2
+
+    def test_unchanged_files_are_not_parsed(self, temp_dir):
+        """Test that files without replacements or assets to extract are copied without parsing."""
+        formatter = PolicyExportFormatter(
+            input_dir=str(temp_dir),
+            string_transforms={"PROD_DB": "DEV_DB"}
+        )
+        (temp_dir / "notes.json").write_text("not json, no sources")
+        (temp_dir / "data_quality_policy_definitions.json").write_text("not json, no sources")
+
+        for threshold in (0, 1 << 62):
+            with patch('src.adoc_migration_toolkit.execution.formatter.STREAMING_THRESHOLD', threshold), \
+                    patch('src.adoc_migration_toolkit.execution.formatter.json.loads') as loads, \
+                    patch.object(formatter, '_transform_json_stream') as transform_stream:
+                assert formatter.process_json_file(temp_dir / "notes.json") == True
+            loads.assert_not_called()
+            transform_stream.assert_not_called()
+            assert (formatter.output_dir / "notes.json").read_text() == "not json, no sources"
+
+            # Policy definitions are still parsed to extract their assets
+            assert formatter.process_json_file(temp_dir / "data_quality_policy_definitions.json") == False
+
+    def test_large_policy_files_are_streamed(self, temp_dir):
+        """Test that files above the streaming threshold give the same output and statistics."""
+        policies = [
+            {"name": "p1", "isSegmented": False, "uid": "PROD_DB.t1", "description": "PROD_DB"},
+            {"name": "p2", "isSegmented": True, "engineType": "SPARK",
+             "backingAssets": [{"uid": "PROD_DB.t2"}]}
+        ]
+        (temp_dir / "data_quality_policy_definitions.json").write_text(json.dumps(policies, indent=2))
+        with zipfile.ZipFile(temp_dir / "test.zip", 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+            zip_ref.writestr("data_quality_policy_definitions.json", json.dumps(policies))
+            zip_ref.writestr("broken.json", '[{"name": ')
+
+        results = []
+        for threshold in (0, 1 << 62):
+            output_dir = temp_dir / f"out-{threshold}"
+            formatter = PolicyExportFormatter(
+                input_dir=str(temp_dir),
+                string_transforms={"PROD_DB": "DEV_DB"},
+                output_dir=str(output_dir)
+            )
+            with patch('src.adoc_migration_toolkit.execution.formatter.STREAMING_THRESHOLD', threshold):
+                assert formatter.process_json_file(temp_dir / "data_quality_policy_definitions.json") == True
+                assert formatter.process_zip_file(temp_dir / "test.zip") == True
+            with zipfile.ZipFile(formatter.output_dir / "test-import-ready.zip", 'r') as zip_ref:
+                zipped = json.loads(zip_ref.read("data_quality_policy_definitions.json"))
+                broken = zip_ref.read("broken.json")
+            stats = {key: value for key, value in formatter.stats.items() if key != "errors"}
+            results.append((json.loads((formatter.output_dir / "data_quality_policy_definitions.json").read_text()),
+                            zipped, broken, stats, len(formatter.stats["errors"]),
+                            formatter.all_asset_uids, formatter.extracted_assets))
+
+        assert results[0] == results[1]
+        assert results[0][0][0]["description"] == "DEV_DB"
+        assert results[0][1] == results[0][0]
+        assert results[0][2] == b'[{"name": '
+        assert results[0][3]["total_policies_processed"] == 4
+        assert results[0][4] == 1
+
+    def test_large_latin1_files_are_streamed(self, temp_dir):
+        """Test that streamed files that are not UTF-8 fall back to latin-1 like loaded ones."""
+        policies = [{"name": "caf\u00e9", "isSegmented": False, "uid": "PROD_DB.t1", "description": "PROD_DB"}]
+        content = json.dumps(policies, ensure_ascii=False).encode('latin-1')
+        (temp_dir / "data_quality_policy_definitions.json").write_bytes(content)
+        (temp_dir / "unchanged.json").write_bytes('{"name": "caf\u00e9"}'.encode('latin-1'))
+        with zipfile.ZipFile(temp_dir / "test.zip", 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+            zip_ref.writestr("data_quality_policy_definitions.json", content)
+
+        formatter = PolicyExportFormatter(
+            input_dir=str(temp_dir),
+            string_transforms={"PROD_DB": "DEV_DB"}
+        )
+        with patch('src.adoc_migration_toolkit.execution.formatter.STREAMING_THRESHOLD', 10):
+            assert formatter.process_json_file(temp_dir / "data_quality_policy_definitions.json") == True
+            assert formatter.process_json_file(temp_dir / "unchanged.json") == True
+            assert formatter.process_zip_file(temp_dir / "test.zip") == True
+
+        assert formatter.stats["errors"] == []
+        output = json.loads((formatter.output_dir / "data_quality_policy_definitions.json").read_text('utf-8'))
+        assert output[0] == {"name": "caf\u00e9", "isSegmented": False, "uid": "DEV_DB.t1", "description": "DEV_DB"}
+        assert (formatter.output_dir / "unchanged.json").read_bytes() == '{"name": "caf\u00e9"}'.encode('latin-1')
+        with zipfile.ZipFile(formatter.output_dir / "test-import-ready.zip", 'r') as zip_ref:
+            assert json.loads(zip_ref.read("data_quality_policy_definitions.json")) == output
+
     def test_process_zip_file_nonexistent(self, temp_dir):
         """Test ZIP file processing with nonexistent file."""
         formatter = PolicyExportFormatter(
@@ -556,6 +681,38 @@ class TestPolicyExportFormatter:
         assert (formatter.policy_export_dir / "segmented_spark_uids.csv").exists()
         assert (formatter.asset_export_dir / "asset_uids.csv").exists()
 
+    def test_process_directory_with_processes(self, temp_dir, sample_json_data, sample_policy_data):
+        """Test that processing in worker processes gives the same results as a sequential run."""
+        input_dir = temp_dir / "input"
+        input_dir.mkdir()
+        with open(input_dir / "test.json", 'w') as f:
+            json.dump(sample_json_data, f)
+        for i in range(3):
+            with zipfile.ZipFile(input_dir / f"export_{i}.zip", 'w') as zip_ref:
+                zip_ref.writestr("data_quality_policy_definitions.json", json.dumps(sample_policy_data))
+                zip_ref.writestr("other.json", json.dumps(sample_json_data))
+        
+        results = []
+        for processes in (1, 3):
+            formatter = PolicyExportFormatter(
+                input_dir=str(input_dir),
+                string_transforms={"PROD_DB": "DEV_DB"},
+                output_dir=str(temp_dir / f"out-{processes}")
+            )
+            stats = formatter.process_directory(processes=processes)
+            with zipfile.ZipFile(formatter.output_dir / "export_1-import-ready.zip", 'r') as zip_ref:
+                contents = {name: zip_ref.read(name) for name in zip_ref.namelist()}
+            assets_csv = (formatter.asset_export_dir / "asset_uids.csv").read_text()
+            results.append((stats, contents, assets_csv))
+        
+        (sequential, sequential_zip, sequential_csv), (parallel, parallel_zip, parallel_csv) = results
+        assert parallel["successful"] == 4 and parallel["failed"] == 0
+        for key in ("files_investigated", "changes_made", "extracted_assets", "all_assets",
+                    "total_policies_processed", "segmented_spark_policies", "deep_scan_count"):
+            assert parallel[key] == sequential[key], key
+        assert parallel_zip == sequential_zip
+        assert parallel_csv == sequential_csv
+
     def test_process_asset_config_export_csv_success(self, temp_dir):
         """Test successful processing of asset-config-export.csv."""
         from src.adoc_migration_toolkit.execution.formatter import PolicyExportFormatter
@@ -681,6 +838,33 @@ class TestPolicyExportFormatter:
         assert output_file.exists()
 
 
+class TestAssetExportFormatter:
+    """Test cases for AssetExportFormatter class."""
+    
+    def test_process_directory(self, temp_dir):
+        """Test that asset CSV files are transformed, leaving source_uid unchanged."""
+        input_dir = temp_dir / "input"
+        input_dir.mkdir()
+        with open(input_dir / "asset-profile-export.csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['target-env', 'profile_json', 'source_uid'])
+            writer.writerow(['PROD_DB.users', '{"db": "PROD_DB"}', 'PROD_DB.users'])
+        
+        formatter = AssetExportFormatter(
+            input_dir=str(input_dir),
+            string_transforms={"PROD_DB": "DEV_DB"},
+            output_dir=str(temp_dir / "output"),
+            logger=logging.getLogger(__name__)
+        )
+        stats = formatter.process_directory()
+        
+        assert stats["successful"] == 1 and stats["failed"] == 0
+        assert stats["changes_made"] == 2
+        with open(temp_dir / "output" / "asset-import" / "asset-profile-import-ready.csv", newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[1] == ['DEV_DB.users', '{"db": "DEV_DB"}', 'PROD_DB.users']
+
+
 class TestValidateArguments:
     """Test cases for validate_arguments function."""
     
@@ -808,6 +992,18 @@ class TestParseFormatterCommand:
         assert input_dir is None
         assert string_transforms is None
 
+    def test_strip_processes_option(self):
+        """Test that --parallel and --processes are removed before parsing the command."""
+        from src.adoc_migration_toolkit.execution.command_parsing import strip_processes_option
+        
+        command, processes = strip_processes_option('policy-xfr --string-transform "A":"B" --processes 4 --quiet')
+        assert command == 'policy-xfr --string-transform "A":"B" --quiet'
+        assert processes == 4
+        assert strip_processes_option('policy-xfr --string-transform "A":"B"')[1] == 1
+        assert strip_processes_option('policy-xfr --parallel')[1] >= 1
+        with pytest.raises(ValueError):
+            strip_processes_option('policy-xfr --processes 0')
+
 
 class TestExecuteFormatter:
     """Test cases for execute_formatter function."""
@@ -929,7 +1125,7 @@ class TestExecuteFormatter:
         """Test execute_formatter with processing error."""
         # Create invalid JSON file
         json_file = temp_dir / "invalid.json"
-        json_file.write_text("{ invalid json }")
+        json_file.write_text("{ invalid PROD_DB json }")
         
         execute_formatter(
             input_dir=str(temp_dir),
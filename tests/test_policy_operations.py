@@ -7,6 +7,7 @@ including policy export/import, list export, and rule tag export.
 
 import pytest
 import json
+import hashlib
 import csv
 import tempfile
 import logging
@@ -19,10 +20,26 @@ from datetime import datetime
 from src.adoc_migration_toolkit.execution.policy_operations import (
     execute_policy_list_export,
     execute_policy_export,
+    execute_policy_export_parallel,
     execute_policy_import,
-    execute_rule_tag_export
+    execute_rule_tag_export,
+    filter_policy_versions
 )
 from src.adoc_migration_toolkit.shared import globals
+from src.adoc_migration_toolkit.shared.api_client import DownloadResult
+
+
+def fake_downloads(*bodies):
+    """Side effect for download_to_file that writes the given bodies in turn, raising exceptions."""
+    remaining = iter(bodies)
+
+    def download_to_file(endpoint, output_file, **kwargs):
+        body = next(remaining)
+        if isinstance(body, Exception):
+            raise body
+        Path(output_file).write_bytes(body)
+        return DownloadResult(Path(output_file), len(body), hashlib.sha256(body).hexdigest())
+    return download_to_file
 
 
 @pytest.fixture
@@ -435,6 +452,142 @@ class TestExecutePolicyExport:
         assert len(zip_files) > 0
 
 
+class TestExecutePolicyExportParallel:
+    """Test cases for execute_policy_export_parallel function."""
+
+    def test_batches_scheduled_largest_first_across_categories(self, temp_dir, mock_client, mock_logger):
+        """Test that batches from all categories share one queue, largest first, with per-category filenames."""
+        csv_file = temp_dir / "policy-export" / "policies-all-export.csv"
+        csv_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'type', 'engineType', 'tableAssetIds', 'assemblyIds', 'assemblyNames',
+                             'sourceTypes', 'subType', 'policyName', 'tableAssetIdsTypes'])
+            for policy_id in range(1, 4):
+                writer.writerow([f'e{policy_id}', 'EQUALITY', 'SPARK', '', '', '', '', '', '', ''])
+            for policy_id in range(1, 6):
+                writer.writerow([f'q{policy_id}', 'DATA_QUALITY', 'SPARK', '', '', '', '', '', '', ''])
+
+        mock_client.download_to_file.side_effect = fake_downloads(*[b'PK zip content'] * 3)
+        with patch('src.adoc_migration_toolkit.execution.policy_operations.globals.GLOBAL_OUTPUT_DIR', temp_dir), \
+             patch('src.adoc_migration_toolkit.execution.policy_operations.get_thread_client', return_value=mock_client):
+            execute_policy_export_parallel(mock_client, mock_logger, quiet_mode=True, max_threads=1,
+                                           filter_versions=False)
+
+        batch_ids = [call.args[0].split('ids=')[1].split('&')[0]
+                     for call in mock_client.download_to_file.call_args_list]
+        assert batch_ids == ['q1,q2,q3,q4,q5', 'e1,e2', 'e3']
+        zip_names = sorted(p.name.split('-')[0] for p in (temp_dir / "policy-export").glob("*.zip"))
+        assert zip_names == ['data_quality', 'equality', 'equality']
+
+
+    def test_timed_out_batch_is_retried_in_halves(self, temp_dir, mock_client, mock_logger):
+        """Test that a batch that times out is split and both halves are exported."""
+        from requests.exceptions import Timeout
+        csv_file = temp_dir / "policy-export" / "policies-all-export.csv"
+        csv_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'type', 'engineType', 'tableAssetIds', 'assemblyIds', 'assemblyNames',
+                             'sourceTypes', 'subType', 'policyName', 'tableAssetIdsTypes'])
+            for policy_id in range(1, 5):
+                writer.writerow([f'q{policy_id}', 'DATA_QUALITY', 'SPARK', '', '', '', '', '', '', ''])
+
+        mock_client.download_to_file.side_effect = fake_downloads(Timeout("read timed out"), b'PK half 1', b'PK half 2')
+        with patch('src.adoc_migration_toolkit.execution.policy_operations.globals.GLOBAL_OUTPUT_DIR', temp_dir), \
+             patch('src.adoc_migration_toolkit.execution.policy_operations.get_thread_client', return_value=mock_client):
+            execute_policy_export_parallel(mock_client, mock_logger, quiet_mode=True, max_threads=1,
+                                           filter_versions=False)
+
+        batch_ids = [call.args[0].split('ids=')[1].split('&')[0]
+                     for call in mock_client.download_to_file.call_args_list]
+        assert batch_ids == ['q1,q2,q3,q4', 'q1,q2', 'q3,q4']
+        assert len(list((temp_dir / "policy-export").glob("*.zip"))) == 2
+
+
+    def test_batch_with_failed_version_filtering_is_not_journaled(self, temp_dir, mock_client, mock_logger, capsys):
+        """Test that a batch whose version filtering fails counts as failed and is exported again on resume."""
+        csv_file = temp_dir / "policy-export" / "policies-all-export.csv"
+        csv_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'type', 'engineType', 'tableAssetIds', 'assemblyIds', 'assemblyNames',
+                             'sourceTypes', 'subType', 'policyName', 'tableAssetIdsTypes'])
+            writer.writerow(['q1', 'DATA_QUALITY', 'SPARK', '', '', '', '', '', '', ''])
+            writer.writerow(['e1', 'EQUALITY', 'SPARK', '', '', '', '', '', '', ''])
+
+        def filter_versions(zip_file_path, quiet_mode=False, verbose_mode=False):
+            return (False, 0, 0) if zip_file_path.name.startswith('data_quality') else (True, 0, 0)
+
+        mock_client.download_to_file.side_effect = fake_downloads(*[b'PK zip content'] * 3)
+        with patch('src.adoc_migration_toolkit.execution.policy_operations.globals.GLOBAL_OUTPUT_DIR', temp_dir), \
+             patch('src.adoc_migration_toolkit.execution.policy_operations.get_thread_client', return_value=mock_client), \
+             patch('src.adoc_migration_toolkit.execution.policy_operations.filter_policy_versions',
+                   side_effect=filter_versions):
+            execute_policy_export_parallel(mock_client, mock_logger, quiet_mode=True, max_threads=1)
+            output = capsys.readouterr().out
+            assert "Total successful exports: 1" in output
+            assert "Total failed exports: 1" in output
+            assert "Version filtering failed for data_quality" in output
+
+            execute_policy_export_parallel(mock_client, mock_logger, quiet_mode=True, max_threads=1, resume=True)
+
+        batch_ids = [call.args[0].split('ids=')[1].split('&')[0]
+                     for call in mock_client.download_to_file.call_args_list]
+        assert sorted(batch_ids[:2]) == ['e1', 'q1']
+        assert batch_ids[2:] == ['q1']
+
+
+class TestFilterPolicyVersions:
+    """Test cases for filter_policy_versions function."""
+
+    @staticmethod
+    def _write_zip(path, members):
+        import zipfile
+        with zipfile.ZipFile(path, 'w') as zf:
+            for name, data, compress_type in members:
+                zf.writestr(name, data, compress_type=compress_type)
+
+    def test_rewrites_only_schema_drift_members(self, temp_dir):
+        """Test that older SCHEMA_DRIFT versions are removed and other members are copied unchanged."""
+        import zipfile
+        drift = [{'name': 'drift', 'type': 'SCHEMA_DRIFT', 'items': [{'ruleVersion': 1}, {'ruleVersion': 3}, {'ruleVersion': 2}]}]
+        quality = [{'name': 'dq', 'type': 'DATA_QUALITY', 'items': [{'ruleVersion': 1}, {'ruleVersion': 2}]}]
+        zip_path = temp_dir / "export.zip"
+        self._write_zip(zip_path, [
+            ('quality.json', json.dumps(quality), zipfile.ZIP_DEFLATED),
+            ('drift.json', json.dumps(drift), zipfile.ZIP_DEFLATED),
+            ('meta/notes.txt', b'x' * 1000, zipfile.ZIP_STORED),
+        ])
+        with zipfile.ZipFile(zip_path) as zf:
+            before = {info.filename: (info.compress_type, info.compress_size, info.CRC) for info in zf.infolist()}
+
+        assert filter_policy_versions(zip_path, quiet_mode=True) == (True, 2, 2)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert [info.filename for info in zf.infolist()] == ['quality.json', 'drift.json', 'meta/notes.txt']
+            assert json.loads(zf.read('drift.json'))[0]['items'] == [{'ruleVersion': 3}]
+            assert json.loads(zf.read('quality.json')) == quality
+            for name in ('quality.json', 'meta/notes.txt'):
+                info = zf.getinfo(name)
+                assert (info.compress_type, info.compress_size, info.CRC) == before[name]
+        assert (temp_dir / "export.zip.backup").exists()
+        assert not (temp_dir / "export.zip.filtering").exists()
+
+    def test_zip_without_older_versions_is_untouched(self, temp_dir):
+        """Test that a ZIP needing no filtering is neither rewritten nor backed up."""
+        import zipfile
+        zip_path = temp_dir / "export.zip"
+        drift = [{'name': 'drift', 'type': 'SCHEMA_DRIFT', 'items': [{'ruleVersion': 1}]}]
+        self._write_zip(zip_path, [('drift.json', json.dumps(drift), zipfile.ZIP_DEFLATED)])
+        original = zip_path.read_bytes()
+
+        assert filter_policy_versions(zip_path, quiet_mode=True) == (True, 1, 0)
+        assert zip_path.read_bytes() == original
+        assert not (temp_dir / "export.zip.backup").exists()
+
+
 class TestExecutePolicyImport:
     """Test cases for execute_policy_import function."""
     
@@ -0,0 +1,97 @@
+"""
+Test cases for the single-pass policy visitor.
+
+This module contains tests for walk_policies and the visitors used by
+policy-xfr and the Custom SQL check.
+"""
+
+import json
+import zipfile
+
+from src.adoc_migration_toolkit.execution.policy_visitor import (
+    walk_policies,
+    PolicyVisitor,
+    StringTransformVisitor,
+    AssetUidVisitor,
+    SegmentedPolicyVisitor,
+    CustomSqlTableVisitor
+)
+from src.adoc_migration_toolkit.execution.custom_sql_operations import _extract_policy_tables_from_zips
+
+
+POLICIES = [
+    {
+        "name": "spark_policy",
+        "isSegmented": True,
+        "engineType": "SPARK",
+        "backingAssets": [{"uid": "PROD.db.t1", "parentAssetUid": "PROD.db"}],
+        "customSqlConfig": {"sqlExpression": "SELECT * FROM PROD.sales.orders"},
+        "nested": [["PROD", {"assetUid": " PROD.db.t2 "}]]
+    },
+    {
+        "name": "plain_policy",
+        "isSegmented": False,
+        "backingAssetId": "PROD.db.t3"
+    },
+    "PROD note"
+]
+
+
+def test_single_pass_combines_all_visitors():
+    """Test that one walk transforms strings, collects UIDs and classifies policies."""
+    strings = StringTransformVisitor(lambda value: value.replace("PROD", "DEV"))
+    uids = AssetUidVisitor()
+    segmented = SegmentedPolicyVisitor()
+
+    result = walk_policies(POLICIES, [strings, uids, segmented])
+
+    assert result[0]["backingAssets"][0]["uid"] == "DEV.db.t1"
+    assert result[0]["nested"] == [["DEV", {"assetUid": " DEV.db.t2 "}]]
+    assert result[2] == "DEV note"
+    assert POLICIES[0]["backingAssets"][0]["uid"] == "PROD.db.t1"  # The input is not modified
+    assert uids.asset_uids == {"PROD.db.t1", "PROD.db", "PROD.db.t2", "PROD.db.t3"}
+    assert segmented.extracted_assets == {"PROD.db.t1"}
+    assert segmented.counts["total_policies_processed"] == 2
+    assert segmented.counts["non_segmented_policies"] == 1
+
+
+def test_policy_level_visitors_do_not_copy_the_document():
+    """Test that a walk without field or string visitors returns the input unchanged."""
+    class Names(PolicyVisitor):
+        def __init__(self):
+            self.names = []
+
+        def enter_policy(self, policy):
+            self.names.append(policy["name"])
+
+    names = Names()
+    assert walk_policies(POLICIES, [names]) is POLICIES
+    assert names.names == ["spark_policy", "plain_policy"]
+
+
+def test_walk_handles_deep_documents():
+    """Test that deeply nested documents do not hit the recursion limit."""
+    document = {"name": "deep", "uid": "PROD.root"}
+    node = document
+    for _ in range(5000):
+        node["child"] = {"value": "PROD"}
+        node = node["child"]
+
+    strings = StringTransformVisitor(lambda value: value.replace("PROD", "DEV"))
+    result = walk_policies(document, [strings])
+
+    assert strings.changes == 5001
+    assert result["uid"] == "DEV.root"
+
+
+def test_custom_sql_tables_from_zips(tmp_path):
+    """Test that the Custom SQL check collects table references through the visitor."""
+    with zipfile.ZipFile(tmp_path / "export.zip", 'w') as zip_ref:
+        zip_ref.writestr("data_quality_policy_definitions.json", json.dumps(POLICIES))
+
+    tables = _extract_policy_tables_from_zips(tmp_path)
+
+    assert dict(tables) == {"spark_policy": {"PROD.sales.orders"}}
+    visitor = CustomSqlTableVisitor()
+    walk_policies({"name": "p", "customSqlConfig": [{"sqlExpression": "a.b.c JOIN d.e.f"}]}, [visitor])
+    assert visitor.tables == {"p": {"a.b.c", "d.e.f"}}
@@ -135,6 +135,41 @@ class TestExecuteSegmentsExport:
         )
         mock_logger.error.assert_called()
 
+    def test_jsonl_format(self, temp_dir, mock_client, mock_logger, sample_csv_data, sample_asset_response, sample_segments_response):
+        """Test that --format jsonl writes one record per line next to the default CSV path."""
+        csv_file = temp_dir / "test.csv"
+        with open(csv_file, 'w') as f:
+            f.write(sample_csv_data)
+        mock_client.make_api_call.side_effect = [
+            sample_asset_response, sample_segments_response,
+            sample_asset_response, sample_segments_response
+        ]
+        with patch('src.adoc_migration_toolkit.execution.segment_operations.globals.GLOBAL_OUTPUT_DIR', temp_dir), \
+             patch('src.adoc_migration_toolkit.shared.file_utils.globals.GLOBAL_OUTPUT_DIR', temp_dir):
+            execute_segments_export(csv_file=str(csv_file), client=mock_client, logger=mock_logger,
+                                    quiet_mode=True, record_format='jsonl')
+        
+        output_file = temp_dir / "policy-import" / "segments_output.jsonl"
+        records = [json.loads(line) for line in output_file.read_text(encoding='utf-8').splitlines()]
+        assert records == [
+            {'target-env': 'asset-1-DEV_DB', 'segments_json': sample_segments_response},
+            {'target-env': 'asset-2-DEV_DB', 'segments_json': sample_segments_response},
+        ]
+
+    def test_strip_format_option(self):
+        """Test that --format is parsed and removed, and switches the default output file to .jsonl."""
+        from src.adoc_migration_toolkit.execution.command_parsing import strip_format_option, default_record_output_file
+        assert strip_format_option("segments-export data.csv --format jsonl --quiet") == \
+            ("segments-export data.csv --quiet", 'jsonl')
+        assert strip_format_option("segments-export data.csv")[1] == 'csv'
+        with pytest.raises(ValueError):
+            strip_format_option("segments-export --format xml")
+        with pytest.raises(ValueError):
+            strip_format_option("segments-export --format")
+        assert default_record_output_file("segments-export", "out/segments_output.csv", 'jsonl') == \
+            str(Path("out/segments_output.jsonl"))
+        assert default_record_output_file("segments-export --output-file my.csv", "my.csv", 'jsonl') == "my.csv"
+
 class TestExecuteSegmentsImport:
     def test_success(self, temp_dir, mock_client, mock_logger, sample_segments_response):
         csv_file = temp_dir / "segments.csv"
@@ -207,4 +242,20 @@ class TestExecuteSegmentsImport:
             client=mock_client,
             logger=mock_logger
         )
-        mock_logger.error.assert_called() 
\ No newline at end of file
+        mock_logger.error.assert_called() 
+
+    def test_jsonl_input(self, temp_dir, mock_client, mock_logger, sample_segments_response):
+        """Test that a JSON Lines file is detected and its segments imported."""
+        jsonl_file = temp_dir / "segments.jsonl"
+        jsonl_file.write_text(json.dumps({'target-env': 'asset-1-DEV_DB', 'segments_json': sample_segments_response}) + '\n',
+                              encoding='utf-8')
+        mock_client.make_api_call.side_effect = [{"data": [{"id": 12345}]}, {}]
+        # The default .csv path falls back to the .jsonl file next to it
+        execute_segments_import(
+            csv_file=str(temp_dir / "segments.csv"),
+            client=mock_client,
+            logger=mock_logger
+        )
+        mock_logger.error.assert_not_called()
+        payload = mock_client.make_api_call.call_args_list[1].kwargs['json_payload']
+        assert [segment['name'] for segment in payload['segments']] == ['seg1', 'seg2']
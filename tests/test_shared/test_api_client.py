@@ -5,16 +5,20 @@ This module contains comprehensive test cases for the API client functionality
 in the shared module, including unit tests, integration tests, and mock tests.
 """
 
+import asyncio
 import pytest
 import tempfile
 import json
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, mock_open
-from requests.exceptions import RequestException, Timeout, ConnectionError
+from requests.exceptions import RequestException, Timeout, ConnectionError, HTTPError
+from requests.models import Response
 import requests
 
 from adoc_migration_toolkit.shared.api_client import AcceldataAPIClient, create_api_client
+from adoc_migration_toolkit.shared.api_client import get_pooled_adapter, reset_connection_pools
+from adoc_migration_toolkit.shared import globals as shared_globals
 
 
 class TestAcceldataAPIClient:
@@ -595,4 +599,292 @@ class TestCreateAPIClient:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__]) 
+
+class TestConnectionPooling:
+    """Test cases for shared connection pools and per-thread clients."""
+
+    @pytest.fixture
+    def client(self):
+        reset_connection_pools()
+        yield AcceldataAPIClient(
+            host="https://test.acceldata.app",
+            access_key="test_access",
+            secret_key="test_secret",
+            tenant="test_tenant"
+        )
+        reset_connection_pools()
+
+    def test_session_uses_shared_adapter(self, client):
+        """Test that the host prefix is routed through the shared pooled adapter."""
+        adapter = get_pooled_adapter("https://test.acceldata.app")
+        assert client.session.get_adapter("https://test.acceldata.app/api/test") is adapter
+        assert adapter._pool_maxsize == shared_globals.HTTP_CONFIG['pool_maxsize']
+
+    def test_for_thread_reuses_clone_per_thread(self, client):
+        """Test that each thread gets one cached clone sharing the pools."""
+        import threading
+        main_clone = client.for_thread()
+        assert main_clone is client.for_thread()
+        assert main_clone is not client
+        assert main_clone.session is not client.session
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(client.for_thread()))
+        worker.start()
+        worker.join()
+        assert other[0] is not main_clone
+        url = "https://test.acceldata.app/api/test"
+        assert other[0].session.get_adapter(url) is client.session.get_adapter(url)
+
+    def test_reset_connection_pools_remounts_adapter(self, client):
+        """Test that make_api_call picks up pools rebuilt after a config change."""
+        url = "https://test.acceldata.app/api/test"
+        old_adapter = client.session.get_adapter(url)
+        with patch.dict(shared_globals.HTTP_CONFIG, {'pool_maxsize': 64}):
+            reset_connection_pools()
+            mock_response = Mock()
+            mock_response.json.return_value = {"status": "success"}
+            with patch.object(client.session, 'get', return_value=mock_response):
+                client.make_api_call("/api/test")
+            new_adapter = client.session.get_adapter(url)
+            assert new_adapter is not old_adapter
+            assert new_adapter._pool_maxsize == 64
+
+    def test_get_thread_client_falls_back_for_other_clients(self):
+        """Test get_thread_client with clients that do not support for_thread."""
+        from adoc_migration_toolkit.execution.utils import get_thread_client
+        mock_client = Mock()
+        mock_client.host = "https://test.acceldata.app"
+        mock_client.target_tenant = "target"
+        thread_client = get_thread_client(mock_client)
+        assert thread_client is not mock_client
+        assert thread_client.host == "https://test.acceldata.app"
+        assert thread_client.target_tenant == "target"
+
+    def test_file_uploads_reuse_upload_session(self, client):
+        """Test that consecutive uploads share one no-retry keep-alive session."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"uuid": "abc"}
+        upload_session = client._get_upload_session()
+        with patch.object(upload_session, 'post', return_value=mock_response) as mock_post:
+            for _ in range(2):
+                client.make_api_call("/api/upload", method="POST", files={"file": ("a.zip", b"data")})
+        assert mock_post.call_count == 2
+        assert client._get_upload_session() is upload_session
+        adapter = upload_session.get_adapter("https://test.acceldata.app/api/upload")
+        assert adapter is get_pooled_adapter("https://test.acceldata.app", retry=False)
+        assert adapter.max_retries.total == 0
+
+    def test_file_upload_streams_open_files(self, client):
+        """Test that open files are sent as a streaming multipart body."""
+        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as f:
+            f.write(b"PK" + b"x" * 100000)
+            zip_path = f.name
+        try:
+            mock_response = Mock()
+            mock_response.json.return_value = {"uuid": "abc"}
+            with open(zip_path, 'rb') as zip_file:
+                files = {"policy-config-file": ("policies.zip", zip_file, "application/zip")}
+                with patch.object(client._get_upload_session(), 'post', return_value=mock_response) as mock_post:
+                    client.make_api_call("/api/upload", method="POST", files=files)
+                    kwargs = mock_post.call_args[1]
+                    assert 'files' not in kwargs
+                    body = kwargs['data']
+                    assert kwargs['headers']['Content-Type'] == body.content_type
+                    chunks = []
+                    while True:
+                        chunk = body.read(8192)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+            payload = b"".join(chunks)
+            assert len(payload) == len(body)
+            assert b'name="policy-config-file"; filename="policies.zip"' in payload
+            assert b"Content-Type: application/zip" in payload
+            assert b"PK" + b"x" * 100000 in payload
+            assert payload.endswith(f"--{body.boundary}--\r\n".encode())
+        finally:
+            os.unlink(zip_path)
+
+    def test_close_keeps_shared_pools(self, client):
+        """Test that closing one client does not remove pools shared with other clients."""
+        adapter = get_pooled_adapter("https://test.acceldata.app")
+        client.close()
+        assert get_pooled_adapter("https://test.acceldata.app") is adapter
+        assert "https://test.acceldata.app/" not in client.session.adapters
+
+    def test_parse_set_http_config_pool_options(self):
+        """Test parsing of the pool sizing options."""
+        from adoc_migration_toolkit.execution.command_parsing import parse_set_http_config_command
+        config = parse_set_http_config_command("set-http-config --pool-connections 4 --pool-maxsize 64")
+        assert config['pool_connections'] == 4
+        assert config['pool_maxsize'] == 64
+        assert config['timeout'] is None
+        assert parse_set_http_config_command("set-http-config --pool-maxsize 0") is None
+
+
+class TestStreamingDownload:
+    """Test cases for download_to_file."""
+
+    @pytest.fixture
+    def client(self):
+        return AcceldataAPIClient(
+            host="https://test.acceldata.app",
+            access_key="test_access",
+            secret_key="test_secret",
+            tenant="test_tenant"
+        )
+
+    @staticmethod
+    def _streamed_response(body, status_code=200):
+        import io
+        response = Response()
+        response.status_code = status_code
+        response.raw = io.BytesIO(body)
+        return response
+
+    def test_download_streams_to_file_with_checksum(self, client, tmp_path):
+        """Test that the body is written in chunks, checksummed and renamed into place."""
+        import hashlib
+        body = b"PK" + os.urandom(5000)
+        output_file = tmp_path / "export.zip"
+        with patch.object(client.session, 'get', return_value=self._streamed_response(body)) as mock_get:
+            result = client.download_to_file("/catalog-server/api/rules/export/policy-definitions?ids=1",
+                                             output_file, chunk_size=1024)
+        assert mock_get.call_args[1]['stream'] is True
+        assert output_file.read_bytes() == body
+        assert result.size == len(body)
+        assert result.sha256 == hashlib.sha256(body).hexdigest()
+        assert list(tmp_path.iterdir()) == [output_file]
+
+    def test_failed_download_leaves_no_file(self, client, tmp_path):
+        """Test that an error status or a broken stream never leaves a partial file."""
+        output_file = tmp_path / "export.zip"
+        with patch.object(client.session, 'get', return_value=self._streamed_response(b"error", 500)):
+            with pytest.raises(HTTPError):
+                client.download_to_file("/api/export", output_file)
+
+        broken = self._streamed_response(b"")
+        broken.iter_content = Mock(side_effect=ConnectionError("connection reset"))
+        with patch.object(client.session, 'get', return_value=broken):
+            with pytest.raises(ConnectionError):
+                client.download_to_file("/api/export", output_file)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_read_timeout_while_streaming_is_logged_as_timeout(self, client, tmp_path):
+        """Test that a stalled body, which requests raises as ConnectionError, is reported as a timeout."""
+        from urllib3.exceptions import ReadTimeoutError
+
+        def stalled_body(chunk_size):
+            try:
+                raise ReadTimeoutError(None, "/api/export", "Read timed out.")
+            except ReadTimeoutError as e:
+                raise ConnectionError(e)  # As raised by Response.iter_content
+            yield b""
+
+        stalled = self._streamed_response(b"")
+        stalled.iter_content = stalled_body
+        client.logger = Mock()
+        with patch.object(client.session, 'get', return_value=stalled), \
+             patch.object(client, '_log_error_details') as log_error_details:
+            with pytest.raises(ConnectionError):
+                client.download_to_file("/api/export", tmp_path / "export.zip")
+        client.logger.error.assert_called_once_with("Request timed out for GET /api/export")
+        log_error_details.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAsyncAcceldataAPIClient:
+    """Test cases for AsyncAcceldataAPIClient class."""
+
+    @pytest.fixture
+    def sync_client(self):
+        """Create a sync client with target configuration."""
+        client = AcceldataAPIClient(
+            host="https://${tenant}.acceldata.app",
+            access_key="test_access",
+            secret_key="test_secret",
+            tenant="source-tenant"
+        )
+        client.target_access_key = "target_access"
+        client.target_secret_key = "target_secret"
+        client.target_tenant = "target-tenant"
+        return client
+
+    @staticmethod
+    def _response(status_code, body, headers=None):
+        response = Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode('utf-8')
+        response.headers.update(headers or {})
+        return response
+
+    def test_make_api_call_get_success(self, sync_client):
+        """Test successful async GET call returns parsed JSON."""
+        pytest.importorskip("aiohttp")
+        from adoc_migration_toolkit.shared.api_client import AsyncAcceldataAPIClient
+
+        async def run():
+            async_client = AsyncAcceldataAPIClient(sync_client, max_concurrency=10)
+            with patch.object(async_client, '_send', return_value=self._response(200, {"status": "success"})) as mock_send:
+                result = await async_client.make_api_call("/api/test", use_target_auth=True, use_target_tenant=True)
+            await async_client.close()
+            return result, mock_send.call_args
+
+        result, call_args = asyncio.run(run())
+        assert result == {"status": "success"}
+        method, url, headers = call_args[0][:3]
+        assert method == 'GET'
+        assert url == "https://target-tenant.acceldata.app/api/test"
+        assert headers['accessKey'] == "target_access"
+        assert headers['X-Tenant'] == "target-tenant"
+
+    def test_make_api_call_retries_throttled_requests(self, sync_client):
+        """Test that 503 responses are retried before succeeding."""
+        pytest.importorskip("aiohttp")
+        from adoc_migration_toolkit.shared.api_client import AsyncAcceldataAPIClient
+
+        responses = [self._response(503, {}), self._response(200, {"ok": True})]
+
+        async def run():
+            async_client = AsyncAcceldataAPIClient(sync_client)
+            with patch.object(async_client, '_send', side_effect=responses) as mock_send, \
+                 patch('adoc_migration_toolkit.shared.api_client.asyncio.sleep') as mock_sleep:
+                result = await async_client.make_api_call("/api/test")
+            return result, mock_send.call_count, mock_sleep.call_count
+
+        result, send_count, sleep_count = asyncio.run(run())
+        assert result == {"ok": True}
+        assert send_count == 2
+        assert sleep_count == 1
+
+    def test_make_api_call_http_error(self, sync_client):
+        """Test that non-retryable errors raise requests exceptions."""
+        pytest.importorskip("aiohttp")
+        from adoc_migration_toolkit.shared.api_client import AsyncAcceldataAPIClient
+
+        async def run():
+            async_client = AsyncAcceldataAPIClient(sync_client)
+            with patch.object(async_client, '_send', return_value=self._response(404, {"error": "missing"})):
+                await async_client.make_api_call("/api/test")
+
+        with pytest.raises(HTTPError):
+            asyncio.run(run())
+
+    def test_make_api_call_invalid_method(self, sync_client):
+        """Test async API call with unsupported method."""
+        pytest.importorskip("aiohttp")
+        from adoc_migration_toolkit.shared.api_client import AsyncAcceldataAPIClient
+
+        async_client = AsyncAcceldataAPIClient(sync_client)
+        with pytest.raises(ValueError, match="Unsupported HTTP method"):
+            asyncio.run(async_client.make_api_call("/api/test", method="DELETE"))
+
+    def test_invalid_max_concurrency(self, sync_client):
+        """Test that a non-positive concurrency limit is rejected."""
+        pytest.importorskip("aiohttp")
+        from adoc_migration_toolkit.shared.api_client import AsyncAcceldataAPIClient
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncAcceldataAPIClient(sync_client, max_concurrency=0)
@@ -0,0 +1,63 @@
+"""
+Tests for the asset UID scanner.
+
+This module contains test cases for key classification, aggregate counts,
+deep documents and debug-only path logging.
+"""
+
+import logging
+
+from adoc_migration_toolkit.shared.asset_uids import is_uid_key, scan_asset_uids
+
+
+DOCUMENT = [
+    {
+        "uid": "PROD.db.t1",
+        "backingAssets": [{"parentAssetUid": " PROD.db "}, {"name": "no uid"}],
+        "backingAssetId": "PROD.db.t2",
+        "assetUid": "",
+        "config": {"ASSET_UID": "PROD.db.t3", "count": 3}
+    }
+]
+
+
+def test_is_uid_key():
+    assert is_uid_key("uid") and is_uid_key("parentAssetUid") and is_uid_key("ASSET_UID")
+    assert is_uid_key("backingAssetId")
+    assert not is_uid_key("name") and not is_uid_key("assetId")
+
+
+def test_scan_collects_uids_with_aggregate_counts():
+    """Test that UIDs are collected and counted, skipping blank values."""
+    asset_uids = set()
+    result = scan_asset_uids(DOCUMENT, asset_uids)
+
+    assert asset_uids == {"PROD.db.t1", "PROD.db", "PROD.db.t2", "PROD.db.t3"}
+    assert result.uid_fields == 4
+    assert result.nodes == 13
+
+
+def test_scan_handles_deep_documents():
+    """Test that deeply nested documents do not hit the recursion limit."""
+    document = node = {}
+    for i in range(5000):
+        node["child"] = {"uid": f"uid-{i}"}
+        node = node["child"]
+
+    asset_uids = set()
+    scan_asset_uids(document, asset_uids)
+    assert len(asset_uids) == 5000
+
+
+def test_paths_are_logged_only_at_debug_level(caplog):
+    """Test that per-UID messages with JSON paths are only produced at debug level."""
+    logger = logging.getLogger("test_asset_uids")
+
+    with caplog.at_level(logging.INFO, logger="test_asset_uids"):
+        scan_asset_uids(DOCUMENT, set(), logger)
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG, logger="test_asset_uids"):
+        scan_asset_uids(DOCUMENT, set(), logger)
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Found asset UID at [0].backingAssets[0].parentAssetUid: PROD.db" in messages
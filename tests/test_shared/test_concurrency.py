@@ -0,0 +1,191 @@
+"""
+Tests for the adaptive concurrency limiter.
+
+This module contains test cases for AIMD limit changes, Retry-After handling
+and the integration of the limiter with AcceldataAPIClient.make_api_call.
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+from requests.models import Response
+
+from adoc_migration_toolkit.shared.api_client import AcceldataAPIClient
+from adoc_migration_toolkit.shared.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+    parse_retry_after,
+    reset_concurrency_limiter
+)
+from adoc_migration_toolkit.shared import globals as shared_globals
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    """Give every test its own process-wide limiter."""
+    reset_concurrency_limiter()
+    yield
+    reset_concurrency_limiter()
+
+
+def _response(status_code, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response._content = b'{"ok": true}'
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter."""
+
+    def test_additive_increase_on_success(self):
+        """Test that the limit grows while requests succeed with stable latency."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+        for _ in range(40):
+            with limiter.slot() as slot:
+                slot.complete(200)
+        assert limiter.limit > 4
+        assert limiter.limit <= 8
+        assert limiter.in_flight == 0
+
+    def test_multiplicative_decrease_on_throttle(self):
+        """Test that a throttled response halves the limit and pauses callers."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=32)
+        with limiter.slot() as slot:
+            slot.complete(429, "2")
+        assert limiter.limit == 8
+        assert 1.5 < limiter.pause_remaining() <= 2
+
+    def test_decrease_at_most_once_per_round_trip(self):
+        """Test that a burst of throttled responses only backs off once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=32)
+        limiter.observe(0.05, 200)
+        for _ in range(5):
+            limiter.observe(0.05, 503, "0")
+        assert limiter.limit == 8
+
+    def test_decrease_on_rising_latency(self):
+        """Test that latency well above its long-term average reduces the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+        for _ in range(30):
+            limiter.observe(0.01, 200)
+        for _ in range(10):
+            limiter.observe(1.0, 200)
+        assert limiter.limit < 10
+
+    def test_timeout_reduces_limit(self):
+        """Test that a timeout raised inside a slot is treated as congestion."""
+        from requests.exceptions import Timeout
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+        with pytest.raises(Timeout):
+            with limiter.slot():
+                raise Timeout("timed out")
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_acquire_blocks_at_limit(self):
+        """Test that callers beyond the limit wait for a slot to be released."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.1)
+        limiter.release(0.01, 200)
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_invalid_limits(self):
+        """Test that inconsistent limits are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=4, max_limit=2)
+
+    def test_parse_retry_after(self):
+        """Test parsing of delay-seconds and HTTP date Retry-After values."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_disabled_by_config(self):
+        """Test that the limiter can be turned off via HTTP_CONFIG."""
+        with patch.dict(shared_globals.HTTP_CONFIG, {'adaptive_concurrency': False}):
+            assert get_concurrency_limiter() is None
+
+
+class TestMakeApiCallBackpressure:
+    """Test cases for make_api_call and download_to_file with the adaptive limiter."""
+
+    @pytest.fixture
+    def client(self):
+        return AcceldataAPIClient(
+            host="https://test.acceldata.app",
+            access_key="test_access",
+            secret_key="test_secret",
+            tenant="test_tenant"
+        )
+
+    def test_throttled_response_is_retried(self, client):
+        """Test that a 429 is retried through the limiter and honours Retry-After."""
+        responses = [_response(429, {'Retry-After': '0'}), _response(200)]
+        with patch.object(client.session, 'get', side_effect=responses) as mock_get:
+            result = client.make_api_call("/api/test")
+        assert result == {"ok": True}
+        assert mock_get.call_count == 2
+        assert get_concurrency_limiter().limit < 16
+
+    def test_throttled_response_gives_up_after_retries(self, client):
+        """Test that persistent throttling raises after HTTP_CONFIG['retry'] retries."""
+        from requests.exceptions import HTTPError
+        with patch.dict(shared_globals.HTTP_CONFIG, {'retry': 1}), \
+             patch.object(client.session, 'get', side_effect=lambda *a, **k: _response(503, {'Retry-After': '0'})) as mock_get:
+            with pytest.raises(HTTPError):
+                client.make_api_call("/api/test")
+        assert mock_get.call_count == 2
+
+    def test_uploads_are_not_retried(self, client):
+        """Test that throttled file uploads are reported but not replayed."""
+        from requests.exceptions import HTTPError
+        upload_session = client._get_upload_session()
+        with patch.object(upload_session, 'post', return_value=_response(503, {'Retry-After': '0'})) as mock_post:
+            with pytest.raises(HTTPError):
+                client.make_api_call("/api/upload", method="POST", files={"file": ("a.zip", b"data")})
+        assert mock_post.call_count == 1
+
+    def test_download_holds_slot_until_body_is_streamed(self, client, tmp_path):
+        """Test that a streamed download keeps its slot, and a stalled body counts as a timeout."""
+        import io
+        from requests.exceptions import ConnectionError
+        from urllib3.exceptions import ReadTimeoutError
+        limiter = get_concurrency_limiter()
+        in_flight = []
+
+        def body(chunk_size):
+            in_flight.append(limiter.in_flight)
+            yield b'PK'
+
+        response = _response(200)
+        response.raw = io.BytesIO(b'')
+        response.iter_content = body
+        with patch.object(client.session, 'get', return_value=response):
+            client.download_to_file("/api/export", tmp_path / "export.zip")
+        assert in_flight == [1]
+        assert limiter.in_flight == 0
+
+        def stalled_body(chunk_size):
+            raise ConnectionError(ReadTimeoutError(None, "/api/export", "Read timed out."))
+            yield b''
+
+        response.iter_content = stalled_body
+        with patch.object(client.session, 'get', return_value=response):
+            with pytest.raises(ConnectionError):
+                client.download_to_file("/api/export", tmp_path / "export.zip")
+        assert limiter.in_flight == 0
+        assert limiter.limit == 8
@@ -6,7 +6,10 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 from datetime import datetime
 
-from adoc_migration_toolkit.shared.file_utils import get_output_file_path
+import threading
+import time
+
+from adoc_migration_toolkit.shared.file_utils import BatchedOutputWriter, get_output_file_path
 
 
 class TestFileUtils:
@@ -144,4 +147,62 @@ class TestFileUtils:
         )
         
         assert isinstance(result, Path)
-        assert result.is_absolute()  # Should be absolute path 
\ No newline at end of file
+        assert result.is_absolute()  # Should be absolute path
+
+
+class TestBatchedOutputWriter:
+    """Test cases for the single-thread batched output writer."""
+    
+    def test_items_from_many_threads_are_written_in_batches(self):
+        """Test that every item is written once, in batches of at most batch_size."""
+        batches = []
+        writer = BatchedOutputWriter(batches.append, max_queue=8, batch_size=50, flush_interval=10)
+        
+        def produce(thread_id):
+            for i in range(100):
+                writer.put((thread_id, i))
+        
+        threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+        
+        items = [item for batch in batches for item in batch]
+        assert sorted(items) == [(t, i) for t in range(4) for i in range(100)]
+        assert all(len(batch) <= 50 for batch in batches)
+        assert [i for t, i in items if t == 0] == list(range(100))  # Order of a thread is kept
+    
+    def test_flush_and_flush_interval(self):
+        """Test that flush() waits for queued items and idle items are written after flush_interval."""
+        batches = []
+        with BatchedOutputWriter(batches.append, batch_size=100, flush_interval=10) as writer:
+            writer.put("a")
+            writer.flush()
+            assert batches == [["a"]]
+        
+        batches = []
+        with BatchedOutputWriter(batches.append, batch_size=100, flush_interval=0.05) as writer:
+            writer.put("b")
+            deadline = time.monotonic() + 5
+            while not batches and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert batches == [["b"]]
+    
+    def test_write_error_is_raised_to_producers(self):
+        """Test that an error in write_batch is raised by later calls instead of being lost."""
+        def fail(batch):
+            raise OSError("No space left on device")
+        
+        writer = BatchedOutputWriter(fail, batch_size=1)
+        writer.put("a")
+        with pytest.raises(OSError):
+            writer.flush()
+        with pytest.raises(OSError):
+            writer.put("b")
+        with pytest.raises(OSError):
+            writer.close()
+        with pytest.raises(ValueError):
+            writer.put("c")
+
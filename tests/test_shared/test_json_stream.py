@@ -0,0 +1,68 @@
+"""
+Tests for incremental JSON array reading and writing.
+
+This module contains test cases for chunked decoding, malformed input and
+round trips through write_json_array.
+"""
+
+import io
+import json
+
+import pytest
+
+from adoc_migration_toolkit.shared.json_stream import (detect_encoding, is_json_array, iter_json_array,
+                                                    write_json_array)
+
+
+ITEMS = [{"name": "p1", "rules": [1, 2.5, None]}, "text with ] and , inside", 12345, [], {"nested": {"a": [True]}}]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1024 * 1024])
+def test_iter_json_array_with_any_chunk_size(chunk_size):
+    """Test that items are decoded correctly however the input is split."""
+    stream = io.StringIO(json.dumps(ITEMS, indent=2))
+    assert list(iter_json_array(stream, chunk_size)) == ITEMS
+
+
+def test_iter_json_array_rejects_other_documents():
+    """Test that objects and truncated arrays raise JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO('{"name": "p1"}')))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO('[{"name": "p1"}, {"name"'), 4))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO('[1 2]')))
+
+
+def test_is_json_array_keeps_position():
+    """Test array detection with a byte order mark and leading whitespace."""
+    stream = io.StringIO('﻿  \n [1, 2]')
+    assert is_json_array(stream)
+    assert stream.tell() == 0
+    assert list(iter_json_array(stream)) == [1, 2]
+    assert not is_json_array(io.StringIO(' {"a": 1}'))
+    assert not is_json_array(io.StringIO(''))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024 * 1024])
+def test_detect_encoding_keeps_position(chunk_size):
+    """Test that UTF-8 split between reads is detected and other bytes fall back to latin-1."""
+    stream = io.BytesIO('["caf\u00e9 \u20ac"]'.encode('utf-8'))
+    assert detect_encoding(stream, chunk_size) == 'utf-8'
+    assert stream.tell() == 0
+    stream = io.BytesIO('["caf\u00e9"]'.encode('latin-1'))
+    assert detect_encoding(stream, chunk_size) == 'latin-1'
+    assert stream.tell() == 0
+    # A sequence cut off at the end of the stream is not UTF-8 either
+    assert detect_encoding(io.BytesIO(b'["\xe2\x82'), chunk_size) == 'latin-1'
+
+
+def test_write_json_array_round_trip():
+    """Test that written arrays are compact and decode to the same items."""
+    stream = io.StringIO()
+    assert write_json_array(iter(ITEMS), stream) == len(ITEMS)
+    assert stream.getvalue() == json.dumps(ITEMS, ensure_ascii=False, separators=(',', ':'))
+
+    stream = io.StringIO()
+    assert write_json_array([], stream) == 0
+    assert stream.getvalue() == '[]'
@@ -0,0 +1,93 @@
+"""
+Tests for CSV and JSON Lines record files.
+
+This module contains test cases for writing, format detection, reading and
+path handling of export and import artefacts.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from adoc_migration_toolkit.shared.record_io import (
+    FORMAT_CSV, FORMAT_JSONL, RecordWriter, detect_record_format, open_records,
+    record_file_path, resolve_record_file
+)
+
+
+COLUMNS = ['target-env', 'profile_json', 'source-env']
+ROWS = [
+    ['PROD.db.t1', {"profileSettingsConfigs": {"enabled": True, "note": "quote \" and ,\nnewline"}}, 'DEV.db.t1'],
+    ['PROD.db.t2', {"profileSettingsConfigs": None, "name": "ünïcode"}, 'DEV.db.t2'],
+]
+
+
+def _write(path, record_format, **kwargs):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = RecordWriter(f, COLUMNS, ('profile_json',), record_format, **kwargs)
+        writer.write_header()
+        writer.write_rows(ROWS)
+    return path
+
+
+@pytest.mark.parametrize("record_format", [FORMAT_CSV, FORMAT_JSONL])
+def test_round_trip(tmp_path, record_format):
+    """Test that rows read back the same in both formats, with the format detected."""
+    path = _write(tmp_path / f"profiles.{record_format}", record_format)
+
+    assert detect_record_format(path) == record_format
+    with open_records(path) as reader:
+        assert reader.record_format == record_format
+        assert reader.header == COLUMNS
+        rows = [[row[0], reader.json(row[1]), row[2]] for row in reader]
+    assert rows == ROWS
+
+
+def test_csv_output_matches_csv_writer(tmp_path):
+    """Test that CSV records are the QUOTE_ALL rows the exports always wrote."""
+    path = _write(tmp_path / "profiles.csv", FORMAT_CSV, json_separators=(', ', ': '))
+
+    expected = io.StringIO()
+    writer = csv.writer(expected, quoting=csv.QUOTE_ALL)
+    writer.writerow(COLUMNS)
+    writer.writerows([row[0], json.dumps(row[1], ensure_ascii=False), row[2]] for row in ROWS)
+    assert path.read_bytes().decode('utf-8') == expected.getvalue()
+
+
+def test_jsonl_embeds_json_columns(tmp_path):
+    """Test that each JSON Lines record is one line keyed by column name."""
+    path = _write(tmp_path / "profiles.jsonl", FORMAT_JSONL)
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == len(ROWS)
+    assert json.loads(lines[0]) == dict(zip(COLUMNS, ROWS[0]))
+    with open_records(path) as reader:
+        assert reader.text(next(iter(reader))[1]) == json.dumps(ROWS[0][1], ensure_ascii=False, separators=(',', ':'))
+
+
+def test_empty_jsonl_file_has_no_header(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_text("\n", encoding='utf-8')
+    with open_records(path) as reader:
+        assert reader.header == []
+        assert list(reader) == []
+
+
+def test_record_file_paths(tmp_path):
+    """Test the .jsonl counterpart of a default .csv path."""
+    csv_path = tmp_path / "segments_output.csv"
+    assert record_file_path(csv_path, FORMAT_JSONL) == tmp_path / "segments_output.jsonl"
+    assert record_file_path(csv_path, FORMAT_CSV) == csv_path
+
+    assert resolve_record_file(csv_path) == csv_path
+    (tmp_path / "segments_output.jsonl").write_text('{"target-env":"a"}\n', encoding='utf-8')
+    assert resolve_record_file(csv_path) == tmp_path / "segments_output.jsonl"
+    csv_path.write_text('"target-env"\n', encoding='utf-8')
+    assert resolve_record_file(csv_path) == csv_path
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        RecordWriter(io.StringIO(), COLUMNS, record_format='xml')
@@ -0,0 +1,149 @@
+"""
+Tests for the persistent GET response cache.
+
+This module contains test cases for TTL handling, LRU eviction, write
+invalidation and the integration of the cache with AcceldataAPIClient.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+from requests.models import Response
+
+from adoc_migration_toolkit.shared.api_client import AcceldataAPIClient
+from adoc_migration_toolkit.shared.response_cache import (
+    ResponseCache,
+    get_endpoint_ttl,
+    get_resource_root,
+    get_response_cache,
+    reset_response_cache
+)
+from adoc_migration_toolkit.shared import globals as shared_globals
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "http-cache.sqlite3", max_bytes=1000)
+
+
+@pytest.fixture
+def enabled_cache(tmp_path):
+    """Enable the process-wide cache with the output directory pointing at tmp_path."""
+    reset_response_cache()
+    with patch.dict(shared_globals.HTTP_CONFIG, {'response_cache': True}), \
+         patch.object(shared_globals, 'GLOBAL_OUTPUT_DIR', tmp_path):
+        yield
+    reset_response_cache()
+
+
+def _response(body, status_code=200):
+    response = Response()
+    response.status_code = status_code
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_put_and_get(self, cache):
+        """Test that stored bodies are returned until they expire."""
+        cache.put("k1", "/catalog-server/api/assets/1/config", b'{"a": 1}', ttl=60)
+        assert cache.get("k1") == b'{"a": 1}'
+        cache.put("k2", "/catalog-server/api/assets/2/config", b'{}', ttl=60)
+        with patch('adoc_migration_toolkit.shared.response_cache.time.time', return_value=time.time() + 120):
+            assert cache.get("k2") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_zero_ttl_is_not_stored(self, cache):
+        """Test that endpoints with a TTL of 0 are never cached."""
+        cache.put("k", "/catalog-server/api/rules/export/policy-definitions", b'zip', ttl=0)
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self, cache):
+        """Test that the least recently used entries are evicted past the size limit."""
+        cache.put("a", "/x/1", b'a' * 400, ttl=60)
+        cache.put("b", "/x/2", b'b' * 400, ttl=60)
+        assert cache.get("a") is not None  # "b" is now least recently used
+        cache.put("c", "/x/3", b'c' * 400, ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()[1] <= 1000
+
+    def test_invalidate_resource(self, cache):
+        """Test that a write drops cached responses for the same resource only."""
+        cache.put("cfg", "/catalog-server/api/assets/12/config", b'{}', ttl=60)
+        cache.put("other", "/catalog-server/api/assets/123/config", b'{}', ttl=60)
+        cache.put("rules", "/catalog-server/api/rules?page=0&size=10", b'{}', ttl=60)
+        assert cache.invalidate("/catalog-server/api/assets/12/config") == 1
+        assert cache.get("cfg") is None
+        assert cache.get("other") is not None
+        assert cache.invalidate("/catalog-server/api/rules/import/policy-definitions/apply-config") == 1
+        assert cache.get("rules") is None
+
+    def test_endpoint_ttls_and_roots(self):
+        """Test per-endpoint TTL lookup and resource roots used for invalidation."""
+        assert get_endpoint_ttl("/catalog-server/api/assets?uid=a.b") == 24 * 60 * 60
+        assert get_endpoint_ttl("/catalog-server/api/rules/export/policy-definitions") == 0
+        with patch.dict(shared_globals.HTTP_CONFIG, {'response_cache_ttl': 42}):
+            assert get_endpoint_ttl("/catalog-server/api/assets/1/config") == 42
+        assert get_resource_root("/catalog-server/api/profile/7/config") == "/catalog-server/api/profile/7"
+        assert get_resource_root("/catalog-server/api/rules/import/x?y=1") == "/catalog-server/api/rules"
+
+    def test_disabled_by_default(self):
+        """Test that the cache is opt-in."""
+        reset_response_cache()
+        assert get_response_cache() is None
+
+
+class TestMakeApiCallResponseCache:
+    """Test cases for make_api_call with the response cache enabled."""
+
+    @pytest.fixture
+    def client(self):
+        return AcceldataAPIClient(
+            host="https://test.acceldata.app",
+            access_key="test_access",
+            secret_key="test_secret",
+            tenant="test_tenant"
+        )
+
+    def test_get_served_from_cache(self, client, enabled_cache, tmp_path):
+        """Test that a repeated GET is answered from the cache file under the output directory."""
+        with patch.object(client.session, 'get', return_value=_response(b'{"data": [1]}')) as mock_get:
+            assert client.make_api_call("/catalog-server/api/assets/1/config") == {"data": [1]}
+            assert client.make_api_call("/catalog-server/api/assets/1/config") == {"data": [1]}
+        assert mock_get.call_count == 1
+        assert (tmp_path / "cache" / "http-cache.sqlite3").exists()
+
+    def test_write_invalidates_cached_get(self, client, enabled_cache):
+        """Test that a successful PUT makes the next GET of the resource hit the API."""
+        with patch.object(client.session, 'get', return_value=_response(b'{"v": 1}')) as mock_get, \
+             patch.object(client.session, 'put', return_value=_response(b'{}')):
+            client.make_api_call("/catalog-server/api/assets/5/config")
+            client.make_api_call("/catalog-server/api/assets/5/config", method='PUT', json_payload={})
+            client.make_api_call("/catalog-server/api/assets/5/config")
+        assert mock_get.call_count == 2
+
+    def test_failed_get_is_not_cached(self, client, enabled_cache):
+        """Test that error responses are not stored."""
+        from requests.exceptions import HTTPError
+        responses = [_response(b'{}', 404), _response(b'{"ok": true}')]
+        with patch.object(client.session, 'get', side_effect=responses) as mock_get:
+            with pytest.raises(HTTPError):
+                client.make_api_call("/catalog-server/api/assets/9/config")
+            assert client.make_api_call("/catalog-server/api/assets/9/config") == {"ok": True}
+        assert mock_get.call_count == 2
+
+    def test_parse_set_http_config_cache_options(self):
+        """Test parsing of the response cache options."""
+        from adoc_migration_toolkit.execution.command_parsing import parse_set_http_config_command
+        config = parse_set_http_config_command("set-http-config --response-cache on --cache-ttl 600 --cache-max-mb 64")
+        assert config['response_cache'] is True
+        assert config['response_cache_ttl'] == 600
+        assert config['response_cache_max_mb'] == 64
+        assert parse_set_http_config_command("set-http-config --response-cache maybe") is None
+        assert parse_set_http_config_command("set-http-config --cache-ttl 0") is None
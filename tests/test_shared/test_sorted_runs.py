@@ -0,0 +1,55 @@
+"""
+Tests for the external merge sort of CSV rows.
+
+This module contains test cases for spilling runs, multi-pass merges,
+merge stability and clean-up of run files.
+"""
+
+import os
+import random
+
+from adoc_migration_toolkit.shared.sorted_runs import SortedRunWriter, merge_sorted_runs, remove_runs
+
+
+def by_name(row):
+    return row[0]
+
+
+def test_rows_are_spilled_and_merged_in_order(tmp_path):
+    """Test that rows spilled across several runs are merged in key order."""
+    names = [f"asset-{i:04d}" for i in range(100)]
+    random.Random(7).shuffle(names)
+
+    writer = SortedRunWriter(by_name, max_rows=10, directory=str(tmp_path))
+    for name in names:
+        writer.add([name, None, 3])
+    runs = writer.close()
+
+    assert len(runs) == 10
+    rows = list(merge_sorted_runs(runs, by_name))
+    assert [row[0] for row in rows] == sorted(names)
+    assert rows[0][1:] == ['', '3']
+    remove_runs(runs)
+    assert not os.listdir(tmp_path)
+
+
+def test_multi_pass_merge_is_stable_and_removes_intermediate_runs(tmp_path):
+    """Test that merging in batches keeps equal keys in run order."""
+    runs = []
+    for run_index in range(5):
+        writer = SortedRunWriter(by_name, directory=str(tmp_path))
+        writer.add(['b', f"run-{run_index}"])
+        writer.add(['a', f"run-{run_index}"])
+        runs.extend(writer.close())
+
+    rows = list(merge_sorted_runs(runs, by_name, max_open=2, directory=str(tmp_path)))
+
+    assert rows == [['a', f"run-{i}"] for i in range(5)] + [['b', f"run-{i}"] for i in range(5)]
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(run) for run in runs)
+    remove_runs(runs)
+
+
+def test_empty_writer_has_no_runs():
+    writer = SortedRunWriter(by_name)
+    assert writer.close() == []
+    assert list(merge_sorted_runs([], by_name)) == []
@@ -0,0 +1,68 @@
+"""
+Tests for in-memory ZIP rewriting.
+
+This module contains test cases for raw member copies, transformed members
+and the handling of invalid archives.
+"""
+
+import zipfile
+import pytest
+
+from adoc_migration_toolkit.shared.zip_stream import rewrite_zip
+
+
+@pytest.fixture
+def source_zip(tmp_path):
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("policies.json", '{"db": "PROD_DB"}')
+        zf.writestr("nested/other.json", '{"db": "OTHER"}')
+        zf.writestr("readme.txt", "PROD_DB readme " * 100)
+    return path
+
+
+def _raw_member_bytes(path, name):
+    """Read the compressed bytes of a member as stored in the archive."""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+    with open(path, 'rb') as f:
+        f.seek(info.header_offset + 26)
+        name_length = int.from_bytes(f.read(2), 'little')
+        extra_length = int.from_bytes(f.read(2), 'little')
+        f.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        return f.read(info.compress_size)
+
+
+def test_rewrite_transforms_selected_and_copies_rest(source_zip, tmp_path):
+    """Test that only changed members are rewritten and the rest are copied byte for byte."""
+    output = tmp_path / "out.zip"
+    seen = []
+
+    def transform(info, content):
+        seen.append(info.filename)
+        return content.replace(b"PROD_DB", b"DEV_DB")
+
+    result = rewrite_zip(source_zip, output, transform)
+
+    assert seen == ["policies.json", "nested/other.json"]
+    assert (result.members, result.rewritten, result.copied) == (3, 1, 2)
+    with zipfile.ZipFile(output) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["policies.json", "nested/other.json", "readme.txt"]
+        assert zf.read("policies.json") == b'{"db": "DEV_DB"}'
+        assert zf.read("readme.txt") == b"PROD_DB readme " * 100
+    assert _raw_member_bytes(output, "readme.txt") == _raw_member_bytes(source_zip, "readme.txt")
+    assert not (tmp_path / "out.zip.part").exists()
+
+
+def test_rewrite_invalid_zip_leaves_no_output(tmp_path):
+    """Test that an invalid archive raises BadZipFile without leaving partial output."""
+    bad = tmp_path / "bad.zip"
+    bad.write_text("not a zip")
+    output = tmp_path / "out.zip"
+
+    with pytest.raises(zipfile.BadZipFile):
+        rewrite_zip(bad, output, lambda info, content: None)
+
+    assert not output.exists()
+    assert not (tmp_path / "out.zip.part").exists()
@@ -0,0 +1,63 @@
+"""
+Test cases for the compiled string transformation engine.
+
+This module contains tests for word-boundary matching, atomic replacement
+without cross-transformation, and the engine's use by the formatters.
+"""
+
+import io
+
+from src.adoc_migration_toolkit.execution.string_transforms import StringTransformEngine
+
+
+class TestStringTransformEngine:
+    """Test cases for StringTransformEngine."""
+
+    def test_word_boundaries(self):
+        """Test that sources are only replaced as complete words."""
+        engine = StringTransformEngine({"PROD": "DEV"})
+        assert engine.apply("snowflake.PROD.schema") == "snowflake.DEV.schema"
+        assert engine.apply("PRODUCTION.PROD_DB") == "PRODUCTION.PROD_DB"
+
+    def test_atomic_swap(self):
+        """Test that the output of one mapping is never matched by another."""
+        engine = StringTransformEngine({"PROD": "DEV", "DEV": "PROD"})
+        assert engine.apply("PROD.DEV.PROD") == "DEV.PROD.DEV"
+
+    def test_mapping_order_breaks_ties(self):
+        """Test that sources matching at the same position are tried in mapping order."""
+        assert StringTransformEngine({"a": "x", "a.b": "y"}).apply("a.b") == "x.b"
+        assert StringTransformEngine({"a.b": "y", "a": "x"}).apply("a.b") == "y"
+
+    def test_special_characters_and_identity(self):
+        """Test regex metacharacters in sources and that identity mappings are ignored."""
+        engine = StringTransformEngine({"db.1": "db2", "same": "same", "": "x"})
+        assert engine.apply("x db.1 dbx1 same") == "x db2 dbx1 same"
+        assert not StringTransformEngine({"same": "same"})
+        assert StringTransformEngine({}).apply("PROD") == "PROD"
+
+    def test_apply_with_matches(self):
+        """Test that replaced sources are reported once each."""
+        engine = StringTransformEngine({"PROD": "DEV", "EU": "US", "X": "Y"})
+        assert engine.apply_with_matches("PROD.EU.PROD") == ("DEV.US.DEV", ["PROD", "EU"])
+
+    def test_may_match_pre_scan(self):
+        """Test that the raw-byte pre-scan never rules out a document that could change."""
+        engine = StringTransformEngine({"PROD": "DEV"})
+        assert not engine.may_match(b'{"db": "STAGE", "sql": "a\\nb"}')
+        assert engine.may_match(b'{"db": "PRODUCTION"}')
+        assert engine.may_match(b'{"db": "\\u0050ROD"}')
+        assert not StringTransformEngine({}).may_match(b'PROD')
+
+        escaped = StringTransformEngine({"a/b": "c", "café": "x"})
+        assert escaped.may_match(b'{"path": "a\\/b"}')
+        assert escaped.may_match('{"name": "café"}'.encode('latin-1'))
+        assert not escaped.may_match(b'{"path": "a-b"}')
+
+    def test_may_match_stream_across_chunks(self):
+        """Test that sources split between reads are still found."""
+        engine = StringTransformEngine({"PROD_DB": "DEV_DB"})
+        data = b'{"padding": "' + b'x' * 10 + b'", "db": "PROD_DB"}'
+        for chunk_size in (1, 3, 7, 1024):
+            assert engine.may_match_stream(io.BytesIO(data), chunk_size)
+            assert not engine.may_match_stream(io.BytesIO(data.replace(b'PROD', b'TEST')), chunk_size)
@@ -0,0 +1,148 @@
+"""
+Test cases for the shared work-queue executor.
+
+This module contains tests for on-demand work distribution, per-item
+latency statistics and progress reporting used by the parallel asset commands.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+from src.adoc_migration_toolkit.execution.work_queue import WorkQueue, SubRequestPool, run_work_queue
+
+
+class TestWorkQueue:
+    """Test cases for WorkQueue and run_work_queue."""
+
+    def test_every_item_processed_once(self):
+        """Test that all items are handed out exactly once across threads."""
+        work_queue = WorkQueue(range(100))
+        seen = []
+        lock = threading.Lock()
+
+        def worker(thread_id):
+            count = 0
+            for item in work_queue.consume():
+                with lock:
+                    seen.append(item)
+                count += 1
+            return count
+
+        results = run_work_queue(work_queue, worker, 4)
+        assert sorted(seen) == list(range(100))
+        assert sum(results) == 100
+        assert work_queue.latency_stats()['count'] == 100
+
+    def test_slow_items_do_not_stall_other_threads(self):
+        """Test that workers keep pulling items while one thread is busy with a slow item."""
+        items = ['slow'] + ['fast'] * 20
+        work_queue = WorkQueue(items)
+        processed = {}
+
+        def worker(thread_id):
+            processed[thread_id] = 0
+            for item in work_queue.consume():
+                time.sleep(0.3 if item == 'slow' else 0.005)
+                processed[thread_id] += 1
+            return processed[thread_id]
+
+        run_work_queue(work_queue, worker, 2)
+        # The thread that took the slow item handled only that one; the other drained the rest
+        assert sorted(processed.values()) == [1, 20]
+
+    def test_latency_stats_and_progress(self):
+        """Test tail latency reporting and shared progress bar updates."""
+        progress_bar = Mock()
+        work_queue = WorkQueue(['a', 'b', 'c', 'd'], progress_bar)
+
+        def worker(thread_id):
+            for item in work_queue.consume():
+                if item == 'a':
+                    continue
+                time.sleep(0.01)
+
+        run_work_queue(work_queue, worker, 1)
+        stats = work_queue.latency_stats()
+        assert stats['count'] == 4
+        assert stats['p50'] <= stats['p90'] <= stats['p99'] <= stats['max']
+        assert stats['max'] >= 0.01
+        assert progress_bar.update.call_count == 4
+        assert "p99" in work_queue.format_latency_stats()
+
+    def test_worker_exception_is_logged(self):
+        """Test that a failing worker is logged without losing other results."""
+        work_queue = WorkQueue(range(10))
+        logger = Mock()
+
+        def worker(thread_id):
+            for item in work_queue.consume():
+                if item == 0:
+                    raise RuntimeError("boom")
+            return thread_id
+
+        results = run_work_queue(work_queue, worker, 2, logger)
+        logger.error.assert_called_once()
+        assert len(results) == 1
+
+    def test_empty_queue(self):
+        """Test that an empty queue reports zeroed statistics."""
+        work_queue = WorkQueue([])
+        assert run_work_queue(work_queue, lambda thread_id: list(work_queue.consume()), 4) == [[]]
+        assert work_queue.latency_stats()['count'] == 0
+
+    def test_streaming_reads_items_lazily(self):
+        """Test that a bounded queue pulls from a generator as workers consume it."""
+        produced = []
+
+        def items():
+            for i in range(50):
+                produced.append(i)
+                yield i
+
+        work_queue = WorkQueue(items(), max_pending=4, total=50)
+        time.sleep(0.2)
+        assert len(produced) <= 6  # Queue capacity plus one item waiting to be put
+        seen = []
+        lock = threading.Lock()
+
+        def worker(thread_id):
+            for item in work_queue.consume():
+                with lock:
+                    seen.append(item)
+
+        run_work_queue(work_queue, worker, num_threads=3)
+        assert sorted(seen) == list(range(50))
+
+    def test_streaming_input_error_is_logged(self):
+        """Test that a failing input stream ends the queue and is reported."""
+        def items():
+            yield 1
+            raise ValueError("bad row")
+
+        logger = Mock()
+        work_queue = WorkQueue(items(), max_pending=2)
+        seen = []
+        run_work_queue(work_queue, lambda thread_id: seen.extend(work_queue.consume()), num_threads=2, logger=logger)
+        assert seen == [1]
+        assert isinstance(work_queue.error, ValueError)
+        assert any("bad row" in str(call) for call in logger.error.call_args_list)
+
+    def test_sub_requests_run_concurrently(self):
+        """Test that an item's sub-requests overlap and failures surface per request."""
+        def slow(value):
+            time.sleep(0.2)
+            return value
+
+        def failing():
+            raise ValueError("not found")
+
+        with SubRequestPool(4) as pool:
+            started = time.monotonic()
+            responses = pool.fan_out({name: (lambda name=name: slow(name)) for name in ("a", "b", "c")})
+            responses["d"] = pool.fan_out({"d": failing})["d"]
+            assert [responses[name].result() for name in ("a", "b", "c")] == ["a", "b", "c"]
+            assert time.monotonic() - started < 0.5
+            with pytest.raises(ValueError):
+                responses["d"].result()